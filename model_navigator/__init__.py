@@ -12,7 +12,56 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # noqa: D104
+# The API and the runners are imported on the first access to the attribute (PEP 562), so `import model_navigator`
+# in the scripts executed in subprocesses does not import the whole API and the frameworks.
+import importlib
+import sys
+import types
+from typing import Any, List
+
+from model_navigator import api as _api
 from model_navigator.__version__ import __version__  # noqa: F401
-from model_navigator.api import *  # noqa: F401, F403
-from model_navigator.runners import register_runner  # noqa: F401
-from model_navigator.runtime_analyzer import strategy  # noqa: F401
+
+_LAZY_ATTRIBUTES = {
+    "register_runner": "model_navigator.runners",
+}
+
+_LAZY_SUBMODULES = {
+    "strategy": "model_navigator.runtime_analyzer.strategy",
+}
+
+__all__ = [*_api.__all__, *_LAZY_ATTRIBUTES, *_LAZY_SUBMODULES]  # noqa: F822
+
+
+def __getattr__(name: str) -> Any:
+    """Import the API attribute, the runners or the submodule on the first access."""
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(_LAZY_SUBMODULES[name])
+    elif name in _api.__all__:
+        value = getattr(_api, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List attributes of the module including not yet imported ones."""
+    return sorted(set(globals()) | set(__all__))
+
+
+class _NavigatorModule(types.ModuleType):
+    """Top-level module keeping the API submodules named like the internal subpackages."""
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # importing internal subpackage (e.g. `model_navigator.package`) sets its attribute on the parent module,
+        # which would shadow the API submodule (e.g. `model_navigator.api.package`)
+        if isinstance(value, types.ModuleType) and value.__name__ == f"{__name__}.{name}" and name in _api.__all__:
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _NavigatorModule
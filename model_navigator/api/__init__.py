@@ -12,43 +12,80 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # noqa: D104
-from model_navigator.commands.base import CommandStatus  # noqa: F401
-from model_navigator.frameworks import is_jax_available, is_tf_available, is_torch_available  # noqa: F401
-from model_navigator.runtime_analyzer.strategy import (  # noqa: F401
-    MaxThroughputAndMinLatencyStrategy,
-    MaxThroughputStrategy,
-    MinLatencyStrategy,
-)
-
-from .config import (  # noqa: F401
-    DeviceKind,
-    Format,
-    JitType,
-    OnnxConfig,
-    OptimizationProfile,
-    TensorFlowConfig,
-    TensorFlowTensorRTConfig,
-    TensorRTConfig,
-    TensorRTPrecision,
-    TensorRTPrecisionMode,
-    TensorRTProfile,
-    TensorType,
-    TorchConfig,
-    TorchTensorRTConfig,
-)
-
-if is_torch_available():
-    from . import torch  # noqa: F401
-
-if is_tf_available():
-    from . import tensorflow  # noqa: F401
-
-if is_tf_available() and is_jax_available():
-    from . import jax  # noqa: F401
-
-from . import onnx  # noqa: F401
-from . import package  # noqa: F401
-from . import python  # noqa: F401
-from . import pytriton  # noqa: F401
-from . import triton  # noqa: F401
-from . import utilities  # noqa: F401
+# API submodules and their dependencies are imported on the first access to the attribute (PEP 562),
+# so scripts importing only a part of the package do not pay the cost of importing the whole API.
+import importlib
+from typing import Any, List
+
+from model_navigator.frameworks import is_jax_available, is_tf_available, is_torch_available
+
+_CONFIG_MODULE = "model_navigator.api.config"
+_STRATEGY_MODULE = "model_navigator.runtime_analyzer.strategy"
+
+_LAZY_ATTRIBUTES = {
+    "CommandStatus": "model_navigator.commands.base",
+    "MaxThroughputAndMinLatencyStrategy": _STRATEGY_MODULE,
+    "MaxThroughputStrategy": _STRATEGY_MODULE,
+    "MinLatencyStrategy": _STRATEGY_MODULE,
+    "ArtifactCacheConfig": _CONFIG_MODULE,
+    "CorrectnessTolerance": _CONFIG_MODULE,
+    "DeviceKind": _CONFIG_MODULE,
+    "ExecutionLimitsConfig": _CONFIG_MODULE,
+    "Format": _CONFIG_MODULE,
+    "JitType": _CONFIG_MODULE,
+    "OnnxConfig": _CONFIG_MODULE,
+    "OptimizationProfile": _CONFIG_MODULE,
+    "ParallelConfig": _CONFIG_MODULE,
+    "PlannerConfig": _CONFIG_MODULE,
+    "PrefetchMode": _CONFIG_MODULE,
+    "ReplicasDispatch": _CONFIG_MODULE,
+    "ReplicatedRunnerConfig": _CONFIG_MODULE,
+    "TensorFlowConfig": _CONFIG_MODULE,
+    "TensorFlowTensorRTConfig": _CONFIG_MODULE,
+    "TensorRTConfig": _CONFIG_MODULE,
+    "TensorRTPrecision": _CONFIG_MODULE,
+    "TensorRTPrecisionMode": _CONFIG_MODULE,
+    "TensorRTProfile": _CONFIG_MODULE,
+    "TensorType": _CONFIG_MODULE,
+    "TorchConfig": _CONFIG_MODULE,
+    "TorchTensorRTConfig": _CONFIG_MODULE,
+}
+
+_LAZY_SUBMODULES = {
+    "config": True,
+    "jax": is_tf_available() and is_jax_available(),
+    "onnx": True,
+    "package": True,
+    "python": True,
+    "pytriton": True,
+    "tensorflow": is_tf_available(),
+    "torch": is_torch_available(),
+    "triton": True,
+    "utilities": True,
+}
+
+__all__ = [  # noqa: F822
+    "is_jax_available",
+    "is_tf_available",
+    "is_torch_available",
+    *_LAZY_ATTRIBUTES,
+    *(name for name, available in _LAZY_SUBMODULES.items() if available),
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the API submodule or the attribute on the first access."""
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif _LAZY_SUBMODULES.get(name, False):
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List attributes of the module including not yet imported ones."""
+    return sorted(set(globals()) | set(__all__))
@@ -13,6 +13,7 @@
 # limitations under the License.
 """Definition of enums and classes representing configuration for Model Navigator."""
 import abc
+import pathlib
 from dataclasses import dataclass
 from enum import Enum
 from typing import (
@@ -38,7 +39,10 @@ from model_navigator.core.constants import (
     DEFAULT_MAX_WORKSPACE_SIZE,
     DEFAULT_MIN_SEGMENT_SIZE,
     DEFAULT_ONNX_OPSET,
+    DEFAULT_PREFETCH_DEPTH,
+    DEFAULT_PROFILING_SAMPLES_COUNT,
     DEFAULT_PROFILING_THROUGHPUT_CUTOFF_THRESHOLD,
+    DEFAULT_RUNNER_REPLICAS,
 )
 from model_navigator.core.logger import LOGGER
 from model_navigator.exceptions import ModelNavigatorConfigurationError
@@ -85,6 +89,8 @@ class SizedIterable(Protocol):
 
 SizedDataLoader = Union[SizedIterable, Sequence]
 
+DataLoader = Union[SizedDataLoader, Iterable]
+
 
 class Format(Enum):
     """All model formats supported by Model Navigator 'optimize' function.
@@ -156,6 +162,32 @@ class TensorRTPrecisionMode(Enum):
     MIXED = "mixed"
 
 
+class PrefetchMode(Enum):
+    """Prefetching of samples from the dataloader.
+
+    Args:
+        THREAD (str): Samples are fetched and converted in a background thread.
+        PROCESS (str): Samples are fetched and converted in a background process.
+            Use for dataloaders which hold the GIL, e.g. decoding data in Python. The process is forked,
+            so when CUDA is initialized samples are fetched in a thread instead.
+    """
+
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class ReplicasDispatch(Enum):
+    """Policy of selecting replica for the request.
+
+    Args:
+        ROUND_ROBIN (str): Requests are assigned to replicas in turns.
+        LEAST_LOADED (str): Request is assigned to replica with the least requests in progress.
+    """
+
+    ROUND_ROBIN = "round_robin"
+    LEAST_LOADED = "least_loaded"
+
+
 class TensorType(Enum):
     """All model formats supported by Model Navigator 'optimize' function."""
 
@@ -225,6 +257,14 @@ class OptimizationProfile(DataObject):
         max_trials: Maximum number of window trials.
         throughput_cutoff_threshold: Minimum throughput increase to continue profiling.
         dataloader: Optional dataloader for profiling. Use only 1 sample.
+        concurrency: Number of requests sent concurrently to the runner. Used only for thread safe runners,
+            other runners are profiled with a single request at a time.
+        prefetch_depth: Number of samples fetched from the dataloader ahead of processing. 0 disables prefetching,
+            which is the default.
+        prefetch_mode: Prefetch samples in a background thread or process.
+        profiling_samples_count: Number of samples profiled for each runner. When larger than 1, samples covering
+            the quantiles of input shapes in the dataloader are profiled and `profiling_results` are aggregated
+            over them weighted by the share of dataloader samples with a similar shape.
     """
 
     max_batch_size: Optional[int] = None
@@ -234,6 +274,10 @@ class OptimizationProfile(DataObject):
     max_trials: int = 10
     throughput_cutoff_threshold: float = DEFAULT_PROFILING_THROUGHPUT_CUTOFF_THRESHOLD
     dataloader: Optional[SizedDataLoader] = None
+    concurrency: int = 1
+    prefetch_depth: int = DEFAULT_PREFETCH_DEPTH
+    prefetch_mode: PrefetchMode = PrefetchMode.THREAD
+    profiling_samples_count: int = DEFAULT_PROFILING_SAMPLES_COUNT
 
     def to_dict(self, filter_fields: Optional[List[str]] = None, parse: bool = False) -> Dict:
         """Serialize to a dictionary.
@@ -272,6 +316,202 @@ class OptimizationProfile(DataObject):
             stability_percentage=optimization_profile_dict.get("stability_percentage", 10.0),
             max_trials=optimization_profile_dict.get("max_trials", 10),
             throughput_cutoff_threshold=optimization_profile_dict.get("throughput_cutoff_threshold", -2),
+            concurrency=optimization_profile_dict.get("concurrency", 1),
+            prefetch_depth=optimization_profile_dict.get("prefetch_depth", DEFAULT_PREFETCH_DEPTH),
+            prefetch_mode=PrefetchMode(optimization_profile_dict.get("prefetch_mode", PrefetchMode.THREAD.value)),
+            profiling_samples_count=optimization_profile_dict.get(
+                "profiling_samples_count", DEFAULT_PROFILING_SAMPLES_COUNT
+            ),
+        )
+
+
+@dataclass
+class CorrectnessTolerance(DataObject):
+    """Accepted error between outputs of the source model and the evaluated model.
+
+    Output element is accepted when `|original - computed| <= atol + rtol * |original|`.
+
+    Args:
+        atol: Accepted absolute error.
+        rtol: Accepted error relative to the source model output.
+    """
+
+    atol: float = 0.0
+    rtol: float = 0.0
+
+    @classmethod
+    def from_dict(cls, tolerance_dict: Mapping) -> "CorrectnessTolerance":
+        """Instantiate CorrectnessTolerance class from a dictionary.
+
+        Args:
+            tolerance_dict (Mapping): Data dictionary.
+
+        Returns:
+            CorrectnessTolerance
+        """
+        return cls(
+            atol=tolerance_dict.get("atol", 0.0),
+            rtol=tolerance_dict.get("rtol", 0.0),
+        )
+
+
+@dataclass
+class ParallelConfig(DataObject):
+    """Concurrent execution of independent pipeline steps.
+
+    Steps which do not depend on each other, like exports to different formats or correctness tests
+    of different models, are executed concurrently in forked worker processes. Steps measuring performance
+    are executed alone, so the measurements are not disturbed by other steps. CUDA cannot be used
+    in forked processes, so when it is initialized in the main process, steps which execute models only
+    in subprocesses, like conversions and correctness tests of exported models, are started from threads
+    and remaining steps are executed in the main process one after another.
+
+    Args:
+        max_workers: Maximal number of steps executed concurrently. 1 executes steps one after another.
+        max_memory: Maximal resident memory in bytes used by the workers and their child processes.
+            New steps are not started while the limit is exceeded. None means no limit.
+    """
+
+    max_workers: int = 1
+    max_memory: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, parallel_config_dict: Mapping) -> "ParallelConfig":
+        """Instantiate ParallelConfig class from a dictionary.
+
+        Args:
+            parallel_config_dict (Mapping): Data dictionary.
+
+        Returns:
+            ParallelConfig
+        """
+        return cls(
+            max_workers=parallel_config_dict.get("max_workers", 1),
+            max_memory=parallel_config_dict.get("max_memory"),
+        )
+
+
+@dataclass
+class ArtifactCacheConfig(DataObject):
+    """Local cache of exported and converted models reused across optimize calls.
+
+    Models are cached by the content of the source or parent model, the command parameters, the versions
+    of the libraries and the GPU, and the samples used during export and conversion. When nothing changed,
+    the model is copied from the cache instead of exporting or converting it again.
+
+    Args:
+        path: Directory of the cache. None means `~/.cache/model_navigator/artifacts`.
+        max_size: Maximal size of the cached models in bytes. Least recently used models are removed
+            when the cache exceeds it. None means no limit.
+    """
+
+    path: Optional[Union[str, pathlib.Path]] = None
+    max_size: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        """Parse path to the cache directory."""
+        if self.path is not None:
+            self.path = pathlib.Path(self.path)
+
+    @classmethod
+    def from_dict(cls, artifact_cache_dict: Mapping) -> "ArtifactCacheConfig":
+        """Instantiate ArtifactCacheConfig class from a dictionary.
+
+        Args:
+            artifact_cache_dict (Mapping): Data dictionary.
+
+        Returns:
+            ArtifactCacheConfig
+        """
+        return cls(
+            path=artifact_cache_dict.get("path"),
+            max_size=artifact_cache_dict.get("max_size"),
+        )
+
+
+@dataclass
+class PlannerConfig(DataObject):
+    """Estimation of the optimize duration before execution.
+
+    Units of the pipelines are estimated from the timings of commands recorded in the local timing database
+    and in the status of previous packages. The plan is logged and saved in the workspace before execution.
+
+    Args:
+        dry_run: Only plan the optimize. Commands for model formats are not executed and the returned package
+            contains no models.
+        time_budget: Estimated time in seconds available for the optimize. Units not fitting in the budget
+            are skipped together with the units depending on them. None means no limit.
+        timings_path: File of the local timing database updated after each optimize.
+            None means `~/.cache/model_navigator/timings.json`.
+        history: Paths to previous `.nav` packages, workspaces or status files with timings of commands.
+    """
+
+    dry_run: bool = False
+    time_budget: Optional[float] = None
+    timings_path: Optional[Union[str, pathlib.Path]] = None
+    history: Sequence[Union[str, pathlib.Path]] = ()
+
+    def __post_init__(self) -> None:
+        """Parse paths to the timing database and to the history."""
+        if self.timings_path is not None:
+            self.timings_path = pathlib.Path(self.timings_path)
+        self.history = tuple(pathlib.Path(path) for path in self.history)
+
+    @classmethod
+    def from_dict(cls, planner_dict: Mapping) -> "PlannerConfig":
+        """Instantiate PlannerConfig class from a dictionary.
+
+        Args:
+            planner_dict (Mapping): Data dictionary.
+
+        Returns:
+            PlannerConfig
+        """
+        return cls(
+            dry_run=planner_dict.get("dry_run", False),
+            time_budget=planner_dict.get("time_budget"),
+            timings_path=planner_dict.get("timings_path"),
+            history=planner_dict.get("history", ()),
+        )
+
+
+@dataclass
+class ExecutionLimitsConfig(DataObject):
+    """Limits of the processes executing commands, like exports, conversions and evaluation of models.
+
+    Limits are applied to each process started by a command separately. The process is started in a new session,
+    so when the timeout is exceeded the process and all processes started by it are killed.
+
+    Args:
+        timeout: Maximal wall time in seconds of the process. None means no limit.
+        max_memory: Maximal size in bytes of the data segment of the process set as `RLIMIT_DATA`. Allocations above
+            the limit fail in the process. Address space reserved by CUDA is not counted. None means no limit.
+        cpu_affinity: CPUs on which the process is executed. None means all CPUs available to Model Navigator.
+    """
+
+    timeout: Optional[float] = None
+    max_memory: Optional[int] = None
+    cpu_affinity: Optional[Sequence[int]] = None
+
+    def __post_init__(self) -> None:
+        """Parse CPUs of the affinity."""
+        if self.cpu_affinity is not None:
+            self.cpu_affinity = tuple(self.cpu_affinity)
+
+    @classmethod
+    def from_dict(cls, execution_limits_dict: Mapping) -> "ExecutionLimitsConfig":
+        """Instantiate ExecutionLimitsConfig class from a dictionary.
+
+        Args:
+            execution_limits_dict (Mapping): Data dictionary.
+
+        Returns:
+            ExecutionLimitsConfig
+        """
+        return cls(
+            timeout=execution_limits_dict.get("timeout"),
+            max_memory=execution_limits_dict.get("max_memory"),
+            cpu_affinity=execution_limits_dict.get("cpu_affinity"),
         )
 
 
@@ -730,6 +970,46 @@ class TensorRTConfig(CustomConfigForFormat):
         return cls(**config_dict)
 
 
+@dataclass
+class ReplicatedRunnerConfig(DataObject, CustomConfig):
+    """Replicated runners custom config.
+
+    Options are passed to the runners selected in `runners` which replicate the model,
+    e.g. `OnnxCPUReplicated`, and recorded in the package with the runner.
+
+    Args:
+        replicas: Number of runner instances serving concurrent requests.
+        threads_per_replica: Number of intra-op threads used by each replica. When None,
+            the CPU cores are divided among the replicas.
+        dispatch: Policy of selecting replica for the request.
+    """
+
+    replicas: int = DEFAULT_RUNNER_REPLICAS
+    threads_per_replica: Optional[int] = None
+    dispatch: ReplicasDispatch = ReplicasDispatch.ROUND_ROBIN
+
+    def __post_init__(self):
+        """Parse dispatch and validate the number of replicas and threads."""
+        self.dispatch = ReplicasDispatch(self.dispatch)
+        if self.replicas < 1:
+            raise ModelNavigatorConfigurationError(f"Number of replicas must be positive, got: {self.replicas}")
+        if self.threads_per_replica is not None and self.threads_per_replica < 1:
+            raise ModelNavigatorConfigurationError(
+                f"Number of threads per replica must be positive, got: {self.threads_per_replica}"
+            )
+
+    @classmethod
+    def name(cls) -> str:
+        """Name of the config."""
+        return "ReplicatedRunner"
+
+    def defaults(self) -> None:
+        """Update parameters to defaults."""
+        self.replicas = DEFAULT_RUNNER_REPLICAS
+        self.threads_per_replica = None
+        self.dispatch = ReplicasDispatch.ROUND_ROBIN
+
+
 def map_custom_configs(custom_configs: Optional[Sequence[CustomConfig]]) -> Dict:
     """Map custom configs from list to dictionary.
 
@@ -745,7 +1025,7 @@ def map_custom_configs(custom_configs: Optional[Sequence[CustomConfig]]) -> Dict
     return {config.name(): config for config in custom_configs}
 
 
-def _custom_configs() -> Dict[str, Type[CustomConfigForFormat]]:
+def _custom_configs() -> Dict[str, Type[CustomConfig]]:
     custom_configs = {}
     custom_configs_formats = {}
     for cls in CustomConfigForFormat.__subclasses__():
@@ -756,6 +1036,8 @@ def _custom_configs() -> Dict[str, Type[CustomConfigForFormat]]:
         custom_configs_formats[cls_format] = custom_configs_formats
         custom_configs[cls.name()] = cls
 
+    custom_configs[ReplicatedRunnerConfig.name()] = ReplicatedRunnerConfig
+
     return custom_configs
 
 
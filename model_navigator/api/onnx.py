@@ -13,15 +13,20 @@
 # limitations under the License.
 """ONNX optimize API."""
 import pathlib
-from typing import Optional, Sequence, Tuple, Type, Union
+from typing import Dict, Optional, Sequence, Tuple, Type, Union
 
 from model_navigator.api.config import (
     DEFAULT_ONNX_TARGET_FORMATS,
+    ArtifactCacheConfig,
+    CorrectnessTolerance,
     CustomConfig,
+    DataLoader,
     DeviceKind,
+    ExecutionLimitsConfig,
     Format,
     OptimizationProfile,
-    SizedDataLoader,
+    ParallelConfig,
+    PlannerConfig,
     VerifyFunction,
     map_custom_configs,
 )
@@ -47,7 +52,7 @@ from model_navigator.utils import enums
 
 def optimize(
     model: Union[pathlib.Path, str],
-    dataloader: SizedDataLoader,
+    dataloader: DataLoader,
     sample_count: int = DEFAULT_SAMPLE_COUNT,
     batching: Optional[bool] = True,
     target_formats: Optional[Tuple[Union[str, Format], ...]] = None,
@@ -58,6 +63,13 @@ def optimize(
     verbose: bool = False,
     debug: bool = False,
     verify_func: Optional[VerifyFunction] = None,
+    correctness_tolerances: Optional[Dict[str, CorrectnessTolerance]] = None,
+    max_samples: Optional[int] = None,
+    parallel_config: Optional[ParallelConfig] = None,
+    resume: bool = False,
+    artifact_cache: Optional[ArtifactCacheConfig] = None,
+    planner: Optional[PlannerConfig] = None,
+    execution_limits: Optional[ExecutionLimitsConfig] = None,
     custom_configs: Optional[Sequence[CustomConfig]] = None,
 ) -> Package:
     """Entrypoint for ONNX optimize.
@@ -66,7 +78,8 @@ def optimize(
 
     Args:
         model: ONNX model path or string
-        dataloader: Sized iterable with data that will be feed to the model
+        dataloader: Iterable with data that will be feed to the model. Dataloaders without length
+            are read up to `max_samples` samples.
         sample_count: Limits how many samples will be used from dataloader
         batching: Enable or disable batching on first (index 0) dimension of the model
         target_formats: Target model formats for optimize process
@@ -77,6 +90,20 @@ def optimize(
         verbose: Enable verbose logging
         debug: Enable debug logging from commands
         verify_func: Function for additional model verification
+        correctness_tolerances: Accepted errors of the outputs by output name. Correctness fails on the first
+            sample exceeding them and the runner is not profiled.
+        max_samples: Limits how many samples are read from the dataloader. Defaults to all samples
+            of sized dataloaders and 1000 samples of dataloaders without length.
+        parallel_config: Limits of executing independent steps concurrently in worker processes.
+            Defaults to executing steps one after another.
+        resume: If True, reuse outputs of the steps completed in the workspace by the previous, interrupted
+            execution started with resume enabled and execute only the remaining ones. Defaults to False.
+        artifact_cache: Location and size limit of the local cache of exported and converted models reused
+            across optimize calls. Defaults to no cache.
+        planner: Estimation of the optimize duration from timings of previous runs, with dry run and pruning
+            of units to the time budget. Defaults to no planning.
+        execution_limits: Timeout, memory limit and CPU affinity of each process executing exports, conversions
+            and evaluation of models. Defaults to no limits.
         custom_configs: Sequence of CustomConfigs used to control produced artifacts
 
     Returns:
@@ -107,12 +134,19 @@ def optimize(
         target_formats=target_formats_enums,
         target_device=target_device,
         sample_count=sample_count,
+        max_samples=max_samples,
         batch_dim=0 if batching else None,
         runner_names=runner_names,
         optimization_profile=optimization_profile,
         verbose=verbose,
         debug=debug,
         verify_func=verify_func,
+        correctness_tolerances=correctness_tolerances,
+        parallel_config=parallel_config,
+        resume=resume,
+        artifact_cache=artifact_cache,
+        planner=planner,
+        execution_limits=execution_limits,
         custom_configs=map_custom_configs(custom_configs=custom_configs),
     )
 
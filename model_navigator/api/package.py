@@ -19,10 +19,15 @@ from typing import Dict, List, Optional, Tuple, Type, Union
 
 from model_navigator.api.config import (
     SOURCE_FORMATS,
+    ArtifactCacheConfig,
+    CorrectnessTolerance,
     CustomConfig,
     DeviceKind,
+    ExecutionLimitsConfig,
     Format,
     OptimizationProfile,
+    ParallelConfig,
+    PlannerConfig,
     SizedDataLoader,
     VerifyFunction,
     map_custom_configs,
@@ -143,6 +148,12 @@ def optimize(
     verbose: bool = False,
     debug: bool = False,
     verify_func: Optional[VerifyFunction] = None,
+    correctness_tolerances: Optional[Dict[str, CorrectnessTolerance]] = None,
+    parallel_config: Optional[ParallelConfig] = None,
+    resume: bool = False,
+    artifact_cache: Optional[ArtifactCacheConfig] = None,
+    planner: Optional[PlannerConfig] = None,
+    execution_limits: Optional[ExecutionLimitsConfig] = None,
     custom_configs: Optional[List[CustomConfig]] = None,
     defaults: bool = True,
     fail_on_empty: bool = True,
@@ -158,6 +169,18 @@ def optimize(
         verbose: If True enable verbose logging. Defaults to False.
         debug: If True print debugging logs. Defaults to False.
         verify_func: Function used for verifying generated models. Defaults to None.
+        correctness_tolerances: Accepted errors of the outputs by output name. Correctness fails on the first
+            sample exceeding them and the runner is not profiled. Defaults to tolerances from the package.
+        parallel_config: Limits of executing independent steps concurrently in worker processes.
+            Defaults to executing steps one after another.
+        resume: If True, reuse outputs of the steps completed in the workspace by the previous, interrupted
+            execution started with resume enabled and execute only the remaining ones. Defaults to False.
+        artifact_cache: Location and size limit of the local cache of exported and converted models reused
+            across optimize calls. Defaults to no cache.
+        planner: Estimation of the optimize duration from timings of previous runs, with dry run and pruning
+            of units to the time budget. Defaults to no planning.
+        execution_limits: Timeout, memory limit and CPU affinity of each process executing exports, conversions
+            and evaluation of models. Defaults to no limits.
         custom_configs: Custom formats configuration. Defaults to None.
         defaults: reset configuration of custom configs to defaults
         fail_on_empty: Fail optimization when empty (no model or base exported model) package provided
@@ -195,6 +218,12 @@ def optimize(
         verbose=verbose,
         debug=debug,
         verify_func=verify_func,
+        correctness_tolerances=correctness_tolerances,
+        parallel_config=parallel_config,
+        resume=resume,
+        artifact_cache=artifact_cache,
+        planner=planner,
+        execution_limits=execution_limits,
         custom_configs=custom_configs,
         defaults=defaults,
         target_device=target_device,
@@ -393,6 +422,12 @@ def _update_config(
     verbose: bool = False,
     debug: bool = False,
     verify_func: Optional[VerifyFunction] = None,
+    correctness_tolerances: Optional[Dict[str, CorrectnessTolerance]] = None,
+    parallel_config: Optional[ParallelConfig] = None,
+    resume: bool = False,
+    artifact_cache: Optional[ArtifactCacheConfig] = None,
+    planner: Optional[PlannerConfig] = None,
+    execution_limits: Optional[ExecutionLimitsConfig] = None,
     custom_configs: Optional[List[CustomConfig]] = None,
     defaults: bool = True,
     target_device: DeviceKind = DeviceKind.CUDA,
@@ -419,7 +454,7 @@ def _update_config(
 
     # Reset runner names
     if runners is None:
-        runners = tuple(runner_registry.keys())
+        runners = tuple(name for name, runner_cls in runner_registry.items() if runner_cls.is_default())
 
     config.runner_names = enums.parse(runners, lambda runner: runner if isinstance(runner, str) else runner.name())
 
@@ -427,6 +462,25 @@ def _update_config(
     if verify_func is not None:
         config.verify_func = verify_func
 
+    # Update correctness tolerances
+    if correctness_tolerances is not None:
+        config.correctness_tolerances = correctness_tolerances
+
+    # Reset parallel execution limits
+    config.parallel_config = parallel_config
+
+    # Reset resuming of the previous execution
+    config.resume = resume
+
+    # Reset artifact cache
+    config.artifact_cache = artifact_cache
+
+    # Reset planning of the optimize
+    config.planner = planner
+
+    # Reset limits of the processes
+    config.execution_limits = execution_limits
+
     # Reset custom config to defaults
     if defaults:
         for custom_config in config.custom_configs.values():
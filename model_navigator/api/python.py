@@ -13,14 +13,19 @@
 # limitations under the License.
 """Python optimize API."""
 import pathlib
-from typing import Callable, Mapping, Optional, Sequence, Tuple, Type, Union
+from typing import Callable, Dict, Mapping, Optional, Sequence, Tuple, Type, Union
 
 from model_navigator.api.config import (
     DEFAULT_NONE_FRAMEWORK_TARGET_FORMATS,
+    ArtifactCacheConfig,
+    CorrectnessTolerance,
     CustomConfig,
+    DataLoader,
     DeviceKind,
+    ExecutionLimitsConfig,
     OptimizationProfile,
-    SizedDataLoader,
+    ParallelConfig,
+    PlannerConfig,
     VerifyFunction,
     map_custom_configs,
 )
@@ -43,7 +48,7 @@ from model_navigator.utils import enums
 
 def optimize(
     model: Callable,
-    dataloader: SizedDataLoader,
+    dataloader: DataLoader,
     sample_count: int = DEFAULT_SAMPLE_COUNT,
     batching: Optional[bool] = True,
     target_device: Optional[DeviceKind] = DeviceKind.CPU,
@@ -53,6 +58,13 @@ def optimize(
     verbose: bool = False,
     debug: bool = False,
     verify_func: Optional[VerifyFunction] = None,
+    correctness_tolerances: Optional[Dict[str, CorrectnessTolerance]] = None,
+    max_samples: Optional[int] = None,
+    parallel_config: Optional[ParallelConfig] = None,
+    resume: bool = False,
+    artifact_cache: Optional[ArtifactCacheConfig] = None,
+    planner: Optional[PlannerConfig] = None,
+    execution_limits: Optional[ExecutionLimitsConfig] = None,
     custom_configs: Optional[Sequence[CustomConfig]] = None,
 ) -> Package:
     """Entrypoint for Python model optimize.
@@ -61,7 +73,8 @@ def optimize(
 
     Args:
         model: Model inference function
-        dataloader: Sized iterable with data that will be feed to the model
+        dataloader: Iterable with data that will be feed to the model. Dataloaders without length
+            are read up to `max_samples` samples.
         sample_count: Limits how many samples will be used from dataloader
         batching: Enable or disable batching on first (index 0) dimension of the model
         target_device: Target device for optimize process, default is CPU
@@ -71,6 +84,20 @@ def optimize(
         verbose: Enable verbose logging
         debug: Enable debug logging from commands
         verify_func: Function for additional model verification
+        correctness_tolerances: Accepted errors of the outputs by output name. Correctness fails on the first
+            sample exceeding them and the runner is not profiled.
+        max_samples: Limits how many samples are read from the dataloader. Defaults to all samples
+            of sized dataloaders and 1000 samples of dataloaders without length.
+        parallel_config: Limits of executing independent steps concurrently in worker processes.
+            Defaults to executing steps one after another.
+        resume: If True, reuse outputs of the steps completed in the workspace by the previous, interrupted
+            execution started with resume enabled and execute only the remaining ones. Defaults to False.
+        artifact_cache: Location and size limit of the local cache of exported and converted models reused
+            across optimize calls. Defaults to no cache.
+        planner: Estimation of the optimize duration from timings of previous runs, with dry run and pruning
+            of units to the time budget. Defaults to no planning.
+        execution_limits: Timeout, memory limit and CPU affinity of each process executing exports, conversions
+            and evaluation of models. Defaults to no limits.
         custom_configs: Sequence of CustomConfigs used to control produced artifacts
 
     Returns:
@@ -100,12 +127,19 @@ def optimize(
         target_formats=target_formats,
         target_device=target_device,
         sample_count=sample_count,
+        max_samples=max_samples,
         batch_dim=0 if batching else None,
         runner_names=runner_names,
         optimization_profile=optimization_profile,
         verbose=verbose,
         debug=debug,
         verify_func=verify_func,
+        correctness_tolerances=correctness_tolerances,
+        parallel_config=parallel_config,
+        resume=resume,
+        artifact_cache=artifact_cache,
+        planner=planner,
+        execution_limits=execution_limits,
         custom_configs=map_custom_configs(custom_configs=custom_configs),
     )
 
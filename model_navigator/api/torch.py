@@ -13,17 +13,22 @@
 # limitations under the License.
 """Torch optimize API."""
 import pathlib
-from typing import Mapping, Optional, Sequence, Tuple, Type, Union
+from typing import Dict, Mapping, Optional, Sequence, Tuple, Type, Union
 
 import torch  # pytype: disable=import-error
 
 from model_navigator.api.config import (
     DEFAULT_TORCH_TARGET_FORMATS,
+    ArtifactCacheConfig,
+    CorrectnessTolerance,
     CustomConfig,
+    DataLoader,
     DeviceKind,
+    ExecutionLimitsConfig,
     Format,
     OptimizationProfile,
-    SizedDataLoader,
+    ParallelConfig,
+    PlannerConfig,
     VerifyFunction,
     map_custom_configs,
 )
@@ -51,7 +56,7 @@ from model_navigator.utils import enums
 
 def optimize(
     model: torch.nn.Module,
-    dataloader: SizedDataLoader,
+    dataloader: DataLoader,
     sample_count: Optional[int] = DEFAULT_SAMPLE_COUNT,
     batching: Optional[bool] = True,
     input_names: Optional[Tuple[str, ...]] = None,
@@ -64,6 +69,13 @@ def optimize(
     verbose: Optional[bool] = False,
     debug: Optional[bool] = False,
     verify_func: Optional[VerifyFunction] = None,
+    correctness_tolerances: Optional[Dict[str, CorrectnessTolerance]] = None,
+    max_samples: Optional[int] = None,
+    parallel_config: Optional[ParallelConfig] = None,
+    resume: bool = False,
+    artifact_cache: Optional[ArtifactCacheConfig] = None,
+    planner: Optional[PlannerConfig] = None,
+    execution_limits: Optional[ExecutionLimitsConfig] = None,
     custom_configs: Optional[Sequence[CustomConfig]] = None,
 ) -> Package:
     """Entrypoint for Torch optimize.
@@ -72,7 +84,8 @@ def optimize(
 
     Args:
         model: PyTorch model object
-        dataloader: Sized iterable with data that will be feed to the model
+        dataloader: Iterable with data that will be feed to the model. Dataloaders without length
+            are read up to `max_samples` samples.
         sample_count: Limits how many samples will be used from dataloader
         batching: Enable or disable batching on first (index 0) dimension of the model
         input_names: Model input names
@@ -85,6 +98,20 @@ def optimize(
         verbose: Enable verbose logging
         debug: Enable debug logging from commands
         verify_func: Function for additional model verification
+        correctness_tolerances: Accepted errors of the outputs by output name. Correctness fails on the first
+            sample exceeding them and the runner is not profiled.
+        max_samples: Limits how many samples are read from the dataloader. Defaults to all samples
+            of sized dataloaders and 1000 samples of dataloaders without length.
+        parallel_config: Limits of executing independent steps concurrently in worker processes.
+            Defaults to executing steps one after another.
+        resume: If True, reuse outputs of the steps completed in the workspace by the previous, interrupted
+            execution started with resume enabled and execute only the remaining ones. Defaults to False.
+        artifact_cache: Location and size limit of the local cache of exported and converted models reused
+            across optimize calls. Defaults to no cache.
+        planner: Estimation of the optimize duration from timings of previous runs, with dry run and pruning
+            of units to the time budget. Defaults to no planning.
+        execution_limits: Timeout, memory limit and CPU affinity of each process executing exports, conversions
+            and evaluation of models. Defaults to no limits.
         custom_configs: Sequence of CustomConfigs used to control produced artifacts
 
     Returns:
@@ -123,6 +150,7 @@ def optimize(
         dataloader=dataloader,
         target_formats=target_formats,
         sample_count=sample_count,
+        max_samples=max_samples,
         _input_names=input_names,
         _output_names=output_names,
         target_device=target_device,
@@ -133,6 +161,12 @@ def optimize(
         verbose=verbose,
         debug=debug,
         verify_func=verify_func,
+        correctness_tolerances=correctness_tolerances,
+        parallel_config=parallel_config,
+        resume=resume,
+        artifact_cache=artifact_cache,
+        planner=planner,
+        execution_limits=execution_limits,
         custom_configs=map_custom_configs(custom_configs=custom_configs),
     )
 
@@ -14,17 +14,39 @@
 # noqa: D104
 """Public utilities for the Model Navigator API."""
 
-from typing import Callable
+import collections
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple, Union
 
-from model_navigator.api.config import SizedDataLoader
+from model_navigator.api.config import PrefetchMode, SizedDataLoader
+
+_PROCESS_UNPACK_FN = None
+
+
+def _initialize_process_unpack_fn(unpack_fn: Callable) -> None:
+    global _PROCESS_UNPACK_FN
+    _PROCESS_UNPACK_FN = unpack_fn
+
+
+def _process_unpack(sample: Any) -> Any:
+    return _PROCESS_UNPACK_FN(sample)  # pytype: disable=not-callable
 
 
 class UnpackedDataloader:
     """A wrapper around a SizedDataLoader that applies a function to each sample.
 
+    The function can be applied in parallel by a pool of `workers` threads or processes.
+    Samples are returned in the dataloader order and at most `look_ahead` samples are unpacked ahead
+    of the consumer.
+
     Args:
         dataloader: A SizedDataLoader.
         unpack_fn: A function that takes a sample and returns a new sample.
+        workers: Number of workers applying the unpack_fn. 1 applies the function in the consuming thread.
+        mode: Apply the unpack_fn in a pool of threads or processes. Processes are forked when supported,
+            otherwise the unpack_fn and samples have to be picklable.
+        look_ahead: Maximal number of samples unpacked ahead of the consumer. Defaults to twice the number of workers.
 
     Returns:
         An iterator over the samples in the dataloader with the unpack_fn applied.
@@ -33,12 +55,27 @@ class UnpackedDataloader:
         >>> dataloader = [1, 2, 3]
         >>> unpacked_dataloader = UnpackedDataloader(dataloader, lambda x: x + 1)
         >>> # unpacked_dataloader is now [2, 3, 4]
+        >>> unpacked_dataloader = UnpackedDataloader(dataloader, lambda x: x + 1, workers=4)
+        >>> # unpacked_dataloader is still [2, 3, 4], with samples unpacked by 4 threads
     """
 
-    def __init__(self, dataloader: SizedDataLoader, unpack_fn: Callable):
+    def __init__(
+        self,
+        dataloader: SizedDataLoader,
+        unpack_fn: Callable,
+        workers: int = 1,
+        mode: Union[str, PrefetchMode] = PrefetchMode.THREAD,
+        look_ahead: Optional[int] = None,
+    ):
         """Initialize the UnpackedDataloader."""
+        if workers < 1:
+            raise ValueError(f"Number of workers must be positive, got: {workers}")
+
         self._dataloader = dataloader
         self._unpack_fn = unpack_fn
+        self._workers = workers
+        self._mode = PrefetchMode(mode)
+        self._look_ahead = max(look_ahead if look_ahead is not None else 2 * workers, 1)
 
     def __len__(self):
         """Return the number of samples in the dataloader."""
@@ -46,5 +83,37 @@ class UnpackedDataloader:
 
     def __iter__(self):
         """Return an iterator over the samples in the dataloader with the unpack_fn applied."""
-        for sample in self._dataloader:
-            yield self._unpack_fn(sample)
+        if self._workers == 1:
+            for sample in self._dataloader:
+                yield self._unpack_fn(sample)
+            return
+
+        executor, unpack_fn = self._create_executor()
+        pending = collections.deque()
+        try:
+            for sample in self._dataloader:
+                pending.append(executor.submit(unpack_fn, sample))
+                if len(pending) >= self._look_ahead:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # `cancel_futures` of `Executor.shutdown` is not available in Python 3.8
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def _create_executor(self) -> Tuple[Executor, Callable]:
+        if self._mode == PrefetchMode.PROCESS:
+            start_methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("fork" if "fork" in start_methods else "spawn")
+            executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=context,
+                initializer=_initialize_process_unpack_fn,
+                initargs=(self._unpack_fn,),
+            )
+            return executor, _process_unpack
+
+        return ThreadPoolExecutor(max_workers=self._workers), self._unpack_fn
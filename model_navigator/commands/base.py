@@ -34,12 +34,54 @@ class CommandStatus(str, Enum):
     SKIPPED = "SKIPPED"
 
 
+@dataclass
+class CommandMetrics(DataObject):
+    """Resources used during command execution.
+
+    Args:
+        start_time: Time when command started in seconds since the epoch
+        wall_time: Duration of the command in seconds
+        cpu_time: User and system CPU time of the process and its child processes in seconds
+        peak_rss: Peak resident memory of the process and its child processes in bytes
+        disk_bytes_written: Bytes written to the storage by the process and its child processes,
+            None when not supported by the system
+        pid: Identifier of the process which executed the command
+    """
+
+    start_time: float
+    wall_time: float
+    cpu_time: float
+    peak_rss: int
+    disk_bytes_written: Optional[int] = None
+    pid: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, data_dict: Dict) -> "CommandMetrics":
+        """Create CommandMetrics from the dictionary.
+
+        Args:
+            data_dict (Dict): dictionary with command metrics data.
+
+        Returns:
+            CommandMetrics
+        """
+        return cls(
+            start_time=data_dict["start_time"],
+            wall_time=data_dict["wall_time"],
+            cpu_time=data_dict["cpu_time"],
+            peak_rss=data_dict["peak_rss"],
+            disk_bytes_written=data_dict.get("disk_bytes_written"),
+            pid=data_dict.get("pid"),
+        )
+
+
 @dataclass
 class CommandOutput(DataObject):
     """Command output dataclass structure."""
 
     status: CommandStatus
     output: Optional[Dict[str, Any]] = None
+    metrics: Optional[CommandMetrics] = None
 
     @classmethod
     def from_dict(cls, data_dict: Dict) -> "CommandOutput":
@@ -51,7 +93,12 @@ class CommandOutput(DataObject):
         Returns:
             CommandOutput
         """
-        return cls(status=CommandStatus(data_dict["status"]), output=data_dict["output"])
+        metrics = data_dict.get("metrics")
+        return cls(
+            status=CommandStatus(data_dict["status"]),
+            output=data_dict["output"],
+            metrics=CommandMetrics.from_dict(metrics) if metrics else None,
+        )
 
 
 class CommandMeta(abc.ABCMeta):  # noqa: B024
@@ -71,12 +118,26 @@ class Command(metaclass=CommandMeta):
     """Base class for command definition."""
 
     _is_required: bool = False
+    _is_exclusive: bool = False
+    _is_cacheable: bool = False
+    _is_isolated: bool = False
     _requires: Optional[List[str]] = None
 
-    def __init_subclass__(cls, is_required: bool = False, requires: Optional[List[str]] = None, **kwargs):
+    def __init_subclass__(
+        cls,
+        is_required: bool = False,
+        is_exclusive: bool = False,
+        is_cacheable: bool = False,
+        is_isolated: bool = False,
+        requires: Optional[List[str]] = None,
+        **kwargs,
+    ):
         """Initialization of a command subclass."""
         super().__init_subclass__(**kwargs)
         cls._is_required = is_required
+        cls._is_exclusive = is_exclusive
+        cls._is_cacheable = is_cacheable
+        cls._is_isolated = is_isolated
         cls._requires = requires if requires is not None else []
 
     @classmethod
@@ -88,6 +149,33 @@ class Command(metaclass=CommandMeta):
         """
         return cls._is_required
 
+    @classmethod
+    def is_exclusive(cls):
+        """Indicates if Command has to be executed when no other command is running.
+
+        Returns:
+            True if exclusive, False otherwise
+        """
+        return cls._is_exclusive
+
+    @classmethod
+    def is_cacheable(cls):
+        """Indicates if model produced by Command can be reused from the artifact cache.
+
+        Returns:
+            True if cacheable, False otherwise
+        """
+        return cls._is_cacheable
+
+    @classmethod
+    def is_isolated(cls):
+        """Indicates if Command executes models which are not in the source format only in subprocesses.
+
+        Returns:
+            True if isolated, False otherwise
+        """
+        return cls._is_isolated
+
     @classmethod
     def requires(cls):
         """Return required commands to execute current command.
@@ -37,7 +37,7 @@ from model_navigator.utils import devices
 from model_navigator.utils.common import parse_kwargs_to_cmd
 
 
-class ConvertONNX2TRT(Convert2TensorRTWithMaxBatchSizeSearch):
+class ConvertONNX2TRT(Convert2TensorRTWithMaxBatchSizeSearch, is_exclusive=True, is_cacheable=True):
     """Command that converts ONNX checkpoint to TensorRT model plan."""
 
     def _run(
@@ -26,7 +26,7 @@ from model_navigator.utils import devices
 from model_navigator.utils.common import parse_kwargs_to_cmd
 
 
-class ConvertSavedModel2ONNX(Command):
+class ConvertSavedModel2ONNX(Command, is_cacheable=True, is_isolated=True):
     """Convert SavedModel to ONNX."""
 
     def _run(
@@ -81,7 +81,7 @@ class ConvertSavedModel2ONNX(Command):
         return CommandOutput(status=CommandStatus.OK)
 
 
-class ConvertSavedModel2TFTRT(Convert2TensorRTWithMaxBatchSizeSearch):
+class ConvertSavedModel2TFTRT(Convert2TensorRTWithMaxBatchSizeSearch, is_exclusive=True, is_cacheable=True):
     """Convert SavedModel to Tensorflow-TensorRT."""
 
     def _run(
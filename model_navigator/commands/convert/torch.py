@@ -29,7 +29,7 @@ from model_navigator.utils import devices
 from model_navigator.utils.common import parse_kwargs_to_cmd
 
 
-class ConvertTorchScript2ONNX(Command):
+class ConvertTorchScript2ONNX(Command, is_cacheable=True, is_isolated=True):
     """Convert TorchScript to ONNX."""
 
     def _run(
@@ -94,7 +94,7 @@ class ConvertTorchScript2ONNX(Command):
         return CommandOutput(status=CommandStatus.OK)
 
 
-class ConvertTorchScript2TorchTensorRT(Convert2TensorRTWithMaxBatchSizeSearch):
+class ConvertTorchScript2TorchTensorRT(Convert2TensorRTWithMaxBatchSizeSearch, is_exclusive=True, is_cacheable=True):
     """Convert TorchScript to Torch-TensorRT."""
 
     def _run(
@@ -14,12 +14,15 @@
 """Correctness command and it's results."""
 
 import json
+import math
 import pathlib
 import tempfile
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, Dict, List, Optional, Sequence, Type
 
-from model_navigator.api.config import Format
+import numpy as np
+
+from model_navigator.api.config import CorrectnessTolerance, CustomConfig, Format, TensorRTProfile
 from model_navigator.commands.base import Command, CommandOutput, CommandStatus
 from model_navigator.commands.execution_context import ExecutionContext
 from model_navigator.core.logger import LOGGER
@@ -80,7 +83,140 @@ class TolerancePerOutputName(Dict[str, Tolerance]):
         return tol_per_out
 
 
-class Correctness(Command):
+ERROR_HISTOGRAM_EDGES = (0.0, *(10.0**exponent for exponent in range(-9, 2)), math.inf)
+
+
+@dataclass
+class ErrorHistogram(DataObject):
+    """Number of output elements with absolute and relative errors in bins.
+
+    Bins are bounded by `ERROR_HISTOGRAM_EDGES`: 0, powers of 10 from 1e-9 to 10 and inf.
+    """
+
+    abs_counts: List[int]
+    rel_counts: List[int]
+
+    @classmethod
+    def empty(cls) -> "ErrorHistogram":
+        """Create histogram without any elements."""
+        bins_count = len(ERROR_HISTOGRAM_EDGES) - 1
+        return cls(abs_counts=[0] * bins_count, rel_counts=[0] * bins_count)
+
+    def update(self, absdiff: np.ndarray, reldiff: np.ndarray) -> None:
+        """Add errors of the output elements to the histogram.
+
+        Args:
+            absdiff: Absolute errors
+            reldiff: Relative errors
+        """
+        abs_counts, _ = np.histogram(absdiff, bins=ERROR_HISTOGRAM_EDGES)
+        rel_counts, _ = np.histogram(reldiff, bins=ERROR_HISTOGRAM_EDGES)
+        self.abs_counts = [int(a + b) for a, b in zip(self.abs_counts, abs_counts)]
+        self.rel_counts = [int(a + b) for a, b in zip(self.rel_counts, rel_counts)]
+
+    @classmethod
+    def from_dict(cls, histogram_dict: Dict) -> "ErrorHistogram":
+        """Instantiate ErrorHistogram from a dictionary.
+
+        Args:
+            histogram_dict (Dict): Dictionary with histogram counts.
+
+        Returns:
+            ErrorHistogram
+        """
+        return cls(
+            abs_counts=histogram_dict["abs_counts"],
+            rel_counts=histogram_dict["rel_counts"],
+        )
+
+
+class ErrorHistogramPerOutputName(Dict[str, ErrorHistogram]):
+    """Dictionary where key is output name and value is ErrorHistogram."""
+
+    def to_json(self) -> List[Dict]:
+        """Parse ErrorHistogramPerOutputName to a list of dictionaries.
+
+        Returns:
+            List[Dict]
+        """
+        return [{"output_name": name, **histogram.to_dict(parse=True)} for name, histogram in self.items()]
+
+    @classmethod
+    def from_json(cls, data: List[Dict]) -> "ErrorHistogramPerOutputName":
+        """Intantiate ErrorHistogramPerOutputName from a list of ditionaries.
+
+        Args:
+            data (List): ErrorHistogramPerOutputName data.
+
+        Returns:
+            ErrorHistogramPerOutputName
+        """
+        histogram_per_out = cls()
+        for histogram in data:
+            histogram_per_out[histogram["output_name"]] = ErrorHistogram.from_dict(histogram)
+        return histogram_per_out
+
+
+class ErrorAccumulator:
+    """Accumulate maximal errors and errors histograms of the outputs sample by sample."""
+
+    def __init__(self, output_names: Sequence[str]) -> None:
+        """Initialize object.
+
+        Args:
+            output_names: Names of compared outputs
+        """
+        self.per_output_tolerance = TolerancePerOutputName({name: Tolerance(0.0, 0.0) for name in output_names})
+        self.per_output_error_histogram = ErrorHistogramPerOutputName(
+            {name: ErrorHistogram.empty() for name in output_names}
+        )
+
+    def update(self, name: str, original: np.ndarray, computed: np.ndarray) -> Tolerance:
+        """Add errors between original and computed output of a single sample.
+
+        Args:
+            name: Output name
+            original: Output of the source model
+            computed: Output of the evaluated model
+
+        Returns:
+            Maximal absolute and relative error of the sample
+        """
+        absdiff = np.abs(original - computed)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            reldiff = absdiff / np.abs(computed)
+
+        sample_tolerance = Tolerance(
+            atol=float(np.amax(absdiff)) if absdiff.size else 0.0,
+            rtol=float(np.amax(reldiff)) if reldiff.size else 0.0,
+        )
+        tolerance = self.per_output_tolerance[name]
+        if sample_tolerance.atol > tolerance.atol:
+            tolerance.atol = sample_tolerance.atol
+        if sample_tolerance.rtol > tolerance.rtol:
+            tolerance.rtol = sample_tolerance.rtol
+        self.per_output_error_histogram[name].update(absdiff, reldiff)
+
+        return sample_tolerance
+
+
+def count_rejected_elements(original: np.ndarray, computed: np.ndarray, tolerance: CorrectnessTolerance) -> int:
+    """Count output elements with errors exceeding the tolerance.
+
+    Args:
+        original: Output of the source model
+        computed: Output of the evaluated model
+        tolerance: Accepted absolute and relative error
+
+    Returns:
+        Number of elements for which `|original - computed| > atol + rtol * |original|`
+    """
+    absdiff = np.abs(original - computed)
+    accepted = absdiff <= tolerance.atol + tolerance.rtol * np.abs(original)
+    return int(accepted.size - np.count_nonzero(accepted))
+
+
+class Correctness(Command, is_isolated=True):
     """Correctness Command."""
 
     def _run(
@@ -94,6 +230,9 @@ class Correctness(Command):
         path: pathlib.Path,
         verbose: bool,
         model: Optional[Any] = None,
+        correctness_tolerances: Optional[Dict[str, CorrectnessTolerance]] = None,
+        custom_configs: Optional[Dict[str, CustomConfig]] = None,
+        dataloader_trt_profile: Optional[TensorRTProfile] = None,
     ) -> CommandOutput:
         """Run correcntess command.
 
@@ -108,9 +247,15 @@ class Correctness(Command):
             verbose (bool): If True verbose logging.
             model (Optional[Any], optional): Model if correcness should be run on a source model.
                 Defaults to None.
+            correctness_tolerances (Optional[Dict[str, CorrectnessTolerance]], optional): Accepted errors
+                by output name. Command fails on the first sample exceeding them. Defaults to None.
+            custom_configs (Optional[Dict[str, CustomConfig]], optional): Custom configurations
+                used to derive the runner options. Defaults to None.
+            dataloader_trt_profile (Optional[TensorRTProfile], optional): Shapes of the dataloader samples
+                used to derive the runner options. Defaults to None.
 
         Returns:
-            CommandOutput: Status OK and TolerancePerOutputName of the model with runner.
+            CommandOutput: Status OK, TolerancePerOutputName and ErrorHistogramPerOutputName of the model with runner.
         """
         per_output_tolerance = None
         LOGGER.info(f"Correctness test for: {format} {runner_cls} started.")
@@ -123,8 +268,8 @@ class Correctness(Command):
 
         with ExecutionContext(
             workspace=workspace,
-            script_path=model_dir / "reproduce_correctness.py",
-            cmd_path=model_dir / "reproduce_correctness.sh",
+            script_path=model_dir / f"reproduce_correctness-{runner_cls.name()}.py",
+            cmd_path=model_dir / f"reproduce_correctness-{runner_cls.name()}.sh",
             verbose=verbose,
         ) as context, tempfile.NamedTemporaryFile() as temp_file:
             kwargs = {
@@ -135,6 +280,16 @@ class Correctness(Command):
                 "input_metadata": input_metadata.to_json(),
                 "output_metadata": output_metadata.to_json(),
             }
+            if correctness_tolerances:
+                kwargs["correctness_tolerances"] = [
+                    {"output_name": name, **tolerance.to_dict(parse=True)}
+                    for name, tolerance in correctness_tolerances.items()
+                ]
+            runner_options = runner_cls.get_runner_options(
+                custom_configs=custom_configs, dataloader_trt_profile=dataloader_trt_profile
+            )
+            if runner_options:
+                kwargs["runner_options"] = runner_options
 
             from model_navigator.commands.correctness import correctness_script
 
@@ -146,6 +301,24 @@ class Correctness(Command):
                 kwargs["model_path"] = path
                 args = parse_kwargs_to_cmd(kwargs)
                 context.execute_external_runtime_script(correctness_script.__file__, args)
-            per_output_tolerance = TolerancePerOutputName.from_json(json.load(temp_file))
+            results = json.load(temp_file)
+            exceeded_tolerance = results.get("exceeded_tolerance")
+            if exceeded_tolerance is not None:
+                LOGGER.error(
+                    f"Correctness test for: {format} {runner_cls} failed. "
+                    f"Output `{exceeded_tolerance['output_name']}` of sample {exceeded_tolerance['sample_id']} "
+                    f"has {exceeded_tolerance['rejected_count']} elements exceeding "
+                    f"atol={exceeded_tolerance['atol']}, rtol={exceeded_tolerance['rtol']}."
+                )
+                return CommandOutput(status=CommandStatus.FAIL)
+
+            per_output_tolerance = TolerancePerOutputName.from_json(results["per_output_tolerance"])
+            per_output_error_histogram = ErrorHistogramPerOutputName.from_json(results["per_output_error_histogram"])
 
-        return CommandOutput(status=CommandStatus.OK, output={"per_output_tolerance": per_output_tolerance})
+        return CommandOutput(
+            status=CommandStatus.OK,
+            output={
+                "per_output_tolerance": per_output_tolerance,
+                "per_output_error_histogram": per_output_error_histogram,
+            },
+        )
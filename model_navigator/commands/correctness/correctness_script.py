@@ -16,16 +16,16 @@
 import json
 import pathlib
 import sys
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import fire
-import numpy as np
 
-from model_navigator.commands.correctness.correctness import Tolerance, TolerancePerOutputName
+from model_navigator.api.config import CorrectnessTolerance
+from model_navigator.commands.correctness.correctness import ErrorAccumulator, count_rejected_elements
 from model_navigator.core.logger import LOGGER
-from model_navigator.core.tensor import TensorMetadata
+from model_navigator.core.tensor import TensorMetadata, find_non_finite_values
 from model_navigator.runners.registry import get_runner
-from model_navigator.utils.dataloader import load_samples
+from model_navigator.utils.dataloader import iter_samples
 
 
 def get_model() -> object:
@@ -47,6 +47,8 @@ def correctness(
     output_metadata: List,
     navigator_workspace: Optional[str] = None,
     model_path: Optional[str] = None,
+    correctness_tolerances: Optional[List] = None,
+    runner_options: Optional[Dict] = None,
 ) -> None:
     """Run correcntess tests.
 
@@ -60,13 +62,16 @@ def correctness(
             When None use current workdir. Defaults to None.
         model_path (Optional[str], optional): Path to the model.
             When None use `get_model()` to load the model. Defaults to None.
+        correctness_tolerances (Optional[List], optional): Accepted errors by output name.
+            Testing stops on the first sample exceeding them. Defaults to None.
+        runner_options (Optional[Dict], optional): Keyword arguments passed to the runner. Defaults to None.
     """
     if not navigator_workspace:
         navigator_workspace = pathlib.Path.cwd()
     navigator_workspace = pathlib.Path(navigator_workspace)
 
-    correctness_samples = load_samples("correctness_samples", navigator_workspace, batch_dim)
-    correctness_samples_output = load_samples("correctness_samples_output", navigator_workspace, batch_dim)
+    correctness_samples = iter_samples("correctness_samples", navigator_workspace, batch_dim)
+    correctness_samples_output = iter_samples("correctness_samples_output", navigator_workspace, batch_dim)
 
     if model_path:
         model = navigator_workspace / model_path
@@ -79,11 +84,18 @@ def correctness(
         model=model,
         input_metadata=input_metadata,
         output_metadata=output_metadata,
+        **(runner_options or {}),
     )  # pytype: disable=not-instantiable
 
-    per_output_tolerance = TolerancePerOutputName({name: Tolerance(0.0, 0.0) for name in output_metadata})
+    tolerances = {
+        tolerance["output_name"]: CorrectnessTolerance.from_dict(tolerance)
+        for tolerance in correctness_tolerances or []
+    }
+    exceeded_tolerance = None
+
+    errors = ErrorAccumulator(output_metadata)
     with runner:
-        for sample, original_output in zip(correctness_samples, correctness_samples_output):
+        for sample_id, (sample, original_output) in enumerate(zip(correctness_samples, correctness_samples_output)):
             comp_output = runner.infer(sample)
 
             is_len_valid = len(original_output) == len(comp_output)
@@ -96,30 +108,49 @@ def correctness(
                 sys.exit(1)
 
             for name in output_metadata:
-                if any(np.isnan(comp_output[name]).flatten()):
-                    LOGGER.error(f"Comparison output {name} contains NaN")
+                non_finite_values = find_non_finite_values(comp_output[name])
+                if non_finite_values is not None and non_finite_values.nan_count:
+                    LOGGER.error(
+                        f"Comparison output {name} contains NaN ({non_finite_values.nan_count} values, "
+                        f"first at index {non_finite_values.first_nan_index})"
+                    )
                     sys.exit(1)
 
-                if any(np.isinf(comp_output[name]).flatten()):
-                    LOGGER.error(f"Comparison output {name} contains inf")
+                if non_finite_values is not None and non_finite_values.inf_count:
+                    LOGGER.error(
+                        f"Comparison output {name} contains inf ({non_finite_values.inf_count} values, "
+                        f"first at index {non_finite_values.first_inf_index})"
+                    )
                     sys.exit(1)
 
-                out0, out1 = original_output[name], comp_output[name]
-                absdiff = np.abs(out0 - out1)
-                absout1 = np.abs(out1)
+                errors.update(name, original_output[name], comp_output[name])
+
+                tolerance = tolerances.get(name)
+                if tolerance is None:
+                    continue
 
-                reldiff = absdiff / absout1
-                max_reldiff = np.amax(reldiff)
-                max_absdiff = np.amax(absdiff)
+                rejected_count = count_rejected_elements(original_output[name], comp_output[name], tolerance)
+                if rejected_count and exceeded_tolerance is None:
+                    exceeded_tolerance = {
+                        "output_name": name,
+                        "sample_id": sample_id,
+                        "rejected_count": rejected_count,
+                        **tolerance.to_dict(parse=True),
+                    }
 
-                if max_absdiff > per_output_tolerance[name].atol:
-                    per_output_tolerance[name].atol = float(max_absdiff)
-                if max_reldiff > per_output_tolerance[name].rtol:
-                    per_output_tolerance[name].rtol = float(max_reldiff)
+            if exceeded_tolerance is not None:
+                break
 
     results_path = pathlib.Path(results_path)
     with results_path.open("w") as f:
-        json.dump(per_output_tolerance.to_json(), f)
+        json.dump(
+            {
+                "per_output_tolerance": errors.per_output_tolerance.to_json(),
+                "per_output_error_histogram": errors.per_output_error_histogram.to_json(),
+                "exceeded_tolerance": exceeded_tolerance,
+            },
+            f,
+        )
 
 
 if __name__ == "__main__":
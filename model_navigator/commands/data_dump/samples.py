@@ -12,37 +12,56 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Commands for fetching and dumping model IO."""
+import json
+import os
 import pathlib
-from typing import Any, List, Optional, Tuple
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import numpy as np
 
-from model_navigator.api.config import OptimizationProfile, Sample, SizedDataLoader, TensorRTProfile
+from model_navigator.api.config import DataLoader, Sample
 from model_navigator.commands.base import Command, CommandOutput, CommandStatus
+from model_navigator.core.constants import (
+    DEFAULT_PROFILING_SAMPLES_CANDIDATES,
+    DEFAULT_PROFILING_SAMPLES_COUNT,
+    PROFILING_SAMPLES_WEIGHTS_FILENAME,
+    SAMPLES_INDEX_FILENAME,
+    SAMPLES_STORE_VERSION,
+)
 from model_navigator.core.logger import LOGGER
-from model_navigator.core.tensor import TensorMetadata
+from model_navigator.core.tensor import TensorMetadata, find_non_finite_values
 from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import ModelNavigatorUserInputError
 from model_navigator.frameworks import Framework
+from model_navigator.runners.base import NavigatorRunner
 from model_navigator.runners.utils import get_format_default_runners
-from model_navigator.utils.dataloader import extract_bs1, extract_sample, load_samples
+from model_navigator.utils.dataloader import extract_bs1, get_dataloader_length, get_samples_limit, load_samples
 from model_navigator.utils.format_helpers import FRAMEWORK2BASE_FORMAT
 
 
 def _validate_tensor(tensor: np.ndarray, *, raise_on_error: bool = True):
-    if any(np.isnan(tensor.flatten())):
-        message = "Tensor data contains `NaN` value. Please verify the dataloader and model."
-        if raise_on_error:
-            raise ModelNavigatorUserInputError(message)
-        else:
-            LOGGER.warning(message)
+    non_finite_values = find_non_finite_values(tensor)
+    if non_finite_values is None:
+        return
+
+    messages = []
+    if non_finite_values.nan_count:
+        messages.append(
+            f"Tensor data contains `NaN` value ({non_finite_values.nan_count} values, "
+            f"first at index {non_finite_values.first_nan_index}). Please verify the dataloader and model."
+        )
+    if non_finite_values.inf_count:
+        messages.append(
+            f"Tensor data contains `inf` value ({non_finite_values.inf_count} values, "
+            f"first at index {non_finite_values.first_inf_index}). Please verify the dataloader and model."
+        )
 
-    if any(np.isinf(tensor.flatten())):
-        message = "Tensor data contains `inf` value. Please verify the dataloader and model."
-        if raise_on_error:
-            raise ModelNavigatorUserInputError(message)
-        else:
-            LOGGER.warning(message)
+    if raise_on_error:
+        raise ModelNavigatorUserInputError(" ".join(messages))
+
+    for message in messages:
+        LOGGER.warning(message)
 
 
 def samples_to_npz(
@@ -70,132 +89,468 @@ def samples_to_npz(
         np.savez((path / f"{i}.npz").as_posix(), **squeezed_sample)
 
 
-class FetchInputModelData(Command, is_required=True):
-    """Command for fetching input samples from the dataloader."""
+def samples_to_mmap(
+    samples: Iterable[Sample], path: pathlib.Path, batch_dim: Optional[int], *, raise_on_error: bool = True
+) -> None:
+    """Save samples to the columnar store which can be memory mapped on load.
 
-    def _run(
-        self,
-        workspace: Workspace,
-        framework: Framework,
-        dataloader: SizedDataLoader,
-        sample_count: int,
-        input_metadata: TensorMetadata,
-        batch_dim: Optional[int],
-        seed: int,
-        dataloader_trt_profile: TensorRTProfile,
-        optimization_profile: OptimizationProfile,
-        raise_on_error: Optional[bool] = False,
-    ) -> CommandOutput:
-        """Run the command.
+    Data of each tensor name from all samples is saved in a single `path/{tensor index}.bin` file.
+    Index of the store, with dtype, offsets and shapes of the tensors, is saved in `path/samples.json`.
+    Files are replaced atomically, so stores memory mapped by readers stay valid.
+
+    Args:
+        samples (Iterable[Sample]): Samples to save.
+        path (Path): Output directory.
+        batch_dim (Optional[int]): Batch dimension
+        raise_on_error (bool, optional): If True raise an error when sample is invalid. Defaults to True.
+    """
+    with MmapSamplesWriter(path, batch_dim, raise_on_error=raise_on_error) as writer:
+        for sample in samples:
+            writer.write(sample)
+
+
+class MmapSamplesWriter:
+    """Write samples one at a time to the columnar store which can be memory mapped on load.
+
+    Tensors are appended to temporary files which replace the store files, together with the index,
+    only when the writer is closed without an error.
+    """
 
-        There are three types of samples that are fetched form the dataloader:
-            1) profiling sample - one sample for profiling,
-            2) conversion samples - samples spanning all dimensions sizes from min to max,
-            3) correctness samples - `sample_count` samples for verifying correctness.
+    def __init__(self, path: pathlib.Path, batch_dim: Optional[int], *, raise_on_error: bool = True) -> None:
+        """Initialize object.
 
         Args:
-            workspace: Workspace of current execution.
-            framework: Model framework.
-            dataloader: Dataloader for the model.
-            sample_count: Number of correctness samples to fetch.
-            input_metadata: Input metadata.
-            batch_dim: Batch dimension.
-            seed: Random seed.
-            dataloader_trt_profile: Model TensorRT Profile.
-            optimization_profile: Performance configuration with dataloader override
-            raise_on_error: If True raise an error when one of the samples is invalid. Defaults to False.
+            path: Output directory
+            batch_dim: Batch dimension
+            raise_on_error: If True raise an error when sample is invalid
+        """
+        self._path = path
+        self._batch_dim = batch_dim
+        self._raise_on_error = raise_on_error
+        self._names = None
+        self._files = []
+        self._tensors_index = []
+        self._samples_count = 0
+
+    def __enter__(self) -> "MmapSamplesWriter":
+        """Create the output directory."""
+        self._path.mkdir(parents=True, exist_ok=True)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Save the store or remove temporary files on error."""
+        if exc_type is None:
+            self.close()
+        else:
+            self._discard()
 
-        Returns:
-            CommandOutput: Fetched samples.
+    def write(self, sample: Sample) -> None:
+        """Append sample to the store.
+
+        Args:
+            sample: Sample to save
+        """
+        if self._names is None:
+            self._names = list(sample.keys())
+            for tensor_idx, name in enumerate(self._names):
+                filename = f"{tensor_idx}.bin"
+                self._files.append(open(self._path / f"{filename}.tmp", "wb"))
+                self._tensors_index.append(
+                    {"name": name, "dtype": None, "filename": filename, "offsets": [0], "shapes": []}
+                )
+
+        for name, f, tensor_index in zip(self._names, self._files, self._tensors_index):
+            tensor = np.asarray(sample[name])
+            if self._batch_dim is not None:
+                tensor = tensor.squeeze(self._batch_dim)
+
+            _validate_tensor(tensor, raise_on_error=self._raise_on_error)
+
+            if tensor_index["dtype"] is None:
+                tensor_index["dtype"] = tensor.dtype.str
+            elif tensor.dtype.str != tensor_index["dtype"]:
+                raise ModelNavigatorUserInputError(
+                    f"Tensor `{name}` has different data types in samples: "
+                    f"{np.dtype(tensor_index['dtype'])} and {tensor.dtype}."
+                )
+
+            np.ascontiguousarray(tensor).tofile(f)
+            tensor_index["offsets"].append(tensor_index["offsets"][-1] + tensor.size)
+            tensor_index["shapes"].append(list(tensor.shape))
+
+        self._samples_count += 1
+
+    def close(self) -> None:
+        """Replace the store files with the written data and save the index."""
+        for f, tensor_index in zip(self._files, self._tensors_index):
+            f.close()
+            os.replace(self._path / f"{tensor_index['filename']}.tmp", self._path / tensor_index["filename"])
+        self._files = []
+
+        index = {"version": SAMPLES_STORE_VERSION, "samples_count": self._samples_count, "tensors": self._tensors_index}
+        with open(self._path / f"{SAMPLES_INDEX_FILENAME}.tmp", "w") as f:
+            json.dump(index, f)
+        os.replace(self._path / f"{SAMPLES_INDEX_FILENAME}.tmp", self._path / SAMPLES_INDEX_FILENAME)
+
+    def _discard(self) -> None:
+        for f, tensor_index in zip(self._files, self._tensors_index):
+            f.close()
+            (self._path / f"{tensor_index['filename']}.tmp").unlink(missing_ok=True)
+        self._files = []
+
+
+class SamplesCollector:
+    """Select profiling, conversion and correctness samples in a single pass over the dataloader.
+
+    Conversion samples are the first samples reaching the minimal and the maximal size on each axis
+    and the profiling sample is the last of them reaching a maximal size. Only the samples which can be selected
+    are kept in memory while the dataloader is iterated. Additional profiling samples covering the quantiles
+    of input shapes are selected with `ProfilingSamplesSelector` when `profiling_samples_count` is larger than 1.
+    """
+
+    def __init__(
+        self,
+        batch_dim: Optional[int],
+        correctness_samples_ind: Optional[Set[int]] = None,
+        *,
+        sample_count: int = 0,
+        seed: int = 0,
+        profiling_samples_count: int = DEFAULT_PROFILING_SAMPLES_COUNT,
+    ) -> None:
+        """Initialize object.
+
+        Args:
+            batch_dim: Batch dimension
+            correctness_samples_ind: Indices of samples selected for correctness. When None, `sample_count`
+                correctness samples are selected with reservoir sampling, so the number of samples in the dataloader
+                does not have to be known upfront.
+            sample_count: Number of correctness samples selected with reservoir sampling
+            seed: Random seed for reservoir sampling
+            profiling_samples_count: Number of profiling samples covering the quantiles of input shapes.
+                When 1, only the profiling sample reaching the maximal size is selected.
         """
-        num_samples = len(dataloader)
-        if sample_count > num_samples:
-            LOGGER.warning(
-                f"Requested sample_count ({sample_count}) is larger than "
-                f"the number of available samples ({num_samples}). Using {num_samples} samples."
-            )
-            sample_count = num_samples
-
-        LOGGER.info("Collecting input samples for model.")
-        np.random.seed(seed)
-        correctness_samples_ind = set(np.random.choice(num_samples, size=sample_count, replace=False))
-        profiling_sample, correctness_samples, conversion_samples = self._collect_samples(
-            dataloader,
-            input_metadata,
-            dataloader_trt_profile,
-            framework,
-            batch_dim,
-            correctness_samples_ind,
-            optimization_profile.dataloader,
+        self._batch_dim = batch_dim
+        self._profiling_samples_selector = (
+            ProfilingSamplesSelector(batch_dim, profiling_samples_count) if profiling_samples_count > 1 else None
         )
+        self._correctness_samples_ind = correctness_samples_ind
+        self._correctness_samples = []
+        self._sample_count = sample_count
+        self._random_state = np.random.RandomState(seed)
+        self._reservoir = []
+        self._extremes = {}
+        self._candidates = {}
 
-        sample_data_path = workspace.path / "model_input"
-        sample_data_path.mkdir(parents=True, exist_ok=True)
+    def add(self, idx: int, sample: Sample) -> None:
+        """Process sample from the dataloader.
 
-        output = {}
+        Args:
+            idx: Index of the sample in the dataloader
+            sample: Sample extracted from the dataloader
+        """
+        sample_bs1 = None
+        if self._correctness_samples_ind is None:
+            sample_bs1 = self._add_to_reservoir(idx, sample)
+        elif idx in self._correctness_samples_ind:
+            sample_bs1 = extract_bs1(sample, self._batch_dim)
+            self._correctness_samples.append(sample_bs1)
 
-        LOGGER.info("Saving samples into the workspace.")
-        for samples, dirname, sample_name in [
-            ([profiling_sample], "profiling", "profiling_sample"),
-            (correctness_samples, "correctness", "correctness_samples"),
-            (conversion_samples, "conversion", "conversion_samples"),
-        ]:
-            sample_path = sample_data_path / dirname
-            samples_to_npz(samples, sample_path, batch_dim, raise_on_error=raise_on_error)
-            output[sample_name] = sample_path
+        if self._profiling_samples_selector is not None:
+            self._profiling_samples_selector.add(sample)
 
-        return CommandOutput(status=CommandStatus.OK, output=output)
+        is_candidate = False
+        for name, tensor in sample.items():
+            for axis, dim in enumerate(tensor.shape):
+                min_key, max_key = (name, axis, "min"), (name, axis, "max")
+                if axis == self._batch_dim:
+                    is_min = dim == 1 and min_key not in self._extremes
+                else:
+                    is_min = min_key not in self._extremes or dim < self._extremes[min_key][0]
+                is_max = max_key not in self._extremes or dim > self._extremes[max_key][0]
+
+                if is_min:
+                    self._extremes[min_key] = (dim, idx)
+                if is_max:
+                    self._extremes[max_key] = (dim, idx)
+                is_candidate = is_candidate or is_min or is_max
+
+        if not is_candidate:
+            return
+
+        self._candidates[idx] = sample_bs1 if sample_bs1 is not None else extract_bs1(sample, self._batch_dim)
+        selected_ind = {selected_idx for _, selected_idx in self._extremes.values()}
+        for candidate_idx in list(self._candidates):
+            if candidate_idx not in selected_ind:
+                del self._candidates[candidate_idx]
+
+    def samples(self) -> Tuple[Sample, List[Sample], List[Sample]]:
+        """Return selected samples.
 
-    @staticmethod
-    def _collect_samples(
-        dataloader, input_metadata, trt_profile, framework, batch_dim, correctness_samples_ind, performance_dataloader
-    ):
-        profiling_sample = None
-        correctness_samples = []
-        conversion_samples = []
-        conversion_min_max_sampled = {
-            name: {ax: {"min": False, "max": False} for ax in range(len(input_metadata[name].shape))}
-            for name in input_metadata
-        }
-        for i, sample in enumerate(dataloader):
-            if i >= len(dataloader):
-                break
-            sample = extract_sample(sample, input_metadata, framework)
-
-            if i in correctness_samples_ind:
-                correctness_samples.append(extract_bs1(sample, batch_dim))
-            do_sample_conversion = False
-            do_sample_profiling = False
-            for name in input_metadata:
-                for (ax, shapes), tensor_dim in zip(
-                    enumerate(zip(trt_profile[name].min, trt_profile[name].opt, trt_profile[name].max)),
-                    sample[name].shape,
-                ):
-                    if tensor_dim == shapes[0] and not conversion_min_max_sampled[name][ax]["min"]:
-                        do_sample_conversion = True
-                        conversion_min_max_sampled[name][ax]["min"] = True
-                    if tensor_dim == shapes[2] and not conversion_min_max_sampled[name][ax]["max"]:
-                        do_sample_conversion = True
-                        conversion_min_max_sampled[name][ax]["max"] = True
-                        do_sample_profiling = True
-
-            if do_sample_conversion:
-                conversion_samples.append(extract_bs1(sample, batch_dim))
-            if do_sample_profiling:
-                profiling_sample = extract_bs1(sample, batch_dim)
-
-        if performance_dataloader:
-            LOGGER.info("Using performance dataloader for profiling sample. Collecting first item only.")
-            sample = next(iter(performance_dataloader))
-            sample = extract_sample(sample, input_metadata, framework)
-            profiling_sample = extract_bs1(sample, batch_dim)
+        Returns:
+            Profiling sample, correctness samples and conversion samples
+        """
+        if self._correctness_samples_ind is None:
+            if len(self._reservoir) < self._sample_count:
+                LOGGER.warning(
+                    f"Requested sample_count ({self._sample_count}) is larger than "
+                    f"the number of available samples ({len(self._reservoir)}). Using {len(self._reservoir)} samples."
+                )
+            self._correctness_samples = [sample for _, sample in sorted(self._reservoir, key=lambda item: item[0])]
+
+        conversion_ind = sorted({idx for _, idx in self._extremes.values()})
+        conversion_samples = [self._candidates[idx] for idx in conversion_ind]
+        profiling_ind = [idx for (_, _, kind), (_, idx) in self._extremes.items() if kind == "max"]
+        profiling_sample = self._candidates[max(profiling_ind)] if profiling_ind else None
 
         if not conversion_samples:
-            conversion_samples = correctness_samples[:1]
+            conversion_samples = self._correctness_samples[:1]
         if profiling_sample is None:
             profiling_sample = conversion_samples[0]
 
-        return profiling_sample, correctness_samples, conversion_samples
+        return profiling_sample, self._correctness_samples, conversion_samples
+
+    def profiling_samples(self) -> Tuple[List[Sample], List[float]]:
+        """Return profiling samples covering the quantiles of input shapes.
+
+        Returns:
+            Profiling samples and their traffic weights. Empty lists when only a single profiling sample is selected.
+        """
+        if self._profiling_samples_selector is None:
+            return [], []
+
+        return self._profiling_samples_selector.samples()
+
+    def _add_to_reservoir(self, idx: int, sample: Sample) -> Optional[Sample]:
+        if len(self._reservoir) < self._sample_count:
+            slot = len(self._reservoir)
+            self._reservoir.append(None)
+        else:
+            slot = self._random_state.randint(0, idx + 1)
+            if slot >= self._sample_count:
+                return None
+
+        sample_bs1 = extract_bs1(sample, self._batch_dim)
+        self._reservoir[slot] = (idx, sample_bs1)
+        return sample_bs1
+
+
+class ProfilingSamplesSelector:
+    """Select profiling samples covering the quantiles of input shapes in a single pass over the dataloader.
+
+    Shapes of the samples, without the batch dimension, are ordered by the number of elements, so the quantiles
+    follow all dynamic axes together. The first sample of each shape is kept and samples with each shape are counted.
+    When more distinct shapes are observed than `max_candidates`, kept samples are thinned to evenly cover
+    the range of sizes, so memory used by the selector is bounded.
+
+    Each selected sample is weighted by the share of dataloader samples which have the size closest to it.
+    """
+
+    def __init__(
+        self,
+        batch_dim: Optional[int],
+        samples_count: int,
+        max_candidates: int = DEFAULT_PROFILING_SAMPLES_CANDIDATES,
+    ) -> None:
+        """Initialize object.
+
+        Args:
+            batch_dim: Batch dimension
+            samples_count: Number of selected samples
+            max_candidates: Maximal number of samples kept in memory while the dataloader is iterated
+        """
+        self._batch_dim = batch_dim
+        self._samples_count = samples_count
+        self._max_candidates = max(max_candidates, samples_count, 2)
+        self._shapes_counts = Counter()
+        self._shapes_sizes = {}
+        self._candidates = {}
+
+    def add(self, sample: Sample) -> None:
+        """Process sample from the dataloader.
+
+        Args:
+            sample: Sample extracted from the dataloader
+        """
+        shapes = tuple(
+            (name, tuple(dim for axis, dim in enumerate(tensor.shape) if axis != self._batch_dim))
+            for name, tensor in sample.items()
+        )
+        self._shapes_counts[shapes] += 1
+        if shapes in self._shapes_sizes:
+            return
+
+        self._shapes_sizes[shapes] = sum(int(np.prod(shape)) for _, shape in shapes)
+        self._candidates[shapes] = extract_bs1(sample, self._batch_dim)
+        if len(self._candidates) > self._max_candidates:
+            self._thin_candidates()
+
+    def samples(self) -> Tuple[List[Sample], List[float]]:
+        """Return selected samples.
+
+        Returns:
+            Samples ordered by size and their traffic weights summing up to 1
+        """
+        if not self._shapes_counts:
+            return [], []
+
+        observed = sorted(self._shapes_counts, key=self._order)
+        cumulative_counts = np.cumsum([self._shapes_counts[shapes] for shapes in observed])
+        total_count = int(cumulative_counts[-1])
+
+        candidates = sorted(self._candidates, key=self._order)
+        candidates_sizes = np.array([self._shapes_sizes[shapes] for shapes in candidates])
+
+        selected = []
+        for idx in range(self._samples_count):
+            target = (idx + 0.5) / self._samples_count * total_count
+            quantile_shapes = observed[int(np.searchsorted(cumulative_counts, target))]
+            distances = np.abs(candidates_sizes - self._shapes_sizes[quantile_shapes])
+            candidate_shapes = candidates[int(np.argmin(distances))]
+            if candidate_shapes not in selected:
+                selected.append(candidate_shapes)
+
+        selected_sizes = np.array([self._shapes_sizes[shapes] for shapes in selected])
+        counts = [0] * len(selected)
+        for shapes, count in self._shapes_counts.items():
+            counts[int(np.argmin(np.abs(selected_sizes - self._shapes_sizes[shapes])))] += count
+
+        return [self._candidates[shapes] for shapes in selected], [count / total_count for count in counts]
+
+    def _order(self, shapes: Tuple) -> Tuple:
+        return self._shapes_sizes[shapes], shapes
+
+    def _thin_candidates(self) -> None:
+        candidates = sorted(self._candidates, key=self._order)
+        sizes = [self._shapes_sizes[shapes] for shapes in candidates]
+        gaps = [sizes[idx + 1] - sizes[idx - 1] for idx in range(1, len(candidates) - 1)]
+        del self._candidates[candidates[int(np.argmin(gaps)) + 1]]
+
+
+def get_correctness_samples_ind(num_samples: int, sample_count: int, seed: int) -> Set[int]:
+    """Draw indices of correctness samples.
+
+    Args:
+        num_samples: Number of samples in the dataloader
+        sample_count: Number of correctness samples
+        seed: Random seed
+
+    Returns:
+        Indices of the samples selected for correctness
+    """
+    if sample_count > num_samples:
+        LOGGER.warning(
+            f"Requested sample_count ({sample_count}) is larger than "
+            f"the number of available samples ({num_samples}). Using {num_samples} samples."
+        )
+        sample_count = num_samples
+
+    np.random.seed(seed)
+    return set(np.random.choice(num_samples, size=sample_count, replace=False))
+
+
+def get_samples_collector(
+    dataloader: DataLoader,
+    max_samples: Optional[int],
+    sample_count: int,
+    seed: int,
+    batch_dim: Optional[int],
+    profiling_samples_count: int = DEFAULT_PROFILING_SAMPLES_COUNT,
+) -> SamplesCollector:
+    """Create collector of samples from the dataloader.
+
+    Correctness samples are drawn upfront from sized dataloaders and with reservoir sampling from dataloaders
+    without length.
+
+    Args:
+        dataloader: Dataloader from which samples are collected
+        max_samples: Maximal number of samples read from the dataloader
+        sample_count: Number of correctness samples
+        seed: Random seed
+        batch_dim: Batch dimension
+        profiling_samples_count: Number of profiling samples covering the quantiles of input shapes
+
+    Returns:
+        Samples collector
+    """
+    if get_dataloader_length(dataloader) is None:
+        return SamplesCollector(
+            batch_dim, sample_count=sample_count, seed=seed, profiling_samples_count=profiling_samples_count
+        )
+
+    num_samples = get_samples_limit(dataloader, max_samples)
+    return SamplesCollector(
+        batch_dim,
+        get_correctness_samples_ind(num_samples, sample_count, seed),
+        profiling_samples_count=profiling_samples_count,
+    )
+
+
+def save_input_samples(
+    workspace: Workspace,
+    profiling_sample: Sample,
+    correctness_samples: List[Sample],
+    conversion_samples: List[Sample],
+    batch_dim: Optional[int],
+    raise_on_error: bool = False,
+) -> Dict[str, pathlib.Path]:
+    """Save input samples into the workspace.
+
+    Args:
+        workspace: Workspace of current execution.
+        profiling_sample: Sample for profiling
+        correctness_samples: Samples for verifying correctness
+        conversion_samples: Samples spanning all dimensions sizes from min to max
+        batch_dim: Batch dimension
+        raise_on_error: If True raise an error when one of the samples is invalid. Defaults to False.
+
+    Returns:
+        Paths of saved samples
+    """
+    sample_data_path = workspace.path / "model_input"
+    sample_data_path.mkdir(parents=True, exist_ok=True)
+
+    output = {}
+
+    LOGGER.info("Saving samples into the workspace.")
+    for samples, dirname, sample_name in [
+        ([profiling_sample], "profiling", "profiling_sample"),
+        (correctness_samples, "correctness", "correctness_samples"),
+        (conversion_samples, "conversion", "conversion_samples"),
+    ]:
+        sample_path = sample_data_path / dirname
+        samples_to_mmap(samples, sample_path, batch_dim, raise_on_error=raise_on_error)
+        output[sample_name] = sample_path
+
+    return output
+
+
+def save_profiling_samples(
+    workspace: Workspace,
+    profiling_samples: List[Sample],
+    traffic_weights: List[float],
+    batch_dim: Optional[int],
+    raise_on_error: bool = False,
+) -> Dict[str, pathlib.Path]:
+    """Save profiling samples covering the quantiles of input shapes into the workspace.
+
+    Traffic weights are saved next to the samples in the `traffic_weights.json` file.
+
+    Args:
+        workspace: Workspace of current execution.
+        profiling_samples: Samples for profiling
+        traffic_weights: Share of dataloader samples represented by each profiling sample
+        batch_dim: Batch dimension
+        raise_on_error: If True raise an error when one of the samples is invalid. Defaults to False.
+
+    Returns:
+        Path of saved samples
+    """
+    sample_path = workspace.path / "model_input" / "stratified"
+    samples_to_mmap(profiling_samples, sample_path, batch_dim, raise_on_error=raise_on_error)
+    with open(sample_path / PROFILING_SAMPLES_WEIGHTS_FILENAME, "w") as f:
+        json.dump(traffic_weights, f)
+
+    return {"stratified_samples": sample_path}
 
 
 class FetchOutputModelData(Command, is_required=True):
@@ -211,9 +566,13 @@ class FetchOutputModelData(Command, is_required=True):
         batch_dim: Optional[int],
         raise_on_error: Optional[bool] = True,
         forward_kw_names: Optional[Tuple[str, ...]] = None,
+        dataloader_max_batch_size: Optional[int] = None,
     ) -> CommandOutput:
         """Run the command and save model outputs.
 
+        Samples with the same shapes are concatenated along the batch dimension and inferred together
+        in batches up to the maximal batch size from the dataloader.
+
         Args:
             framework: Model framework.
             workspace: Model Navigator workspace path.
@@ -224,6 +583,8 @@ class FetchOutputModelData(Command, is_required=True):
             raise_on_error: If True raise an error when one of the samples is invalid.
                 Defaults to True.
             forward_kw_names: List of source model input signature names. Defaults to None.
+            dataloader_max_batch_size: Maximal batch size of samples in the dataloader.
+                When None samples are inferred one at a time. Defaults to None.
 
         Returns:
             CommandOutput
@@ -239,17 +600,72 @@ class FetchOutputModelData(Command, is_required=True):
         )  # pytype: disable=not-instantiable
 
         output = {}
-        for input_sample, sample_name, output_sample in [
-            ("profiling_sample", "profiling", "profiling_sample_output"),
-            ("correctness_samples", "correctness", "correctness_samples_output"),
-            ("conversion_samples", "conversion", "conversion_samples_output"),
-        ]:
-            samples = load_samples(samples_name=input_sample, workspace=workspace.path, batch_dim=batch_dim)
-            with runner:
-                outputs = [runner.infer(sample) for sample in samples]
-
-            sample_path = output_data_path / sample_name
-            samples_to_npz(outputs, sample_path, batch_dim, raise_on_error=raise_on_error)
-            output[output_sample] = sample_path
+        with runner:
+            for input_sample, sample_name, output_sample in [
+                ("profiling_sample", "profiling", "profiling_sample_output"),
+                ("correctness_samples", "correctness", "correctness_samples_output"),
+                ("conversion_samples", "conversion", "conversion_samples_output"),
+            ]:
+                samples = load_samples(samples_name=input_sample, workspace=workspace.path, batch_dim=batch_dim)
+                outputs = infer_batched(runner, samples, batch_dim, dataloader_max_batch_size)
+
+                sample_path = output_data_path / sample_name
+                samples_to_mmap(outputs, sample_path, batch_dim, raise_on_error=raise_on_error)
+                output[output_sample] = sample_path
 
         return CommandOutput(status=CommandStatus.OK, output=output)
+
+
+def infer_batched(
+    runner: NavigatorRunner, samples: List[Sample], batch_dim: Optional[int], max_batch_size: Optional[int]
+) -> List[Sample]:
+    """Run inference on samples concatenated in batches and split the outputs back to samples.
+
+    Only samples with the same shapes and data types are concatenated. Samples are inferred one at a time
+    when batching is disabled or when outputs of the batch cannot be split along the batch dimension.
+
+    Args:
+        runner: Activated runner
+        samples: Samples to infer
+        batch_dim: Batch dimension
+        max_batch_size: Maximal batch size of the concatenated samples
+
+    Returns:
+        Outputs in the order of samples
+    """
+    if batch_dim is None or not max_batch_size or max_batch_size < 2:
+        return [runner.infer(sample) for sample in samples]
+
+    groups = {}
+    for idx, sample in enumerate(samples):
+        key = tuple((name, tensor.shape, tensor.dtype.str) for name, tensor in sample.items())
+        groups.setdefault(key, []).append(idx)
+
+    outputs = [None] * len(samples)
+    for key, indices in groups.items():
+        sample_batch_size = key[0][1][batch_dim] if key else max_batch_size
+        samples_per_batch = max(max_batch_size // max(sample_batch_size, 1), 1)
+        for start in range(0, len(indices), samples_per_batch):
+            batch_indices = indices[start : start + samples_per_batch]
+            batch_outputs = _infer_batch(runner, [samples[idx] for idx in batch_indices], batch_dim)
+            for idx, sample_output in zip(batch_indices, batch_outputs):
+                outputs[idx] = sample_output
+
+    return outputs
+
+
+def _infer_batch(runner: NavigatorRunner, samples: List[Sample], batch_dim: int) -> List[Sample]:
+    if len(samples) == 1:
+        return [runner.infer(samples[0])]
+
+    batch = {name: np.concatenate([sample[name] for sample in samples], axis=batch_dim) for name in samples[0]}
+    batch_output = runner.infer(batch)
+
+    sizes = [next(iter(sample.values())).shape[batch_dim] for sample in samples]
+    if any(tensor.ndim <= batch_dim or tensor.shape[batch_dim] != sum(sizes) for tensor in batch_output.values()):
+        LOGGER.debug("Outputs cannot be split along the batch dimension. Inferring samples one at a time.")
+        return [runner.infer(sample) for sample in samples]
+
+    split_indices = np.cumsum(sizes)[:-1]
+    split_outputs = {name: np.split(tensor, split_indices, axis=batch_dim) for name, tensor in batch_output.items()}
+    return [{name: tensors[idx] for name, tensors in split_outputs.items()} for idx in range(len(samples))]
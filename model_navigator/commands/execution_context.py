@@ -18,13 +18,13 @@ import logging
 import os
 import pathlib
 import shutil
-import subprocess
 import sys
 import textwrap
 from typing import Callable, List, Optional, Union
 
 import fire
 
+from model_navigator.commands.process_executor import execute_process
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import ModelNavigatorUserInputError
@@ -107,12 +107,11 @@ class ExecutionContext(contextlib.AbstractContextManager):
         self._script_path = pathlib.Path(script_path) if script_path else script_path
         self._cmd_path = pathlib.Path(cmd_path) if cmd_path else cmd_path
         self._cache = {}
-        self._output = None
         self._verbose = verbose
         self._on_exit = on_exit
 
     def __exit__(self, exc_type, exc_value, traceback):  # noqa: F841
-        """Exit the context and store the command output to file.
+        """Exit the context.
 
         Args:
             exc_type: class of exception
@@ -122,12 +121,6 @@ class ExecutionContext(contextlib.AbstractContextManager):
         Raises:
             ModelNavigatorUserInputError when issue was cased by provided by user data
         """
-        if self._output is not None:
-            with FileHandlersLogging():
-                if not self._verbose:
-                    LOGGER.info("Command output:")
-                LOGGER.info(textwrap.indent(self._output, "    "))
-
         if self._on_exit is not None:
             self._on_exit()
 
@@ -203,38 +196,49 @@ class ExecutionContext(contextlib.AbstractContextManager):
         if dry_run:
             return run_cmd
 
-        process = subprocess.Popen(
-            run_cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            encoding="utf-8",
-            cwd=self._workspace.path,
-        )
-
         if self._verbose:
             LOGGER.info("Command output:")
+        else:
+            with FileHandlersLogging():
+                LOGGER.info("Command output:")
+
+        result = execute_process(run_cmd, cwd=self._workspace.path, on_output=self._log_output)
+
+        usage = [f"{result.wall_time:.2f}s"]
+        if result.cpu_time is not None:
+            usage.append(f"CPU {result.cpu_time:.2f}s")
+        if result.peak_rss is not None:
+            usage.append(f"peak RSS {result.peak_rss / 2**20:.1f}MiB")
+        LOGGER.info(f"Process finished with code {result.returncode} ({', '.join(usage)}).")
+
+        if result.timed_out:
+            message = f"Process exceeded timeout and was killed. Command to reproduce error: {' '.join(run_cmd)}"
+        elif result.returncode != 0:
+            message = (
+                f"Processes exited with error code: {result.returncode}. "
+                f"Command to reproduce error: {' '.join(run_cmd)}"
+            )
+        else:
+            return
 
-        self._output = ""
-        while True:
-            output = process.stdout.readline()
-            if output == "" and process.poll() is not None:
-                break
-            if output:
-                self._output += output
-                if self._verbose:
-                    print(textwrap.indent(output.rstrip(), "    "))  # noqa: T201
+        if not self._verbose and result.output_tail:
+            LOGGER.info("Last lines of the command output:")
+            LOGGER.info(textwrap.indent("\n".join(result.output_tail), "    "))
 
-        result = process.poll()
+        if not allow_failure:
+            raise ModelNavigatorUserInputError(message)
+        else:
+            LOGGER.warning(message)
 
-        if result != 0:
-            if not allow_failure:
-                raise ModelNavigatorUserInputError(
-                    f"Processes exited with error code: {result}. Command to reproduce error: {' '.join(run_cmd)}"
-                )
-            else:
-                LOGGER.warning(
-                    f"Processes exited with error code: {result}. Command to reproduce error: {' '.join(run_cmd)}"
-                )
+    def _log_output(self, line: str) -> None:
+        if self._verbose:
+            print(textwrap.indent(line, "    "))  # noqa: T201
+
+        # output is streamed only to the log files
+        record = LOGGER.makeRecord(LOGGER.name, logging.INFO, __file__, 0, textwrap.indent(line, "    "), None, None)
+        for handler in LOGGER.handlers:
+            if isinstance(handler, logging.FileHandler) and record.levelno >= handler.level:
+                handler.handle(record)
 
     def _bake_command(self, cmd: List):
         LOGGER.info(f"Command: {' '.join(cmd)}")
@@ -26,7 +26,7 @@ from model_navigator.frameworks.jax import JaxModel
 from model_navigator.utils.common import parse_kwargs_to_cmd
 
 
-class ExportJAX2SavedModel(Command):
+class ExportJAX2SavedModel(Command, is_cacheable=True):
     """Export JAX to SavedModel command."""
 
     def _run(
@@ -27,7 +27,7 @@ from model_navigator.core.workspace import Workspace
 from model_navigator.utils.common import parse_kwargs_to_cmd
 
 
-class ExportTF2SavedModel(Command):
+class ExportTF2SavedModel(Command, is_cacheable=True):
     """Tensorflow to SavedModel exporter."""
 
     def _run(
@@ -29,7 +29,7 @@ from model_navigator.exceptions import ModelNavigatorConfigurationError
 from model_navigator.utils.common import parse_kwargs_to_cmd
 
 
-class ExportTorch2TorchScript(Command):
+class ExportTorch2TorchScript(Command, is_cacheable=True):
     """Command for export PyTorch model to TorchScript.
 
     Example of use:
@@ -114,7 +114,7 @@ class ExportTorch2TorchScript(Command):
         return CommandOutput(status=CommandStatus.OK)
 
 
-class ExportTorch2ONNX(Command):
+class ExportTorch2ONNX(Command, is_cacheable=True):
     """Command for export PyTorch model to ONNX.
 
     Example of use:
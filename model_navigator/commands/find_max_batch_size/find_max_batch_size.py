@@ -48,7 +48,7 @@ class FindMaxBatchSizeConfig:
     runner_cls: Type[NavigatorRunner]
 
 
-class FindMaxBatchSize(Command):
+class FindMaxBatchSize(Command, is_exclusive=True):
     """Command for searching maximal possible batch size that model can be loaded with."""
 
     def _run(
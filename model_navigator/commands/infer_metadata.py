@@ -12,13 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Inputs and outputs metadata commands."""
+import itertools
 import pathlib
+from collections import Counter
 from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
-from model_navigator.api.config import OptimizationProfile, SizedDataLoader, SizedIterable, TensorRTProfile
+from model_navigator.api.config import DataLoader, OptimizationProfile, SizedDataLoader, SizedIterable, TensorRTProfile
 from model_navigator.commands.base import Command, CommandOutput, CommandStatus
+from model_navigator.commands.data_dump.samples import get_samples_collector, save_input_samples, save_profiling_samples
 from model_navigator.commands.execution_context import ExecutionContext
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import FRAMEWORK_TO_TENSOR_TYPE, TensorMetadata, TensorSpec
@@ -26,7 +29,18 @@ from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import ModelNavigatorUserInputError
 from model_navigator.frameworks import Framework
 from model_navigator.runners.utils import get_format_default_runners
-from model_navigator.utils.dataloader import extract_sample, load_samples, sample_to_tuple, validate_sample_input
+from model_navigator.utils.dataloader import (
+    DataloaderPrefetcher,
+    SamplesFingerprint,
+    extract_bs1,
+    extract_sample,
+    get_dataloader_length,
+    get_samples_limit,
+    load_samples,
+    sample_to_numpy,
+    sample_to_tuple,
+    validate_sample_input,
+)
 from model_navigator.utils.devices import is_cuda_available
 from model_navigator.utils.format_helpers import FRAMEWORK2BASE_FORMAT
 
@@ -38,21 +52,19 @@ def _extract_axes_shapes(
     num_samples: int,
     framework: Framework,
     check_len: bool = True,
-) -> Dict[str, Dict[int, List[int]]]:
+) -> Dict[str, Dict[int, Counter]]:
     assert not (check_len) or isinstance(
         dataloader, (SizedIterable, Sequence)
     ), "dataloader is not an instance of SizedDataLoader, unable to check length."
 
-    axes_shapes = {name: {ax: [] for ax in range(ndim)} for name, ndim in zip(input_names, input_ndims)}
+    axes_shapes = {name: {ax: Counter() for ax in range(ndim)} for name, ndim in zip(input_names, input_ndims)}
     for i, sample in enumerate(dataloader):
         if i >= num_samples:
             LOGGER.warning(f"{len(dataloader)=}, but more samples found.")
             break
         validate_sample_input(sample, FRAMEWORK_TO_TENSOR_TYPE[framework])
         sample = extract_sample(sample, input_names, framework)
-        for name, tensor in sample.items():
-            for k, dim in enumerate(tensor.shape):
-                axes_shapes[name][k].append(dim)
+        _update_axes_shapes(axes_shapes, sample)
 
     if check_len:
         assert i + 1 >= len(dataloader), f"{len(dataloader)=}, but only {i + 1} samples found."
@@ -60,6 +72,27 @@ def _extract_axes_shapes(
     return axes_shapes
 
 
+def _update_axes_shapes(axes_shapes: Dict[str, Dict[int, Counter]], sample: Dict[str, np.ndarray]) -> None:
+    for name, tensor in sample.items():
+        for k, dim in enumerate(tensor.shape):
+            axes_shapes[name][k][dim] += 1
+
+
+def _get_median_size(sizes: Counter) -> int:
+    """Median of the sizes counted in the dataloader, equal to `int(np.median)` of all the observed sizes."""
+    total = sum(sizes.values())
+    lower_position, upper_position = (total - 1) // 2, total // 2
+    lower, upper, seen = None, None, 0
+    for size in sorted(sizes):
+        seen += sizes[size]
+        if lower is None and seen > lower_position:
+            lower = size
+        if seen > upper_position:
+            upper = size
+            break
+    return int((lower + upper) / 2)
+
+
 def _get_metadata_from_axes_shapes(axes_shapes, batch_dim, dtypes):
     metadata = TensorMetadata()
     for name, axes in axes_shapes.items():
@@ -68,12 +101,12 @@ def _get_metadata_from_axes_shapes(axes_shapes, batch_dim, dtypes):
             if ax == batch_dim or min(shapes) != max(shapes):
                 tensor_shape.append(-1)
             else:
-                tensor_shape.append(shapes[0])
+                tensor_shape.append(min(shapes))
         metadata.add(name, tuple(tensor_shape), dtypes[name])
     return metadata
 
 
-def _extract_max_batch_size(axes_shapes: Dict[str, Dict[int, List[int]]], batch_dim: Optional[int]) -> int:
+def _extract_max_batch_size(axes_shapes: Dict[str, Dict[int, Counter]], batch_dim: Optional[int]) -> int:
     if batch_dim is not None:
         return max(list(axes_shapes.values())[0][batch_dim])
     return 0
@@ -85,9 +118,9 @@ def _get_trt_profile_from_axes_shapes(axes_shapes, batch_dim):
         min_max_opt = []
         for ax, shapes in axes.items():
             if ax == batch_dim:  # min bs = 1
-                min_max_opt.append((1, int(np.median(shapes)), max(shapes)))
+                min_max_opt.append((1, _get_median_size(shapes), max(shapes)))
             else:
-                min_max_opt.append((min(shapes), int(np.median(shapes)), max(shapes)))
+                min_max_opt.append((min(shapes), _get_median_size(shapes), max(shapes)))
         if min_max_opt:
             trt_profile.add(name, *list(zip(*min_max_opt)))
         else:
@@ -106,34 +139,89 @@ class InferInputMetadata(Command, is_required=True):
         self,
         model: Union[object, pathlib.Path],
         framework: Framework,
-        dataloader: SizedDataLoader,
+        dataloader: DataLoader,
         optimization_profile: OptimizationProfile,
         _input_names: Optional[Tuple[str, ...]] = None,
         batch_dim: Optional[int] = None,
+        workspace: Optional[Workspace] = None,
+        sample_count: Optional[int] = None,
+        seed: int = 0,
+        max_samples: Optional[int] = None,
     ) -> CommandOutput:
         """Execute the InferInputMetadata command.
 
+        Metadata and fingerprint of the samples are collected in a single pass over the dataloader.
+        When `workspace` and `sample_count` are provided, profiling, correctness and conversion samples
+        are collected in the same pass and saved into the workspace.
+        Dataloaders without length are read up to `max_samples` samples and only counts of the observed sizes
+        are kept, so the stream is not materialized.
+
         Args:
             framework: Framework of model to run inference
             model: A model object or path to file
             dataloader: Dataloader for providing samples
+            optimization_profile: Performance configuration with dataloader override
             _input_names: Name of model inputs
             batch_dim: Location of batch dimension in data samples
+            workspace: Working directory where samples are saved
+            sample_count: Number of correctness samples to collect
+            seed: Random seed for correctness samples selection
+            max_samples: Maximal number of samples read from the dataloader. Defaults to all samples of sized
+                dataloaders and `DEFAULT_UNSIZED_DATALOADER_MAX_SAMPLES` for dataloaders without length.
 
         Returns:
             CommandOutput object
         """
-        sample = next(iter(dataloader))
-        validate_sample_input(sample, FRAMEWORK_TO_TENSOR_TYPE[framework])
+        samples_limit = get_samples_limit(dataloader, max_samples)
+        collector = None
+        if workspace is not None and sample_count is not None:
+            LOGGER.info("Collecting input samples for model.")
+            collector = get_samples_collector(
+                dataloader,
+                max_samples,
+                sample_count,
+                seed,
+                batch_dim,
+                profiling_samples_count=optimization_profile.profiling_samples_count,
+            )
+
+        def _validate_and_convert(sample):
+            validate_sample_input(sample, FRAMEWORK_TO_TENSOR_TYPE[framework])
+            return sample_to_numpy(sample, framework)
+
+        prefetcher = DataloaderPrefetcher(
+            itertools.islice(dataloader, samples_limit),
+            transform=_validate_and_convert,
+            depth=optimization_profile.prefetch_depth,
+            mode=optimization_profile.prefetch_mode,
+        )
+
         input_names = _input_names
-        if input_names is None:
-            input_names = self._get_default_input_names(model, sample, framework)
-
-        input_sample = extract_sample(sample, input_names, framework)
-        input_ndims = [t.ndim for t in input_sample.values()]
-        input_dtypes = {n: t.dtype for n, t in input_sample.items()}
-        num_samples = len(dataloader)
-        axes_shapes = _extract_axes_shapes(dataloader, input_names, input_ndims, num_samples, framework)
+        axes_shapes, input_ndims, input_dtypes = None, None, None
+        samples_fingerprint = SamplesFingerprint()
+        for i, sample in enumerate(prefetcher):
+            if input_names is None:
+                input_names = self._get_default_input_names(model, sample, framework)
+
+            input_sample = extract_sample(sample, input_names, framework)
+            if axes_shapes is None:
+                input_ndims = [t.ndim for t in input_sample.values()]
+                input_dtypes = {n: t.dtype for n, t in input_sample.items()}
+                axes_shapes = {name: {ax: Counter() for ax in range(t.ndim)} for name, t in input_sample.items()}
+
+            _update_axes_shapes(axes_shapes, input_sample)
+            samples_fingerprint.update(input_sample)
+            if collector is not None:
+                collector.add(i, input_sample)
+
+        prefetcher.log_stats("Input metadata and samples collection")
+        if axes_shapes is None:
+            raise ModelNavigatorUserInputError("Dataloader does not provide any samples.")
+        if get_dataloader_length(dataloader) is None:
+            LOGGER.info(f"Read {i + 1} samples from the dataloader without length (limit: {samples_limit}).")
+        else:
+            assert i + 1 >= samples_limit, f"{len(dataloader)=}, but only {i + 1} samples found."
+
         dataloader_max_batch_size = _extract_max_batch_size(axes_shapes, batch_dim)
         dataloader_trt_profile = _get_trt_profile_from_axes_shapes(axes_shapes, batch_dim)
         input_metadata = _get_metadata_from_axes_shapes(axes_shapes, batch_dim, input_dtypes)
@@ -163,14 +251,26 @@ class InferInputMetadata(Command, is_required=True):
                 dataloader_trt_profile=dataloader_trt_profile,
             )
 
-        return CommandOutput(
-            status=CommandStatus.OK,
-            output={
-                "input_metadata": input_metadata,
-                "dataloader_trt_profile": dataloader_trt_profile,
-                "dataloader_max_batch_size": dataloader_max_batch_size,
-            },
-        )
+        output = {
+            "input_metadata": input_metadata,
+            "dataloader_trt_profile": dataloader_trt_profile,
+            "dataloader_max_batch_size": dataloader_max_batch_size,
+            "samples_fingerprint": samples_fingerprint.hexdigest(),
+        }
+        if collector is not None:
+            profiling_sample, correctness_samples, conversion_samples = collector.samples()
+            if optimization_profile.dataloader:
+                LOGGER.info("Using performance dataloader for profiling sample.")
+                profiling_sample = extract_bs1(pd_input_sample, batch_dim)
+
+            output.update(
+                save_input_samples(workspace, profiling_sample, correctness_samples, conversion_samples, batch_dim)
+            )
+            profiling_samples, traffic_weights = collector.profiling_samples()
+            if profiling_samples and not optimization_profile.dataloader:
+                output.update(save_profiling_samples(workspace, profiling_samples, traffic_weights, batch_dim))
+
+        return CommandOutput(status=CommandStatus.OK, output=output)
 
     def _get_default_input_names(self, model, sample, framework):
         input_tuple = sample_to_tuple(sample)
@@ -230,7 +330,6 @@ class InferOutputMetadata(Command, is_required=True):
         self,
         framework: Framework,
         model: Union[object, pathlib.Path],
-        dataloader: SizedDataLoader,
         profiling_sample: pathlib.Path,
         conversion_samples: pathlib.Path,
         input_metadata: TensorMetadata,
@@ -246,7 +345,6 @@ class InferOutputMetadata(Command, is_required=True):
         Args:
             framework: Framework of model to run inference
             model: A model object or path to file
-            dataloader: Dataloader for providing samples
             profiling_sample: Profiling sample
             conversion_samples: Conversion samples
             input_metadata: Model inputs metadata
@@ -283,7 +381,7 @@ class InferOutputMetadata(Command, is_required=True):
 
             output_ndims = [t.ndim for t in output_sample.values()]
             output_dtypes = {n: t.dtype for n, t in output_sample.items()}
-            num_samples = len(dataloader)
+            num_samples = len(conversion_samples)
             axes_shapes = _extract_axes_shapes(
                 output_generator, output_names, output_ndims, num_samples, framework, check_len=False
             )
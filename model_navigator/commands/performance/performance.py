@@ -12,28 +12,37 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Command for performance measurement."""
+import json
 import pathlib
 import shutil
 import tempfile
-from typing import Any, Optional, Type
+from typing import Any, Dict, List, Optional, Type
 
 from jsonlines import jsonlines
 
-from model_navigator.api.config import Format, OptimizationProfile
+from model_navigator.api.config import CustomConfig, Format, OptimizationProfile, TensorRTProfile
 from model_navigator.commands.base import Command, CommandOutput, CommandStatus
+from model_navigator.commands.correctness.correctness import Correctness
 from model_navigator.commands.execution_context import ExecutionContext
-from model_navigator.commands.performance.results import ProfilingResults
+from model_navigator.commands.performance.results import ProfilingResults, aggregate_profiling_results
+from model_navigator.core.constants import PROFILING_SAMPLES_WEIGHTS_FILENAME
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata
 from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import ModelNavigatorProfilingError
 from model_navigator.runners.base import NavigatorRunner
 from model_navigator.utils.common import parse_kwargs_to_cmd
+from model_navigator.utils.dataloader import load_samples
 from model_navigator.utils.format_helpers import is_source_format
 
 
-class Performance(Command):
-    """Performance command."""
+class Performance(Command, is_exclusive=True, requires=[Correctness.name]):
+    """Performance command.
+
+    When `profiling_samples_count` in the optimization profile is larger than 1, samples covering the quantiles
+    of input shapes are profiled. Results for each sample are returned in `samples_profiling_results`
+    and `profiling_results` are aggregated over the samples weighted by their share in the dataloader.
+    """
 
     def _run(
         self,
@@ -48,6 +57,8 @@ class Performance(Command):
         runner_cls: Type[NavigatorRunner],
         reproduce_script_dir: Optional[pathlib.Path] = None,
         model: Optional[Any] = None,
+        custom_configs: Optional[Dict[str, CustomConfig]] = None,
+        dataloader_trt_profile: Optional[TensorRTProfile] = None,
     ) -> CommandOutput:
         """Run performance command.
 
@@ -64,6 +75,9 @@ class Performance(Command):
             reproduce_script_dir: Path to store the reproducing scripts for the command.
                 When None use model directory. Defaults to None.
             model: Model when profiling on a source format. Defaults to None.
+            custom_configs: Custom configurations used to derive the runner options. Defaults to None.
+            dataloader_trt_profile: Shapes of the dataloader samples used to derive the runner options.
+                Defaults to None.
 
         Returns:
             CommandOutput: Output of the command containing profiling results.
@@ -76,12 +90,7 @@ class Performance(Command):
             LOGGER.warning(f"Model: {model_path.as_posix()!r} not found, command skipped.")
             return CommandOutput(status=CommandStatus.SKIPPED)
 
-        profiler_samples = workspace.path / "model_input" / "profiler"
-        if profiler_samples.exists():
-            shutil.rmtree(profiler_samples.as_posix())
-
-        profiling_samples = workspace.path / "model_input" / "profiling"
-        shutil.copytree(profiling_samples, profiler_samples)
+        traffic_weights = self._prepare_profiler_samples(workspace, optimization_profile)
 
         with ExecutionContext(
             workspace=workspace,
@@ -98,6 +107,11 @@ class Performance(Command):
                 "input_metadata": input_metadata.to_json(),
                 "output_metadata": output_metadata.to_json(),
             }
+            runner_options = runner_cls.get_runner_options(
+                custom_configs=custom_configs, dataloader_trt_profile=dataloader_trt_profile
+            )
+            if runner_options:
+                kwargs["runner_options"] = runner_options
 
             from model_navigator.commands.performance import profile_script
 
@@ -115,4 +129,61 @@ class Performance(Command):
                 profiling_results = [ProfilingResults.from_dict(res) for res in f]
         if not profiling_results:
             raise ModelNavigatorProfilingError("No profiling results found.")
-        return CommandOutput(status=CommandStatus.OK, output={"profiling_results": profiling_results})
+        if not traffic_weights:
+            return CommandOutput(status=CommandStatus.OK, output={"profiling_results": profiling_results})
+
+        return CommandOutput(
+            status=CommandStatus.OK,
+            output=self._aggregate_profiling_results(
+                workspace=workspace,
+                profiling_results=profiling_results,
+                traffic_weights=traffic_weights,
+                batch_dim=batch_dim,
+                runner_name=runner_cls.name(),
+            ),
+        )
+
+    def _prepare_profiler_samples(self, workspace: Workspace, optimization_profile: OptimizationProfile) -> List[float]:
+        profiler_samples = workspace.path / "model_input" / "profiler"
+        if profiler_samples.exists():
+            shutil.rmtree(profiler_samples.as_posix())
+
+        stratified_samples = workspace.path / "model_input" / "stratified"
+        if optimization_profile.profiling_samples_count > 1 and stratified_samples.exists():
+            shutil.copytree(stratified_samples, profiler_samples)
+            with open(profiler_samples / PROFILING_SAMPLES_WEIGHTS_FILENAME) as f:
+                return json.load(f)
+
+        profiling_samples = workspace.path / "model_input" / "profiling"
+        shutil.copytree(profiling_samples, profiler_samples)
+        return []
+
+    def _aggregate_profiling_results(
+        self,
+        workspace: Workspace,
+        profiling_results: List[ProfilingResults],
+        traffic_weights: List[float],
+        batch_dim: Optional[int],
+        runner_name: str,
+    ) -> Dict:
+        profiling_samples = []
+        samples = load_samples("profiler_sample", workspace.path, batch_dim)
+        for sample_id, (sample, traffic_weight) in enumerate(zip(samples, traffic_weights)):
+            shapes = {name: list(tensor.shape) for name, tensor in sample.items()}
+            LOGGER.info(f"Profiling sample {sample_id} with shapes {shapes} has traffic weight {traffic_weight:.2%}.")
+            profiling_samples.append({"shapes": shapes, "traffic_weight": traffic_weight})
+
+        aggregated_results = aggregate_profiling_results(profiling_results, traffic_weights)
+        if not aggregated_results:
+            raise ModelNavigatorProfilingError("No batch size was profiled for all of the profiling samples.")
+
+        for result in aggregated_results:
+            LOGGER.info(
+                f"Traffic weighted profiling result for {runner_name} and batch size: {result.batch_size}:\n{result}"
+            )
+
+        return {
+            "profiling_results": aggregated_results,
+            "samples_profiling_results": profiling_results,
+            "profiling_samples": profiling_samples,
+        }
@@ -15,13 +15,13 @@
 import pathlib
 import shutil
 import tempfile
-from typing import Any, Optional, Type
+from typing import Any, Dict, Optional, Type
 
 from jsonlines import jsonlines
 
-from model_navigator.api.config import Format, OptimizationProfile, SizedDataLoader
+from model_navigator.api.config import CustomConfig, Format, OptimizationProfile, SizedDataLoader, TensorRTProfile
 from model_navigator.commands.base import Command, CommandOutput, CommandStatus
-from model_navigator.commands.data_dump.samples import samples_to_npz
+from model_navigator.commands.data_dump.samples import samples_to_mmap
 from model_navigator.commands.execution_context import ExecutionContext
 from model_navigator.commands.performance.results import ProfilingResults
 from model_navigator.core.logger import LOGGER
@@ -35,7 +35,7 @@ from model_navigator.utils.dataloader import extract_bs1, extract_sample, load_s
 from model_navigator.utils.format_helpers import is_source_format
 
 
-class Profile(Command):
+class Profile(Command, is_exclusive=True):
     """Profile command."""
 
     def _run(
@@ -52,6 +52,8 @@ class Profile(Command):
         verbose: bool,
         runner_cls: Type[NavigatorRunner],
         model: Optional[Any] = None,
+        custom_configs: Optional[Dict[str, CustomConfig]] = None,
+        dataloader_trt_profile: Optional[TensorRTProfile] = None,
     ) -> CommandOutput:
         """Run performance command.
 
@@ -66,6 +68,9 @@ class Profile(Command):
             verbose: If True verbose logging.
             runner_cls: Runner type to profile the model with.
             model: Model when profiling on a source format. Defaults to None.
+            custom_configs: Custom configurations used to derive the runner options. Defaults to None.
+            dataloader_trt_profile: Shapes of the dataloader samples used to derive the runner options.
+                Defaults to None.
 
         Returns:
             CommandOutput: Output of the command containing profiling results.
@@ -77,6 +82,9 @@ class Profile(Command):
 
         profiling_results = []
         profiling_samples = []
+        runner_options = runner_cls.get_runner_options(
+            custom_configs=custom_configs, dataloader_trt_profile=dataloader_trt_profile
+        )
 
         for sample_id, sample_metadata in self._next_sample(
             workspace=workspace,
@@ -102,6 +110,8 @@ class Profile(Command):
                     "output_metadata": output_metadata.to_json(),
                     "sample_id": sample_id,
                 }
+                if runner_options:
+                    kwargs["runner_options"] = runner_options
 
                 from model_navigator.commands.performance import profile_script
 
@@ -155,6 +165,6 @@ class Profile(Command):
                 sample = extract_sample(sample, input_metadata, framework)
                 metadata = {n: t.shape for n, t in sample.items()}
                 profiler_sample = extract_bs1(sample, batch_dim)
-                samples_to_npz([profiler_sample], profiler_samples, batch_dim, raise_on_error=True)
+                samples_to_mmap([profiler_sample], profiler_samples, batch_dim, raise_on_error=True)
 
                 yield idx, metadata
@@ -46,6 +46,7 @@ def profile(
     sample_id: int = 0,
     navigator_workspace: Optional[str] = None,
     model_path: Optional[str] = None,
+    runner_options: Optional[Dict] = None,
 ) -> None:
     """Run profiling.
 
@@ -56,17 +57,19 @@ def profile(
         optimization_profile: Optimization profile used for configuration.
         input_metadata: Input metadata.
         output_metadata: Output metadata.
-        sample_id: Identifier of profiled sample.
+        sample_id: Identifier of the first profiled sample. All samples from the profiler samples store
+            are profiled in order with consecutive identifiers.
         navigator_workspace: Path of the Model Navigator workspace.
             When None use current workdir. Defaults to None.
         model_path: Path to the model.
             When None use `get_model()` to load the model. Defaults to None.
+        runner_options: Keyword arguments passed to the runner. Defaults to None.
     """
     if not navigator_workspace:
         navigator_workspace = pathlib.Path.cwd()
     navigator_workspace = pathlib.Path(navigator_workspace)
 
-    profiling_sample = load_samples("profiler_sample", navigator_workspace, batch_dim)[0]
+    profiling_samples = load_samples("profiler_sample", navigator_workspace, batch_dim)
 
     if model_path:
         model = navigator_workspace / model_path
@@ -77,17 +80,20 @@ def profile(
         model=model,
         input_metadata=TensorMetadata.from_json(input_metadata),
         output_metadata=TensorMetadata.from_json(output_metadata),
+        **(runner_options or {}),
     )  # pytype: disable=not-instantiable
 
-    Profiler(
+    profiler = Profiler(
         profile=OptimizationProfile.from_dict(optimization_profile),
         batch_dim=batch_dim,
         results_path=pathlib.Path(results_path),
-    ).run(
-        runner=runner,
-        profiling_sample=profiling_sample,
-        sample_id=sample_id,
     )
+    for idx, profiling_sample in enumerate(profiling_samples):
+        profiler.run(
+            runner=runner,
+            profiling_sample=profiling_sample,
+            sample_id=sample_id + idx,
+        )
 
 
 if __name__ == "__main__":
@@ -16,6 +16,8 @@
 import logging
 import math
 import pathlib
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 import numpy as np
@@ -29,6 +31,32 @@ from model_navigator.runners.base import NavigatorRunner, NavigatorStabilizedRun
 from model_navigator.utils.dataloader import expand_sample
 
 
+def get_profiled_batch_sizes(profile: OptimizationProfile, batch_dim: Optional[int] = 0) -> List[Optional[int]]:
+    """Get batch sizes profiled for the optimization profile.
+
+    Without `max_batch_size` and `batch_sizes` in the profile, all powers of two are returned and profiling
+    stops when the throughput saturates.
+
+    Args:
+        profile: Optimization profile used for configuration.
+        batch_dim: Batch dimension. Defaults to 0.
+
+    Returns:
+        Sorted list of batch sizes, `[None]` when the model does not support batching.
+    """
+    if batch_dim is None:
+        return [None]
+    elif profile.max_batch_size:
+        magnitude = math.floor(math.log2(profile.max_batch_size)) + 1
+        batch_sizes = set((2 ** np.arange(magnitude, dtype=np.int32)).tolist())
+        batch_sizes.add(profile.max_batch_size)
+        return sorted(batch_sizes)
+    elif profile.batch_sizes:
+        return sorted(profile.batch_sizes)
+    else:
+        return (2 ** np.arange(31, dtype=np.int32)).tolist()
+
+
 class Profiler:
     """Runs profiling on a runner a profiling sample.
 
@@ -62,19 +90,9 @@ class Profiler:
         self._batch_dim = batch_dim
         self._results_path = results_path
 
-        if self._batch_dim is None:
-            batch_sizes = [None]
-        elif self._profile.max_batch_size:
-            magnitude = math.floor(math.log2(self._profile.max_batch_size)) + 1
-            batch_sizes = set((2 ** np.arange(magnitude, dtype=np.int32)).tolist())
-            batch_sizes.add(self._profile.max_batch_size)
-            batch_sizes = sorted(batch_sizes)
-        elif self._profile.batch_sizes:
-            batch_sizes = sorted(self._profile.batch_sizes)
-        else:
-            batch_sizes = (2 ** np.arange(31, dtype=np.int32)).tolist()
-
-        self._batch_sizes = batch_sizes
+        self._batch_sizes = get_profiled_batch_sizes(profile=self._profile, batch_dim=self._batch_dim)
+        self._executor = None
+        self._concurrency = 1
 
     def run(
         self,
@@ -93,7 +111,10 @@ class Profiler:
             List[ProfilingResults]: Results for each of the batch sizes from profiler configuration.
         """
         results, prev_result = [], None
-        with runner:
+        concurrency = self._get_concurrency(runner)
+        with runner, ThreadPoolExecutor(max_workers=concurrency) as executor:
+            self._executor = executor if concurrency > 1 else None
+            self._concurrency = concurrency
             for batch_size in self._batch_sizes:
                 LOGGER.log(self._profiling_results_logging_level, f"Performance profiling for {runner.name()} started.")
                 if batch_size:
@@ -116,6 +137,7 @@ class Profiler:
                 ):
                     break
                 prev_result = profiling_result
+            self._executor = None
 
         return results
 
@@ -123,9 +145,38 @@ class Profiler:
     def _profiling_results_logging_level(self):
         return logging.INFO
 
+    def _get_concurrency(self, runner: NavigatorRunner) -> int:
+        concurrency = self._profile.concurrency or 1
+        if concurrency > 1 and not runner.is_thread_safe():
+            LOGGER.warning(
+                f"Runner {runner.name()} does not support concurrent requests. Profiling with concurrency 1."
+            )
+            concurrency = 1
+
+        return concurrency
+
+    def _run_concurrent_window_measurement(
+        self, runner: NavigatorRunner, sample: Sample, batch_size: Optional[int], sample_id: int
+    ) -> ProfilingResults:
+        def _measure(_):
+            start_time = time.perf_counter()
+            runner.infer(sample)
+            return (time.perf_counter() - start_time) * 1000
+
+        start_time = time.perf_counter()
+        measurements = list(self._executor.map(_measure, range(self._profile.window_size)))
+        duration = (time.perf_counter() - start_time) * 1000
+
+        return ProfilingResults.from_measurements(
+            measurements, batch_size, sample_id, duration=duration, concurrency=self._concurrency
+        )
+
     def _run_window_measurement(
         self, runner: NavigatorRunner, sample: Sample, batch_size: Optional[int], sample_id: int
     ) -> ProfilingResults:
+        if self._executor is not None:
+            return self._run_concurrent_window_measurement(runner, sample, batch_size, sample_id)
+
         measurements = []
         for _ in range(self._profile.window_size):
             runner.infer(sample)
@@ -155,6 +206,18 @@ class Profiler:
 
     def _run_measurement(
         self, runner: NavigatorRunner, sample: Sample, batch_size: Optional[int], sample_id: int
+    ) -> ProfilingResults:
+        retrace_count = runner.retrace_count()
+        profiling_result = self._run_stable_measurement(runner, sample, batch_size, sample_id)
+        if retrace_count is not None:
+            profiling_result.retrace_count = runner.retrace_count() - retrace_count
+        profiling_result.padding_waste = runner.padding_waste()
+        profiling_result.saved_recompilations = runner.saved_recompilations()
+
+        return profiling_result
+
+    def _run_stable_measurement(
+        self, runner: NavigatorRunner, sample: Sample, batch_size: Optional[int], sample_id: int
     ) -> ProfilingResults:
         profiling_results = []
 
@@ -35,6 +35,10 @@ class ProfilingResults(DataObject):
     p99_latency: float  # ms
     throughput: float  # infer / sec
     request_count: int
+    concurrency: int = 1
+    retrace_count: Optional[int] = None
+    padding_waste: Optional[float] = None
+    saved_recompilations: Optional[int] = None
 
     @classmethod
     def from_dict(cls, d: Mapping) -> "ProfilingResults":
@@ -53,7 +57,12 @@ class ProfilingResults(DataObject):
 
     @classmethod
     def from_measurements(
-        cls, measurements: List[float], batch_size: Optional[int], sample_id: int
+        cls,
+        measurements: List[float],
+        batch_size: Optional[int],
+        sample_id: int,
+        duration: Optional[float] = None,
+        concurrency: int = 1,
     ) -> "ProfilingResults":
         """Instantiate ProfilingResults from a list of measurements.
 
@@ -61,11 +70,18 @@ class ProfilingResults(DataObject):
             measurements: List of measurements.
             batch_size: Batch size.
             sample_id: Sample id
+            duration: Wall time of all measurements in ms. Required to compute throughput
+                of concurrent requests, when None requests are assumed to be sequential.
+            concurrency: Number of concurrent requests.
 
         Returns:
             ProfilingResults
         """
         measurements = np.array(measurements)
+        if duration is None:
+            throughput = float(1000 * (batch_size or 1) / np.mean(measurements))
+        else:
+            throughput = float(1000 * (batch_size or 1) * len(measurements) / duration)
         return cls(
             sample_id=sample_id,
             batch_size=batch_size,
@@ -75,8 +91,9 @@ class ProfilingResults(DataObject):
             p90_latency=float(np.percentile(measurements, 90)),
             p95_latency=float(np.percentile(measurements, 95)),
             p99_latency=float(np.percentile(measurements, 99)),
-            throughput=float(1000 * (batch_size or 1) / np.mean(measurements)),
+            throughput=throughput,
             request_count=len(measurements),
+            concurrency=concurrency,
         )
 
     @classmethod
@@ -102,6 +119,54 @@ class ProfilingResults(DataObject):
             p99_latency=float(np.mean([result.p99_latency for result in profiling_results])),
             throughput=float(np.mean([result.throughput for result in profiling_results])),
             request_count=int(np.mean([result.request_count for result in profiling_results])),
+            concurrency=profiling_results[0].concurrency,
+        )
+
+    @classmethod
+    def from_weighted_profiling_results(
+        cls, profiling_results: List["ProfilingResults"], weights: List[float]
+    ) -> "ProfilingResults":
+        """Instantiate ProfilingResults aggregated over samples weighted by their share in the traffic.
+
+        Latencies are weighted means of the samples latencies. Throughput is computed from the weighted mean
+        time of a single inference, so it is the throughput of the traffic mix. Aggregated results have
+        `sample_id` equal to -1.
+
+        Args:
+            profiling_results: Results of the samples profiled with the same batch size.
+            weights: Share of the traffic represented by each of the samples.
+
+        Returns:
+            ProfilingResults
+        """
+        weights = np.asarray(weights, dtype=np.float64) / np.sum(weights)
+
+        def _weighted_mean(values: List[float]) -> float:
+            return float(np.sum(weights * np.asarray(values)))
+
+        retrace_counts = [result.retrace_count for result in profiling_results if result.retrace_count is not None]
+        padding_waste = None
+        if all(result.padding_waste is not None for result in profiling_results):
+            padding_waste = _weighted_mean([result.padding_waste for result in profiling_results])
+        saved_recompilations = [
+            result.saved_recompilations for result in profiling_results if result.saved_recompilations is not None
+        ]
+
+        return cls(
+            sample_id=-1,
+            batch_size=profiling_results[0].batch_size,
+            avg_latency=_weighted_mean([result.avg_latency for result in profiling_results]),
+            std_latency=_weighted_mean([result.std_latency for result in profiling_results]),
+            p50_latency=_weighted_mean([result.p50_latency for result in profiling_results]),
+            p90_latency=_weighted_mean([result.p90_latency for result in profiling_results]),
+            p95_latency=_weighted_mean([result.p95_latency for result in profiling_results]),
+            p99_latency=_weighted_mean([result.p99_latency for result in profiling_results]),
+            throughput=float(1 / _weighted_mean([1 / result.throughput for result in profiling_results])),
+            request_count=sum(result.request_count for result in profiling_results),
+            concurrency=profiling_results[0].concurrency,
+            retrace_count=sum(retrace_counts) if retrace_counts else None,
+            padding_waste=padding_waste,
+            saved_recompilations=max(saved_recompilations) if saved_recompilations else None,
         )
 
     @classmethod
@@ -133,10 +198,11 @@ class ProfilingResults(DataObject):
 
     def __str__(self) -> str:
         """Get string representation."""
-        return (
+        result = (
             f"Sample ID: {self.sample_id}\n"
             f"Batch: {self.batch_size}\n"
             f"Request count: {self.request_count}\n"
+            f"Concurrency: {self.concurrency}\n"
             f"Throughput: {self.throughput:.4f} [infer/sec]\n"
             f"Avg Latency: {self.avg_latency:.4f} [ms]\n"
             f"Std Latency: {self.std_latency:.4f} [ms]\n"
@@ -145,3 +211,45 @@ class ProfilingResults(DataObject):
             f"p95 Latency: {self.p95_latency:.4f} [ms]\n"
             f"p99 Latency: {self.p99_latency:.4f} [ms]"
         )
+        if self.retrace_count is not None:
+            result += f"\nRetrace count: {self.retrace_count}"
+        if self.padding_waste is not None:
+            result += f"\nPadding waste: {self.padding_waste:.2%}"
+        if self.saved_recompilations is not None:
+            result += f"\nSaved recompilations: {self.saved_recompilations}"
+
+        return result
+
+
+def aggregate_profiling_results(
+    profiling_results: List[ProfilingResults], traffic_weights: List[float]
+) -> List[ProfilingResults]:
+    """Aggregate results of profiled samples for each batch size weighted by the traffic share of the samples.
+
+    Profiling may stop at different batch sizes for each sample, so only batch sizes profiled
+    for all of the samples are aggregated.
+
+    Args:
+        profiling_results: Results of samples with `sample_id` equal to the index of the traffic weight.
+        traffic_weights: Share of the traffic represented by each of the samples.
+
+    Returns:
+        Aggregated results in the order of batch sizes
+    """
+    results_per_batch_size = {}
+    for result in profiling_results:
+        results_per_batch_size.setdefault(result.batch_size, {})[result.sample_id] = result
+
+    aggregated_results = []
+    sample_ids = range(len(traffic_weights))
+    for results in results_per_batch_size.values():
+        if any(sample_id not in results for sample_id in sample_ids):
+            continue
+
+        aggregated_results.append(
+            ProfilingResults.from_weighted_profiling_results(
+                [results[sample_id] for sample_id in sample_ids], traffic_weights
+            )
+        )
+
+    return aggregated_results
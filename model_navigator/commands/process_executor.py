@@ -0,0 +1,331 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Execution of commands in subprocesses with timeout, memory limit and CPU affinity."""
+import collections
+import contextlib
+import os
+import pathlib
+import queue
+import signal
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Deque, List, Optional, Sequence, Tuple
+
+from model_navigator.api.config import ExecutionLimitsConfig
+from model_navigator.core.constants import PROCESS_OUTPUT_TAIL_LINES, PROCESS_POLL_INTERVAL, PROCESS_TERMINATE_TIMEOUT
+from model_navigator.core.logger import LOGGER
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+# limits are set in the started process just before the command is executed in its place, so processes started
+# by the command inherit them; functions executed between fork and exec may deadlock when other threads of the
+# parent hold locks, and limits set by the parent after the start race with the command forking its children
+_LIMITS_LAUNCHER = """
+import os, resource, sys
+max_memory, cpu_affinity, *cmd = sys.argv[1:]
+if max_memory:
+    _, hard_limit = resource.getrlimit(resource.RLIMIT_DATA)
+    soft_limit = int(max_memory)
+    if hard_limit != resource.RLIM_INFINITY:
+        soft_limit = min(soft_limit, hard_limit)
+    resource.setrlimit(resource.RLIMIT_DATA, (soft_limit, hard_limit))
+if cpu_affinity:
+    os.sched_setaffinity(0, [int(cpu) for cpu in cpu_affinity.split(",")])
+os.execvp(cmd[0], cmd)
+"""
+
+
+@dataclass
+class ProcessResult:
+    """Result of the process with the resources used by the process and processes started by it.
+
+    Args:
+        returncode: Exit code of the process, negative signal number when the process was killed
+        timed_out: Flag if the process was killed after exceeding the timeout
+        wall_time: Wall time of the process in seconds
+        cpu_time: User and system CPU time in seconds, None when not reported by the system
+        peak_rss: Peak resident memory in bytes, None when not reported by the system
+        output_tail: Last lines of the process output
+    """
+
+    returncode: int
+    timed_out: bool
+    wall_time: float
+    cpu_time: Optional[float] = None
+    peak_rss: Optional[int] = None
+    output_tail: List[str] = field(default_factory=lambda: [])
+
+
+class ProcessesUsage(contextlib.AbstractContextManager):
+    """Collect results of the processes executed inside the context by the current thread.
+
+    Example:
+        with ProcessesUsage() as processes_usage:
+            execute_process(["python", "script.py"], cwd=workspace.path)
+        peak_rss = max(result.peak_rss for result in processes_usage.results)
+    """
+
+    _local = threading.local()
+
+    def __init__(self) -> None:
+        """Initialize object."""
+        self.results: List[ProcessResult] = []
+
+    def __enter__(self) -> "ProcessesUsage":
+        """Start collecting results of the processes."""
+        self._active().append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:  # noqa: F841
+        """Stop collecting results of the processes."""
+        self._active().remove(self)
+
+    @classmethod
+    def add(cls, result: ProcessResult) -> None:
+        """Add result of the process to the active contexts of the current thread.
+
+        Args:
+            result: Result of the finished process
+        """
+        for processes_usage in cls._active():
+            processes_usage.results.append(result)
+
+    @classmethod
+    def _active(cls) -> List["ProcessesUsage"]:
+        if not hasattr(cls._local, "active"):
+            cls._local.active = []
+
+        return cls._local.active
+
+
+class ExecutionLimits(contextlib.AbstractContextManager):
+    """Set limits of the processes executed inside the context by the current thread.
+
+    Example:
+        with ExecutionLimits(ExecutionLimitsConfig(timeout=600)):
+            execute_process(["python", "export.py"], cwd=workspace.path)
+    """
+
+    _local = threading.local()
+
+    def __init__(self, limits: Optional[ExecutionLimitsConfig]) -> None:
+        """Initialize object.
+
+        Args:
+            limits: Limits of the processes, None means no limits
+        """
+        self._limits = limits
+        self._previous_limits: Optional[ExecutionLimitsConfig] = None
+
+    def __enter__(self) -> "ExecutionLimits":
+        """Apply limits to the processes executed inside the context."""
+        self._previous_limits = ExecutionLimits.current()
+        ExecutionLimits._local.limits = self._limits
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:  # noqa: F841
+        """Restore limits of the processes."""
+        ExecutionLimits._local.limits = self._previous_limits
+
+    @classmethod
+    def current(cls) -> Optional[ExecutionLimitsConfig]:
+        """Limits of the processes executed in the current context of the current thread."""
+        return getattr(cls._local, "limits", None)
+
+
+def execute_process(
+    cmd: Sequence[str],
+    cwd: pathlib.Path,
+    limits: Optional[ExecutionLimitsConfig] = None,
+    on_output: Optional[Callable[[str], None]] = None,
+    output_tail_lines: int = PROCESS_OUTPUT_TAIL_LINES,
+) -> ProcessResult:
+    """Execute process and wait until it finishes or exceeds the timeout.
+
+    Output of the process is passed line by line to `on_output`. Only the last lines of the output are kept
+    in memory and returned in the result.
+
+    Args:
+        cmd: Command to execute
+        cwd: Working directory of the process
+        limits: Limits of the process. None means limits of the current `ExecutionLimits` context.
+        on_output: Function called with each line of the output
+        output_tail_lines: Number of last output lines returned in the result
+
+    Returns:
+        Result of the process
+    """
+    if limits is None:
+        limits = ExecutionLimits.current()
+
+    start_time = time.perf_counter()
+    process = subprocess.Popen(
+        _wrap_with_limits(cmd, limits),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        encoding="utf-8",
+        errors="replace",
+        cwd=cwd,
+        start_new_session=limits is not None and limits.timeout is not None,
+    )
+
+    output_tail = collections.deque(maxlen=output_tail_lines)
+    output_lines: "queue.Queue[Optional[str]]" = queue.Queue()
+
+    def _read_output():
+        for line in process.stdout:
+            output_lines.put(line.rstrip("\n"))
+        output_lines.put(None)
+
+    # output is passed to `on_output` in the calling thread, so it is logged in the context of the caller
+    reader = threading.Thread(target=_read_output, daemon=True)
+    reader.start()
+
+    timeout = limits.timeout if limits is not None else None
+    output_closed = _handle_output(output_lines, output_tail, on_output, start_time=start_time, timeout=timeout)
+    timed_out = not output_closed
+    if not timed_out and timeout is not None:
+        # the process may close the output before it exits
+        remaining_time = max(timeout - (time.perf_counter() - start_time), 0.0)
+        timed_out = not _wait_for_exit(process, timeout=remaining_time)
+    if timed_out:
+        LOGGER.warning(f"Process {process.pid} exceeded timeout of {timeout} s. Killing the process.")
+        _kill_session(process)
+        reader.join()
+        if not output_closed:
+            _handle_output(output_lines, output_tail, on_output)
+
+    returncode, cpu_time, peak_rss = _wait(process)
+    process.stdout.close()
+    result = ProcessResult(
+        returncode=returncode,
+        timed_out=timed_out,
+        wall_time=time.perf_counter() - start_time,
+        cpu_time=cpu_time,
+        peak_rss=peak_rss,
+        output_tail=list(output_tail),
+    )
+    ProcessesUsage.add(result)
+
+    return result
+
+
+def _handle_output(
+    output_lines: "queue.Queue[Optional[str]]",
+    output_tail: Deque[str],
+    on_output: Optional[Callable[[str], None]],
+    start_time: float = 0.0,
+    timeout: Optional[float] = None,
+) -> bool:
+    # returns False when the timeout is exceeded before the output is closed
+    while True:
+        remaining_time = None
+        if timeout is not None:
+            remaining_time = timeout - (time.perf_counter() - start_time)
+            if remaining_time <= 0:
+                return False
+        try:
+            line = output_lines.get(timeout=remaining_time)
+        except queue.Empty:
+            return False
+
+        if line is None:
+            return True
+
+        output_tail.append(line)
+        if on_output is not None:
+            on_output(line)
+
+
+def _wrap_with_limits(cmd: Sequence[str], limits: Optional[ExecutionLimitsConfig]) -> List[str]:
+    if limits is None:
+        return list(cmd)
+
+    max_memory = ""
+    if limits.max_memory is not None:
+        if resource is None:
+            LOGGER.warning("Memory limit of processes is not supported on this platform.")
+        else:
+            max_memory = str(limits.max_memory)
+
+    cpu_affinity = ""
+    if limits.cpu_affinity is not None:
+        if not hasattr(os, "sched_setaffinity"):
+            LOGGER.warning("CPU affinity of processes is not supported on this platform.")
+        else:
+            cpu_affinity = ",".join(str(cpu) for cpu in limits.cpu_affinity)
+
+    if not max_memory and not cpu_affinity:
+        return list(cmd)
+
+    return [sys.executable, "-c", _LIMITS_LAUNCHER, max_memory, cpu_affinity, *cmd]
+
+
+def _kill_session(process: subprocess.Popen) -> None:
+    # processes started by the command may keep the output open after the command exits, so the whole session
+    # is killed when the command does not finish after the termination request
+    _signal_session(process, signal.SIGTERM)
+    _wait_for_exit(process, timeout=PROCESS_TERMINATE_TIMEOUT)
+    _signal_session(process, signal.SIGKILL)
+
+
+def _signal_session(process: subprocess.Popen, signum: int) -> None:
+    if not hasattr(os, "killpg"):
+        process.send_signal(signum)
+        return
+
+    with contextlib.suppress(ProcessLookupError, PermissionError):
+        os.killpg(process.pid, signum)
+
+
+def _wait_for_exit(process: subprocess.Popen, timeout: float) -> bool:
+    # the process is not reaped, so the used resources are reported when it is reaped
+    if not hasattr(os, "waitid"):
+        try:
+            process.wait(timeout=timeout)
+            return True
+        except subprocess.TimeoutExpired:
+            return False
+
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            if os.waitid(os.P_PID, process.pid, os.WEXITED | os.WNOHANG | os.WNOWAIT) is not None:
+                return True
+        except ChildProcessError:
+            return True
+        if time.perf_counter() >= deadline:
+            return False
+        time.sleep(PROCESS_POLL_INTERVAL)
+
+
+def _wait(process: subprocess.Popen) -> Tuple[int, Optional[float], Optional[int]]:
+    if not hasattr(os, "wait4"):
+        return process.wait(), None, None
+
+    _, status, rusage = os.wait4(process.pid, 0)
+    if os.WIFSIGNALED(status):
+        process.returncode = -os.WTERMSIG(status)
+    else:
+        process.returncode = os.WEXITSTATUS(status)
+
+    # Linux reports kilobytes, macOS reports bytes
+    peak_rss = rusage.ru_maxrss if sys.platform == "darwin" else rusage.ru_maxrss * 1024
+    return process.returncode, rusage.ru_utime + rusage.ru_stime, peak_rss
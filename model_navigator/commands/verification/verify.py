@@ -14,13 +14,27 @@
 """Runtime verification command."""
 
 
+import itertools
+import os
 import pathlib
-from typing import Any, Optional, Type
-
-from model_navigator.api.config import Format, SizedDataLoader, VerifyFunction
+import shutil
+import tempfile
+from typing import Any, Dict, Iterable, Optional, Type
+
+from model_navigator.api.config import (
+    CustomConfig,
+    DataLoader,
+    Format,
+    OptimizationProfile,
+    Sample,
+    TensorRTProfile,
+    VerifyFunction,
+)
 from model_navigator.commands.base import Command, CommandOutput, CommandStatus
 from model_navigator.commands.correctness import Correctness
+from model_navigator.commands.data_dump.samples import samples_to_mmap
 from model_navigator.commands.performance import Performance
+from model_navigator.core.constants import SAMPLES_INDEX_FILENAME
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata
 from model_navigator.core.workspace import Workspace
@@ -28,12 +42,22 @@ from model_navigator.frameworks import Framework
 from model_navigator.runners.base import NavigatorRunner
 from model_navigator.runners.registry import get_runner
 from model_navigator.runners.utils import get_source_default_runners
-from model_navigator.utils.dataloader import extract_sample
+from model_navigator.utils.dataloader import (
+    DataloaderPrefetcher,
+    extract_sample,
+    get_samples_fingerprint,
+    get_samples_limit,
+    iter_mmap_samples,
+)
 from model_navigator.utils.format_helpers import FRAMEWORK2BASE_FORMAT
 
 
 class VerifyModel(Command, requires=[Correctness.name, Performance.name]):
-    """Verify model with a runner."""
+    """Verify model with a runner.
+
+    Outputs of the source model are computed once per dataloader content and saved in the workspace,
+    so verification of each runner compares its outputs with the memory mapped source model outputs.
+    """
 
     def _pre_run(
         self,
@@ -59,12 +83,17 @@ class VerifyModel(Command, requires=[Correctness.name, Performance.name]):
         format: Format,
         workspace: Workspace,
         path: pathlib.Path,
-        dataloader: SizedDataLoader,
+        dataloader: DataLoader,
         verify_func: VerifyFunction,
         runner_cls: Type[NavigatorRunner],
         input_metadata: TensorMetadata,
         output_metadata: TensorMetadata,
         model: Optional[Any] = None,
+        optimization_profile: Optional[OptimizationProfile] = None,
+        max_samples: Optional[int] = None,
+        samples_fingerprint: Optional[str] = None,
+        custom_configs: Optional[Dict[str, CustomConfig]] = None,
+        dataloader_trt_profile: Optional[TensorRTProfile] = None,
     ) -> CommandOutput:
         """Run verification.
 
@@ -73,13 +102,23 @@ class VerifyModel(Command, requires=[Correctness.name, Performance.name]):
             format (Format): Model format.
             workspace (Path): Model Navigator workspace path.
             path (Path): Model path, relative to the workspace path.
-            dataloader (SizedDataLoader): Model dataloader.
+            dataloader (DataLoader): Model dataloader.
             verify_func (VerifyFunction): Boolean function that verifies the runner based on outputs
                 of the runner and source model.
             runner_cls (Type[NavigatorRunner]): Type of the runner to use for verification.
             input_metadata (TensorMetadata): Input metadata.
             output_metadata (TensorMetadata): Output metadata.
             model (Optional[Any], optional): Model if source model should be used. Defaults to None.
+            optimization_profile (Optional[OptimizationProfile], optional): Configuration of dataloader prefetching.
+                Defaults to None.
+            max_samples (Optional[int], optional): Maximal number of samples read from the dataloader.
+                Defaults to None.
+            samples_fingerprint (Optional[str], optional): Fingerprint of the dataloader samples computed
+                by InferInputMetadata. When None, it is computed from the dataloader. Defaults to None.
+            custom_configs (Optional[Dict[str, CustomConfig]], optional): Custom configurations
+                used to derive the runner options. Defaults to None.
+            dataloader_trt_profile (Optional[TensorRTProfile], optional): Shapes of the dataloader samples
+                used to derive the runner options. Defaults to None.
 
         Returns:
             CommandOutput: Status OK if succesfull verification, FAIL otherwise.
@@ -93,25 +132,63 @@ class VerifyModel(Command, requires=[Correctness.name, Performance.name]):
             LOGGER.info("Runner is the same as source model.")
             return CommandOutput(status=CommandStatus.OK)
 
+        optimization_profile = optimization_profile or OptimizationProfile()
+        samples_limit = get_samples_limit(dataloader, max_samples)
+
         def _get_outputs(runner):
+            prefetcher = DataloaderPrefetcher(
+                itertools.islice(dataloader, samples_limit),
+                transform=lambda sample: extract_sample(sample, input_metadata, framework),
+                depth=optimization_profile.prefetch_depth,
+                mode=optimization_profile.prefetch_mode,
+            )
             with runner:
-                for sample in dataloader:
-                    sample = extract_sample(sample, input_metadata, framework)
+                for sample in prefetcher:
                     output = runner.infer(sample)
                     yield output
+            prefetcher.log_stats(f"Verification with {runner.name()}")
+
+        if samples_fingerprint is None:
+            samples_fingerprint = get_samples_fingerprint(
+                extract_sample(sample, input_metadata, framework)
+                for sample in itertools.islice(dataloader, samples_limit)
+            )
+        reference_outputs_path = workspace.path / "verification" / samples_fingerprint
+        if (reference_outputs_path / SAMPLES_INDEX_FILENAME).exists():
+            LOGGER.info(f"Using cached source model outputs from {reference_outputs_path}.")
+        else:
+            fw_runner = get_runner(source_runners[0])(
+                model=model,
+                input_metadata=input_metadata,
+                output_metadata=output_metadata,
+            )
+            _save_reference_outputs(_get_outputs(fw_runner), reference_outputs_path)
 
         runner = get_runner(runner_cls)(
             model=model if format == source_format else workspace.path / path,
             input_metadata=input_metadata,
             output_metadata=output_metadata,
+            **runner_cls.get_runner_options(
+                custom_configs=custom_configs, dataloader_trt_profile=dataloader_trt_profile
+            ),
         )
         y_pred = _get_outputs(runner)
-
-        fw_runner = get_runner(source_runners[0])(
-            model=model,
-            input_metadata=input_metadata,
-            output_metadata=output_metadata,
-        )
-        y_fw = _get_outputs(fw_runner)
+        y_fw = iter_mmap_samples(reference_outputs_path)
         is_verified = verify_func(y_pred, y_fw)
         return CommandOutput(status=CommandStatus.OK if is_verified is True else CommandStatus.FAIL)
+
+
+def _save_reference_outputs(outputs: Iterable[Sample], path: pathlib.Path) -> None:
+    """Save source model outputs to the samples store replacing the whole directory at once."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = pathlib.Path(tempfile.mkdtemp(dir=path.parent, prefix=f"{path.name}."))
+    try:
+        samples_to_mmap(outputs, tmp_path, batch_dim=None, raise_on_error=False)
+        try:
+            os.replace(tmp_path, path)
+        except OSError:
+            # Outputs were saved in the meantime by the verification of another runner
+            if not (path / SAMPLES_INDEX_FILENAME).exists():
+                raise
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
@@ -18,11 +18,16 @@ from dataclasses import dataclass
 from typing import Dict, Optional, Sequence
 
 from model_navigator.api.config import (
+    ArtifactCacheConfig,
+    CorrectnessTolerance,
     CustomConfig,
+    DataLoader,
     DeviceKind,
+    ExecutionLimitsConfig,
     Format,
     OptimizationProfile,
-    SizedDataLoader,
+    ParallelConfig,
+    PlannerConfig,
     VerifyFunction,
 )
 from model_navigator.frameworks import Framework
@@ -35,7 +40,7 @@ class CommonConfig(DataObject):
 
     framework: Framework
     model: object
-    dataloader: SizedDataLoader
+    dataloader: DataLoader
     target_formats: Sequence[Format]
     target_device: DeviceKind
     sample_count: int
@@ -43,11 +48,18 @@ class CommonConfig(DataObject):
     runner_names: Sequence[str]
     batch_dim: Optional[int] = 0
     seed: int = 0
+    max_samples: Optional[int] = None
     _input_names: Optional[Sequence[str]] = None
     _output_names: Optional[Sequence[str]] = None
     from_source: bool = True
     forward_kw_names: Optional[Sequence[str]] = None
     verify_func: Optional[VerifyFunction] = None
+    correctness_tolerances: Optional[Dict[str, CorrectnessTolerance]] = None
+    parallel_config: Optional[ParallelConfig] = None
+    resume: bool = False
+    artifact_cache: Optional[ArtifactCacheConfig] = None
+    planner: Optional[PlannerConfig] = None
+    execution_limits: Optional[ExecutionLimitsConfig] = None
     custom_configs: Dict[str, CustomConfig] = dataclasses.field(default_factory=lambda: {})
 
     # Verbose logging - enable debug mode in export and conversion paths
@@ -23,9 +23,25 @@ DEFAULT_WORKSPACE = "navigator_workspace"
 
 # Profiling related
 DEFAULT_PROFILING_THROUGHPUT_CUTOFF_THRESHOLD = 0.05
+DEFAULT_PROFILING_SAMPLES_COUNT = 1
+DEFAULT_PROFILING_SAMPLES_CANDIDATES = 64
+PROFILING_SAMPLES_WEIGHTS_FILENAME = "traffic_weights.json"
+
+# Runners related
+DEFAULT_MAX_TRACED_SIGNATURES = 8
+DEFAULT_SHAPE_BUCKETS_COUNT = 4
+DEFAULT_PROCESS_POOL_WORKERS = 4
+PROCESS_POOL_WORKERS_VARIANTS = (2, 4, 8)
+DEFAULT_RUNNER_REPLICAS = 2
+DEFAULT_PROCESS_POOL_JOIN_TIMEOUT = 10.0
 
 # Dataloader related
 DEFAULT_SAMPLE_COUNT = 100
+DEFAULT_UNSIZED_DATALOADER_MAX_SAMPLES = 1000
+SAMPLES_INDEX_FILENAME = "samples.json"
+SAMPLES_STORE_VERSION = 1
+DEFAULT_PREFETCH_DEPTH = 0
+DEFAULT_VALIDATION_CHUNK_SIZE = 2**20
 
 # TensorRT conversion related
 DEFAULT_MAX_WORKSPACE_SIZE = 8589934592
@@ -40,6 +56,35 @@ DEFAULT_ONNX_OPSET = 17
 DEFAULT_MAX_BATCH_SIZE_THRESHOLD = 512
 DEFAULT_MAX_BATCH_SIZE_HALVING = 2
 
+# Pipelines related
+DEFAULT_SCHEDULER_POLL_INTERVAL = 0.1
+CONTEXT_FILENAME = "context.yaml"
+CONTEXT_JOURNAL_FILENAME = "context.jsonl"
+CONTEXT_OUTPUTS_DIRNAME = "context_outputs"
+
+# Process execution related
+PROCESS_OUTPUT_TAIL_LINES = 100
+PROCESS_TERMINATE_TIMEOUT = 5.0
+PROCESS_POLL_INTERVAL = 0.01
+
+# Command metrics related
+COMMAND_METRICS_SAMPLING_INTERVAL = 0.05
+COMMANDS_TRACE_FILENAME = "commands_trace.json"
+
+# Artifact cache related
+DEFAULT_ARTIFACT_CACHE_DIR = "~/.cache/model_navigator/artifacts"
+ARTIFACT_CACHE_VERSION = 1
+
+# Planner related
+DEFAULT_TIMING_DATABASE_PATH = "~/.cache/model_navigator/timings.json"
+TIMING_DATABASE_HISTORY_SIZE = 10
+OPTIMIZE_PLAN_FILENAME = "optimize_plan.yaml"
+
+# Environment snapshot related
+DEFAULT_ENVIRONMENT_CACHE_PATH = "~/.cache/model_navigator/environment.json"
+ENVIRONMENT_CACHE_TTL = 24 * 60 * 60
+NVIDIA_DRIVER_VERSION_FILE = "/proc/driver/nvidia/version"
+
 
 # Logging
 NAVIGATOR_LOGGER_NAME = "Navigator"
@@ -16,7 +16,8 @@ import contextlib
 import json
 import logging
 import pathlib
-from typing import Dict, Optional
+import threading
+from typing import Dict, List, Optional
 
 import coloredlogs
 
@@ -74,12 +75,17 @@ class StdoutLogger:
 class LoggingContext(contextlib.AbstractContextManager):
     """LoggingContext to handle correct logging options when commands are executed.
 
+    Records logged by threads which entered other logging contexts are not stored in the log file, so logs
+    of commands executed concurrently in threads do not mix.
+
     Example of use:
         log_dir = pathlib.Path("/path/to/log/directory")
         with LoggingContext(log_dir=log_dir):
             LOGGER.info("Log inside the context")
     """
 
+    _threads: List[int] = []
+
     def __init__(
         self,
         *,
@@ -93,8 +99,10 @@ class LoggingContext(contextlib.AbstractContextManager):
         super().__init__()
         self.log_dir = log_dir
         self.loggers = list(logging.root.manager.loggerDict.keys())
+        self._thread = threading.get_ident()
 
         if self.log_dir:
+            LoggingContext._threads.append(self._thread)
             log_format = "%(asctime)s %(levelname)-8s %(name)s: %(message)s"
             self.log_dir.mkdir(parents=True, exist_ok=True)
             log_file = self.log_dir / "format.log"
@@ -102,6 +110,7 @@ class LoggingContext(contextlib.AbstractContextManager):
             self.log_file_handler.setLevel(logging.INFO)
             formatter = logging.Formatter(log_format)
             self.log_file_handler.setFormatter(formatter)
+            self.log_file_handler.addFilter(self._filter_thread)
             LOGGER.addHandler(self.log_file_handler)
 
             for logger in self.loggers:
@@ -122,9 +131,13 @@ class LoggingContext(contextlib.AbstractContextManager):
             for logger in self.loggers:
                 if isinstance(logger, str):
                     logger = logging.getLogger(logger)
-                logger.handlers = [h for h in logger.handlers if h != self.log_file_handler]
+                logger.removeHandler(self.log_file_handler)
             LOGGER.removeHandler(self.log_file_handler)
             self.log_file_handler = None
+            LoggingContext._threads.remove(self._thread)
+
+    def _filter_thread(self, record: logging.LogRecord) -> bool:
+        return record.thread == self._thread or record.thread not in LoggingContext._threads
 
 
 def add_log_file_handler(log_dir: pathlib.Path) -> None:
@@ -20,6 +20,7 @@ from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
 import numpy as np
 
 from model_navigator.api.config import TensorType
+from model_navigator.core.constants import DEFAULT_VALIDATION_CHUNK_SIZE
 from model_navigator.frameworks import Framework, is_jax_available, is_tf_available, is_torch_available
 from model_navigator.utils import common, module
 
@@ -277,6 +278,73 @@ def get_tensor_type(tensor: Any) -> TensorType:
         raise TypeError(f"Unsupported tensor type: {type(tensor)}")
 
 
+@dataclasses.dataclass
+class NonFiniteValues:
+    """Summary of `NaN` and `inf` values found in the tensor.
+
+    Args:
+        nan_count: Number of `NaN` values
+        inf_count: Number of positive and negative `inf` values
+        first_nan_index: Index of the first `NaN` value in C order
+        first_inf_index: Index of the first `inf` value in C order
+    """
+
+    nan_count: int = 0
+    inf_count: int = 0
+    first_nan_index: Optional[Tuple[int, ...]] = None
+    first_inf_index: Optional[Tuple[int, ...]] = None
+
+
+def find_non_finite_values(
+    tensor: np.ndarray, chunk_size: int = DEFAULT_VALIDATION_CHUNK_SIZE
+) -> Optional[NonFiniteValues]:
+    """Find `NaN` and `inf` values in the tensor.
+
+    Tensor is checked in chunks of `chunk_size` elements, so temporary masks stay small and contiguous tensors
+    are not copied. Tensors with integer or boolean data types are not checked.
+
+    Args:
+        tensor: Tensor to check
+        chunk_size: Number of elements checked at once
+
+    Returns:
+        Summary of non finite values or None when all values are finite
+    """
+    if tensor.dtype.kind not in "fc" or tensor.size == 0:
+        return None
+
+    data = tensor.reshape(-1) if tensor.flags.c_contiguous else tensor
+    row_size = data.size // data.shape[0]
+    rows_per_chunk = max(chunk_size // row_size, 1)
+
+    result = None
+    for start in range(0, data.shape[0], rows_per_chunk):
+        chunk = data[start : start + rows_per_chunk]
+        finite = np.isfinite(chunk)
+        if finite.all():
+            continue
+
+        if result is None:
+            result = NonFiniteValues()
+
+        nan_mask = np.isnan(chunk)
+        nan_count = int(np.count_nonzero(nan_mask))
+        result.nan_count += nan_count
+        result.inf_count += int(finite.size - np.count_nonzero(finite)) - nan_count
+        offset = start * row_size
+        if nan_count and result.first_nan_index is None:
+            result.first_nan_index = _unravel_flat_index(offset, nan_mask, tensor.shape)
+        if result.inf_count and result.first_inf_index is None:
+            result.first_inf_index = _unravel_flat_index(offset, np.isinf(chunk), tensor.shape)
+
+    return result
+
+
+def _unravel_flat_index(offset: int, mask: np.ndarray, shape: Tuple[int, ...]) -> Tuple[int, ...]:
+    position = offset + int(np.flatnonzero(mask)[0])
+    return tuple(int(idx) for idx in np.unravel_index(position, shape))
+
+
 FRAMEWORK_TO_TENSOR_TYPE = {
     Framework.TORCH: TensorType.TORCH,
     Framework.TENSORFLOW: TensorType.TENSORFLOW,
@@ -53,14 +53,21 @@ class Workspace:
         """Remove existing workspace."""
         shutil.rmtree(self._path.as_posix(), ignore_errors=True)
 
-    def initialize(self):
-        """Initializing workspace."""
-        if self.exists():
-            LOGGER.info(f"Removing exiting workspace at {self.path}")
-            self.delete()
+    def initialize(self, resume: bool = False):
+        """Initializing workspace.
 
-        LOGGER.info(f"Creating workspace at {self.path}")
-        self.create()
+        Args:
+            resume: If True, keep the existing workspace to resume the previous execution in it
+        """
+        if resume and self.exists():
+            LOGGER.info(f"Resuming in existing workspace at {self.path}")
+        else:
+            if self.exists():
+                LOGGER.info(f"Removing exiting workspace at {self.path}")
+                self.delete()
+
+            LOGGER.info(f"Creating workspace at {self.path}")
+            self.create()
 
         LOGGER.info("Initializing log file.")
         add_log_file_handler(log_dir=self.path)
@@ -12,43 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Definition of Deep Learning frameworks related constants."""
-from distutils.version import LooseVersion
+import functools
+import importlib
+import importlib.util
 from enum import Enum
+from importlib import metadata as importlib_metadata
+from typing import Optional, Tuple
 
-try:
-    import jax.experimental  # pytype: disable=import-error # noqa: F401
+from packaging import version
 
-    _JAX_AVILABLE = True
-except ModuleNotFoundError:
-    _JAX_AVILABLE = False
-
-try:
-    import torch  # pytype: disable=import-error # noqa: F401
-
-    _TORCH_AVAILABLE = True
-    _TORCH_VERSION = LooseVersion(torch.__version__)
-except ModuleNotFoundError:
-    _TORCH_AVAILABLE = False
-
-try:
-    import tensorflow  # pytype: disable=import-error
-
-    _TF_VERSION = LooseVersion(tensorflow.__version__)
-
-    if _TF_VERSION < LooseVersion("2.0.0"):
-        _TF_AVAILABLE = False
-    else:
-        _TF_AVAILABLE = True
-except (ModuleNotFoundError, AttributeError):
-    _TF_AVAILABLE = False
-
-
-try:
-    import tensorrt  # pytype: disable=import-error # noqa: F401
-
-    _TRT_AVAILABLE = True
-except ModuleNotFoundError:
-    _TRT_AVAILABLE = False
+# Distributions checked for the version of the framework, importing the framework only to check it is slow
+_FRAMEWORK_DISTRIBUTIONS = {
+    "torch": ["torch"],
+    "tensorflow": ["tensorflow", "tensorflow-gpu", "tensorflow-cpu", "tf-nightly", "tensorflow-macos"],
+    "jax": ["jax"],
+    "tensorrt": ["tensorrt"],
+}
 
 
 class Framework(Enum):
@@ -76,7 +55,7 @@ def is_torch_available() -> bool:
     Returns:
         bool: True if torch is available.
     """
-    return _TORCH_AVAILABLE
+    return _get_framework_release("torch") is not None
 
 
 def is_torch2_available() -> bool:
@@ -85,7 +64,8 @@ def is_torch2_available() -> bool:
     Returns:
         bool: True if torch2 is available.
     """
-    return _TORCH_AVAILABLE and _TORCH_VERSION >= LooseVersion("2.0.0")
+    release = _get_framework_release("torch")
+    return release is not None and release >= (2, 0, 0)
 
 
 def is_tf_available() -> bool:
@@ -94,7 +74,8 @@ def is_tf_available() -> bool:
     Returns:
         bool: True if tensorflow is available.
     """
-    return _TF_AVAILABLE
+    release = _get_framework_release("tensorflow")
+    return release is not None and release >= (2, 0, 0)
 
 
 def is_jax_available() -> bool:
@@ -103,7 +84,7 @@ def is_jax_available() -> bool:
     Returns:
         bool: True if JAX is available.
     """
-    return _JAX_AVILABLE
+    return _get_framework_release("jax") is not None
 
 
 def is_trt_available() -> bool:
@@ -112,4 +93,23 @@ def is_trt_available() -> bool:
     Returns:
         bool: True if TensorRT is available.
     """
-    return _TRT_AVAILABLE
+    return _get_framework_release("tensorrt") is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _get_framework_release(module_name: str) -> Optional[Tuple[int, ...]]:
+    # the framework is found without importing it, it is imported when a runner or a command uses it
+    if importlib.util.find_spec(module_name) is None:
+        return None
+
+    for distribution in _FRAMEWORK_DISTRIBUTIONS[module_name]:
+        try:
+            return version.parse(importlib_metadata.version(distribution)).release
+        except (importlib_metadata.PackageNotFoundError, version.InvalidVersion):
+            continue
+
+    try:
+        module = importlib.import_module(module_name)
+        return version.parse(module.__version__).release
+    except (ImportError, AttributeError, version.InvalidVersion):
+        return None
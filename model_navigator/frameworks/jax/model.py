@@ -13,21 +13,33 @@
 # limitations under the License.
 """JAX utils."""
 
-from typing import Any
+import pathlib
+from typing import Any, Optional
 
 
 class JaxModel:
     """Wrapper on a JAX infer function and params."""
 
-    def __init__(self, model: Any, params: Any) -> None:
+    def __init__(
+        self,
+        model: Any,
+        params: Any,
+        compilation_cache_dir: Optional[pathlib.Path] = None,
+    ) -> None:
         """Initialize JaxModel.
 
         Args:
             model (Any): Inference function.
             params (Any): JAX Parameters.
+            compilation_cache_dir (Optional[pathlib.Path]): Directory for persistent JAX compilation cache shared
+                by optimize runs and loaded packages. It is used by the runners compiling the model while they are
+                active. None disables the persistent cache.
         """
         self._model = model
         self._params = params
+        self._compilation_cache_dir = (
+            pathlib.Path(compilation_cache_dir).expanduser() if compilation_cache_dir is not None else None
+        )
 
     @property
     def model(self) -> Any:
@@ -47,6 +59,15 @@ class JaxModel:
         """
         return self._params
 
+    @property
+    def compilation_cache_dir(self) -> Optional[pathlib.Path]:
+        """Directory for persistent JAX compilation cache.
+
+        Returns:
+            Optional[pathlib.Path]: Cache directory or None when persistent cache is disabled.
+        """
+        return self._compilation_cache_dir
+
     def __call__(self, *args: Any, **kwds: Any) -> Any:
         """Run the inference on the model.
 
@@ -19,7 +19,7 @@ import zipfile
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 from model_navigator.api.config import Format, TensorRTProfile
-from model_navigator.commands.base import CommandStatus
+from model_navigator.commands.base import CommandMetrics, CommandOutput, CommandStatus
 from model_navigator.commands.infer_metadata import InferInputMetadata, InferOutputMetadata
 from model_navigator.commands.load import LoadMetadata
 from model_navigator.commands.verification.verify import VerifyModel
@@ -29,6 +29,7 @@ from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata
 from model_navigator.exceptions import ModelNavigatorRuntimeAnalyzerError, ModelNavigatorRuntimeError
 from model_navigator.pipelines.pipeline_context import PipelineCommands, PipelineContext
+from model_navigator.runners.registry import get_runner
 from model_navigator.runtime_analyzer.strategy import MaxThroughputStrategy, MinLatencyStrategy
 from model_navigator.utils.format_helpers import FORMAT2SUFFIX, get_framework_export_formats
 
@@ -50,7 +51,7 @@ class PackageBuilder:
         Returns:
             Package object
         """
-        status, result = self._get_command_status_and_result(context.commands)
+        status, result, metrics = self._get_status_result_and_metrics(context.commands.commands)
 
         status = Status(
             uuid=str(uuid.uuid1()),
@@ -58,13 +59,14 @@ class PackageBuilder:
             model_navigator_version=context.metadata.model_navigator_version,
             environment=context.metadata.environment,
             config=config.to_dict(),
-            models_status=self._get_model_status(context.commands),
+            models_status=self._get_model_status(config, context.commands),
             input_metadata=self._get_input_metadata(context.commands),
             output_metadata=self._get_output_metadata(context.commands),
             dataloader_trt_profile=self._get_dataloader_trt_profile(context.commands),
             dataloader_max_batch_size=self._get_dataloader_max_batch_size(context.commands),
             status=status,
             result=result,
+            metrics=metrics,
         )
 
         package = Package(status=status, workspace=context.workspace, model=model)
@@ -179,50 +181,47 @@ class PackageBuilder:
 
         return list(reproduction_paths_to_save)
 
-    def _get_command_status_and_result(
-        self, commands: PipelineCommands
-    ) -> Tuple[Dict[str, CommandStatus], Dict[str, Any]]:
+    def _get_status_result_and_metrics(
+        self, commands: Dict[str, CommandOutput]
+    ) -> Tuple[Dict[str, CommandStatus], Dict[str, Any], Dict[str, CommandMetrics]]:
         status = {}
         result = {}
-        for command_name, command_output in commands.commands.items():
+        metrics = {}
+        for command_name, command_output in commands.items():
             status[command_name] = command_output.status
             if command_output.output:
                 result[command_name] = command_output.output
+            if command_output.metrics:
+                metrics[command_name] = command_output.metrics
 
-        return status, result
+        return status, result, metrics
 
-    def _get_model_status(self, commands: PipelineCommands) -> Dict[str, ModelStatus]:
+    def _get_model_status(self, config: CommonConfig, commands: PipelineCommands) -> Dict[str, ModelStatus]:
         model_commands = commands.models_commands
+        dataloader_trt_profile = self._get_dataloader_trt_profile(commands)
         model_status = {}
         for model_key, model_command in model_commands.items():
 
             runners_status = {}
             for runner_name, runner_command in model_command.runners_commands.items():
-                status = {}
-                result = {}
-                for command_name, command_output in runner_command.commands.items():
-                    status[command_name] = command_output.status
-                    if command_output.output:
-                        result[command_name] = command_output.output
-
+                status, result, metrics = self._get_status_result_and_metrics(runner_command.commands)
                 runners_status[runner_name] = RunnerStatus(
                     runner_name=runner_name,
                     status=status,
                     result=result,
+                    metrics=metrics,
+                    runner_options=get_runner(runner_name).get_runner_options(
+                        custom_configs=config.custom_configs, dataloader_trt_profile=dataloader_trt_profile
+                    ),
                 )
 
-            status = {}
-            result = {}
-            for command_name, command_output in model_command.commands.items():
-                status[command_name] = command_output.status
-                if command_output.output:
-                    result[command_name] = command_output.output
-
+            status, result, metrics = self._get_status_result_and_metrics(model_command.commands)
             model_status[model_key] = ModelStatus(
                 model_config=model_command.model_config,
                 runners_status=runners_status,
                 status=status,
                 result=result,
+                metrics=metrics,
             )
 
         return model_status
@@ -21,10 +21,15 @@ import yaml
 from model_navigator.api.config import (
     CUSTOM_CONFIGS_MAPPING,
     SERIALIZED_FORMATS,
+    ArtifactCacheConfig,
+    CorrectnessTolerance,
     CustomConfigForFormat,
     DeviceKind,
+    ExecutionLimitsConfig,
     Format,
     OptimizationProfile,
+    ParallelConfig,
+    PlannerConfig,
     TensorType,
 )
 from model_navigator.commands.base import CommandStatus
@@ -98,6 +103,29 @@ class Package:
             optimization_profile = OptimizationProfile.from_dict(optimization_profile)
         config_dict["optimization_profile"] = optimization_profile
 
+        correctness_tolerances = config_dict.get("correctness_tolerances")
+        if correctness_tolerances is not None:
+            config_dict["correctness_tolerances"] = {
+                name: CorrectnessTolerance.from_dict(tolerance) if isinstance(tolerance, dict) else tolerance
+                for name, tolerance in correctness_tolerances.items()
+            }
+
+        parallel_config = config_dict.get("parallel_config")
+        if isinstance(parallel_config, dict):
+            config_dict["parallel_config"] = ParallelConfig.from_dict(parallel_config)
+
+        artifact_cache = config_dict.get("artifact_cache")
+        if isinstance(artifact_cache, dict):
+            config_dict["artifact_cache"] = ArtifactCacheConfig.from_dict(artifact_cache)
+
+        planner = config_dict.get("planner")
+        if isinstance(planner, dict):
+            config_dict["planner"] = PlannerConfig.from_dict(planner)
+
+        execution_limits = config_dict.get("execution_limits")
+        if isinstance(execution_limits, dict):
+            config_dict["execution_limits"] = ExecutionLimitsConfig.from_dict(execution_limits)
+
         if "batch_dim" not in config_dict:
             config_dict["batch_dim"] = None
 
@@ -248,11 +276,15 @@ class Package:
             model = self._model
         else:
             model = self.workspace.path / model_config.path
+
+        runner_status = self.status.models_status[model_key].runners_status.get(runner_name)
+        runner_options = runner_status.runner_options if runner_status else {}
         return get_runner(runner_name)(
             model=model,
             input_metadata=self.status.input_metadata,
             output_metadata=self.status.output_metadata,
             return_type=return_type,
+            **runner_options,
         )  # pytype: disable=not-instantiable
 
     def _get_best_runtime(
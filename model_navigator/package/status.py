@@ -20,7 +20,7 @@ import dataclasses
 import datetime
 import pathlib
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from packaging import version
 
@@ -34,8 +34,12 @@ from model_navigator.api.config import (
     TensorRTProfile,
     TorchTensorRTConfig,
 )
-from model_navigator.commands.base import CommandStatus
-from model_navigator.commands.correctness.correctness import Correctness, TolerancePerOutputName
+from model_navigator.commands.base import CommandMetrics, CommandStatus
+from model_navigator.commands.correctness.correctness import (
+    Correctness,
+    ErrorHistogramPerOutputName,
+    TolerancePerOutputName,
+)
 from model_navigator.commands.performance.performance import Performance, ProfilingResults
 from model_navigator.commands.verification.verify import VerifyModel
 from model_navigator.configuration.model.model_config import ModelConfig
@@ -54,6 +58,8 @@ class RunnerStatus(DataObject):
     runner_name: str
     status: Dict[str, CommandStatus] = field(default_factory=lambda: {})
     result: Dict = field(default_factory=lambda: {})
+    metrics: Dict[str, CommandMetrics] = field(default_factory=lambda: {})
+    runner_options: Dict[str, Any] = field(default_factory=lambda: {})
 
     @classmethod
     def from_dict(cls, data_dict: Dict) -> "RunnerStatus":
@@ -73,23 +79,35 @@ class RunnerStatus(DataObject):
                 continue
 
             if c == Correctness.name:
+                correctness_result = data_dict["result"][Correctness.__name__]
                 result[c] = {
-                    "per_output_tolerance": TolerancePerOutputName.from_json(
-                        data_dict["result"][Correctness.__name__]["per_output_tolerance"]
-                    )
+                    "per_output_tolerance": TolerancePerOutputName.from_json(correctness_result["per_output_tolerance"])
                 }
+                if "per_output_error_histogram" in correctness_result:
+                    result[c]["per_output_error_histogram"] = ErrorHistogramPerOutputName.from_json(
+                        correctness_result["per_output_error_histogram"]
+                    )
             elif c == Performance.name:
+                performance_result = data_dict["result"][Performance.__name__]
                 result[c] = {
                     "profiling_results": [
                         ProfilingResults.from_dict(profiling_results_dict)
-                        for profiling_results_dict in data_dict["result"][Performance.__name__]["profiling_results"]
+                        for profiling_results_dict in performance_result["profiling_results"]
                     ]
                 }
+                if "samples_profiling_results" in performance_result:
+                    result[c]["samples_profiling_results"] = [
+                        ProfilingResults.from_dict(profiling_results_dict)
+                        for profiling_results_dict in performance_result["samples_profiling_results"]
+                    ]
+                    result[c]["profiling_samples"] = performance_result["profiling_samples"]
 
         return cls(
             runner_name=data_dict["runner_name"],
             status=status,
             result=result,
+            metrics=_parse_metrics(data_dict),
+            runner_options=data_dict.get("runner_options", {}),
         )
 
 
@@ -101,6 +119,7 @@ class ModelStatus(DataObject):
     runners_status: Dict[str, RunnerStatus] = field(default_factory=lambda: {})
     status: Dict[str, CommandStatus] = field(default_factory=lambda: {})
     result: Dict = field(default_factory=lambda: {})
+    metrics: Dict[str, CommandMetrics] = field(default_factory=lambda: {})
 
     @classmethod
     def from_dict(cls, data_dict: Dict) -> "ModelStatus":
@@ -120,6 +139,7 @@ class ModelStatus(DataObject):
             },
             status={k: CommandStatus(v) for k, v in data_dict.get("status", {}).items()},
             result=data_dict.get("result", {}),
+            metrics=_parse_metrics(data_dict),
         )
 
 
@@ -139,6 +159,7 @@ class Status(DataObject):
     dataloader_max_batch_size: int
     status: Dict[str, CommandStatus] = field(default_factory=lambda: {})
     result: Dict = field(default_factory=lambda: {})
+    metrics: Dict[str, CommandMetrics] = field(default_factory=lambda: {})
     timestamp: str = dataclasses.field(default_factory=lambda: f"{datetime.datetime.utcnow():%Y-%m-%dT%H:%M:%S.%f}")
 
     @classmethod
@@ -191,6 +212,7 @@ class Status(DataObject):
             output_metadata=TensorMetadata.from_json(data_dict["output_metadata"]),
             dataloader_trt_profile=dataloader_trt_profile,
             dataloader_max_batch_size=int(data_dict["dataloader_max_batch_size"]),
+            metrics=_parse_metrics(data_dict),
             timestamp=data_dict["timestamp"],
         )
 
@@ -207,6 +229,13 @@ class Status(DataObject):
         return model_configs
 
 
+def _parse_metrics(data_dict: Dict) -> Dict[str, CommandMetrics]:
+    return {
+        command_name: CommandMetrics.from_dict(metrics)
+        for command_name, metrics in data_dict.get("metrics", {}).items()
+    }
+
+
 class StatusDictUpdater:
     """Update status dictionary to the current version."""
 
@@ -0,0 +1,431 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Content-addressed cache of exported and converted models shared between optimize calls.
+
+Each entry is a directory named by the key of the unit which produced the model:
+
+    <cache>/entries/<key>/artifacts/  - model and files stored next to it, like ONNX external weights
+    <cache>/entries/<key>/output.pkl  - output of the command
+    <cache>/entries/<key>/entry.json  - command, size of artifacts; modification time marks the last use
+
+Entries are created in a temporary directory and moved to place, so the cache can be shared by concurrent runs.
+"""
+import functools
+import hashlib
+import json
+import os
+import pathlib
+import pickle
+import platform
+import shutil
+import uuid
+from dataclasses import dataclass
+from importlib import metadata as importlib_metadata
+from inspect import getfullargspec
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from model_navigator.api.config import ArtifactCacheConfig
+from model_navigator.commands.base import CommandOutput, CommandStatus, ExecutionUnit
+from model_navigator.configuration.common_config import CommonConfig
+from model_navigator.core.constants import ARTIFACT_CACHE_VERSION, DEFAULT_ARTIFACT_CACHE_DIR, NAVIGATOR_VERSION
+from model_navigator.core.logger import LOGGER, pad_string
+from model_navigator.core.workspace import Workspace
+from model_navigator.frameworks.jax import JaxModel
+from model_navigator.pipelines.pipeline_context import PipelineContext
+from model_navigator.utils.common import DataObject
+from model_navigator.utils.environment import PACKAGES, get_gpu_info
+
+
+@dataclass
+class ArtifactCacheStats(DataObject):
+    """Statistics of the artifact cache usage.
+
+    Args:
+        hits: Number of models copied from the cache
+        misses: Number of models not found in the cache
+        stores: Number of models added to the cache
+        evictions: Number of models removed from the cache to fit the size limit
+        size: Size of the models in the cache in bytes
+    """
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+class ArtifactCache:
+    """Cache of models produced by the exports and conversions.
+
+    Key of the model covers:
+        - content of the source model, or of the parent model for conversions,
+        - parameters passed to the command, like format specific parameters from custom configs and model metadata,
+        - versions of Model Navigator, Python, frameworks and GPU with driver,
+        - content of the samples stored in the workspace, which are used to trace and build the models.
+    """
+
+    _ignored_parameters = ["workspace", "model", "dataloader", "verify_func", "verbose", "debug"]
+    _ignored_files = ["*.log", "reproduce_*"]
+
+    def __init__(self, config: ArtifactCacheConfig) -> None:
+        """Initialize object.
+
+        Args:
+            config: Location and size limit of the cache
+        """
+        self._path = pathlib.Path(config.path or DEFAULT_ARTIFACT_CACHE_DIR).expanduser()
+        self._entries_path = self._path / "entries"
+        self._max_size = config.max_size
+        self._stats = ArtifactCacheStats()
+        self._samples_fingerprint: Optional[str] = None
+
+    @property
+    def path(self) -> pathlib.Path:
+        """Directory of the cache."""
+        return self._path
+
+    @property
+    def stats(self) -> ArtifactCacheStats:
+        """Statistics of the cache usage in this run."""
+        return self._stats
+
+    def get_key(
+        self, workspace: Workspace, config: CommonConfig, execution_unit: ExecutionUnit, context: PipelineContext
+    ) -> Optional[str]:
+        """Compute key of the model produced by the unit.
+
+        Args:
+            workspace: Workspace where unit is executed
+            config: Common configuration passed to execution
+            execution_unit: Unit producing the model
+            context: Pipeline execution context with outputs passed to the command
+
+        Returns:
+            Hex digest of the key or None if the model produced by the unit cannot be cached
+        """
+        if not execution_unit.command.is_cacheable() or execution_unit.model_config is None:
+            return None
+
+        model_config = execution_unit.model_config
+        if model_config.parent is None:
+            model_fingerprint = context.get_model_fingerprint(config.model)
+        else:
+            model_fingerprint = _get_files_fingerprint(
+                _get_model_files(workspace.path / model_config.parent.path, self._ignored_files)
+            )
+        if model_fingerprint is None:
+            return None
+
+        try:
+            context.validate_execution(execution_unit=execution_unit)
+            command_args = context.command_args(workspace=workspace, config=config, execution_unit=execution_unit)
+        except Exception as e:
+            LOGGER.debug(f"Model of command {execution_unit.command.name!r} cannot be cached: {e}")
+            return None
+
+        parameters = {
+            name: command_args[name]
+            for name in getfullargspec(execution_unit.command._run).args
+            if name in command_args and name not in self._ignored_parameters
+        }
+        data = {
+            "version": ARTIFACT_CACHE_VERSION,
+            "command": execution_unit.command.name,
+            "model": model_fingerprint,
+            "parameters": DataObject.parse_data(parameters),
+            "environment": _get_environment(),
+            "samples": self._get_samples_fingerprint(workspace),
+        }
+
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(json.dumps(data, sort_keys=True, default=_get_key_value).encode())
+
+        return hasher.hexdigest()
+
+    def restore(
+        self, key: Optional[str], workspace: Workspace, execution_unit: ExecutionUnit
+    ) -> Optional[CommandOutput]:
+        """Copy model from the cache to the workspace.
+
+        Args:
+            key: Key of the model
+            workspace: Workspace where unit is executed
+            execution_unit: Unit producing the model
+
+        Returns:
+            Output of the command which produced the cached model or None if model is not in the cache
+        """
+        if key is None or (workspace.path / execution_unit.model_config.path).exists():
+            return None
+
+        entry_path = self._entries_path / key
+        model_path = workspace.path / execution_unit.model_config.path
+        try:
+            with (entry_path / "output.pkl").open("rb") as fp:
+                command_output = pickle.load(fp)
+            # Resources were used by the run which stored the model
+            command_output.metrics = None
+            shutil.copytree(entry_path / "artifacts", model_path.parent, dirs_exist_ok=True)
+            os.utime(entry_path / "entry.json")
+        except Exception as e:
+            LOGGER.debug(f"Model of command {execution_unit.command.name!r} not restored from cache: {e}")
+            if model_path.is_dir():
+                shutil.rmtree(model_path, ignore_errors=True)
+            else:
+                model_path.unlink(missing_ok=True)
+            self._stats.misses += 1
+            return None
+
+        self._stats.hits += 1
+        LOGGER.info(pad_string(f"Command {execution_unit.command.name!r} restored from artifact cache"))
+
+        return command_output
+
+    def store(
+        self, key: Optional[str], workspace: Workspace, execution_unit: ExecutionUnit, command_output: CommandOutput
+    ) -> None:
+        """Add model produced by the unit to the cache and remove least recently used models above the size limit.
+
+        Args:
+            key: Key of the model
+            workspace: Workspace where unit was executed
+            execution_unit: Unit which produced the model
+            command_output: Output of the command
+        """
+        model_path = workspace.path / execution_unit.model_config.path if execution_unit.model_config else None
+        if key is None or command_output.status != CommandStatus.OK or not model_path.exists():
+            return
+
+        entry_path = self._entries_path / key
+        tmp_path = self._path / "tmp" / uuid.uuid4().hex
+        try:
+            files = _get_model_files(model_path, self._ignored_files)
+            tmp_path.mkdir(parents=True)
+            for file in files:
+                destination = tmp_path / "artifacts" / file.relative_to(model_path.parent)
+                destination.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(file, destination)
+            with (tmp_path / "output.pkl").open("wb") as fp:
+                pickle.dump(command_output, fp)
+            with (tmp_path / "entry.json").open("w") as fp:
+                json.dump({"command": execution_unit.command.name, "size": _get_files_size(files)}, fp)
+
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_path, entry_path)
+        except OSError as e:
+            if entry_path.exists():
+                LOGGER.debug(f"Model of command {execution_unit.command.name!r} already stored in cache.")
+            else:
+                LOGGER.warning(f"Model of command {execution_unit.command.name!r} not stored in cache: {e}")
+            return
+        finally:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+        self._stats.stores += 1
+        LOGGER.info(f"Model of command {execution_unit.command.name!r} stored in artifact cache {entry_path}.")
+        self._evict()
+
+    def log_stats(self) -> None:
+        """Log statistics of the cache usage and update statistics of all runs stored in the cache."""
+        self._stats.size = sum(size for _, _, size in self._get_entries())
+        LOGGER.info(
+            f"Artifact cache {self._path}: {self._stats.hits} hits, {self._stats.misses} misses, "
+            f"{self._stats.stores} stored, {self._stats.evictions} evicted, size {self._stats.size} bytes."
+        )
+
+        stats_path = self._path / "stats.json"
+        try:
+            total_stats = json.loads(stats_path.read_text()) if stats_path.exists() else {}
+            for name in ["hits", "misses", "stores", "evictions"]:
+                total_stats[name] = total_stats.get(name, 0) + getattr(self._stats, name)
+            tmp_stats_path = stats_path.with_name(f"stats.json.{uuid.uuid4().hex}")
+            tmp_stats_path.write_text(json.dumps(total_stats))
+            os.replace(tmp_stats_path, stats_path)
+        except (OSError, ValueError) as e:
+            LOGGER.debug(f"Statistics of artifact cache not updated: {e}")
+
+    def _evict(self) -> None:
+        if self._max_size is None:
+            return
+
+        entries = sorted(self._get_entries(), key=lambda entry: entry[1])
+        size = sum(entry_size for _, _, entry_size in entries)
+        for entry_path, _, entry_size in entries:
+            if size <= self._max_size:
+                break
+            shutil.rmtree(entry_path, ignore_errors=True)
+            size -= entry_size
+            self._stats.evictions += 1
+            LOGGER.info(f"Removed least recently used model {entry_path} from artifact cache.")
+
+    def _get_entries(self) -> List:
+        if not self._entries_path.is_dir():
+            return []
+
+        entries = []
+        for entry_path in self._entries_path.iterdir():
+            try:
+                entry_file = entry_path / "entry.json"
+                entries.append((entry_path, entry_file.stat().st_mtime, json.loads(entry_file.read_text())["size"]))
+            except (OSError, ValueError, KeyError):
+                continue
+
+        return entries
+
+    def _get_samples_fingerprint(self, workspace: Workspace) -> str:
+        if self._samples_fingerprint is None:
+            samples_path = workspace.path / "model_input"
+            files = sorted(samples_path.rglob("*")) if samples_path.exists() else []
+            self._samples_fingerprint = _get_files_fingerprint(files, root=samples_path)
+
+        return self._samples_fingerprint
+
+
+def get_model_fingerprint(model: Any) -> Optional[str]:
+    """Compute fingerprint of the source model content.
+
+    Supported are paths to serialized models, PyTorch modules, Keras models and JAX models.
+    Fingerprint of the modules covers the class, structure and the weights.
+
+    Args:
+        model: Source model
+
+    Returns:
+        Hex digest of the model or None if the model is not supported
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    if isinstance(model, (str, pathlib.Path)):
+        model_path = pathlib.Path(model)
+        if not model_path.exists():
+            return None
+        return _get_files_fingerprint(sorted([model_path, *model_path.rglob("*")]), root=model_path)
+
+    if isinstance(model, JaxModel):
+        function = model.model
+        hasher.update(f"{function.__module__}.{function.__qualname__}".encode())
+        if hasattr(function, "__code__"):
+            hasher.update(function.__code__.co_code)
+        _update_with_tensors(hasher, model.params)
+    elif hasattr(model, "state_dict"):
+        hasher.update(f"{type(model).__module__}.{type(model).__qualname__}".encode())
+        if type(model).__repr__ is not object.__repr__:
+            # Modules describe their structure in repr, default repr contains only the object address
+            hasher.update(repr(model).encode())
+        _update_with_tensors(hasher, model.state_dict())
+    elif hasattr(model, "get_weights"):
+        hasher.update(f"{type(model).__module__}.{type(model).__qualname__}".encode())
+        try:
+            hasher.update(model.to_json().encode())
+        except Exception:
+            pass
+        _update_with_tensors(hasher, model.get_weights())
+    else:
+        return None
+
+    return hasher.hexdigest()
+
+
+def _update_with_tensors(hasher, value: Any) -> None:
+    if isinstance(value, dict):
+        for name in sorted(value, key=str):
+            hasher.update(f"{name};".encode())
+            _update_with_tensors(hasher, value[name])
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _update_with_tensors(hasher, item)
+    elif hasattr(value, "detach"):
+        tensor = value.detach().cpu()
+        try:
+            array = tensor.numpy()
+        except TypeError:
+            array = tensor.float().numpy()
+        _update_with_array(hasher, array)
+    else:
+        _update_with_array(hasher, np.asarray(value))
+
+
+def _update_with_array(hasher, array: np.ndarray) -> None:
+    array = np.ascontiguousarray(array)
+    hasher.update(f"{array.dtype.str}:{array.shape};".encode())
+    if array.dtype != object:
+        hasher.update(array.data)
+
+
+def _get_model_files(model_path: pathlib.Path, ignored_files: List[str]) -> List[pathlib.Path]:
+    """Get model files together with files stored next to the model, like ONNX external weights."""
+    if not model_path.exists():
+        return []
+
+    files = []
+    for path in sorted(model_path.parent.rglob("*")):
+        relative_path = path.relative_to(model_path.parent)
+        if not path.is_file() or any(relative_path.match(pattern) for pattern in ignored_files):
+            continue
+        files.append(path)
+
+    return files
+
+
+def _get_files_fingerprint(files: Iterable[pathlib.Path], root: Optional[pathlib.Path] = None) -> Optional[str]:
+    files = [file for file in files if file.is_file()]
+    if not files:
+        return None
+
+    hasher = hashlib.blake2b(digest_size=16)
+    for file in files:
+        name = file.relative_to(root) if root is not None else file.name
+        hasher.update(f"{pathlib.PurePath(name).as_posix()}:{file.stat().st_size};".encode())
+        with file.open("rb") as fp:
+            for chunk in iter(functools.partial(fp.read, 2**20), b""):
+                hasher.update(chunk)
+
+    return hasher.hexdigest()
+
+
+def _get_files_size(files: Iterable[pathlib.Path]) -> int:
+    return sum(file.stat().st_size for file in files)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_environment() -> Dict[str, Any]:
+    packages = {}
+    for package in PACKAGES:
+        try:
+            packages[package] = importlib_metadata.version(package)
+        except importlib_metadata.PackageNotFoundError:
+            packages[package] = None
+
+    gpu_info = get_gpu_info()
+
+    return {
+        "model_navigator": NAVIGATOR_VERSION,
+        "python": platform.python_version(),
+        "packages": packages,
+        "gpu": gpu_info["name"],
+        "driver": gpu_info["driver_version"],
+    }
+
+
+def _get_key_value(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, type) or callable(value):
+        return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', type(value).__qualname__)}"
+
+    return f"{type(value).__module__}.{type(value).__qualname__}"
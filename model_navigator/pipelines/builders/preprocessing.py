@@ -17,7 +17,7 @@ from typing import Dict, List
 
 from model_navigator.api.config import Format
 from model_navigator.commands.base import ExecutionUnit
-from model_navigator.commands.data_dump.samples import FetchInputModelData, FetchOutputModelData
+from model_navigator.commands.data_dump.samples import FetchOutputModelData
 from model_navigator.commands.infer_metadata import InferInputMetadata, InferOutputMetadata
 from model_navigator.commands.load import LoadMetadata
 from model_navigator.configuration.common_config import CommonConfig
@@ -44,7 +44,6 @@ def preprocessing_builder(config: CommonConfig, models_config: Dict[Format, List
         execution_units.extend(
             [
                 ExecutionUnit(command=InferInputMetadata),
-                ExecutionUnit(command=FetchInputModelData),
                 ExecutionUnit(command=InferOutputMetadata),
                 ExecutionUnit(command=FetchOutputModelData),
             ]
@@ -0,0 +1,211 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Collecting resources used by commands and exporting them as a timeline."""
+import json
+import pathlib
+import sys
+import threading
+import time
+from typing import Dict, List, Optional
+
+import psutil
+
+from model_navigator.commands.base import CommandMetrics, CommandOutput
+from model_navigator.commands.process_executor import ProcessesUsage
+from model_navigator.core.constants import COMMAND_METRICS_SAMPLING_INTERVAL
+from model_navigator.pipelines.pipeline_context import PipelineCommands
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+class CommandMetricsCollector:
+    """Collect resources used by the current process and its child processes while a command is executed.
+
+    CPU time and bytes written include child processes which finished during the command, like the scripts
+    executed through `ExecutionContext`. Peak memory is sampled in a background thread and completed with
+    the peak memory of the finished child processes reported by the system and by `execute_process`.
+
+    Example:
+        with CommandMetricsCollector() as collector:
+            command_output = command.run()
+        command_output.metrics = collector.metrics
+    """
+
+    def __init__(self, sampling_interval: float = COMMAND_METRICS_SAMPLING_INTERVAL) -> None:
+        """Initialize object.
+
+        Args:
+            sampling_interval: Interval of sampling memory of processes in seconds
+        """
+        self._process = psutil.Process()
+        self._sampling_interval = sampling_interval
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._peak_rss = 0
+        self._start_time = 0.0
+        self._start_counter = 0.0
+        self._start_cpu_time = 0.0
+        self._start_disk_bytes_written: Optional[int] = None
+        self._start_children_peak_rss: Optional[int] = None
+        self._processes_usage = ProcessesUsage()
+        self.metrics: Optional[CommandMetrics] = None
+
+    def __enter__(self) -> "CommandMetricsCollector":
+        """Start collecting metrics."""
+        self._start_time = time.time()
+        self._start_counter = time.perf_counter()
+        self._start_cpu_time = self._get_cpu_time()
+        self._start_disk_bytes_written = self._get_disk_bytes_written()
+        self._start_children_peak_rss = _get_children_peak_rss()
+        self._peak_rss = self._get_rss()
+        self._processes_usage.__enter__()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._sample_rss, daemon=True)
+        self._thread.start()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:  # noqa: F841
+        """Stop collecting metrics and store them in `metrics`."""
+        wall_time = time.perf_counter() - self._start_counter
+        self._stop_event.set()
+        self._thread.join()
+        self._peak_rss = max(self._peak_rss, self._get_rss())
+
+        children_peak_rss = _get_children_peak_rss()
+        if children_peak_rss is not None and children_peak_rss > (self._start_children_peak_rss or 0):
+            # child process finished between samples reached the highest peak of all child processes so far
+            self._peak_rss = max(self._peak_rss, children_peak_rss)
+
+        self._processes_usage.__exit__(exc_type, exc_value, traceback)
+        for process_result in self._processes_usage.results:
+            # peak memory of the processes executed by the command is reported when they are reaped
+            if process_result.peak_rss is not None:
+                self._peak_rss = max(self._peak_rss, process_result.peak_rss)
+
+        disk_bytes_written = self._get_disk_bytes_written()
+        if disk_bytes_written is not None and self._start_disk_bytes_written is not None:
+            disk_bytes_written -= self._start_disk_bytes_written
+
+        self.metrics = CommandMetrics(
+            start_time=self._start_time,
+            wall_time=wall_time,
+            cpu_time=self._get_cpu_time() - self._start_cpu_time,
+            peak_rss=self._peak_rss,
+            disk_bytes_written=disk_bytes_written,
+            pid=self._process.pid,
+        )
+
+    def _sample_rss(self) -> None:
+        while not self._stop_event.wait(self._sampling_interval):
+            self._peak_rss = max(self._peak_rss, self._get_rss())
+
+    def _get_rss(self) -> int:
+        rss = self._process.memory_info().rss
+        for child in self._process.children(recursive=True):
+            try:
+                rss += child.memory_info().rss
+            except psutil.Error:
+                continue
+
+        return rss
+
+    def _get_cpu_time(self) -> float:
+        cpu_times = self._process.cpu_times()
+        return (
+            cpu_times.user
+            + cpu_times.system
+            + getattr(cpu_times, "children_user", 0.0)
+            + getattr(cpu_times, "children_system", 0.0)
+        )
+
+    def _get_disk_bytes_written(self) -> Optional[int]:
+        # On Linux counters of the process include its finished child processes
+        try:
+            return self._process.io_counters().write_bytes
+        except (AttributeError, psutil.Error):
+            return None
+
+
+def save_commands_trace(commands: PipelineCommands, path: pathlib.Path) -> None:
+    """Save timeline of the executed commands in the Chrome trace event format.
+
+    Trace can be opened in `chrome://tracing` or Perfetto UI. Each process executing commands
+    has its own track, so commands executed concurrently by the workers are shown side by side.
+
+    Args:
+        commands: Commands executed in pipelines
+        path: Path to the trace file
+    """
+    events = []
+    for command_name, command_output in commands.commands.items():
+        events.extend(_get_trace_events(command_name, command_output))
+
+    for model_key, model_command in commands.models_commands.items():
+        for command_name, command_output in model_command.commands.items():
+            events.extend(_get_trace_events(command_name, command_output, model_key=model_key))
+
+        for runner_name, runner_command in model_command.runners_commands.items():
+            for command_name, command_output in runner_command.commands.items():
+                events.extend(
+                    _get_trace_events(command_name, command_output, model_key=model_key, runner_name=runner_name)
+                )
+
+    events.sort(key=lambda event: event["ts"])
+    with path.open("w") as fp:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, fp)
+
+
+def _get_trace_events(
+    command_name: str,
+    command_output: CommandOutput,
+    model_key: Optional[str] = None,
+    runner_name: Optional[str] = None,
+) -> List[Dict]:
+    metrics = command_output.metrics
+    if metrics is None:
+        return []
+
+    return [
+        {
+            "name": " ".join(name for name in [model_key, runner_name, command_name] if name),
+            "cat": "runner" if runner_name else "model" if model_key else "pipeline",
+            "ph": "X",
+            "ts": metrics.start_time * 1e6,
+            "dur": metrics.wall_time * 1e6,
+            "pid": metrics.pid or 0,
+            "tid": metrics.pid or 0,
+            "args": {
+                "command": command_name,
+                "model": model_key,
+                "runner": runner_name,
+                "status": command_output.status.value,
+                "cpu_time": metrics.cpu_time,
+                "peak_rss": metrics.peak_rss,
+                "disk_bytes_written": metrics.disk_bytes_written,
+            },
+        }
+    ]
+
+
+def _get_children_peak_rss() -> Optional[int]:
+    if resource is None:
+        return None
+
+    peak_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
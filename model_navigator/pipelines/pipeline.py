@@ -15,13 +15,16 @@
 import contextlib
 import sys
 import traceback
-from typing import List
+from typing import List, Optional
 
 from model_navigator.commands.base import CommandOutput, CommandStatus, ExecutionUnit
+from model_navigator.commands.process_executor import ExecutionLimits
 from model_navigator.configuration.common_config import CommonConfig
 from model_navigator.core.logger import LOGGER, LoggingContext, StdoutLogger, pad_string
 from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import ModelNavigatorCommandNotExecutable, ModelNavigatorUserInputError
+from model_navigator.pipelines.artifact_cache import ArtifactCache
+from model_navigator.pipelines.metrics import CommandMetricsCollector
 from model_navigator.pipelines.pipeline_context import PipelineContext
 
 
@@ -43,43 +46,79 @@ class Pipeline:
         self.id = name.lower().replace(" ", "_").replace("-", "_")
         self.execution_units = execution_units
 
-    def run(self, workspace: Workspace, config: CommonConfig, context: PipelineContext) -> None:
+    def run(
+        self,
+        workspace: Workspace,
+        config: CommonConfig,
+        context: PipelineContext,
+        artifact_cache: Optional[ArtifactCache] = None,
+    ) -> None:
         """Execute pipeline.
 
         Args:
             workspace: Workspace where unit is executed
             config: A global config provided by user
             context: Context of pipeline execution
+            artifact_cache: Cache of exported and converted models. Defaults to None.
         """
         LOGGER.info(pad_string(f"Pipeline {self.name!r} started"))
 
         for execution_unit in self.execution_units:
-            command_output = self._execute_unit(
-                workspace=workspace,
-                execution_unit=execution_unit,
-                config=config,
-                context=context,
-            )
+            fingerprint = context.get_unit_fingerprint(config=config, execution_unit=execution_unit)
+            command_output = context.get_resumed_output(execution_unit=execution_unit, fingerprint=fingerprint)
+            resumed = command_output is not None
+            if not resumed and artifact_cache is not None:
+                cache_key = artifact_cache.get_key(
+                    workspace=workspace, config=config, execution_unit=execution_unit, context=context
+                )
+                command_output = artifact_cache.restore(
+                    key=cache_key, workspace=workspace, execution_unit=execution_unit
+                )
+                if command_output is None:
+                    command_output = self.execute_unit(
+                        workspace=workspace,
+                        execution_unit=execution_unit,
+                        config=config,
+                        context=context,
+                    )
+                    artifact_cache.store(
+                        key=cache_key,
+                        workspace=workspace,
+                        execution_unit=execution_unit,
+                        command_output=command_output,
+                    )
+            elif not resumed:
+                command_output = self.execute_unit(
+                    workspace=workspace,
+                    execution_unit=execution_unit,
+                    config=config,
+                    context=context,
+                )
             context.update(
                 execution_unit=execution_unit,
                 command_output=command_output,
+                fingerprint=fingerprint,
+                resumed=resumed,
             )
             context.save()
 
-    def _execute_unit(
+    def execute_unit(
         self,
         workspace: Workspace,
         execution_unit: ExecutionUnit,
         config: CommonConfig,
         context: PipelineContext,
+        redirect_stdout: bool = True,
     ) -> CommandOutput:
-        """Execute a single unit.
+        """Execute a single unit and collect resources used by the command.
 
         Args:
             workspace: Workspace where unit is executed
             execution_unit: A unit to execute
             config: Common configuration parameters
             context: Pipeline execution context
+            redirect_stdout: Redirect standard output to the logger in debug mode. Standard output is shared
+                by all threads, so it is not redirected when units are executed concurrently in threads.
 
         Returns:
             Command execution result
@@ -88,41 +127,46 @@ class Pipeline:
         if execution_unit.model_config:
             log_dir = workspace.path / execution_unit.model_config.path.parent
 
-        if config.debug:
+        if config.debug and redirect_stdout:
             redirect_stdout_context = StdoutLogger(LOGGER)
         else:
             redirect_stdout_context = contextlib.nullcontext()
 
-        with LoggingContext(log_dir=log_dir), redirect_stdout_context:
+        with LoggingContext(log_dir=log_dir), ExecutionLimits(config.execution_limits), redirect_stdout_context:
             LOGGER.info(pad_string(f"Command {execution_unit.command.name!r} started"))
-            try:
-                context.validate_execution(execution_unit=execution_unit)
-                input_parameters = context.command_args(
-                    workspace=workspace,
-                    config=config,
-                    execution_unit=execution_unit,
-                )
-                command_output = execution_unit.command().run(**input_parameters)  # pytype: disable=not-instantiable
-            except ModelNavigatorUserInputError as e:
-                command_output = CommandOutput(status=CommandStatus.FAIL)
-
-                if config.verbose and e.__context__:
-                    LOGGER.info(e.__context__)
-
-                error = traceback.format_exc()
-                LOGGER.warning(
-                    "Command finished with ModelNavigatorUserInputError. "
-                    "The error is considered as external error. Usually caused by "
-                    "incompatibilities between the model and the target formats and/or runtimes. "
-                    "Please review the command output.\n"
-                    f"{error}"
-                )
-            except ModelNavigatorCommandNotExecutable:
-                command_output = CommandOutput(status=CommandStatus.SKIPPED)
-            except Exception:
-                command_output = CommandOutput(status=CommandStatus.FAIL)
-                error = traceback.format_exc()
-                LOGGER.error(f"Command finished with unexpected error: {error}")
+            with CommandMetricsCollector() as metrics_collector:
+                try:
+                    context.validate_execution(execution_unit=execution_unit)
+                    input_parameters = context.command_args(
+                        workspace=workspace,
+                        config=config,
+                        execution_unit=execution_unit,
+                    )
+                    command_output = execution_unit.command().run(  # pytype: disable=not-instantiable
+                        **input_parameters
+                    )
+                except ModelNavigatorUserInputError as e:
+                    command_output = CommandOutput(status=CommandStatus.FAIL)
+
+                    if config.verbose and e.__context__:
+                        LOGGER.info(e.__context__)
+
+                    error = traceback.format_exc()
+                    LOGGER.warning(
+                        "Command finished with ModelNavigatorUserInputError. "
+                        "The error is considered as external error. Usually caused by "
+                        "incompatibilities between the model and the target formats and/or runtimes. "
+                        "Please review the command output.\n"
+                        f"{error}"
+                    )
+                except ModelNavigatorCommandNotExecutable:
+                    command_output = CommandOutput(status=CommandStatus.SKIPPED)
+                except Exception:
+                    command_output = CommandOutput(status=CommandStatus.FAIL)
+                    error = traceback.format_exc()
+                    LOGGER.error(f"Command finished with unexpected error: {error}")
+
+            command_output.metrics = metrics_collector.metrics
 
             if command_output.status != CommandStatus.OK and execution_unit.command.is_required():
                 sys.exit("The required command has failed. Please, review the log and verify the reported problems.")
@@ -13,11 +13,21 @@
 # limitations under the License.
 """PipelineContext class definition."""
 import collections
+import copy
 import dataclasses
 import datetime
+import hashlib
+import json
+import os
+import pathlib
+import pickle
+import shutil
+import uuid
 from dataclasses import dataclass, field
-from typing import Any, Dict, List
+from inspect import getfullargspec
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import yaml
 from tabulate import tabulate
 
@@ -25,12 +35,21 @@ from model_navigator.api.config import Format
 from model_navigator.commands.base import CommandOutput, CommandStatus, ExecutionUnit
 from model_navigator.configuration.common_config import CommonConfig
 from model_navigator.configuration.model.model_config import ModelConfig
-from model_navigator.core.constants import NAVIGATOR_VERSION
+from model_navigator.core.constants import (
+    CONTEXT_FILENAME,
+    CONTEXT_JOURNAL_FILENAME,
+    CONTEXT_OUTPUTS_DIRNAME,
+    NAVIGATOR_VERSION,
+)
 from model_navigator.core.logger import LOGGER, pad_string
 from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import ModelNavigatorCommandNotExecutable, ModelNavigatorRuntimeError
 from model_navigator.utils.common import DataObject
-from model_navigator.utils.environment import get_env
+from model_navigator.utils.environment import EnvironmentSnapshot
+
+# LibYAML bindings are much faster on large profiling results, pure Python implementation is used without them
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 @dataclass
@@ -49,7 +68,7 @@ class RunnerCommand(DataObject):
         Returns:
             RunnerCommand
         """
-        commands = {k: CommandOutput(v) for k, v in data_dict["commands"].items()}
+        commands = {k: CommandOutput.from_dict(v) for k, v in data_dict["commands"].items()}
 
         return cls(
             commands=commands,
@@ -80,7 +99,9 @@ class ModelCommand(DataObject):
                 runner_name: RunnerCommand.from_dict(runner_res)
                 for runner_name, runner_res in data_dict["runners_commands"].items()
             },
-            commands={command: CommandOutput(output) for command, output in data_dict.get("commands", {}).items()},
+            commands={
+                command: CommandOutput.from_dict(output) for command, output in data_dict.get("commands", {}).items()
+            },
         )
 
 
@@ -155,18 +176,95 @@ class PipelineMetadata(DataObject):
         )
 
 
+@dataclass
+class UnitRecord(DataObject):
+    """Record of the executed unit used to resume pipelines.
+
+    Args:
+        command: Name of the executed command
+        model_key: Key of the model on which command was executed
+        runner_name: Name of the runner with which command was executed
+        fingerprint: Hash of the unit inputs
+        result: Unique identifier of the unit output
+        status: Status of the command
+        artifacts: Paths to files and directories produced by the unit
+    """
+
+    command: str
+    model_key: Optional[str]
+    runner_name: Optional[str]
+    fingerprint: str
+    result: str
+    status: CommandStatus
+    artifacts: List[str] = field(default_factory=lambda: [])
+
+    @classmethod
+    def from_dict(cls, data_dict: Dict) -> "UnitRecord":
+        """Create UnitRecord from the dictionary.
+
+        Args:
+            data_dict: Dictionary with unit record data.
+
+        Returns:
+            UnitRecord
+        """
+        return cls(
+            command=data_dict["command"],
+            model_key=data_dict["model_key"],
+            runner_name=data_dict["runner_name"],
+            fingerprint=data_dict["fingerprint"],
+            result=data_dict["result"],
+            status=CommandStatus(data_dict["status"]),
+            artifacts=data_dict.get("artifacts", []),
+        )
+
+    @property
+    def unit_id(self) -> str:
+        """Identifier of the unit in the context."""
+        return _get_unit_id(command=self.command, model_key=self.model_key, runner_name=self.runner_name)
+
+
 class PipelineContext:
-    """PipelineContext class."""
+    """PipelineContext class.
+
+    Outputs of the executed units are appended to the journal file in the workspace, one JSON record per unit,
+    so saving the context after each unit does not serialize the whole history of the execution. The journal is
+    compacted into the context file when the execution finishes. Loading the context reads the context file
+    and replays the journal records written after it. Resumed context starts the journal with records of the units
+    executed before, so they can be resumed also when the resumed execution is interrupted again.
+
+    Environment is gathered in the background thread started by `initialize` or `resume` while the pipelines
+    are executed. The journal records it only when it was gathered before the journal was started, the context file
+    always records it.
+    """
+
+    _fingerprint_filter_fields = [
+        "model",
+        "dataloader",
+        "verify_func",
+        "verbose",
+        "debug",
+        "parallel_config",
+        "resume",
+        "artifact_cache",
+        "planner",
+        "execution_limits",
+    ]
 
     def __init__(self, workspace: Workspace):
         """Initialize context."""
         self._workspace = workspace
-        self._file = workspace.path / "context.yaml"
-        self._metadata = PipelineMetadata(
-            model_navigator_version=NAVIGATOR_VERSION,
-            environment=get_env(),
-        )
+        self._file = workspace.path / CONTEXT_FILENAME
+        self._journal_file = workspace.path / CONTEXT_JOURNAL_FILENAME
+        self._outputs_path = workspace.path / CONTEXT_OUTPUTS_DIRNAME
+        self._environment_snapshot: Optional[EnvironmentSnapshot] = None
+        self._metadata = PipelineMetadata(model_navigator_version=NAVIGATOR_VERSION, environment={})
         self._commands = PipelineCommands(models_commands={}, commands={})
+        self._units: Dict[str, UnitRecord] = {}
+        self._previous_units: Dict[str, UnitRecord] = {}
+        self._journal_records: List[Dict] = []
+        self._resumed = False
+        self._models_fingerprints: Dict[int, Tuple[Any, Optional[str]]] = {}
 
     @property
     def workspace(self) -> Workspace:
@@ -176,6 +274,7 @@ class PipelineContext:
     @property
     def metadata(self) -> PipelineMetadata:
         """Pipeline Execution Metadata."""
+        self._update_environment(wait=True)
         return self._metadata
 
     @property
@@ -187,53 +286,465 @@ class PipelineContext:
         self,
         execution_unit: ExecutionUnit,
         command_output: CommandOutput,
+        fingerprint: Optional[str] = None,
+        resumed: bool = False,
     ) -> None:
         """Update context based on execution unit and its output.
 
         Args:
             execution_unit: Executed command
             command_output: command output
+            fingerprint: Hash of the unit inputs. When provided, the output is recorded for resuming pipelines.
+            resumed: If True, the output was reused from the previous execution in the workspace
         """
-        if execution_unit.model_config is not None:
-            # If not models_commands with given model_config then add new ModelCommand.
-            if execution_unit.model_config.key not in self._commands.models_commands:
-                self._commands.models_commands[execution_unit.model_config.key] = ModelCommand(
-                    model_config=execution_unit.model_config,
+        unit_record = None
+        if fingerprint is not None:
+            unit_record = self._record_unit(
+                execution_unit=execution_unit,
+                command_output=command_output,
+                fingerprint=fingerprint,
+                resumed=resumed,
+            )
+
+        runner_name = execution_unit.runner_cls.name() if execution_unit.runner_cls else None
+        self._set_command_output(
+            model_config=execution_unit.model_config,
+            runner_name=runner_name,
+            command_name=execution_unit.command.name,
+            command_output=command_output,
+        )
+        self._journal_records.append(
+            {
+                "model_config": execution_unit.model_config.to_dict(parse=True)
+                if execution_unit.model_config
+                else None,
+                "runner_name": runner_name,
+                "command": execution_unit.command.name,
+                "output": command_output.to_dict(parse=True),
+                "unit": unit_record.to_dict(parse=True) if unit_record else None,
+            }
+        )
+
+    def snapshot(self) -> "PipelineContext":
+        """Copy of the context with outputs of the commands executed so far.
+
+        Updates of the context do not change the copy, so it can be read by a command executed in another thread.
+
+        Returns:
+            Copy of the context
+        """
+        context = copy.copy(self)
+        context._commands = PipelineCommands(
+            models_commands={
+                model_key: ModelCommand(
+                    model_config=model_command.model_config,
+                    runners_commands={
+                        runner_name: RunnerCommand(commands=dict(runner_command.commands))
+                        for runner_name, runner_command in model_command.runners_commands.items()
+                    },
+                    commands=dict(model_command.commands),
                 )
-            models_command = self._commands.models_commands[execution_unit.model_config.key]
+                for model_key, model_command in self._commands.models_commands.items()
+            },
+            commands=dict(self._commands.commands),
+        )
+        context._journal_records = []
 
-            if execution_unit.runner_cls is None:
-                models_command.commands[execution_unit.command.name] = command_output
-            else:
-                if execution_unit.runner_cls.name() not in models_command.runners_commands:
-                    models_command.runners_commands[execution_unit.runner_cls.name()] = RunnerCommand()
+        return context
 
-                runners_command = models_command.runners_commands[execution_unit.runner_cls.name()]
-                runners_command.commands[execution_unit.command.name] = command_output
-        elif execution_unit.model_config is None:
-            self._commands.commands[execution_unit.command.name] = command_output
+    def clear(self):
+        """Remove outputs of all executed commands."""
+        self._commands = PipelineCommands(models_commands={}, commands={})
+        self._journal_records = []
 
     def initialize(self):
-        """Initialize context file."""
-        self._file.unlink(missing_ok=True)
-        self._file.touch()
+        """Initialize context files and start gathering the environment."""
+        shutil.rmtree(self._outputs_path, ignore_errors=True)
+        self._environment_snapshot = EnvironmentSnapshot()
+        self._start_journal()
 
-    def load(self):
-        """Load context from file."""
-        with self._file.open("r") as fp:
-            data = yaml.safe_load(fp)
+    def resume(self):
+        """Initialize context from the file saved by the previous execution in the workspace.
+
+        Context starts without executed commands. Outputs of the units executed before are reused
+        through `get_resumed_output` when the inputs of the unit and the files it produced did not change.
+        """
+        data = self._read_snapshot()
+        journal_records = self._read_journal()
+        metadata = next((record["metadata"] for record in journal_records if "metadata" in record), None)
+        if metadata is None:
+            metadata = data.get("metadata")
+
+        if metadata is None:
+            LOGGER.warning(f"No context to resume found in {self._workspace.path}. Executing all commands.")
+            self.initialize()
+            return
+
+        previous_version = metadata["model_navigator_version"]
+        if previous_version != NAVIGATOR_VERSION:
+            LOGGER.warning(
+                f"Context was saved by Model Navigator {previous_version}, "
+                f"current version is {NAVIGATOR_VERSION}. Executing all commands."
+            )
+            self.initialize()
+            return
+
+        self._previous_units = {}
+        units_data = data.get("units", []) + [
+            record.get("unit") or record.get("previous_unit")
+            for record in journal_records
+            if record.get("unit") or record.get("previous_unit")
+        ]
+        for unit_data in units_data:
+            unit_record = UnitRecord.from_dict(unit_data)
+            self._previous_units[unit_record.unit_id] = unit_record
+        self._resumed = True
+        self._environment_snapshot = EnvironmentSnapshot()
+        self._start_journal()
+
+        LOGGER.info(f"Resuming {len(self._previous_units)} commands executed before in {self._workspace.path}.")
+
+    def get_unit_fingerprint(self, config: CommonConfig, execution_unit: ExecutionUnit) -> Optional[str]:
+        """Compute hash of the unit inputs when resuming pipelines is enabled.
+
+        Fingerprint covers the command, model and runner of the unit, the configuration with the content of the model,
+        the fingerprint of the samples reported by the command which iterated over the dataloader, and outputs
+        of the units which the command could receive arguments from or which produced the parent models. Outputs
+        of these units are identified by their results, which change every time a unit is executed, so a unit
+        is executed again when any of the units it depends on is executed again.
+
+        The dataloader is not iterated to compute the fingerprint, so units of commands reading the dataloader
+        before the fingerprint of the samples is known are not resumable.
+
+        Args:
+            config: Common configuration passed to execution
+            execution_unit: Unit to compute the fingerprint for
+
+        Returns:
+            Hex digest of the unit inputs or None if the unit cannot be resumed
+        """
+        if not config.resume:
+            return None
+
+        samples_fingerprint = self._get_samples_fingerprint()
+        if samples_fingerprint is None and "dataloader" in getfullargspec(execution_unit.command._run).args:
+            return None
+
+        model_config = execution_unit.model_config
+        dependencies = sorted(
+            [unit_record.unit_id, unit_record.result]
+            for unit_record in self._units.values()
+            if _is_unit_dependency(unit_record, execution_unit)
+        )
+        data = {
+            "unit": _get_execution_unit_id(execution_unit),
+            "config": config.to_dict(filter_fields=self._fingerprint_filter_fields, parse=True),
+            "model": self.get_model_fingerprint(config.model),
+            "samples": samples_fingerprint,
+            "kwargs": DataObject.parse_data(execution_unit.kwargs),
+            "model_config": DataObject.parse_data(model_config.get_config_dict_for_command()) if model_config else None,
+            "dependencies": dependencies,
+        }
+
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(json.dumps(data, sort_keys=True, default=_get_fingerprint_value).encode())
+
+        return hasher.hexdigest()
+
+    def get_model_fingerprint(self, model: Any) -> Optional[str]:
+        """Compute fingerprint of the source model content once per model.
+
+        Args:
+            model: Source model
+
+        Returns:
+            Hex digest of the model or None if the model is not supported
+        """
+        # Model is kept together with the fingerprint, so its id is not reused
+        if id(model) not in self._models_fingerprints:
+            # Artifact cache imports the context
+            from model_navigator.pipelines.artifact_cache import get_model_fingerprint
+
+            self._models_fingerprints[id(model)] = (model, get_model_fingerprint(model))
+
+        return self._models_fingerprints[id(model)][1]
+
+    def get_resumed_output(self, execution_unit: ExecutionUnit, fingerprint: Optional[str]) -> Optional[CommandOutput]:
+        """Get output of the unit executed before in the workspace.
+
+        Output is reused only when the unit did not fail, its inputs have the same fingerprint
+        and all files produced by the unit still exist. When the unit has to be executed again,
+        the model left by its previous execution is removed unless other unit has already produced it
+        in the current execution.
+
+        Args:
+            execution_unit: Unit to resume
+            fingerprint: Hash of the unit inputs, None if the unit cannot be resumed
+
+        Returns:
+            Output of the previous execution or None if unit has to be executed
+        """
+        if not self._resumed or fingerprint is None:
+            return None
+
+        command_output = self._load_previous_output(execution_unit=execution_unit, fingerprint=fingerprint)
+        if command_output is None:
+            self._remove_stale_model(execution_unit=execution_unit)
+            return None
+
+        LOGGER.info(pad_string(f"Command {execution_unit.command.name!r} resumed from previous execution"))
 
-        self._commands = PipelineCommands.from_dict(data_dict=data["commands"])
-        self._metadata = PipelineMetadata.from_dict(data_dict=data["metadata"])
+        return command_output
+
+    def _get_samples_fingerprint(self) -> Optional[str]:
+        for command_output in self._commands.commands.values():
+            if command_output.output and "samples_fingerprint" in command_output.output:
+                return command_output.output["samples_fingerprint"]
+
+        return None
+
+    def _load_previous_output(self, execution_unit: ExecutionUnit, fingerprint: str) -> Optional[CommandOutput]:
+        unit_record = self._previous_units.get(_get_execution_unit_id(execution_unit))
+        if unit_record is None or unit_record.status == CommandStatus.FAIL or unit_record.fingerprint != fingerprint:
+            return None
+
+        missing_artifacts = [
+            artifact for artifact in unit_record.artifacts if not (self._workspace.path / artifact).exists()
+        ]
+        if missing_artifacts:
+            LOGGER.info(
+                f"Command {execution_unit.command.name!r} is executed again. Missing outputs: {missing_artifacts}."
+            )
+            return None
+
+        try:
+            with self._get_output_path(unit_record.result).open("rb") as fp:
+                return pickle.load(fp)
+        except Exception as e:
+            LOGGER.debug(f"Output of command {execution_unit.command.name!r} cannot be loaded: {e}")
+            return None
+
+    def _remove_stale_model(self, execution_unit: ExecutionUnit) -> None:
+        if execution_unit.model_config is None or execution_unit.runner_cls is not None:
+            return
+
+        model_path = self._workspace.path / execution_unit.model_config.path
+        produced_artifacts = {artifact for unit_record in self._units.values() for artifact in unit_record.artifacts}
+        if not model_path.exists() or execution_unit.model_config.path.as_posix() in produced_artifacts:
+            return
+
+        LOGGER.info(f"Removing model {model_path} left by the previous execution.")
+        if model_path.is_dir():
+            shutil.rmtree(model_path)
+        else:
+            model_path.unlink()
+
+    def load(self):
+        """Load context from the context file and replay the journal records written after it."""
+        data = self._read_snapshot()
+        self._environment_snapshot = None
+        self._commands = PipelineCommands(models_commands={}, commands={})
+        if "commands" in data:
+            self._commands = PipelineCommands.from_dict(data_dict=data["commands"])
+        if "metadata" in data:
+            self._metadata = PipelineMetadata.from_dict(data_dict=data["metadata"])
+        self._units = {}
+        for unit_data in data.get("units", []):
+            unit_record = UnitRecord.from_dict(unit_data)
+            self._units[unit_record.unit_id] = unit_record
+
+        for record in self._read_journal():
+            if "metadata" in record:
+                self._metadata = PipelineMetadata.from_dict(data_dict=record["metadata"])
+                continue
+
+            if "previous_unit" in record:
+                continue
+
+            model_config = None
+            if record["model_config"] is not None:
+                model_key = record["model_config"]["key"]
+                model_command = self._commands.models_commands.get(model_key)
+                if model_command is not None:
+                    model_config = model_command.model_config
+                else:
+                    model_config = ModelConfig.from_dict(record["model_config"])
+                    parent_model_command = self._commands.models_commands.get(record["model_config"]["parent_key"])
+                    if parent_model_command is not None:
+                        model_config.parent = parent_model_command.model_config
+
+            self._set_command_output(
+                model_config=model_config,
+                runner_name=record["runner_name"],
+                command_name=record["command"],
+                command_output=CommandOutput.from_dict(record["output"]),
+            )
+            if record.get("unit"):
+                unit_record = UnitRecord.from_dict(record["unit"])
+                self._units[unit_record.unit_id] = unit_record
 
     def save(self):
-        """Save context status to file."""
+        """Append records of the units updated since the last save to the journal."""
+        if not self._journal_records:
+            return
+
+        with self._journal_file.open("a") as fp:
+            for record in self._journal_records:
+                fp.write(f"{json.dumps(record)}\n")
+        self._journal_records = []
+
+    def compact(self):
+        """Save whole context to the context file and remove the journal."""
+        self._update_environment(wait=True)
         data = {
             "metadata": self._metadata.to_dict(parse=True),
             "commands": self._commands.to_dict(parse=True),
+            "units": [unit_record.to_dict(parse=True) for unit_record in self._units.values()],
         }
-        with self._file.open("w") as fp:
-            yaml.safe_dump(data=data, stream=fp, sort_keys=False)
+        tmp_file = self._file.with_name(f"{self._file.name}.tmp")
+        with tmp_file.open("w") as fp:
+            yaml.dump(data, fp, Dumper=_YAML_DUMPER, sort_keys=False)
+        os.replace(tmp_file, self._file)
+        self._journal_file.unlink(missing_ok=True)
+        self._journal_records = []
+
+        # outputs of the previous execution which were not resumed are not referenced anymore
+        results = {unit_record.result for unit_record in self._units.values()}
+        for unit_record in self._previous_units.values():
+            if unit_record.result not in results:
+                self._get_output_path(unit_record.result).unlink(missing_ok=True)
+        self._previous_units = {}
+
+    def wait_for_environment(self) -> None:
+        """Wait until the environment is gathered in the background thread.
+
+        Processes must not be forked while the thread is running, as the child could inherit locks held by it.
+        """
+        self._update_environment(wait=True)
+
+    def _update_environment(self, wait: bool) -> None:
+        if self._environment_snapshot is None or not (wait or self._environment_snapshot.ready):
+            return
+
+        self._metadata.environment = self._environment_snapshot.get()
+        self._environment_snapshot = None
+
+    def _start_journal(self):
+        self._update_environment(wait=False)
+        tmp_file = self._journal_file.with_name(f"{self._journal_file.name}.tmp")
+        with tmp_file.open("w") as fp:
+            fp.write(f"{json.dumps({'metadata': self._metadata.to_dict(parse=True)})}\n")
+            for unit_record in self._previous_units.values():
+                fp.write(f"{json.dumps({'previous_unit': unit_record.to_dict(parse=True)})}\n")
+        os.replace(tmp_file, self._journal_file)
+        self._file.unlink(missing_ok=True)
+        self._journal_records = []
+
+    def _read_snapshot(self) -> Dict:
+        if not self._file.is_file():
+            return {}
+
+        with self._file.open("r") as fp:
+            return yaml.load(fp, Loader=_YAML_LOADER) or {}
+
+    def _read_journal(self) -> List[Dict]:
+        if not self._journal_file.is_file():
+            return []
+
+        records = []
+        with self._journal_file.open("r") as fp:
+            for line in fp:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # The last record is incomplete when the execution was interrupted while writing it
+                    LOGGER.debug(f"Skipping incomplete record in {self._journal_file}.")
+                    break
+
+        return records
+
+    def _set_command_output(
+        self,
+        model_config: Optional[ModelConfig],
+        runner_name: Optional[str],
+        command_name: str,
+        command_output: CommandOutput,
+    ) -> None:
+        if model_config is not None:
+            # If not models_commands with given model_config then add new ModelCommand.
+            if model_config.key not in self._commands.models_commands:
+                self._commands.models_commands[model_config.key] = ModelCommand(model_config=model_config)
+            models_command = self._commands.models_commands[model_config.key]
+
+            if runner_name is None:
+                models_command.commands[command_name] = command_output
+            else:
+                if runner_name not in models_command.runners_commands:
+                    models_command.runners_commands[runner_name] = RunnerCommand()
+
+                models_command.runners_commands[runner_name].commands[command_name] = command_output
+        else:
+            self._commands.commands[command_name] = command_output
+
+    def _record_unit(
+        self, execution_unit: ExecutionUnit, command_output: CommandOutput, fingerprint: str, resumed: bool
+    ) -> Optional[UnitRecord]:
+        unit_id = _get_execution_unit_id(execution_unit)
+        previous_unit_record = self._previous_units.get(unit_id)
+        if resumed and previous_unit_record is not None:
+            result = previous_unit_record.result
+        else:
+            result = uuid.uuid4().hex
+            try:
+                self._outputs_path.mkdir(parents=True, exist_ok=True)
+                with self._get_output_path(result).open("wb") as fp:
+                    pickle.dump(command_output, fp)
+            except Exception as e:
+                LOGGER.debug(f"Output of command {execution_unit.command.name!r} cannot be resumed: {e}")
+                self._get_output_path(result).unlink(missing_ok=True)
+                return None
+            finally:
+                if previous_unit_record is not None:
+                    self._get_output_path(previous_unit_record.result).unlink(missing_ok=True)
+
+        self._units[unit_id] = UnitRecord(
+            command=execution_unit.command.name,
+            model_key=execution_unit.model_config.key if execution_unit.model_config else None,
+            runner_name=execution_unit.runner_cls.name() if execution_unit.runner_cls else None,
+            fingerprint=fingerprint,
+            result=result,
+            status=command_output.status,
+            artifacts=self._get_artifacts(execution_unit=execution_unit, command_output=command_output),
+        )
+
+        return self._units[unit_id]
+
+    def _get_artifacts(self, execution_unit: ExecutionUnit, command_output: CommandOutput) -> List[str]:
+        paths = _find_paths(command_output.output)
+        if (
+            execution_unit.model_config is not None
+            and execution_unit.runner_cls is None
+            and command_output.status == CommandStatus.OK
+        ):
+            paths.append(execution_unit.model_config.path)
+
+        artifacts = []
+        for path in paths:
+            path = self._workspace.path / path
+            if not path.exists():
+                continue
+
+            try:
+                path = path.relative_to(self._workspace.path)
+            except ValueError:
+                pass
+            if path.as_posix() not in artifacts:
+                artifacts.append(path.as_posix())
+
+        return artifacts
+
+    def _get_output_path(self, result: str) -> pathlib.Path:
+        return self._outputs_path / f"{result}.pkl"
 
     def command_args(self, workspace: Workspace, config: CommonConfig, execution_unit: ExecutionUnit) -> Dict[str, Any]:
         """Prepare command arguments from config and current context.
@@ -336,7 +847,7 @@ class PipelineContext:
                     )
 
     def log_status(self):
-        """Log status."""
+        """Log status with wall time, CPU time, peak memory and bytes written by each command."""
         summary = [[] for _ in range(len(self._commands.models_commands))]
         model_status, runner_status = None, None
         for i, model_status in enumerate(self._commands.models_commands.values()):
@@ -346,12 +857,15 @@ class PipelineContext:
                 summary[i].append(model_status.model_config.parent_key)
             else:
                 summary[i].append("Framework")
-            summary[i].append("\n".join([f"{k}: {v.status.value}" for k, v in model_status.commands.items()]))
+            summary[i].append("\n".join([_format_command_status(k, v) for k, v in model_status.commands.items()]))
             runtime_status = []
 
             for runner_name, runner_status in model_status.runners_commands.items():
                 runtime_status.append(
-                    "\n".join([runner_name] + [f"    {k}: {v.status.value}" for k, v in runner_status.commands.items()])
+                    "\n".join(
+                        [runner_name]
+                        + [f"    {_format_command_status(k, v)}" for k, v in runner_status.commands.items()]
+                    )
                 )
             summary[i].append("\n".join(runtime_status))
 
@@ -362,3 +876,77 @@ class PipelineContext:
             headers.append("Runner Status")
         table = tabulate(summary, headers, "grid")
         LOGGER.info(f"\n{pad_string('Model Navigator Summary')}\n{table}")
+
+
+def _format_command_status(command_name: str, command_output: CommandOutput) -> str:
+    status = f"{command_name}: {command_output.status.value}"
+    metrics = command_output.metrics
+    if metrics is None:
+        return status
+
+    resources = [f"{metrics.wall_time:.2f}s", f"CPU {metrics.cpu_time:.2f}s", f"RSS {_format_bytes(metrics.peak_rss)}"]
+    if metrics.disk_bytes_written is not None:
+        resources.append(f"disk {_format_bytes(metrics.disk_bytes_written)}")
+
+    return f"{status} ({', '.join(resources)})"
+
+
+def _format_bytes(value: int) -> str:
+    return f"{value / 2**20:.1f}MiB"
+
+
+def _get_unit_id(command: str, model_key: Optional[str], runner_name: Optional[str]) -> str:
+    return "/".join([model_key or "", runner_name or "", command])
+
+
+def _get_execution_unit_id(execution_unit: ExecutionUnit) -> str:
+    return _get_unit_id(
+        command=execution_unit.command.name,
+        model_key=execution_unit.model_config.key if execution_unit.model_config else None,
+        runner_name=execution_unit.runner_cls.name() if execution_unit.runner_cls else None,
+    )
+
+
+def _is_unit_dependency(unit_record: UnitRecord, execution_unit: ExecutionUnit) -> bool:
+    if unit_record.model_key is None:
+        return True
+
+    model_config = execution_unit.model_config
+    if model_config is None:
+        return False
+
+    if unit_record.model_key == model_config.key:
+        return unit_record.runner_name is None or (
+            execution_unit.runner_cls is not None and unit_record.runner_name == execution_unit.runner_cls.name()
+        )
+
+    if unit_record.runner_name is not None:
+        return False
+
+    parent = model_config.parent
+    while parent is not None:
+        if parent.key == unit_record.model_key:
+            return True
+        parent = parent.parent
+
+    return False
+
+
+def _find_paths(value: Any) -> List[pathlib.Path]:
+    if isinstance(value, pathlib.Path):
+        return [value]
+    if isinstance(value, dict):
+        return [path for item in value.values() for path in _find_paths(item)]
+    if isinstance(value, (list, tuple)):
+        return [path for item in value for path in _find_paths(item)]
+
+    return []
+
+
+def _get_fingerprint_value(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, type) or callable(value):
+        return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', type(value).__qualname__)}"
+
+    return f"{type(value).__module__}.{type(value).__qualname__}"
@@ -12,16 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Pipeline manager submodule."""
+import time
 from typing import Dict, List, Optional, Sequence
 
 from model_navigator.api.config import Format
 from model_navigator.configuration.common_config import CommonConfig
 from model_navigator.configuration.model.model_config import ModelConfig
+from model_navigator.core.constants import COMMANDS_TRACE_FILENAME, OPTIMIZE_PLAN_FILENAME
 from model_navigator.core.logger import LOGGER, log_dict
 from model_navigator.core.workspace import Workspace
 from model_navigator.package.package import Package
+from model_navigator.pipelines.artifact_cache import ArtifactCache
 from model_navigator.pipelines.builders import PipelineBuilder
+from model_navigator.pipelines.metrics import save_commands_trace
 from model_navigator.pipelines.pipeline_context import PipelineContext
+from model_navigator.pipelines.planner import OptimizePlanner
+from model_navigator.pipelines.scheduler import PipelineScheduler, is_parallel_execution_supported
 from model_navigator.pipelines.validation import PipelineManagerConfigurationValidator
 
 
@@ -75,7 +81,10 @@ class PipelineManager:
         PipelineManagerConfigurationValidator.run(config, package)
 
         context = PipelineContext(workspace=self._workspace)
-        context.initialize()
+        if config.resume:
+            context.resume()
+        else:
+            context.initialize()
 
         pipelines = self._build_pipelines(
             builders=builders,
@@ -83,10 +92,37 @@ class PipelineManager:
             config=config,
         )
 
-        for pipeline in pipelines:
-            pipeline.run(workspace=workspace, config=config, context=context)
+        planner = None
+        if config.planner is not None:
+            planner = OptimizePlanner(config.planner)
+            plan = planner.plan(pipelines=pipelines, config=config)
+            plan.log()
+            plan.save(workspace.path / OPTIMIZE_PLAN_FILENAME)
+            pipelines = planner.get_planned_pipelines(pipelines=pipelines, plan=plan, dry_run=config.planner.dry_run)
+
+        artifact_cache = ArtifactCache(config.artifact_cache) if config.artifact_cache is not None else None
+
+        start_time = time.time()
+
+        if self._is_parallel_execution(config):
+            scheduler = PipelineScheduler(
+                pipelines=pipelines,
+                parallel_config=config.parallel_config,
+                artifact_cache=artifact_cache,
+            )
+            scheduler.run(workspace=workspace, config=config, context=context)
+        else:
+            for pipeline in pipelines:
+                pipeline.run(workspace=workspace, config=config, context=context, artifact_cache=artifact_cache)
+            context.compact()
 
         context.log_status()
+        save_commands_trace(context.commands, workspace.path / COMMANDS_TRACE_FILENAME)
+        if artifact_cache is not None:
+            artifact_cache.log_stats()
+        if planner is not None:
+            planner.timing_database.add_commands(context.commands, config.target_device.value, since=start_time)
+            planner.timing_database.save()
 
         LOGGER.warning(
             "Initially models are not verified. Validate exported models and use "
@@ -95,6 +131,16 @@ class PipelineManager:
 
         return context
 
+    def _is_parallel_execution(self, config: CommonConfig) -> bool:
+        if config.parallel_config is None or config.parallel_config.max_workers < 2:
+            return False
+
+        if not is_parallel_execution_supported():
+            LOGGER.warning("Parallel execution requires forking processes. Executing pipelines sequentially.")
+            return False
+
+        return True
+
     def _build_pipelines(
         self,
         builders: Sequence[PipelineBuilder],
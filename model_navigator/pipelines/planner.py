@@ -0,0 +1,500 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Planning of the optimize with the duration of units estimated from timings of previous runs."""
+import json
+import os
+import pathlib
+import statistics
+import uuid
+import zipfile
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+import yaml
+from tabulate import tabulate
+
+from model_navigator.api.config import PlannerConfig
+from model_navigator.commands.base import CommandOutput, ExecutionUnit
+from model_navigator.commands.performance.performance import Performance
+from model_navigator.commands.performance.profiler import get_profiled_batch_sizes
+from model_navigator.configuration.common_config import CommonConfig
+from model_navigator.core.constants import DEFAULT_TIMING_DATABASE_PATH, TIMING_DATABASE_HISTORY_SIZE
+from model_navigator.core.logger import LOGGER, pad_string
+from model_navigator.pipelines.pipeline import Pipeline
+from model_navigator.pipelines.pipeline_context import PipelineCommands
+from model_navigator.utils.common import DataObject
+
+# Timing is a pair of the wall time in seconds and the number of profiled batch sizes
+Timing = Tuple[float, Optional[int]]
+
+
+@dataclass
+class PlannedUnit(DataObject):
+    """Unit of the pipeline with the estimated duration.
+
+    Args:
+        pipeline: Name of the pipeline executing the unit
+        command: Name of the command
+        model_key: Key of the model produced or evaluated by the command
+        runner_name: Name of the runner evaluating the model
+        batch_sizes: Batch sizes profiled by the command, None when searched until the throughput saturates
+        estimated_time: Estimated wall time in seconds, None when no timing of the command was recorded
+        skipped: Flag if the unit is skipped to fit in the time budget
+    """
+
+    pipeline: str
+    command: str
+    model_key: Optional[str] = None
+    runner_name: Optional[str] = None
+    batch_sizes: Optional[List[Optional[int]]] = None
+    estimated_time: Optional[float] = None
+    skipped: bool = False
+
+    @classmethod
+    def from_dict(cls, data_dict: Mapping) -> "PlannedUnit":
+        """Create PlannedUnit from the dictionary.
+
+        Args:
+            data_dict: Dictionary with unit data
+
+        Returns:
+            PlannedUnit
+        """
+        return cls(**data_dict)
+
+
+@dataclass
+class OptimizePlan(DataObject):
+    """Units of the optimize in execution order with their estimated duration.
+
+    Args:
+        units: Planned units of all pipelines
+        time_budget: Estimated time in seconds available for the optimize
+    """
+
+    units: List[PlannedUnit] = field(default_factory=lambda: [])
+    time_budget: Optional[float] = None
+
+    @property
+    def estimated_time(self) -> float:
+        """Estimated wall time in seconds of the units which are not skipped."""
+        return sum(unit.estimated_time or 0.0 for unit in self.units if not unit.skipped)
+
+    @property
+    def skipped_units(self) -> List[PlannedUnit]:
+        """Units skipped to fit in the time budget."""
+        return [unit for unit in self.units if unit.skipped]
+
+    @property
+    def unknown_units(self) -> List[PlannedUnit]:
+        """Units without recorded timings which are not counted in the estimated time."""
+        return [unit for unit in self.units if unit.estimated_time is None and not unit.skipped]
+
+    @classmethod
+    def from_dict(cls, data_dict: Mapping) -> "OptimizePlan":
+        """Create OptimizePlan from the dictionary.
+
+        Args:
+            data_dict: Dictionary with plan data
+
+        Returns:
+            OptimizePlan
+        """
+        return cls(
+            units=[PlannedUnit.from_dict(unit) for unit in data_dict.get("units", [])],
+            time_budget=data_dict.get("time_budget"),
+        )
+
+    def save(self, path: pathlib.Path) -> None:
+        """Save plan to the YAML file.
+
+        Args:
+            path: Path to the plan file
+        """
+        data = {"estimated_time": self.estimated_time, **self.to_dict(parse=True)}
+        with path.open("w") as fp:
+            yaml.safe_dump(data, fp, sort_keys=False)
+
+    def log(self) -> None:
+        """Log table of planned units with the estimated duration."""
+        rows = []
+        for unit in self.units:
+            estimated_time = "unknown" if unit.estimated_time is None else f"{unit.estimated_time:.2f}s"
+            batch_sizes = "search" if unit.batch_sizes is None else ", ".join(str(bs) for bs in unit.batch_sizes)
+            rows.append(
+                [
+                    unit.pipeline,
+                    unit.command,
+                    unit.model_key or "",
+                    unit.runner_name or "",
+                    batch_sizes if unit.command == Performance.name else "",
+                    estimated_time,
+                    "skipped" if unit.skipped else "planned",
+                ]
+            )
+        headers = ["Pipeline", "Command", "Model Key", "Runner", "Batch Sizes", "Estimated Time", "Plan"]
+        table = tabulate(rows, headers, "grid")
+
+        summary = f"Estimated time: {self.estimated_time:.2f}s"
+        if self.time_budget is not None:
+            summary += f" of {self.time_budget:.2f}s budget, {len(self.skipped_units)} units skipped"
+        if self.unknown_units:
+            summary += f", {len(self.unknown_units)} units without recorded timings not included"
+        LOGGER.info(f"\n{pad_string('Model Navigator Optimize Plan')}\n{table}\n{summary}.")
+
+
+class TimingDatabase:
+    """Wall times of commands recorded in previous runs.
+
+    Timings are stored per target device and command on three levels: for the model key and runner, for the model
+    format and runner, and for the command only. Estimation uses the most specific level with recorded timings.
+    Only the last timings on each level are kept.
+
+    Example:
+        timing_database = TimingDatabase(path)
+        timing_database.add_commands(context.commands, target_device=config.target_device.value)
+        timing_database.save()
+    """
+
+    def __init__(self, path: Optional[pathlib.Path] = None, history_size: int = TIMING_DATABASE_HISTORY_SIZE) -> None:
+        """Initialize object and load timings stored in the database file.
+
+        Args:
+            path: File of the database. None means `~/.cache/model_navigator/timings.json`.
+            history_size: Number of last timings kept for each key
+        """
+        self._path = pathlib.Path(path or DEFAULT_TIMING_DATABASE_PATH).expanduser()
+        self._history_size = history_size
+        self._timings = self._read_timings()
+        self._new_timings: Dict[str, List[Timing]] = {}
+        self._since: Optional[float] = None
+
+    def add_commands(self, commands: PipelineCommands, target_device: str, since: Optional[float] = None) -> None:
+        """Add timings of commands executed in the pipelines and record them in the database.
+
+        Args:
+            commands: Commands executed in the pipelines
+            target_device: Device on which the commands were executed
+            since: Timestamp of the start of the pipelines. Commands started earlier, like the commands resumed
+                from the previous execution, are not added. None means all commands are added.
+        """
+        self._since = since
+        for command_name, command_output in commands.commands.items():
+            self._add(target_device, command_name, command_output)
+
+        for model_key, model_command in commands.models_commands.items():
+            model_format = model_command.model_config.format.value
+            for command_name, command_output in model_command.commands.items():
+                self._add(target_device, command_name, command_output, model_key, model_format)
+            for runner_name, runner_command in model_command.runners_commands.items():
+                for command_name, command_output in runner_command.commands.items():
+                    self._add(target_device, command_name, command_output, model_key, model_format, runner_name)
+
+    def add_status(self, path: pathlib.Path) -> None:
+        """Add timings of commands from the status of the previous package.
+
+        Timings from the status are used for estimation and are not recorded in the database.
+
+        Args:
+            path: Path to the `.nav` package, workspace or status file
+        """
+        try:
+            status = _read_status(path)
+        except (OSError, KeyError, zipfile.BadZipFile, yaml.YAMLError) as e:
+            LOGGER.warning(f"Timings of commands not read from {path}: {e}")
+            return
+
+        target_device = status.get("config", {}).get("target_device", "")
+        for command_name, metrics in status.get("metrics", {}).items():
+            self._add_timing(_get_keys(target_device, command_name), (metrics["wall_time"], None))
+
+        for model_key, model_status in status.get("models_status", {}).items():
+            model_format = model_status["model_config"]["format"]
+            for command_name, metrics in model_status.get("metrics", {}).items():
+                keys = _get_keys(target_device, command_name, model_key, model_format)
+                self._add_timing(keys, (metrics["wall_time"], None))
+            for runner_name, runner_status in model_status.get("runners_status", {}).items():
+                for command_name, metrics in runner_status.get("metrics", {}).items():
+                    result = runner_status.get("result", {}).get(command_name, {})
+                    timing = (metrics["wall_time"], _get_profiled_batch_sizes_count(result))
+                    keys = _get_keys(target_device, command_name, model_key, model_format, runner_name)
+                    self._add_timing(keys, timing)
+
+    def estimate(self, execution_unit: ExecutionUnit, config: CommonConfig) -> Optional[float]:
+        """Estimate the wall time of the unit.
+
+        Time of profiling is scaled by the number of profiled batch sizes when they are known.
+
+        Args:
+            execution_unit: Unit to estimate
+            config: Common configuration
+
+        Returns:
+            Estimated wall time in seconds or None when no timing of the command was recorded
+        """
+        model_config = execution_unit.model_config
+        keys = _get_keys(
+            config.target_device.value,
+            execution_unit.command.name,
+            model_config.key if model_config else None,
+            model_config.format.value if model_config else None,
+            execution_unit.runner_cls.name() if execution_unit.runner_cls else None,
+        )
+        for key in keys:
+            timings = self._timings.get(key)
+            if timings:
+                break
+        else:
+            return None
+
+        batch_sizes = get_planned_batch_sizes(execution_unit, config)
+        scaled_times = [wall_time / count for wall_time, count in timings if count]
+        if execution_unit.command.name == Performance.name and batch_sizes is not None and scaled_times:
+            profiled_count = len(batch_sizes) * config.optimization_profile.profiling_samples_count
+            return statistics.median(scaled_times) * profiled_count
+
+        return statistics.median(wall_time for wall_time, _ in timings)
+
+    def save(self) -> None:
+        """Record timings added from the executed commands in the database file."""
+        if not self._new_timings:
+            return
+
+        try:
+            timings = self._read_timings()
+            for key, new_timings in self._new_timings.items():
+                timings[key] = (timings.get(key, []) + new_timings)[-self._history_size :]
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self._path.with_name(f"{self._path.name}.{uuid.uuid4().hex}")
+            tmp_path.write_text(json.dumps(timings))
+            os.replace(tmp_path, self._path)
+        except OSError as e:
+            LOGGER.warning(f"Timings of commands not recorded in {self._path}: {e}")
+            return
+
+        self._new_timings = {}
+        LOGGER.info(f"Timings of commands recorded in {self._path}.")
+
+    def _add(
+        self,
+        target_device: str,
+        command_name: str,
+        command_output: CommandOutput,
+        model_key: Optional[str] = None,
+        model_format: Optional[str] = None,
+        runner_name: Optional[str] = None,
+    ) -> None:
+        # timings of commands restored from the artifact cache are not measured
+        if command_output.metrics is None:
+            return
+
+        if self._since is not None and command_output.metrics.start_time < self._since:
+            return
+
+        timing = (command_output.metrics.wall_time, _get_profiled_batch_sizes_count(command_output.output or {}))
+        keys = _get_keys(target_device, command_name, model_key, model_format, runner_name)
+        self._add_timing(keys, timing)
+        for key in keys:
+            self._new_timings.setdefault(key, []).append(timing)
+
+    def _add_timing(self, keys: List[str], timing: Timing) -> None:
+        for key in keys:
+            self._timings.setdefault(key, []).append(timing)
+            self._timings[key] = self._timings[key][-self._history_size :]
+
+    def _read_timings(self) -> Dict[str, List[Timing]]:
+        if not self._path.exists():
+            return {}
+
+        try:
+            data = json.loads(self._path.read_text())
+        except (OSError, ValueError) as e:
+            LOGGER.warning(f"Timing database {self._path} not loaded: {e}")
+            return {}
+
+        return {key: [(wall_time, count) for wall_time, count in timings] for key, timings in data.items()}
+
+
+class OptimizePlanner:
+    """Plan units of the pipelines and skip units not fitting in the time budget.
+
+    Units without a model, like collecting the input and output metadata, are never skipped. When a unit is skipped,
+    the units of the same model and runner requiring it are skipped too. When a unit producing the model is skipped,
+    all units of the model and of the models converted from it are skipped. Units without recorded timings
+    are not skipped.
+    """
+
+    def __init__(self, config: PlannerConfig) -> None:
+        """Initialize object.
+
+        Args:
+            config: Configuration of the planner
+        """
+        self._config = config
+        self.timing_database = TimingDatabase(config.timings_path)
+        for path in config.history:
+            self.timing_database.add_status(path)
+
+    def plan(self, pipelines: Sequence[Pipeline], config: CommonConfig) -> OptimizePlan:
+        """Plan units of the pipelines.
+
+        Args:
+            pipelines: Pipelines to execute
+            config: Common configuration
+
+        Returns:
+            Plan with units in execution order
+        """
+        plan = OptimizePlan(time_budget=self._config.time_budget)
+        for pipeline in pipelines:
+            for execution_unit in pipeline.execution_units:
+                model_config = execution_unit.model_config
+                plan.units.append(
+                    PlannedUnit(
+                        pipeline=pipeline.name,
+                        command=execution_unit.command.name,
+                        model_key=model_config.key if model_config else None,
+                        runner_name=execution_unit.runner_cls.name() if execution_unit.runner_cls else None,
+                        batch_sizes=get_planned_batch_sizes(execution_unit, config),
+                        estimated_time=self.timing_database.estimate(execution_unit, config),
+                    )
+                )
+
+        if self._config.time_budget is not None:
+            self._prune(pipelines, plan)
+
+        return plan
+
+    def get_planned_pipelines(
+        self, pipelines: Sequence[Pipeline], plan: OptimizePlan, dry_run: bool = False
+    ) -> List[Pipeline]:
+        """Remove units skipped in the plan from the pipelines.
+
+        Args:
+            pipelines: Pipelines used for planning
+            plan: Plan of the pipelines
+            dry_run: Keep only the required units without a model, which collect data stored in the package
+
+        Returns:
+            Pipelines with planned units
+        """
+        planned_units = iter(plan.units)
+        planned_pipelines = []
+        for pipeline in pipelines:
+            execution_units = []
+            for execution_unit in pipeline.execution_units:
+                planned_unit = next(planned_units)
+                if planned_unit.skipped:
+                    continue
+                if dry_run and (execution_unit.model_config is not None or not execution_unit.command.is_required()):
+                    continue
+                execution_units.append(execution_unit)
+            planned_pipelines.append(Pipeline(name=pipeline.name, execution_units=execution_units))
+
+        return planned_pipelines
+
+    def _prune(self, pipelines: Sequence[Pipeline], plan: OptimizePlan) -> None:
+        execution_units = [execution_unit for pipeline in pipelines for execution_unit in pipeline.execution_units]
+        units = list(zip(execution_units, plan.units))
+
+        # units without model are required to execute other units
+        remaining_time = self._config.time_budget - sum(
+            planned_unit.estimated_time or 0.0 for execution_unit, planned_unit in units if not planned_unit.model_key
+        )
+        skipped_models: Set[str] = set()
+        skipped_commands: Set[Tuple[str, Optional[str], str]] = set()
+        for execution_unit, planned_unit in units:
+            if not planned_unit.model_key:
+                continue
+
+            model_config = execution_unit.model_config
+            requires_skipped = any(
+                (planned_unit.model_key, planned_unit.runner_name, required) in skipped_commands
+                for required in execution_unit.command.requires()
+            )
+            if requires_skipped or _is_model_skipped(model_config, skipped_models):
+                planned_unit.skipped = True
+            elif (planned_unit.estimated_time or 0.0) > remaining_time:
+                planned_unit.skipped = True
+                if planned_unit.runner_name is None:
+                    skipped_models.add(planned_unit.model_key)
+            else:
+                remaining_time -= planned_unit.estimated_time or 0.0
+
+            if planned_unit.skipped:
+                skipped_commands.add((planned_unit.model_key, planned_unit.runner_name, planned_unit.command))
+
+
+def get_planned_batch_sizes(execution_unit: ExecutionUnit, config: CommonConfig) -> Optional[List[Optional[int]]]:
+    """Get batch sizes profiled by the unit.
+
+    Args:
+        execution_unit: Unit to plan
+        config: Common configuration
+
+    Returns:
+        Batch sizes profiled by the unit, None when unit does not profile or batch sizes are searched
+    """
+    if execution_unit.command.name != Performance.name:
+        return None
+
+    profile = config.optimization_profile
+    if config.batch_dim is not None and not profile.max_batch_size and not profile.batch_sizes:
+        return None
+
+    return get_profiled_batch_sizes(profile=profile, batch_dim=config.batch_dim)
+
+
+def _is_model_skipped(model_config, skipped_models: Set[str]) -> bool:
+    while model_config is not None:
+        if model_config.key in skipped_models:
+            return True
+        model_config = model_config.parent
+
+    return False
+
+
+def _get_keys(
+    target_device: str,
+    command_name: str,
+    model_key: Optional[str] = None,
+    model_format: Optional[str] = None,
+    runner_name: Optional[str] = None,
+) -> List[str]:
+    keys = []
+    if model_key:
+        keys.append(f"{target_device}/{command_name}/{model_key}/{runner_name or ''}")
+    if model_format and model_format != model_key:
+        keys.append(f"{target_device}/{command_name}/{model_format}/{runner_name or ''}")
+    keys.append(f"{target_device}/{command_name}")
+
+    return keys
+
+
+def _get_profiled_batch_sizes_count(result: Mapping) -> Optional[int]:
+    profiling_results = result.get("samples_profiling_results") or result.get("profiling_results")
+    return len(profiling_results) if profiling_results else None
+
+
+def _read_status(path: pathlib.Path) -> Dict:
+    path = pathlib.Path(path)
+    if path.is_dir():
+        path = path / "status.yaml"
+
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as zf:
+            return yaml.safe_load(zf.read("status.yaml"))
+
+    with path.open() as fp:
+        return yaml.safe_load(fp)
@@ -0,0 +1,407 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Scheduler executing independent units of pipelines concurrently."""
+import multiprocessing
+import sys
+import threading
+from multiprocessing.connection import Connection, wait
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import psutil
+
+from model_navigator.api.config import ParallelConfig
+from model_navigator.commands.base import CommandOutput, CommandStatus, ExecutionUnit
+from model_navigator.configuration.common_config import CommonConfig
+from model_navigator.configuration.model.model_config import ModelConfig
+from model_navigator.core.constants import DEFAULT_SCHEDULER_POLL_INTERVAL
+from model_navigator.core.logger import LOGGER, pad_string
+from model_navigator.core.workspace import Workspace
+from model_navigator.exceptions import ModelNavigatorRuntimeError
+from model_navigator.pipelines.artifact_cache import ArtifactCache
+from model_navigator.pipelines.pipeline import Pipeline
+from model_navigator.pipelines.pipeline_context import PipelineContext
+from model_navigator.utils.devices import is_cuda_initialized
+from model_navigator.utils.format_helpers import is_source_format
+
+Worker = Tuple[Union[multiprocessing.Process, threading.Thread], Connection]
+
+
+def is_parallel_execution_supported() -> bool:
+    """Check if units can be executed in forked worker processes.
+
+    Returns:
+        True if processes can be started with the fork method, False otherwise
+    """
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def get_units_dependencies(execution_units: List[ExecutionUnit]) -> List[Set[int]]:
+    """Build Direct Acyclic Graph (DAG) of dependencies between execution units.
+
+    Unit depends on an earlier unit when:
+        - any of the units is not executed on a model, as such units provide outputs for all other units,
+        - both units are executed on the same model and at least one of them without a runner,
+        - both units are executed on the same model with the same runner and the command of the earlier unit
+          is required by `Command.requires()` of the later one, as only then outputs are passed between them,
+        - the earlier unit is executed without a runner on the parent model or any further ancestor.
+
+    Args:
+        execution_units: Execution units in the order of declaration in pipelines
+
+    Returns:
+        Indices of the units each of the units depends on
+    """
+    dependencies = []
+    for idx, execution_unit in enumerate(execution_units):
+        dependencies.append(
+            {prev_idx for prev_idx in range(idx) if _depends_on(execution_unit, execution_units[prev_idx])}
+        )
+
+    return dependencies
+
+
+def _depends_on(execution_unit: ExecutionUnit, prev_execution_unit: ExecutionUnit) -> bool:
+    if execution_unit.model_config is None or prev_execution_unit.model_config is None:
+        return True
+
+    if execution_unit.model_config.key == prev_execution_unit.model_config.key:
+        if execution_unit.runner_cls is None or prev_execution_unit.runner_cls is None:
+            return True
+
+        return (
+            execution_unit.runner_cls.name() == prev_execution_unit.runner_cls.name()
+            and prev_execution_unit.command.name in execution_unit.command.requires()
+        )
+
+    if prev_execution_unit.runner_cls is not None:
+        return False
+
+    return prev_execution_unit.model_config.key in _get_ancestors_keys(execution_unit.model_config)
+
+
+def _get_ancestors_keys(model_config: ModelConfig) -> Set[str]:
+    ancestors_keys = set()
+    parent = model_config.parent
+    while parent is not None:
+        ancestors_keys.add(parent.key)
+        parent = parent.parent
+
+    return ancestors_keys
+
+
+class PipelineScheduler:
+    """Execute units of pipelines concurrently in the order of dependencies between them.
+
+    Units are dispatched in the order of declaration when all units they depend on are finished.
+    Units executed on models run in forked worker processes, up to `max_workers` at once and only while
+    the memory used by the workers is below `max_memory`. Units which are not executed on a model
+    and exclusive commands, like performance measurements, run when no other unit is running.
+    CUDA cannot be used in forked processes, so once it is initialized in the main process, units of isolated
+    commands, which execute models only in subprocesses, are dispatched from threads and remaining units
+    are executed one at a time in the main process.
+    Units with outputs resumed from the previous execution in the workspace or with models restored from
+    the artifact cache finish without starting a worker. Models are added to the cache when units finish.
+
+    Context is updated when units finish and arguments of each unit depend only on outputs of the units
+    it depends on. When all units finish, the context is rebuilt in the order of declaration, so it is the same
+    as after executing pipelines one after another.
+    """
+
+    def __init__(
+        self,
+        pipelines: List[Pipeline],
+        parallel_config: ParallelConfig,
+        artifact_cache: Optional[ArtifactCache] = None,
+    ) -> None:
+        """Initialize object.
+
+        Args:
+            pipelines: Pipelines to execute
+            parallel_config: Limits of the concurrent execution
+            artifact_cache: Cache of exported and converted models. Defaults to None.
+        """
+        self._units = [
+            (pipeline, execution_unit) for pipeline in pipelines for execution_unit in pipeline.execution_units
+        ]
+        self._dependencies = get_units_dependencies([execution_unit for _, execution_unit in self._units])
+        self._parallel_config = parallel_config
+        self._artifact_cache = artifact_cache
+        self._cache_keys: Dict[int, Optional[str]] = {}
+        self._cuda_initialized = False
+
+    def run(self, workspace: Workspace, config: CommonConfig, context: PipelineContext) -> None:
+        """Execute all units of pipelines.
+
+        Args:
+            workspace: Workspace where units are executed
+            config: A global config provided by user
+            context: Context of pipelines execution. It must not contain outputs of other commands.
+
+        Raises:
+            ModelNavigatorRuntimeError: When context contains outputs of other commands
+        """
+        if context.commands.commands or context.commands.models_commands:
+            raise ModelNavigatorRuntimeError("Pipelines can be scheduled only on a context without executed commands.")
+
+        LOGGER.info(
+            pad_string(f"Scheduling {len(self._units)} commands on {self._parallel_config.max_workers} workers")
+        )
+        outputs: Dict[int, CommandOutput] = {}
+        running: Dict[int, Worker] = {}
+        fingerprints: Dict[int, Optional[str]] = {}
+        started_pipelines = set()
+        try:
+            while len(outputs) < len(self._units):
+                for idx in self._get_ready_units(outputs, running):
+                    pipeline, execution_unit = self._units[idx]
+                    if idx not in fingerprints:
+                        fingerprints[idx] = context.get_unit_fingerprint(config=config, execution_unit=execution_unit)
+                        command_output = context.get_resumed_output(
+                            execution_unit=execution_unit, fingerprint=fingerprints[idx]
+                        )
+                        if command_output is not None:
+                            self._finish_unit(idx, command_output, outputs, context, fingerprints[idx], resumed=True)
+                            break
+
+                        command_output = self._restore_from_cache(idx, workspace, config, context)
+                        if command_output is not None:
+                            self._finish_unit(idx, command_output, outputs, context, fingerprints[idx])
+                            break
+
+                    if not self._can_start(idx, running):
+                        break
+
+                    if pipeline.id not in started_pipelines:
+                        started_pipelines.add(pipeline.id)
+                        LOGGER.info(pad_string(f"Pipeline {pipeline.name!r} started"))
+
+                    if self._is_executed_in_process(execution_unit):
+                        command_output = pipeline.execute_unit(
+                            workspace=workspace,
+                            execution_unit=execution_unit,
+                            config=config,
+                            context=context,
+                        )
+                        self._finish_unit(idx, command_output, outputs, context, fingerprints[idx])
+                        break
+
+                    running[idx] = self._start_worker(pipeline, workspace, execution_unit, config, context)
+
+                if running:
+                    self._collect_finished_units(running, outputs, context, fingerprints)
+        finally:
+            for worker, connection in running.values():
+                if isinstance(worker, multiprocessing.Process):
+                    worker.terminate()
+                worker.join()
+                connection.close()
+
+        context.clear()
+        for idx, (_, execution_unit) in enumerate(self._units):
+            context.update(execution_unit=execution_unit, command_output=outputs[idx])
+        context.compact()
+
+    def _get_ready_units(self, outputs: Dict[int, CommandOutput], running: Dict) -> Iterable[int]:
+        for idx in range(len(self._units)):
+            if idx in outputs or idx in running:
+                continue
+            if all(dependency in outputs for dependency in self._dependencies[idx]):
+                yield idx
+
+    def _restore_from_cache(
+        self, idx: int, workspace: Workspace, config: CommonConfig, context: PipelineContext
+    ) -> Optional[CommandOutput]:
+        if self._artifact_cache is None:
+            return None
+
+        _, execution_unit = self._units[idx]
+        self._cache_keys[idx] = self._artifact_cache.get_key(
+            workspace=workspace, config=config, execution_unit=execution_unit, context=context
+        )
+        command_output = self._artifact_cache.restore(
+            key=self._cache_keys[idx], workspace=workspace, execution_unit=execution_unit
+        )
+        if command_output is not None:
+            self._cache_keys[idx] = None
+
+        return command_output
+
+    def _is_executed_in_process(self, execution_unit: ExecutionUnit) -> bool:
+        if execution_unit.model_config is None:
+            return True
+
+        return self._is_cuda_initialized() and not _is_isolated(execution_unit)
+
+    def _is_cuda_initialized(self) -> bool:
+        if not self._cuda_initialized and is_cuda_initialized():
+            LOGGER.warning(
+                "CUDA is initialized in the main process and cannot be used in forked workers. "
+                "Commands executing models in subprocesses are dispatched from threads, "
+                "remaining commands are executed one at a time in the main process."
+            )
+            self._cuda_initialized = True
+
+        return self._cuda_initialized
+
+    def _can_start(self, idx: int, running: Dict[int, Worker]) -> bool:
+        _, execution_unit = self._units[idx]
+        if self._is_executed_in_process(execution_unit) or execution_unit.command.is_exclusive():
+            return not running
+
+        if any(self._units[running_idx][1].command.is_exclusive() for running_idx in running):
+            return False
+
+        if len(running) >= self._parallel_config.max_workers:
+            return False
+
+        max_memory = self._parallel_config.max_memory
+        if max_memory is not None and running:
+            return _get_children_memory() < max_memory
+
+        return True
+
+    def _start_worker(
+        self,
+        pipeline: Pipeline,
+        workspace: Workspace,
+        execution_unit: ExecutionUnit,
+        config: CommonConfig,
+        context: PipelineContext,
+    ) -> Worker:
+        if self._cuda_initialized:
+            receiver, sender = multiprocessing.Pipe(duplex=False)
+            thread = threading.Thread(
+                target=_execute_unit_in_worker,
+                args=(pipeline, workspace, execution_unit, config, context.snapshot(), sender, False),
+                daemon=True,
+            )
+            thread.start()
+            LOGGER.debug(f"Command {execution_unit.command.name!r} started in worker thread {thread.name}.")
+
+            return thread, receiver
+
+        context.wait_for_environment()
+        mp_context = multiprocessing.get_context("fork")
+        receiver, sender = mp_context.Pipe(duplex=False)
+        process = mp_context.Process(
+            target=_execute_unit_in_worker,
+            args=(pipeline, workspace, execution_unit, config, context, sender),
+        )
+        process.start()
+        sender.close()
+        LOGGER.debug(f"Command {execution_unit.command.name!r} started in worker process {process.pid}.")
+
+        return process, receiver
+
+    def _collect_finished_units(
+        self,
+        running: Dict[int, Worker],
+        outputs: Dict[int, CommandOutput],
+        context: PipelineContext,
+        fingerprints: Dict[int, Optional[str]],
+    ) -> None:
+        ready_connections = wait(
+            [connection for _, connection in running.values()], timeout=DEFAULT_SCHEDULER_POLL_INTERVAL
+        )
+        for idx in [idx for idx, (_, connection) in running.items() if connection in ready_connections]:
+            worker, connection = running.pop(idx)
+            _, execution_unit = self._units[idx]
+            try:
+                command_output = connection.recv()
+            except EOFError:
+                command_output = CommandOutput(status=CommandStatus.FAIL)
+            worker.join()
+            connection.close()
+
+            if isinstance(worker, multiprocessing.Process) and worker.exitcode != 0:
+                LOGGER.error(
+                    f"Worker process of command {execution_unit.command.name!r} exited with code {worker.exitcode}."
+                )
+                command_output = CommandOutput(status=CommandStatus.FAIL)
+
+            self._finish_unit(idx, command_output, outputs, context, fingerprints[idx])
+
+    def _finish_unit(
+        self,
+        idx: int,
+        command_output: CommandOutput,
+        outputs: Dict[int, CommandOutput],
+        context: PipelineContext,
+        fingerprint: Optional[str],
+        resumed: bool = False,
+    ) -> None:
+        _, execution_unit = self._units[idx]
+        outputs[idx] = command_output
+        if self._artifact_cache is not None and self._cache_keys.get(idx) is not None:
+            self._artifact_cache.store(
+                key=self._cache_keys[idx],
+                workspace=context.workspace,
+                execution_unit=execution_unit,
+                command_output=command_output,
+            )
+        context.update(
+            execution_unit=execution_unit,
+            command_output=command_output,
+            fingerprint=fingerprint,
+            resumed=resumed,
+        )
+        context.save()
+
+        if command_output.status != CommandStatus.OK and execution_unit.command.is_required():
+            sys.exit("The required command has failed. Please, review the log and verify the reported problems.")
+
+
+def _execute_unit_in_worker(
+    pipeline: Pipeline,
+    workspace: Workspace,
+    execution_unit: ExecutionUnit,
+    config: CommonConfig,
+    context: PipelineContext,
+    connection: Connection,
+    redirect_stdout: bool = True,
+) -> None:
+    try:
+        command_output = pipeline.execute_unit(
+            workspace=workspace,
+            execution_unit=execution_unit,
+            config=config,
+            context=context,
+            redirect_stdout=redirect_stdout,
+        )
+    except SystemExit:
+        command_output = CommandOutput(status=CommandStatus.FAIL)
+
+    try:
+        connection.send(command_output)
+    except Exception as e:
+        LOGGER.error(f"Output of command {execution_unit.command.name!r} cannot be passed from the worker: {e}")
+        connection.send(CommandOutput(status=CommandStatus.FAIL))
+    finally:
+        connection.close()
+
+
+def _is_isolated(execution_unit: ExecutionUnit) -> bool:
+    return execution_unit.command.is_isolated() and not is_source_format(execution_unit.model_config.format)
+
+
+def _get_children_memory() -> int:
+    # forked workers and processes started by the worker threads are all descendants of the main process
+    memory = 0
+    for process in psutil.Process().children(recursive=True):
+        try:
+            memory += process.memory_info().rss
+        except psutil.NoSuchProcess:
+            continue
+
+    return memory
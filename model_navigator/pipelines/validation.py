@@ -54,6 +54,10 @@ class PipelineManagerConfigurationValidator:
         cls._validate_if_custom_configs_match_target_formats(config)
         cls._validate_if_target_formats_match_framework(config)
         cls._validate_optimization_profile_batch_sizes_when_batching_is_disabled(config)
+        cls._validate_parallel_config(config)
+        cls._validate_artifact_cache(config)
+        cls._validate_planner(config)
+        cls._validate_execution_limits(config)
         for custom_config in config.custom_configs.values():
             if isinstance(custom_config, (TensorRTConfig, TorchTensorRTConfig, TensorFlowTensorRTConfig)):
                 cls._validate_trt_profile_input_names(custom_config.trt_profile, config._input_names)
@@ -106,6 +110,57 @@ class PipelineManagerConfigurationValidator:
                 f"Model does not support batching, but profiling batch sizes are {config.optimization_profile.batch_sizes}."
             )
 
+    @classmethod
+    def _validate_parallel_config(cls, config: CommonConfig):
+        if config.parallel_config is None:
+            return
+
+        if config.parallel_config.max_workers < 1:
+            raise ModelNavigatorConfigurationError(
+                f"Number of workers must be positive, got: {config.parallel_config.max_workers}."
+            )
+        if config.parallel_config.max_memory is not None and config.parallel_config.max_memory <= 0:
+            raise ModelNavigatorConfigurationError(
+                f"Memory limit of workers must be positive, got: {config.parallel_config.max_memory}."
+            )
+
+    @classmethod
+    def _validate_artifact_cache(cls, config: CommonConfig):
+        if config.artifact_cache is None:
+            return
+
+        if config.artifact_cache.max_size is not None and config.artifact_cache.max_size <= 0:
+            raise ModelNavigatorConfigurationError(
+                f"Size limit of artifact cache must be positive, got: {config.artifact_cache.max_size}."
+            )
+
+    @classmethod
+    def _validate_planner(cls, config: CommonConfig):
+        if config.planner is None:
+            return
+
+        if config.planner.time_budget is not None and config.planner.time_budget <= 0:
+            raise ModelNavigatorConfigurationError(
+                f"Time budget of planner must be positive, got: {config.planner.time_budget}."
+            )
+
+    @classmethod
+    def _validate_execution_limits(cls, config: CommonConfig):
+        limits = config.execution_limits
+        if limits is None:
+            return
+
+        if limits.timeout is not None and limits.timeout <= 0:
+            raise ModelNavigatorConfigurationError(f"Timeout of processes must be positive, got: {limits.timeout}.")
+
+        if limits.max_memory is not None and limits.max_memory <= 0:
+            raise ModelNavigatorConfigurationError(
+                f"Memory limit of processes must be positive, got: {limits.max_memory}."
+            )
+
+        if limits.cpu_affinity is not None and len(limits.cpu_affinity) == 0:
+            raise ModelNavigatorConfigurationError("CPU affinity of processes must contain at least one CPU.")
+
     @classmethod
     def _validate_trt_profile_input_names(
         cls,
@@ -179,13 +234,13 @@ class PipelineManagerConfigurationValidator:
 
         if config.from_source:
             try:
-                iter(config.dataloader)
+                dataloader_iterator = iter(config.dataloader)
             except TypeError as e:
                 raise ModelNavigatorConfigurationError("Datalaoder must be iterable.") from e
-            try:
-                len(config.dataloader)
-            except TypeError as e:
-                raise ModelNavigatorConfigurationError("Datalaoder must must have len().") from e
+            if dataloader_iterator is config.dataloader:
+                raise ModelNavigatorConfigurationError(
+                    "Dataloader must be re-iterable. Wrap the iterator in a class which creates it in `__iter__`."
+                )
 
     @classmethod
     def _validate_if_trt_profile_aligns_with_dynamic_axes(
@@ -55,7 +55,7 @@ def optimize_pipeline(
 
     workspace = Workspace(workspace)
     if not package or workspace.path != package.workspace.path:
-        workspace.initialize()
+        workspace.initialize(resume=config.resume)
 
     pipeline_manager = PipelineManager(workspace=workspace)
     context = pipeline_manager.run(
@@ -19,7 +19,7 @@ from typing import Any, Dict, List, Optional
 
 import numpy as np
 
-from model_navigator.api.config import DeviceKind, Format, TensorType
+from model_navigator.api.config import CustomConfig, DeviceKind, Format, TensorRTProfile, TensorType
 from model_navigator.core.logger import LOGGER
 from model_navigator.core.tensor import TensorMetadata, TensorSpec, get_tensor_type
 from model_navigator.utils.dataloader import validate_sample_output
@@ -151,6 +151,44 @@ class NavigatorRunner(abc.ABC):
         """
         return False
 
+    @classmethod
+    def is_default(cls) -> bool:
+        """Flag indicating if runner is used when runners are not selected explicitly.
+
+        Returns:
+            True if runner is selected by default, False if it has to be selected explicitly
+        """
+        return True
+
+    @classmethod
+    def get_runner_options(
+        cls,
+        custom_configs: Optional[Dict[str, CustomConfig]] = None,
+        dataloader_trt_profile: Optional[TensorRTProfile] = None,
+    ) -> Dict[str, Any]:
+        """Keyword arguments passed to the runner on creation, derived from the optimization configuration and data.
+
+        Options are passed to the runners executed in correctness and profiling scripts
+        and recorded in the package status, so they have to be serializable to YAML.
+
+        Args:
+            custom_configs: Custom configurations passed to optimize, mapped by the config name
+            dataloader_trt_profile: Profile with min, opt and max shapes of the dataloader samples
+
+        Returns:
+            Runner keyword arguments
+        """
+        return {}
+
+    @classmethod
+    def is_thread_safe(cls) -> bool:
+        """Flag indicating if runner can process `infer` calls from multiple threads concurrently.
+
+        Returns:
+            True if runner is thread safe, False otherwise
+        """
+        return False
+
     def __enter__(self):
         """Activate the runner on entering runner context."""
         self.activate()
@@ -270,6 +308,54 @@ class NavigatorRunner(abc.ABC):
             return None
         return self.inference_time
 
+    def retrace_count(self) -> Optional[int]:
+        """Returns the number of times the model was retraced or recompiled since the activation.
+
+        Runners which specialize the model for input shapes override this method.
+
+        Returns:
+            The number of retraces, or None if runner does not trace the model.
+        """
+        return None
+
+    def padding_waste(self) -> Optional[float]:
+        """Returns the fraction of input elements added as padding in the last call to ``infer()``.
+
+        Runners which pad inputs to shape buckets override this method.
+
+        Returns:
+            The padding fraction, or None if runner does not pad inputs.
+        """
+        return None
+
+    def saved_recompilations(self) -> Optional[int]:
+        """Returns the number of compilations avoided by padding inputs to shape buckets since the activation.
+
+        Runners which pad inputs to shape buckets override this method.
+
+        Returns:
+            The number of avoided compilations, or None if runner does not pad inputs.
+        """
+        return None
+
+    def load_shared_weights(self) -> Optional[Any]:
+        """Load the model weights which can be shared by multiple instances of the runner.
+
+        Runners which can share read-only weights between instances override this method.
+
+        Returns:
+            The weights passed to `use_shared_weights()` of other instances, or None if weights cannot be shared.
+        """
+        return None
+
+    def use_shared_weights(self, shared_weights: Any) -> None:
+        """Use the weights loaded by `load_shared_weights()` instead of loading own copy on activation.
+
+        Args:
+            shared_weights: Weights returned by `load_shared_weights()` of the runner of the same class
+        """
+        raise NotImplementedError(f"{self.name()} | Runner does not support sharing weights.")
+
     def deactivate(self):
         """Deactivate the runner. For example, this may involve freeing CPU or GPU memory."""
         if not self.is_active:
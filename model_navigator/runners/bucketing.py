@@ -0,0 +1,357 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Shape bucketing for runners which compile the model per input shape.
+
+Inputs are padded on dynamic axes to the nearest bucket size and outputs are sliced back,
+so the model is compiled once per bucket instead of once per distinct input shape.
+
+Bucketing variants of the built-in runners which compile the model per input shape are registered,
+but not used by default - select them in `runners` to profile them next to the regular runners.
+Their buckets are derived from the TensorRT profile of the dataloader samples and recorded in the package
+with the runner options. Variants with custom buckets have to be registered in the module loaded
+from the `model_navigator` entry point, so the runner is available also in the subprocesses
+running correctness and profiling.
+
+Example:
+    register_runner(
+        bucketing_runner(JAXCPURunner, shape_buckets={"input__0": {1: [16, 32, 64]}}, name="JAXCPUShortSequences")
+    )
+
+    runner = bucketing_runner(JAXCPURunner)(
+        model=model,
+        input_metadata=input_metadata,
+        output_metadata=output_metadata,
+        shape_buckets=get_shape_buckets_from_trt_profile(trt_profile),
+    )
+"""
+import bisect
+import math
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+
+import numpy as np
+
+from model_navigator.api.config import CustomConfig, TensorRTProfile
+from model_navigator.core.constants import DEFAULT_SHAPE_BUCKETS_COUNT
+from model_navigator.core.logger import LOGGER
+from model_navigator.core.tensor import TensorMetadata
+from model_navigator.exceptions import ModelNavigatorRuntimeError
+from model_navigator.runners.base import NavigatorRunner
+from model_navigator.utils.common import DataObject
+
+ShapeBuckets = Dict[str, Dict[int, List[int]]]
+
+
+def get_shape_buckets_from_trt_profile(trt_profile: TensorRTProfile) -> ShapeBuckets:
+    """Derive buckets for dynamic axes from TensorRT profile.
+
+    Buckets are powers of 2 between min and max shape extended with opt and max shapes.
+
+    Args:
+        trt_profile: Profile with min, opt and max shapes for each input
+
+    Returns:
+        Sorted bucket sizes for each dynamic axis of each input
+    """
+    shape_buckets = {}
+    for name, shape in trt_profile.items():
+        axes_buckets = {}
+        for axis, (min_size, opt_size, max_size) in enumerate(zip(shape.min, shape.opt, shape.max)):
+            if min_size == max_size:
+                continue
+            powers = range(math.ceil(math.log2(max(min_size, 1))), int(math.log2(max_size)) + 1)
+            buckets = {2**power for power in powers}
+            buckets.update({opt_size, max_size})
+            axes_buckets[axis] = sorted(buckets)
+        shape_buckets[name] = axes_buckets
+
+    return shape_buckets
+
+
+def get_shape_buckets_from_axes_shapes(
+    axes_shapes: Dict[str, Dict[int, Union[Counter, List[int]]]], buckets_count: int = DEFAULT_SHAPE_BUCKETS_COUNT
+) -> ShapeBuckets:
+    """Derive buckets for dynamic axes from shapes observed in the dataloader.
+
+    Buckets are quantiles of the observed sizes weighted by the number of samples with each size,
+    so each bucket covers a similar number of samples.
+
+    Args:
+        axes_shapes: Counts of the observed sizes for each axis of each input, as collected
+            by InferInputMetadata, or lists of the observed sizes
+        buckets_count: Maximal number of buckets for each axis
+
+    Returns:
+        Sorted bucket sizes for each dynamic axis of each input
+    """
+    shape_buckets = {}
+    for name, axes in axes_shapes.items():
+        axes_buckets = {}
+        for axis, sizes in axes.items():
+            sizes_counts = sizes if isinstance(sizes, Counter) else Counter(sizes)
+            if len(sizes_counts) < 2:
+                continue
+            quantiles = np.linspace(1 / buckets_count, 1.0, buckets_count)
+            buckets = _inverted_cdf_quantiles(list(sizes_counts), list(sizes_counts.values()), quantiles)
+            axes_buckets[axis] = sorted(set(buckets))
+        shape_buckets[name] = axes_buckets
+
+    return shape_buckets
+
+
+def _inverted_cdf_quantiles(values: List[int], weights: List[int], quantiles: np.ndarray) -> List[int]:
+    # Equivalent of `np.quantile(method="inverted_cdf")` with weights, which is not available in numpy 1.21
+    order = np.argsort(values, kind="stable")
+    sorted_values = np.asarray(values)[order]
+    cumulative_weights = np.cumsum(np.asarray(weights, dtype=np.float64)[order])
+    targets = np.asarray(quantiles) * cumulative_weights[-1]
+    indices = np.searchsorted(cumulative_weights, targets - 1e-9 * cumulative_weights[-1], side="left")
+    return [int(sorted_values[idx]) for idx in np.minimum(indices, len(sorted_values) - 1)]
+
+
+def get_bucket_size(size: int, buckets: Optional[List[int]]) -> int:
+    """Select the smallest bucket which fits the size.
+
+    Args:
+        size: Size of the axis
+        buckets: Sorted bucket sizes. When None, the size is rounded up to the power of 2.
+
+    Returns:
+        Bucket size or the size itself when it exceeds the largest bucket
+    """
+    if buckets is None:
+        return 2 ** math.ceil(math.log2(size)) if size > 0 else size
+
+    idx = bisect.bisect_left(buckets, size)
+    if idx == len(buckets):
+        return size
+
+    return buckets[idx]
+
+
+@dataclass
+class BucketingStats(DataObject):
+    """Statistics of the padding performed by the bucketing runner.
+
+    Args:
+        request_count: Number of inference requests
+        total_elements: Number of input elements passed to the model including padding
+        padded_elements: Number of input elements added by padding
+        shapes_count: Number of distinct input shapes received
+        buckets_count: Number of distinct padded input shapes passed to the model
+    """
+
+    request_count: int = 0
+    total_elements: int = 0
+    padded_elements: int = 0
+    shapes_count: int = 0
+    buckets_count: int = 0
+
+    @property
+    def padding_waste(self) -> float:
+        """Fraction of computed input elements which are padding."""
+        return self.padded_elements / self.total_elements if self.total_elements else 0.0
+
+    @property
+    def saved_recompilations(self) -> int:
+        """Number of compilations avoided by bucketing the shapes."""
+        return self.shapes_count - self.buckets_count
+
+
+class BucketingRunner(NavigatorRunner):
+    """Runs inference of `runner_cls` on inputs padded to shape buckets.
+
+    The class is used as a mixin, concrete runners are created with `bucketing_runner`.
+    """
+
+    runner_cls: Type[NavigatorRunner] = NavigatorRunner
+    runner_name: Optional[str] = None
+    shape_buckets: Optional[ShapeBuckets] = None
+
+    def __init__(self, *args, shape_buckets: Optional[ShapeBuckets] = None, **kwargs) -> None:
+        """Initialize object.
+
+        Args:
+            shape_buckets: Bucket sizes for dynamic axes of inputs. When None, buckets of the runner class are used
+                and when those are not set, dynamic axes from input metadata are padded to powers of 2.
+        """
+        if shape_buckets is None:
+            shape_buckets = self.shape_buckets
+        # Axes are serialized as strings in the package status and scripts arguments
+        self._shape_buckets = (
+            {name: {int(axis): buckets for axis, buckets in axes.items()} for name, axes in shape_buckets.items()}
+            if shape_buckets is not None
+            else None
+        )
+        self._stats = BucketingStats()
+        self._last_padding_waste = None
+        self._seen_shapes = set()
+        self._seen_buckets = set()
+        super().__init__(*args, **kwargs)
+
+    def activate_impl(self):
+        """Runner activation implementation."""
+        super().activate_impl()
+        self._stats = BucketingStats()
+        self._seen_shapes = set()
+        self._seen_buckets = set()
+
+    def deactivate_impl(self):
+        """Runner deactivation implementation."""
+        LOGGER.info(
+            f"{self.name()} | Padding waste: {self._stats.padding_waste:.2%}, "
+            f"saved recompilations: {self._stats.saved_recompilations} "
+            f"({self._stats.shapes_count} shapes in {self._stats.buckets_count} buckets)."
+        )
+        super().deactivate_impl()
+
+    def infer_impl(self, feed_dict: Dict, *args: Any, **kwargs: Any) -> Dict[str, np.ndarray]:
+        """Run inference on padded inputs and slice outputs to the original shapes."""
+        padded_feed_dict, padded_sizes = self._pad(feed_dict)
+        outputs = super().infer_impl(padded_feed_dict, *args, **kwargs)
+        return self._slice(outputs, padded_sizes)
+
+    def padding_waste(self) -> Optional[float]:
+        """Fraction of input elements which were padding in the last inference."""
+        return self._last_padding_waste
+
+    def saved_recompilations(self) -> Optional[int]:
+        """Number of compilations avoided by bucketing since the activation."""
+        return self._stats.saved_recompilations
+
+    def bucketing_stats(self) -> BucketingStats:
+        """Padding statistics collected since the activation."""
+        return self._stats
+
+    @classmethod
+    def name(cls) -> str:
+        """Runner name."""
+        return cls.runner_name or f"{cls.runner_cls.name()}Bucketing"
+
+    @classmethod
+    def is_default(cls) -> bool:
+        """Bucketing is used only when the runner is selected explicitly."""
+        return False
+
+    @classmethod
+    def get_runner_options(
+        cls,
+        custom_configs: Optional[Dict[str, CustomConfig]] = None,
+        dataloader_trt_profile: Optional[TensorRTProfile] = None,
+    ) -> Dict[str, Any]:
+        """Buckets derived from the dataloader profile, unless the runner class defines own buckets."""
+        runner_options = super().get_runner_options(
+            custom_configs=custom_configs, dataloader_trt_profile=dataloader_trt_profile
+        )
+        if cls.shape_buckets is None and dataloader_trt_profile is not None:
+            runner_options["shape_buckets"] = get_shape_buckets_from_trt_profile(dataloader_trt_profile)
+
+        return runner_options
+
+    def _axis_buckets(self, name: str, axis: int) -> Tuple[bool, Optional[List[int]]]:
+        if self._shape_buckets is not None:
+            buckets = self._shape_buckets.get(name, {}).get(axis)
+            return buckets is not None, buckets
+
+        return _is_dynamic_axis(self.input_metadata, name, axis), None
+
+    def _pad(self, feed_dict: Dict) -> Tuple[Dict, Dict[str, Dict[int, Tuple[int, int]]]]:
+        padded_feed_dict, padded_sizes = {}, {}
+        for name, tensor in feed_dict.items():
+            pad_width, input_padded_sizes = [], {}
+            for axis, size in enumerate(tensor.shape):
+                is_dynamic, buckets = self._axis_buckets(name, axis)
+                bucket_size = get_bucket_size(size, buckets) if is_dynamic else size
+                pad_width.append((0, bucket_size - size))
+                if is_dynamic:
+                    input_padded_sizes[axis] = (size, bucket_size)
+
+            padded_sizes[name] = input_padded_sizes
+            padded_feed_dict[name] = np.pad(tensor, pad_width) if any(after for _, after in pad_width) else tensor
+
+        self._update_stats(feed_dict, padded_feed_dict)
+
+        return padded_feed_dict, padded_sizes
+
+    def _update_stats(self, feed_dict: Dict, padded_feed_dict: Dict) -> None:
+        total_elements = sum(tensor.size for tensor in padded_feed_dict.values())
+        padded_elements = total_elements - sum(tensor.size for tensor in feed_dict.values())
+
+        self._seen_shapes.add(tuple(tensor.shape for tensor in feed_dict.values()))
+        self._seen_buckets.add(tuple(tensor.shape for tensor in padded_feed_dict.values()))
+        self._stats.request_count += 1
+        self._stats.total_elements += total_elements
+        self._stats.padded_elements += padded_elements
+        self._stats.shapes_count = len(self._seen_shapes)
+        self._stats.buckets_count = len(self._seen_buckets)
+        self._last_padding_waste = padded_elements / total_elements if total_elements else 0.0
+
+    def _slice(self, outputs: Dict[str, Any], padded_sizes: Dict[str, Dict[int, Tuple[int, int]]]) -> Dict[str, Any]:
+        sliced_outputs = type(outputs)()
+        for name, output in outputs.items():
+            slices = []
+            for axis, size in enumerate(output.shape):
+                original_size = None
+                if _is_dynamic_axis(self.output_metadata, name, axis):
+                    original_size = _get_original_size(name, axis, size, padded_sizes)
+                slices.append(slice(0, original_size) if original_size is not None else slice(None))
+            sliced_outputs[name] = output[tuple(slices)]
+
+        return sliced_outputs
+
+
+def bucketing_runner(
+    runner_cls: Type[NavigatorRunner], shape_buckets: Optional[ShapeBuckets] = None, name: Optional[str] = None
+) -> Type[NavigatorRunner]:
+    """Create runner which pads inputs to shape buckets before running the inference with `runner_cls`.
+
+    Args:
+        runner_cls: Runner used for the inference on padded inputs
+        shape_buckets: Bucket sizes for dynamic axes of inputs used by default by all instances of the runner
+        name: Name of the runner. When None, the name is `<runner_cls.name()>Bucketing`.
+
+    Returns:
+        Runner class padding inputs to shape buckets
+    """
+    attributes = {
+        "runner_cls": runner_cls,
+        "runner_name": name,
+        "shape_buckets": shape_buckets,
+        "__doc__": BucketingRunner.__doc__,
+    }
+    return type(f"{runner_cls.__name__}Bucketing", (BucketingRunner, runner_cls), attributes)
+
+
+def _is_dynamic_axis(metadata: Optional[TensorMetadata], name: str, axis: int) -> bool:
+    spec = metadata.get(name) if metadata else None
+    return spec is not None and axis < len(spec.shape) and spec.shape[axis] == -1
+
+
+def _get_original_size(
+    output_name: str, axis: int, size: int, padded_sizes: Dict[str, Dict[int, Tuple[int, int]]]
+) -> Optional[int]:
+    original_sizes = {
+        input_padded_sizes[axis][0]
+        for input_padded_sizes in padded_sizes.values()
+        if axis in input_padded_sizes and input_padded_sizes[axis][1] == size
+    }
+    if len(original_sizes) > 1:
+        raise ModelNavigatorRuntimeError(
+            f"Output `{output_name}` size {size} on axis {axis} matches inputs of sizes {sorted(original_sizes)} "
+            "after padding, so the size of the output without padding is ambiguous. "
+            "Use buckets which do not pad inputs of different sizes to the same size or a runner without bucketing."
+        )
+
+    return original_sizes.pop() if original_sizes else None
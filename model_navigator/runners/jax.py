@@ -13,21 +13,145 @@
 # limitations under the License.
 """JAX runner."""
 
+import functools
+import pathlib
 from collections import OrderedDict
-from typing import List, Mapping
+from typing import Any, Dict, List, Mapping, Optional
 
-import jax.numpy as jnp  # pytype: disable=import-error
 import numpy
 
 from model_navigator.api.config import Format
+from model_navigator.core.constants import DEFAULT_MAX_TRACED_SIGNATURES
+from model_navigator.core.logger import LOGGER
+from model_navigator.frameworks.jax import JaxModel
 from model_navigator.runners.base import DeviceKind, NavigatorRunner
+from model_navigator.runners.bucketing import bucketing_runner
 from model_navigator.runners.registry import register_runner
+from model_navigator.utils import module
 from model_navigator.utils.dataloader import get_default_output_names
 
+jax = module.lazy_import("jax")
+jnp = module.lazy_import("jax.numpy")
 
-class JAXRunner(NavigatorRunner):
+# Directory of the persistent compilation cache initialized by the runners in JAX without the config option
+_compilation_cache_dir: Optional[str] = None
+
+
+def _get_compilation_cache_dir() -> Optional[str]:
+    if "jax_compilation_cache_dir" in jax.config.values:
+        return jax.config.values["jax_compilation_cache_dir"]
+
+    return _compilation_cache_dir
+
+
+def _is_compilation_cache_configurable() -> bool:
+    if "jax_compilation_cache_dir" in jax.config.values:
+        return True
+
+    # cache initialized by the user cannot be restored after it is switched
+    from jax.experimental.compilation_cache import compilation_cache  # pytype: disable=import-error
+
+    return _compilation_cache_dir is not None or not compilation_cache.is_initialized()
+
+
+def _set_compilation_cache_dir(cache_dir: Optional[str]) -> None:
+    """Switch process global JAX persistent compilation cache to the directory, None disables the cache."""
+    global _compilation_cache_dir
+
+    from jax.experimental.compilation_cache import compilation_cache  # pytype: disable=import-error
+
+    if compilation_cache.is_initialized():
+        compilation_cache.reset_cache()
+    if "jax_compilation_cache_dir" in jax.config.values:
+        jax.config.update("jax_compilation_cache_dir", cache_dir)
+    elif cache_dir is not None:
+        compilation_cache.initialize_cache(cache_dir)
+
+    _compilation_cache_dir = cache_dir
+    LOGGER.debug(f"JAX compilation cache set to {cache_dir}.")
+
+
+def _forward(fn, params, args, kwargs):
+    if params is None:
+        return fn(*args, **kwargs)
+
+    return fn(*args, **kwargs, params=params)
+
+
+class _BaseJAXRunner(NavigatorRunner):
     """Runs inference using JAX."""
 
+    def __init__(
+        self,
+        *args,
+        jit_compile: bool = False,
+        donate_inputs: bool = False,
+        max_compiled_shapes: int = DEFAULT_MAX_TRACED_SIGNATURES,
+        **kwargs,
+    ) -> None:
+        """Initialize object.
+
+        Args:
+            jit_compile: When True, model is compiled with `jax.jit` for each input shapes.
+            donate_inputs: Donate input buffers to the compiled computation. Used only with `jit_compile`.
+            max_compiled_shapes: Maximal number of compiled executables kept in the cache.
+        """
+        self._jit_compile = jit_compile
+        self._donate_inputs = donate_inputs
+        self._max_compiled_shapes = max_compiled_shapes
+        self._forward = None
+        self._params = None
+        self._executables = OrderedDict()
+        self._retrace_count = 0
+        self._previous_compilation_cache_dir: Optional[str] = None
+        self._compilation_cache_switched = False
+        super().__init__(*args, **kwargs)
+
+    def activate_impl(self):
+        """Runner activation implementation."""
+        if not self._jit_compile:
+            return
+
+        model = self.model
+        if isinstance(model, JaxModel):
+            fn, params = model.model, model.params
+            if model.compilation_cache_dir is not None:
+                self._switch_compilation_cache(model.compilation_cache_dir)
+        else:
+            fn, params = model, None
+
+        self._params = jax.device_put(params, self._device()) if params is not None else None
+        donate_argnums = (1, 2) if self._donate_inputs else ()
+        self._forward = jax.jit(functools.partial(_forward, fn), donate_argnums=donate_argnums)
+        self._executables = OrderedDict()
+        self._retrace_count = 0
+
+    def deactivate_impl(self):
+        """Runner deactivation implementation."""
+        self._forward = None
+        self._params = None
+        self._executables = OrderedDict()
+        if self._compilation_cache_switched:
+            _set_compilation_cache_dir(self._previous_compilation_cache_dir)
+            self._compilation_cache_switched = False
+
+    def _switch_compilation_cache(self, cache_dir: pathlib.Path) -> None:
+        if not _is_compilation_cache_configurable():
+            LOGGER.warning(f"JAX compilation cache is already initialized, {cache_dir} is not used.")
+            return
+
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._previous_compilation_cache_dir = _get_compilation_cache_dir()
+        _set_compilation_cache_dir(cache_dir.as_posix())
+        self._compilation_cache_switched = True
+
+    def retrace_count(self) -> Optional[int]:
+        """Number of executables compiled since the activation."""
+        if not self._jit_compile:
+            return None
+
+        return self._retrace_count
+
     def infer_impl(self, feed_dict):
         """Run inference in JAX.
 
@@ -37,10 +161,14 @@ class JAXRunner(NavigatorRunner):
         inputs = tuple(feed_dict.values())
 
         if self._input_metadata_mapping is None:
-            outputs = self.model(*inputs)
+            args, kwargs = inputs, {}
         else:
-            inputs = dict(zip(self._input_metadata_mapping, inputs))
-            outputs = self.model(**inputs)
+            args, kwargs = (), dict(zip(self._input_metadata_mapping, inputs))
+
+        if self._jit_compile:
+            outputs = self._infer_compiled(feed_dict, args, kwargs)
+        else:
+            outputs = self.model(*args, **kwargs)
 
         if self.output_metadata:
             output_names = self.output_metadata.keys()
@@ -59,22 +187,73 @@ class JAXRunner(NavigatorRunner):
             out_dict[name] = output
         return out_dict
 
-    @classmethod
-    def name(cls) -> str:
-        """Return name of the runner."""
-        return "JAX"
+    def _infer_compiled(self, feed_dict: Dict, args: tuple, kwargs: Dict[str, Any]):
+        device = self._device()
+        args = jax.device_put(args, device)
+        kwargs = jax.device_put(kwargs, device)
+
+        key = tuple((name, tuple(tensor.shape), str(tensor.dtype)) for name, tensor in feed_dict.items())
+        executable = self._executables.get(key)
+        if executable is None:
+            executable = self._forward.lower(self._params, args, kwargs).compile()
+            self._retrace_count += 1
+            LOGGER.debug(f"{self.name()} | Compiled executable for input signature: {key}")
+
+            self._executables[key] = executable
+            if len(self._executables) > self._max_compiled_shapes:
+                self._executables.popitem(last=False)
+        else:
+            self._executables.move_to_end(key)
+
+        return executable(self._params, args, kwargs)
+
+    def _device(self):
+        return None
 
     @classmethod
     def format(cls) -> Format:
         """Return JAX runner format."""
         return Format.JAX
 
+
+class JAXRunner(_BaseJAXRunner):
+    """Runs inference using JAX."""
+
+    @classmethod
+    def name(cls) -> str:
+        """Return name of the runner."""
+        return "JAX"
+
     @classmethod
     def devices_kind(cls) -> List[DeviceKind]:
         """Return supported devices for runner."""
         return [DeviceKind.CUDA]
 
 
+class JAXCPURunner(_BaseJAXRunner):
+    """Runs inference using JAX compiled for CPU."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize object."""
+        kwargs.setdefault("jit_compile", True)
+        super().__init__(*args, **kwargs)
+
+    def _device(self):
+        return jax.devices("cpu")[0]
+
+    @classmethod
+    def name(cls) -> str:
+        """Return name of the runner."""
+        return "JAXCPU"
+
+    @classmethod
+    def devices_kind(cls) -> List[DeviceKind]:
+        """Return supported devices for runner."""
+        return [DeviceKind.CPU]
+
+
 def register_jax_runners():
     """Register all jax runners."""
     register_runner(JAXRunner)
+    register_runner(JAXCPURunner)
+    register_runner(bucketing_runner(JAXCPURunner))
@@ -13,7 +13,7 @@
 # limitations under the License.
 """ONNX runners."""
 from collections import OrderedDict
-from typing import List, Optional, Sequence, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 
 import model_navigator.utils.common as utils
 from model_navigator.api.config import Format, TensorType
@@ -24,8 +24,11 @@ from model_navigator.frameworks.onnx.utils import ONNX_RT_TYPE_TO_NP
 from model_navigator.frameworks.tensorrt.cuda import DeviceView
 from model_navigator.runners.base import DeviceKind, NavigatorRunner
 from model_navigator.runners.registry import register_runner
+from model_navigator.runners.replicated import replicated_runner
 from model_navigator.utils import module
 
+onnx = module.lazy_import("onnx")
+onnx_numpy_helper = module.lazy_import("onnx.numpy_helper")
 onnxrt = module.lazy_import("onnxruntime")
 np = module.lazy_import("numpy")
 
@@ -36,7 +39,13 @@ class SessionFromOnnx:
     Functor that builds an ONNX-Runtime inference session.
     """
 
-    def __init__(self, model_bytes: Union[bytes, str], providers: Optional[Sequence[str]] = None):
+    def __init__(
+        self,
+        model_bytes: Union[bytes, str],
+        providers: Optional[Sequence[str]] = None,
+        initializers: Optional[Dict[str, Any]] = None,
+        intra_op_num_threads: Optional[int] = None,
+    ):
         """Builds an ONNX-Runtime inference session.
 
         Args:
@@ -47,10 +56,16 @@ class SessionFromOnnx:
                     for the execution providers available in ONNX-Runtime. For example, a value of "cpu" would
                     match the "CPUExecutionProvider".
                     Defaults to ``["CUDA"]``.
+            initializers: Initializers as ``onnxruntime.OrtValue`` used by the session instead of the ones
+                    stored in the model, so sessions created with the same values share the memory.
+            intra_op_num_threads: Number of threads used to parallelize the execution of operators.
+                    Defaults to the ONNX-Runtime default of one thread per physical core.
 
         """
         self._model_bytes_or_path = model_bytes
         self.providers = utils.default(providers, ["cuda"])
+        self.initializers = initializers
+        self.intra_op_num_threads = intra_op_num_threads
 
     def __call__(self, *args, **kwargs):
         """Invokes ``call_impl``.
@@ -79,17 +94,26 @@ class SessionFromOnnx:
                 )
             providers.append(matched_prov)
 
+        sess_options = onnxrt.SessionOptions()
+        for name, value in (self.initializers or {}).items():
+            sess_options.add_initializer(name, value)
+        if self.intra_op_num_threads is not None:
+            sess_options.intra_op_num_threads = self.intra_op_num_threads
+
         LOGGER.info(f"Creating ONNX-Runtime Inference Session with providers: {providers}")
-        return onnxrt.InferenceSession(model_bytes, providers=providers)
+        return onnxrt.InferenceSession(model_bytes, sess_options=sess_options, providers=providers)
 
 
 class _BaseOnnxrtRunner(NavigatorRunner):
     _provider: str
 
-    def __init__(self, disable_fallback=True, *args, **kwargs) -> None:
+    def __init__(self, disable_fallback=True, *args, intra_op_num_threads: Optional[int] = None, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._disable_fallback = disable_fallback
-        self._sess = SessionFromOnnx(self._model.as_posix(), providers=[self._provider])
+        self._intra_op_num_threads = intra_op_num_threads
+        self._sess = SessionFromOnnx(
+            self._model.as_posix(), providers=[self._provider], intra_op_num_threads=intra_op_num_threads
+        )
 
     @classmethod
     def format(cls) -> Format:
@@ -119,6 +143,23 @@ class _BaseOnnxrtRunner(NavigatorRunner):
             assert self.input_metadata[name].dtype == onnx_input_metadata[name].dtype
             assert self.input_metadata[name].shape == onnx_input_metadata[name].shape
 
+    def load_shared_weights(self) -> Dict[str, Any]:
+        """Load model initializers to CPU memory shared by sessions of all instances using them."""
+        model = onnx.load(self._model.as_posix())
+        return {
+            initializer.name: onnxrt.OrtValue.ortvalue_from_numpy(onnx_numpy_helper.to_array(initializer))
+            for initializer in model.graph.initializer
+        }
+
+    def use_shared_weights(self, shared_weights: Dict[str, Any]) -> None:
+        """Create session with initializers loaded by other instance of the runner."""
+        self._sess = SessionFromOnnx(
+            self._model.as_posix(),
+            providers=[self._provider],
+            initializers=shared_weights,
+            intra_op_num_threads=self._intra_op_num_threads,
+        )
+
     def activate_impl(self):
         self.sess, _ = utils.invoke_if_callable(self._sess)
         if self._disable_fallback:
@@ -255,7 +296,9 @@ class OnnxrtTensorRTRunner(OnnxrtCUDARunner):
 
 
 def register_onnx_runners() -> None:
-    """Register CPU, CUDA and TensorRT ONNX runners."""
+    """Register CPU, CUDA and TensorRT ONNX runners and replicated CPU and CUDA runners."""
     register_runner(OnnxrtCPURunner)
     register_runner(OnnxrtCUDARunner)
     register_runner(OnnxrtTensorRTRunner)
+    register_runner(replicated_runner(OnnxrtCPURunner))
+    register_runner(replicated_runner(OnnxrtCUDARunner))
@@ -12,12 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Runner definition for Python based models."""
+import multiprocessing
+import os
+import queue
+import traceback
 from collections import OrderedDict
-from typing import Dict, List, Mapping
+from multiprocessing import shared_memory
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 
 import numpy
 
 from model_navigator.api.config import Format
+from model_navigator.core.constants import (
+    DEFAULT_PROCESS_POOL_JOIN_TIMEOUT,
+    DEFAULT_PROCESS_POOL_WORKERS,
+    PROCESS_POOL_WORKERS_VARIANTS,
+)
+from model_navigator.core.logger import LOGGER
+from model_navigator.exceptions import ModelNavigatorRuntimeError
 from model_navigator.runners.base import DeviceKind, NavigatorRunner
 from model_navigator.runners.registry import register_runner
 from model_navigator.utils.dataloader import get_default_output_names
@@ -61,6 +73,223 @@ class PythonRunner(NavigatorRunner):
         return "PythonRunner"
 
 
+_TensorsLayout = List[Tuple[str, Tuple[int, ...], str, int]]
+
+
+class _SharedBuffer:
+    """Growable shared memory block owned by the process which created it."""
+
+    def __init__(self) -> None:
+        self.shm = None
+
+    def write(self, tensors: Sequence[Tuple[str, numpy.ndarray]]) -> _TensorsLayout:
+        layout, offset = [], 0
+        for name, tensor in tensors:
+            layout.append((name, tensor.shape, tensor.dtype.str, offset))
+            offset += _aligned(tensor.nbytes)
+
+        if self.shm is None or self.shm.size < offset:
+            self.close()
+            self.shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+
+        for (_, shape, dtype, tensor_offset), (_, tensor) in zip(layout, tensors):
+            numpy.ndarray(shape, dtype=dtype, buffer=self.shm.buf, offset=tensor_offset)[...] = tensor
+
+        return layout
+
+    def close(self) -> None:
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
+
+
+class _SharedBufferReader:
+    """Cache of shared memory blocks attached by name."""
+
+    def __init__(self) -> None:
+        self._shms = {}
+
+    def read(self, shm_name: str, layout: _TensorsLayout) -> List[Tuple[str, numpy.ndarray]]:
+        shm = self._shms.get(shm_name)
+        if shm is None:
+            # owner replaces the block when it grows, previous one is no longer used
+            self.close()
+            shm = shared_memory.SharedMemory(name=shm_name)
+            self._shms[shm_name] = shm
+
+        return [
+            (name, numpy.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset))
+            for name, shape, dtype, offset in layout
+        ]
+
+    def close(self) -> None:
+        for shm in self._shms.values():
+            shm.close()
+        self._shms = {}
+
+
+def _aligned(nbytes: int, alignment: int = 64) -> int:
+    return (nbytes + alignment - 1) // alignment * alignment
+
+
+def _process_pool_worker(model, connection) -> None:
+    """Serve inference requests with the resident model until `None` is received."""
+    reader, output_buffer = _SharedBufferReader(), _SharedBuffer()
+    try:
+        while True:
+            request = connection.recv()
+            if request is None:
+                break
+
+            shm_name, layout = request
+            try:
+                feed_dict = dict(reader.read(shm_name, layout))
+                outputs = model(**feed_dict)
+                if isinstance(outputs, numpy.ndarray):
+                    outputs = {"output__0": outputs}
+                outputs = [(name, numpy.asarray(output)) for name, output in outputs.items()]
+                del feed_dict
+                connection.send(("ok", output_buffer.write(outputs), output_buffer.shm.name))
+            except Exception:
+                connection.send(("error", traceback.format_exc(), None))
+    finally:
+        reader.close()
+        output_buffer.close()
+        connection.close()
+
+
+class PythonProcessPoolRunner(PythonRunner):
+    """Runs inference for Python models in a pool of worker processes.
+
+    Each worker holds its own copy of the model for the whole runner activation.
+    Inputs and outputs are exchanged through shared memory, so requests issued from multiple threads
+    are processed in parallel.
+
+    Runner is used only when selected explicitly in `runners`. Variants with fixed number of workers
+    are registered as `PythonProcessPool<workers>`.
+    """
+
+    workers_count: Optional[int] = None
+
+    def __init__(self, *args, workers: Optional[int] = None, **kwargs) -> None:
+        """Initialize object.
+
+        Args:
+            workers: Number of worker processes. Defaults to `workers_count` of the runner class and when it is not set
+                to `DEFAULT_PROCESS_POOL_WORKERS` limited by CPU count.
+        """
+        if workers is None:
+            workers = self.workers_count or min(DEFAULT_PROCESS_POOL_WORKERS, os.cpu_count() or 1)
+
+        self._workers_count = workers
+        self._workers = []
+        self._idle_workers = queue.Queue()
+        super().__init__(*args, **kwargs)
+
+        if self._workers_count < 1:
+            raise ValueError(f"Number of workers must be positive, got: {self._workers_count}")
+
+    @property
+    def workers(self) -> int:
+        """Number of worker processes."""
+        return self._workers_count
+
+    def activate_impl(self):
+        """Start worker processes with resident model."""
+        start_methods = multiprocessing.get_all_start_methods()
+        self._context = multiprocessing.get_context("fork" if "fork" in start_methods else "spawn")
+        for _ in range(self._workers_count):
+            worker = self._start_worker()
+            self._workers.append(worker)
+            self._idle_workers.put(worker)
+
+    def deactivate_impl(self):
+        """Stop worker processes and release shared memory."""
+        for worker in self._workers:
+            try:
+                worker[1].send(None)
+            except OSError:
+                pass
+            self._stop_worker(worker)
+
+        self._workers = []
+        self._idle_workers = queue.Queue()
+
+    def infer_impl(self, feed_dict: Dict):
+        """Run inference in the first idle worker."""
+        worker = self._idle_workers.get()
+        try:
+            process, connection, input_buffer, output_reader = worker
+            layout = input_buffer.write([(name, numpy.asarray(tensor)) for name, tensor in feed_dict.items()])
+            try:
+                connection.send((input_buffer.shm.name, layout))
+                status, result, shm_name = connection.recv()
+            except (EOFError, OSError) as e:
+                worker = self._replace_worker(worker)
+                raise ModelNavigatorRuntimeError(
+                    f"Worker process {process.pid} exited during inference with code {process.exitcode}."
+                ) from e
+            if status != "ok":
+                raise ModelNavigatorRuntimeError(f"Inference in worker process failed:\n{result}")
+            outputs = [(name, tensor.copy()) for name, tensor in output_reader.read(shm_name, result)]
+        finally:
+            self._idle_workers.put(worker)
+
+        output_names = self.output_metadata.keys() if self.output_metadata else [name for name, _ in outputs]
+
+        out_dict = OrderedDict()
+        for name, (_, output) in zip(output_names, outputs):
+            out_dict[name] = output
+        return out_dict
+
+    def _start_worker(self) -> Tuple:
+        parent_connection, child_connection = self._context.Pipe()
+        process = self._context.Process(target=_process_pool_worker, args=(self.model, child_connection), daemon=True)
+        process.start()
+        child_connection.close()
+        return process, parent_connection, _SharedBuffer(), _SharedBufferReader()
+
+    def _stop_worker(self, worker: Tuple) -> None:
+        process, connection, input_buffer, output_reader = worker
+        process.join(timeout=DEFAULT_PROCESS_POOL_JOIN_TIMEOUT)
+        if process.is_alive():
+            LOGGER.warning(f"{self.name()} | Worker process {process.pid} did not stop in time. Terminating.")
+            process.terminate()
+            process.join()
+        connection.close()
+        output_reader.close()
+        input_buffer.close()
+
+    def _replace_worker(self, worker: Tuple) -> Tuple:
+        """Stop the worker which lost the connection and start a new one in its place."""
+        LOGGER.warning(f"{self.name()} | Worker process {worker[0].pid} is not responding. Starting a new worker.")
+        self._stop_worker(worker)
+        new_worker = self._start_worker()
+        self._workers[self._workers.index(worker)] = new_worker
+        return new_worker
+
+    @classmethod
+    def is_thread_safe(cls) -> bool:
+        """Requests are dispatched to idle workers, so runner can be used from multiple threads."""
+        return True
+
+    @classmethod
+    def is_default(cls) -> bool:
+        """Worker processes are started only when the runner is selected explicitly."""
+        return False
+
+    @classmethod
+    def name(cls) -> str:
+        """Runner name."""
+        return f"PythonProcessPool{cls.workers_count or ''}"
+
+
 def register_python_runners():
     """Register Python runner in global registry."""
     register_runner(PythonRunner)
+    register_runner(PythonProcessPoolRunner)
+    for workers in PROCESS_POOL_WORKERS_VARIANTS:
+        register_runner(
+            type(f"PythonProcessPool{workers}Runner", (PythonProcessPoolRunner,), {"workers_count": workers})
+        )
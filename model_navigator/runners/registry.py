@@ -12,9 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Runners global registry."""
-from typing import Dict, Type, Union
-
-import pkg_resources
+from importlib import metadata as importlib_metadata
+from typing import Dict, Iterable, Type, Union
 
 from model_navigator.core.logger import LOGGER
 from model_navigator.runners.base import NavigatorRunner
@@ -24,7 +23,7 @@ runner_registry: Dict[str, Type[NavigatorRunner]] = {}
 
 def load_runners_from_entry_points():
     """Load runners from package entrypoints."""
-    for entry_point in pkg_resources.iter_entry_points("model_navigator"):
+    for entry_point in _get_entry_points("model_navigator"):
         try:
             entry_point.load()
         except Exception as e:
@@ -64,3 +63,11 @@ def get_runner(runner_name: Union[str, Type[NavigatorRunner]]) -> Type[Navigator
     if runner is None:
         raise ValueError(f"Runner `{runner_name}` not available.")
     return runner
+
+
+def _get_entry_points(group: str) -> Iterable[importlib_metadata.EntryPoint]:
+    # pkg_resources is slow to import, entry points are read from distributions metadata instead
+    entry_points = importlib_metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        return entry_points.select(group=group)
+    return entry_points.get(group, [])  # Python < 3.10
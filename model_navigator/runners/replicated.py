@@ -0,0 +1,238 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Runners replicating the model to serve concurrent requests.
+
+The number of replicas, threads of each replica and dispatch policy are runner options
+set with `ReplicatedRunnerConfig` and recorded in the package status together with the profiling results.
+Replicas share the model weights when the replicated runner supports it.
+
+Replicated ONNX Runtime and TorchScript runners are registered, but not used by default - select them in `runners`
+to let the profiling compare them with a single instance. Other variants have to be registered in the module
+loaded from the `model_navigator` entry point, so the runner is available also in the subprocesses
+running correctness and profiling.
+
+Example:
+    package = nav.onnx.optimize(
+        ...,
+        runners=("OnnxCPU", "OnnxCPUReplicated"),
+        optimization_profile=nav.OptimizationProfile(concurrency=4),
+        custom_configs=[nav.ReplicatedRunnerConfig(replicas=4)],
+    )
+
+    register_runner(replicated_runner(PythonRunner, replicas=4, dispatch="least_loaded"))
+"""
+import os
+import threading
+from typing import Any, Dict, List, Optional, Type, Union
+
+import numpy as np
+
+from model_navigator.api.config import (
+    CustomConfig,
+    DeviceKind,
+    Format,
+    ReplicasDispatch,
+    ReplicatedRunnerConfig,
+    TensorRTProfile,
+    TensorType,
+)
+from model_navigator.core.constants import DEFAULT_RUNNER_REPLICAS
+from model_navigator.runners.base import NavigatorRunner
+
+
+class ReplicatedRunner(NavigatorRunner):
+    """Runs inference in one of the runner replicas.
+
+    Concrete runners are created with `replicated_runner`.
+    """
+
+    runner_cls: Type[NavigatorRunner] = NavigatorRunner
+    replicas_count: Optional[int] = None
+    replicas_dispatch: Optional[ReplicasDispatch] = None
+
+    def __init__(
+        self,
+        *args,
+        replicas: Optional[int] = None,
+        threads_per_replica: Optional[int] = None,
+        dispatch: Optional[Union[str, ReplicasDispatch]] = None,
+        **kwargs,
+    ) -> None:
+        """Initialize replicas with the same arguments.
+
+        Args:
+            replicas: Number of runner instances. Defaults to `replicas_count` of the runner class and when it is
+                not set to `DEFAULT_RUNNER_REPLICAS`.
+            threads_per_replica: Number of intra-op threads passed to each replica as `intra_op_num_threads`.
+                When None, the CPU cores are divided among the replicas.
+            dispatch: Policy of selecting replica for the request. Defaults to `replicas_dispatch`
+                of the runner class and when it is not set to round robin.
+        """
+        if replicas is None:
+            replicas = self.replicas_count or DEFAULT_RUNNER_REPLICAS
+        self._replicas_count = replicas
+        if self._replicas_count < 1:
+            raise ValueError(f"Number of replicas must be positive, got: {self._replicas_count}")
+
+        self._replicas_dispatch = ReplicasDispatch(dispatch or self.replicas_dispatch or ReplicasDispatch.ROUND_ROBIN)
+        self._threads_per_replica = threads_per_replica or max(1, (os.cpu_count() or 1) // self._replicas_count)
+        self._replicas = [
+            self.runner_cls(*args, intra_op_num_threads=self._threads_per_replica, **kwargs)
+            for _ in range(self._replicas_count)
+        ]
+        self._in_progress = [0] * self._replicas_count
+        self._replicas_locks = [threading.Lock() for _ in range(self._replicas_count)]
+        self._dispatch_lock = threading.Lock()
+        self._next_replica = 0
+        super().__init__(*args, **kwargs)
+
+    @property
+    def threads_per_replica(self) -> int:
+        """Number of intra-op threads used by each replica."""
+        return self._threads_per_replica
+
+    @property
+    def replicated_runners(self) -> List[NavigatorRunner]:
+        """Replicated runners."""
+        return self._replicas
+
+    def activate_impl(self):
+        """Activate all replicas sharing the weights loaded once."""
+        shared_weights = self._replicas[0].load_shared_weights()
+        for replica in self._replicas:
+            if shared_weights is not None:
+                replica.use_shared_weights(shared_weights)
+            replica.activate()
+
+    def deactivate_impl(self):
+        """Deactivate all replicas in reverse order, so process wide settings are restored."""
+        for replica in reversed(self._replicas):
+            replica.deactivate()
+
+    def infer_impl(self, feed_dict: Dict, *args: Any, **kwargs: Any) -> Dict[str, np.ndarray]:
+        """Run inference in the replica selected by the dispatch policy."""
+        idx = self._acquire_replica()
+        try:
+            if self.runner_cls.is_thread_safe():
+                return self._replicas[idx].infer(feed_dict, False, *args, **kwargs)
+
+            with self._replicas_locks[idx]:
+                return self._replicas[idx].infer(feed_dict, False, *args, **kwargs)
+        finally:
+            with self._dispatch_lock:
+                self._in_progress[idx] -= 1
+
+    def _acquire_replica(self) -> int:
+        with self._dispatch_lock:
+            if self._replicas_dispatch == ReplicasDispatch.LEAST_LOADED:
+                idx = self._in_progress.index(min(self._in_progress))
+            else:
+                idx = self._next_replica
+                self._next_replica = (self._next_replica + 1) % self._replicas_count
+            self._in_progress[idx] += 1
+
+        return idx
+
+    def retrace_count(self) -> Optional[int]:
+        """Number of retraces in all replicas."""
+        retrace_counts = [replica.retrace_count() for replica in self._replicas]
+        if all(retrace_count is None for retrace_count in retrace_counts):
+            return None
+
+        return sum(retrace_count or 0 for retrace_count in retrace_counts)
+
+    def get_available_return_types_impl(self) -> List[TensorType]:
+        """Return types supported by the replicated runner."""
+        return self._replicas[0].get_available_return_types()
+
+    def get_available_input_types_impl(self) -> List[TensorType]:
+        """Input types supported by the replicated runner."""
+        return self._replicas[0].get_available_input_types()
+
+    @classmethod
+    def is_thread_safe(cls) -> bool:
+        """Requests from multiple threads are dispatched to replicas."""
+        return True
+
+    @classmethod
+    def is_default(cls) -> bool:
+        """Replicas are created only when the runner is selected explicitly."""
+        return False
+
+    @classmethod
+    def get_runner_options(
+        cls,
+        custom_configs: Optional[Dict[str, CustomConfig]] = None,
+        dataloader_trt_profile: Optional[TensorRTProfile] = None,
+    ) -> Dict[str, Any]:
+        """Options of the replicated runner extended with replicas options from `ReplicatedRunnerConfig`.
+
+        Replicas count and dispatch policy fixed by the runner class are not overridden.
+        """
+        runner_options = cls.runner_cls.get_runner_options(
+            custom_configs=custom_configs, dataloader_trt_profile=dataloader_trt_profile
+        )
+        config = (custom_configs or {}).get(ReplicatedRunnerConfig.name()) or ReplicatedRunnerConfig()
+        if cls.replicas_count is None:
+            runner_options["replicas"] = config.replicas
+        if cls.replicas_dispatch is None:
+            runner_options["dispatch"] = config.dispatch.value
+        if config.threads_per_replica is not None:
+            runner_options["threads_per_replica"] = config.threads_per_replica
+
+        return runner_options
+
+    @classmethod
+    def format(cls) -> Format:
+        """Format of the replicated runner."""
+        return cls.runner_cls.format()
+
+    @classmethod
+    def devices_kind(cls) -> List[DeviceKind]:
+        """Devices supported by the replicated runner."""
+        return cls.runner_cls.devices_kind()
+
+    @classmethod
+    def name(cls) -> str:
+        """Runner name with replicas count and dispatch policy when they are fixed by the runner class."""
+        suffix = "LeastLoaded" if cls.replicas_dispatch == ReplicasDispatch.LEAST_LOADED else ""
+        return f"{cls.runner_cls.name()}Replicated{cls.replicas_count or ''}{suffix}"
+
+
+def replicated_runner(
+    runner_cls: Type[NavigatorRunner],
+    replicas: Optional[int] = None,
+    dispatch: Optional[Union[str, ReplicasDispatch]] = None,
+) -> Type[NavigatorRunner]:
+    """Create runner which dispatches requests to replicas of `runner_cls`.
+
+    Args:
+        runner_cls: Runner replicated for the inference
+        replicas: Number of runner instances. When None, it is set by the runner options.
+        dispatch: Policy of selecting replica for the request. When None, it is set by the runner options.
+
+    Returns:
+        Runner class named `<runner_cls.name()>Replicated`, followed by `replicas` and `LeastLoaded`
+        suffix for least loaded dispatch when they are fixed.
+    """
+    if replicas is not None and replicas < 1:
+        raise ValueError(f"Number of replicas must be positive, got: {replicas}")
+
+    attributes = {
+        "runner_cls": runner_cls,
+        "replicas_count": replicas,
+        "replicas_dispatch": ReplicasDispatch(dispatch) if dispatch is not None else None,
+        "__doc__": ReplicatedRunner.__doc__,
+    }
+    return type(f"{runner_cls.__name__}Replicated{replicas or ''}", (ReplicatedRunner,), attributes)
@@ -14,13 +14,16 @@
 """Runner definition for TensorFlow based models."""
 import gc
 from collections import OrderedDict
-from typing import Any, Dict, List, Mapping
+from typing import Any, Dict, List, Mapping, Optional
 
 import numpy
 import numpy as np
 
 from model_navigator.api.config import Format
+from model_navigator.core.constants import DEFAULT_MAX_TRACED_SIGNATURES
+from model_navigator.core.logger import LOGGER
 from model_navigator.runners.base import DeviceKind, NavigatorRunner
+from model_navigator.runners.bucketing import bucketing_runner
 from model_navigator.runners.registry import register_runner
 from model_navigator.utils import module
 from model_navigator.utils.dataloader import get_default_output_names
@@ -63,19 +66,89 @@ class _BaseTFRunner(NavigatorRunner):
         raise NotImplementedError
 
 
-class TensorFlowSavedModelCUDARunner(_BaseTFRunner):
-    """Runs inference for TensorFlow SavedModels."""
+class _BaseTFSavedModelRunner(_BaseTFRunner):
+    """Runs inference for TensorFlow SavedModels using the serving signature."""
+
+    def __init__(
+        self,
+        *args,
+        specialize_shapes: bool = False,
+        jit_compile: bool = False,
+        max_traced_signatures: int = DEFAULT_MAX_TRACED_SIGNATURES,
+        **kwargs,
+    ) -> None:
+        """Initialize object.
+
+        Args:
+            specialize_shapes: When True, serving signature is wrapped in `tf.function` traced for
+                the exact shapes of the inputs instead of the generic signature shapes.
+            jit_compile: Enable XLA compilation of shape specialized functions.
+            max_traced_signatures: Maximal number of shape specialized functions kept in the cache.
+        """
+        self._specialize_shapes = specialize_shapes or jit_compile
+        self._jit_compile = jit_compile
+        self._max_traced_signatures = max_traced_signatures
+        self._infer_fn = None
+        self._traced_fns = OrderedDict()
+        self._retrace_count = 0
+        super().__init__(*args, **kwargs)
 
     def activate_impl(self):
         """Runner activation implementation."""
         self._loaded_model = tf.keras.models.load_model(str(self._model))
+        self._infer_fn = self._loaded_model.signatures["serving_default"]
+        self._traced_fns = OrderedDict()
+        self._retrace_count = 0
+
+    def deactivate_impl(self):
+        """Runner deactivation implementation."""
+        super().deactivate_impl()
+        self._infer_fn = None
+        self._traced_fns = OrderedDict()
+
+    def retrace_count(self) -> Optional[int]:
+        """Number of shape specialized functions traced since the activation."""
+        if not self._specialize_shapes:
+            return None
+
+        return self._retrace_count
 
     def _infer_impl(self, feed_dict: Dict):
         """Runner inference handler implementation."""
-        infer = self._loaded_model.signatures["serving_default"]
+        infer = self._get_specialized_fn(feed_dict) if self._specialize_shapes else self._infer_fn
         outputs = [output.numpy() for output in infer(**feed_dict).values()]
         return outputs
 
+    def _get_specialized_fn(self, feed_dict: Dict):
+        key = tuple((name, tuple(tensor.shape), str(tensor.dtype)) for name, tensor in feed_dict.items())
+        infer = self._traced_fns.get(key)
+        if infer is not None:
+            self._traced_fns.move_to_end(key)
+            return infer
+
+        signature_fn = self._infer_fn
+
+        def _specialized_fn(**inputs):
+            return signature_fn(**inputs)
+
+        input_specs = {
+            name: tf.TensorSpec(shape=tensor.shape, dtype=tf.as_dtype(tensor.dtype), name=name)
+            for name, tensor in feed_dict.items()
+        }
+        infer = tf.function(_specialized_fn, jit_compile=self._jit_compile).get_concrete_function(**input_specs)
+        self._retrace_count += 1
+        LOGGER.debug(f"{self.name()} | Traced function for input signature: {key}")
+
+        self._traced_fns[key] = infer
+        if len(self._traced_fns) > self._max_traced_signatures:
+            self._traced_fns.popitem(last=False)
+
+        return infer
+
+
+class TensorFlowSavedModelCUDARunner(_BaseTFSavedModelRunner):
+    """Runs inference for TensorFlow SavedModels."""
+
     @classmethod
     def format(cls) -> Format:
         """Runner supported format."""
@@ -92,23 +165,14 @@ class TensorFlowSavedModelCUDARunner(_BaseTFRunner):
         return "TensorFlowSavedModelCUDA"
 
 
-class TensorFlowSavedModelCPURunner(_BaseTFRunner):
+class TensorFlowSavedModelCPURunner(_BaseTFSavedModelRunner):
     """Runs inference for TensorFlow SavedModels."""
 
     def activate_impl(self):
         """Runner activation implementation."""
         if any(device.device_type == "GPU" for device in tf.config.get_visible_devices()):
             tf.config.set_visible_devices([], "GPU")
-        self._loaded_model = tf.keras.models.load_model(str(self._model))
-
-    def deactivate_impl(self):
-        """Runner deactivation implementation."""
-
-    def _infer_impl(self, feed_dict: Dict):
-        """Runner inference handler implementation."""
-        infer = self._loaded_model.signatures["serving_default"]
-        outputs = [output.numpy() for output in infer(**feed_dict).values()]
-        return outputs
+        super().activate_impl()
 
     @classmethod
     def format(cls) -> Format:
@@ -126,6 +190,44 @@ class TensorFlowSavedModelCPURunner(_BaseTFRunner):
         return "TensorFlowSavedModelCPU"
 
 
+class TensorFlowSavedModelXLACUDARunner(TensorFlowSavedModelCUDARunner):
+    """Runs inference for TensorFlow SavedModels with XLA compiled shape specialized functions."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize object."""
+        kwargs.setdefault("jit_compile", True)
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def is_default(cls) -> bool:
+        """XLA compilation is enabled only when the runner is selected explicitly."""
+        return False
+
+    @classmethod
+    def name(cls) -> str:
+        """Runner name."""
+        return "TensorFlowSavedModelXLACUDA"
+
+
+class TensorFlowSavedModelXLACPURunner(TensorFlowSavedModelCPURunner):
+    """Runs inference for TensorFlow SavedModels with XLA compiled shape specialized functions."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize object."""
+        kwargs.setdefault("jit_compile", True)
+        super().__init__(*args, **kwargs)
+
+    @classmethod
+    def is_default(cls) -> bool:
+        """XLA compilation is enabled only when the runner is selected explicitly."""
+        return False
+
+    @classmethod
+    def name(cls) -> str:
+        """Runner name."""
+        return "TensorFlowSavedModelXLACPU"
+
+
 class TensorFlowTensorRTRunner(TensorFlowSavedModelCUDARunner):
     """Runs inference for TensorFlow TensorRT models."""
 
@@ -233,6 +335,10 @@ def register_tensorflow_runners():
     """Register TensorFlow runner in global registry."""
     register_runner(TensorFlowSavedModelCPURunner)
     register_runner(TensorFlowSavedModelCUDARunner)
+    register_runner(TensorFlowSavedModelXLACPURunner)
+    register_runner(TensorFlowSavedModelXLACUDARunner)
+    register_runner(bucketing_runner(TensorFlowSavedModelXLACPURunner))
+    register_runner(bucketing_runner(TensorFlowSavedModelXLACUDARunner))
     register_runner(TensorFlowTensorRTRunner)
     register_runner(TensorFlowCUDARunner)
     register_runner(TensorFlowCPURunner)
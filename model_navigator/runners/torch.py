@@ -13,14 +13,16 @@
 # limitations under the License.
 """Torch runners."""
 from collections import OrderedDict
-from typing import List, Mapping
+from typing import List, Mapping, Optional
 
 from model_navigator.api.config import Format, TensorType
 from model_navigator.core.tensor import get_tensor_type
 from model_navigator.frameworks import is_torch2_available
 from model_navigator.frameworks.tensorrt import utils as tensorrt_utils
 from model_navigator.runners.base import DeviceKind, NavigatorRunner
+from model_navigator.runners.bucketing import bucketing_runner
 from model_navigator.runners.registry import register_runner
+from model_navigator.runners.replicated import replicated_runner
 from model_navigator.utils import module
 from model_navigator.utils.common import numpy_to_torch_dtype
 from model_navigator.utils.dataloader import get_default_output_names
@@ -38,10 +40,17 @@ class _BaseTorchRunner(NavigatorRunner):
         """Runner supported format."""
         return Format.TORCH
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Initialization implementation."""
+    def __init__(self, *args, intra_op_num_threads: Optional[int] = None, **kwargs) -> None:
+        """Initialization implementation.
+
+        Args:
+            intra_op_num_threads: Number of threads used by PyTorch for intra-op parallelism while the runner
+                is active. The setting is process wide and restored on deactivation. Defaults to PyTorch setting.
+        """
         super().__init__(*args, **kwargs)
         self._loaded_model = None
+        self._intra_op_num_threads = intra_op_num_threads
+        self._previous_num_threads = None
         if is_torch2_available():
             self._infer = self._infer_inference_mode
         else:
@@ -49,12 +58,16 @@ class _BaseTorchRunner(NavigatorRunner):
 
     def activate_impl(self):
         """Activation implementation."""
+        self._set_num_threads()
         self._loaded_model = self.model
         self._loaded_model.to(self._target_device).eval()
 
     def deactivate_impl(self):
         """Deactivation implementation."""
         self._loaded_model = None
+        if self._previous_num_threads is not None:
+            torch.set_num_threads(self._previous_num_threads)
+            self._previous_num_threads = None
 
     def infer_impl(self, feed_dict):
         """Inference handler implementation."""
@@ -105,6 +118,11 @@ class _BaseTorchRunner(NavigatorRunner):
 
         return outputs
 
+    def _set_num_threads(self):
+        if self._intra_op_num_threads is not None:
+            self._previous_num_threads = torch.get_num_threads()
+            torch.set_num_threads(self._intra_op_num_threads)
+
     def _prepare_inputs(self, feed_dict):
         """Prepare inputs for inference."""
         inputs = []
@@ -143,6 +161,7 @@ class _BaseTorchScriptRunner(_BaseTorchRunner):
 
     def activate_impl(self):
         """Activation implementation."""
+        self._set_num_threads()
         self._loaded_model = torch.jit.load(str(self._model), map_location=self._target_device).eval()
 
 
@@ -255,6 +274,8 @@ def register_torch_runners():
     register_runner(TorchScriptCUDARunner)
     register_runner(TorchScriptCPURunner)
     register_runner(TorchTensorRTRunner)
+    register_runner(replicated_runner(TorchScriptCPURunner))
+    register_runner(replicated_runner(TorchScriptCUDARunner))
 
 
 class TorchCompileCUDARunner(_BaseTorchRunner):
@@ -318,3 +339,5 @@ def register_torch2_runners():
     """Register runners in global registry."""
     register_runner(TorchCompileCPURunner)
     register_runner(TorchCompileCUDARunner)
+    register_runner(bucketing_runner(TorchCompileCPURunner))
+    register_runner(bucketing_runner(TorchCompileCUDARunner))
@@ -25,12 +25,14 @@ from model_navigator.utils.format_helpers import is_source_format
 def default_runners(device_kind: DeviceKind) -> List:
     """Select default runners defined for the process.
 
+    Runners which have to be selected explicitly are skipped.
+
     Returns:
         List of default runners
     """
     _default_runners = set()
     for name, runner in runner_registry.items():
-        if device_kind in runner.devices_kind():
+        if device_kind in runner.devices_kind() and runner.is_default():
             _default_runners.add(name)
 
     return list(_default_runners)
@@ -65,9 +67,9 @@ def get_source_default_runners(format: Format) -> List[Type[NavigatorRunner]]:
 
         return [OnnxrtCUDARunner, OnnxrtCPURunner] if is_cuda_available() else [OnnxrtCPURunner]
     if format == Format.JAX:
-        from model_navigator.runners.jax import JAXRunner
+        from model_navigator.runners.jax import JAXCPURunner, JAXRunner
 
-        return [JAXRunner]
+        return [JAXRunner, JAXCPURunner] if is_cuda_available() else [JAXCPURunner]
     raise ValueError(f"Not source format: {format}")
 
 
@@ -87,7 +89,7 @@ def get_format_default_runners(format: Format) -> List[Type[NavigatorRunner]]:
         return get_source_default_runners(format)
     runners = []
     for runner_cls in runner_registry.values():
-        if runner_cls.format() == format:
+        if runner_cls.format() == format and runner_cls.is_default():
             runners.append(runner_cls)
     if runners:
         LOGGER.info(
@@ -12,14 +12,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Dataloader definition and helpers module."""
+import atexit
+import hashlib
+import json
+import multiprocessing
 import pathlib
-from typing import Any, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+import pickle
+import queue
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
-from model_navigator.api.config import Sample, TensorType
-from model_navigator.exceptions import ModelNavigatorUserInputError
+from model_navigator.api.config import PrefetchMode, Sample, TensorType
+from model_navigator.core.constants import (
+    DEFAULT_PREFETCH_DEPTH,
+    DEFAULT_UNSIZED_DATALOADER_MAX_SAMPLES,
+    SAMPLES_INDEX_FILENAME,
+    SAMPLES_STORE_VERSION,
+)
+from model_navigator.core.logger import LOGGER
+from model_navigator.exceptions import ModelNavigatorRuntimeError, ModelNavigatorUserInputError
 from model_navigator.frameworks import Framework
+from model_navigator.utils.common import DataObject
+from model_navigator.utils.devices import is_cuda_initialized
 
 
 def to_numpy(tensor: Any, from_framework: Framework) -> np.ndarray:
@@ -72,6 +91,56 @@ def extract_sample(sample, input_metadata, framework: Framework) -> Sample:
     return sample
 
 
+def sample_to_numpy(sample: Any, framework: Framework) -> Any:
+    """Convert tensors in the sample to numpy arrays keeping the sample structure.
+
+    Args:
+        sample: A dataloader sample to convert
+        framework: A framework from which the tensors are converted
+
+    Returns:
+        Sample with the same structure and numpy arrays as tensors
+    """
+    if isinstance(sample, Sequence):
+        return tuple(to_numpy(tensor, framework) for tensor in sample)
+    if isinstance(sample, Mapping):
+        return {name: to_numpy(tensor, framework) for name, tensor in sample.items()}
+    return to_numpy(sample, framework)
+
+
+def get_dataloader_length(dataloader: Iterable) -> Optional[int]:
+    """Get number of samples in the dataloader.
+
+    Args:
+        dataloader: Dataloader to check
+
+    Returns:
+        Length of the dataloader or None when the dataloader has no length, e.g. is a stream
+    """
+    try:
+        return len(dataloader)
+    except TypeError:
+        return None
+
+
+def get_samples_limit(dataloader: Iterable, max_samples: Optional[int]) -> int:
+    """Get number of samples to read from the dataloader.
+
+    Args:
+        dataloader: Dataloader to read
+        max_samples: Maximal number of samples to read. When None, sized dataloaders are read whole and
+            dataloaders without length up to `DEFAULT_UNSIZED_DATALOADER_MAX_SAMPLES` samples.
+
+    Returns:
+        Number of samples to read
+    """
+    dataloader_length = get_dataloader_length(dataloader)
+    if dataloader_length is None:
+        return max_samples if max_samples is not None else DEFAULT_UNSIZED_DATALOADER_MAX_SAMPLES
+
+    return min(dataloader_length, max_samples) if max_samples is not None else dataloader_length
+
+
 def extract_bs1(sample: Sample, batch_dim: Optional[int]) -> Sample:
     """Extract sample with batch size 1.
 
@@ -194,6 +263,9 @@ def validate_sample_output(sample, tensor_type: TensorType = TensorType.NUMPY):
 def load_samples(samples_name: str, workspace: Union[pathlib.Path, str], batch_dim: Optional[int]) -> List[Sample]:
     """Load samples for provided name.
 
+    Samples saved in the columnar store are memory mapped, so tensors are views on the store files
+    and data is read from the disk only when accessed. Samples saved as `.npz` files are loaded to memory.
+
     Args:
         samples_name: Name of samples to load
         workspace: Working directory
@@ -202,25 +274,184 @@ def load_samples(samples_name: str, workspace: Union[pathlib.Path, str], batch_d
     Returns:
         List of data samples
     """
+    samples_dirpath = _get_samples_dirpath(samples_name, workspace)
+
+    if (samples_dirpath / SAMPLES_INDEX_FILENAME).exists():
+        samples = load_mmap_samples(samples_dirpath)
+    else:
+        samples = _load_npz_samples(samples_dirpath)
+
+    if batch_dim is not None:
+        samples = [_expand_sample_dims(sample, batch_dim) for sample in samples]
+
+    return samples
+
+
+def iter_samples(samples_name: str, workspace: Union[pathlib.Path, str], batch_dim: Optional[int]) -> Iterator[Sample]:
+    """Iterate over samples for provided name loading one sample at a time.
+
+    Each sample from the columnar store is mapped separately and unmapped when released by the consumer,
+    so memory used by the samples stays at about one sample regardless of the number of samples.
+
+    Args:
+        samples_name: Name of samples to load
+        workspace: Working directory
+        batch_dim: Position of batch dimension
+
+    Yields:
+        Data samples in the saved order
+    """
+    samples_dirpath = _get_samples_dirpath(samples_name, workspace)
+
+    if (samples_dirpath / SAMPLES_INDEX_FILENAME).exists():
+        samples = iter_mmap_samples(samples_dirpath)
+    else:
+        samples = _iter_npz_samples(samples_dirpath)
+
+    for sample in samples:
+        yield _expand_sample_dims(sample, batch_dim) if batch_dim is not None else sample
+
+
+def _get_samples_dirpath(samples_name: str, workspace: Union[pathlib.Path, str]) -> pathlib.Path:
     if isinstance(workspace, str):
         workspace = pathlib.Path(workspace)
     samples_type = samples_name.split("_")[0]
     samples_dirname = "model_output" if samples_name.split("_")[-1] == "output" else "model_input"
-    samples_dirpath = workspace / samples_dirname / samples_type
-    samples = []
-    for sample_filepath in sorted(samples_dirpath.iterdir()):
+    return workspace / samples_dirname / samples_type
+
+
+def _expand_sample_dims(sample: Sample, batch_dim: int) -> Sample:
+    return {name: np.expand_dims(tensor, batch_dim) for name, tensor in sample.items()}
+
+
+def _load_mmap_index(path: pathlib.Path) -> Dict:
+    with (path / SAMPLES_INDEX_FILENAME).open("r") as f:
+        index = json.load(f)
+
+    if index["version"] > SAMPLES_STORE_VERSION:
+        raise ModelNavigatorUserInputError(
+            f"Samples store version {index['version']} in {path} is not supported. "
+            f"Supported version: {SAMPLES_STORE_VERSION}."
+        )
+
+    return index
+
+
+def iter_mmap_samples(path: pathlib.Path) -> Iterator[Sample]:
+    """Iterate over samples from the columnar store mapping one sample at a time.
+
+    Args:
+        path: Directory with the samples store
+
+    Yields:
+        Samples with tensors mapped from the store
+    """
+    index = _load_mmap_index(path)
+    for sample_idx in range(index["samples_count"]):
         sample = {}
-        with np.load(sample_filepath.as_posix()) as data:
-            for k, v in data.items():
-                if batch_dim is not None:
-                    v = np.expand_dims(v, batch_dim)
-                    # v = numpy.repeat(v, max_batch_size, batch_dim)
-                sample[k] = v
-        samples.append(sample)
+        for tensor_index in index["tensors"]:
+            dtype = np.dtype(tensor_index["dtype"])
+            start, end = tensor_index["offsets"][sample_idx], tensor_index["offsets"][sample_idx + 1]
+            shape = tuple(tensor_index["shapes"][sample_idx])
+            if end > start:
+                sample[tensor_index["name"]] = np.memmap(
+                    path / tensor_index["filename"],
+                    dtype=dtype,
+                    mode="c",
+                    offset=start * dtype.itemsize,
+                    shape=shape,
+                )
+            else:
+                sample[tensor_index["name"]] = np.empty(shape, dtype=dtype)
+        yield sample
+
+
+class SamplesFingerprint:
+    """Fingerprint of the samples content updated sample by sample.
+
+    Fingerprint covers names, data types, shapes and data of the tensors in the order of samples,
+    so it can be computed in the pass which already iterates over the dataloader.
+    """
+
+    def __init__(self) -> None:
+        """Initialize object."""
+        self._hasher = hashlib.blake2b(digest_size=16)
+
+    def update(self, sample: Sample) -> None:
+        """Add the next sample to the fingerprint.
+
+        Args:
+            sample: Sample with numpy tensors
+        """
+        for name, tensor in sample.items():
+            tensor = np.ascontiguousarray(tensor)
+            self._hasher.update(f"{name}:{tensor.dtype.str}:{tensor.shape};".encode())
+            self._hasher.update(tensor.data)
+        self._hasher.update(b"\n")
+
+    def hexdigest(self) -> str:
+        """Hex digest of the samples added so far."""
+        return self._hasher.hexdigest()
+
+
+def get_samples_fingerprint(samples: Iterable[Sample]) -> str:
+    """Compute fingerprint of the samples content.
+
+    Args:
+        samples: Samples with numpy tensors
+
+    Returns:
+        Hex digest of the samples content
+    """
+    fingerprint = SamplesFingerprint()
+    for sample in samples:
+        fingerprint.update(sample)
+
+    return fingerprint.hexdigest()
+
+
+def load_mmap_samples(path: pathlib.Path) -> List[Sample]:
+    """Load samples from the columnar store without copying the data.
+
+    Store contains one binary file per tensor name with data of all samples and `samples.json` index
+    with dtype, offsets and shapes of the samples. Tensors are copy-on-write views on memory mapped files.
+
+    Args:
+        path: Directory with the samples store
+
+    Returns:
+        List of samples with tensors mapped from the store
+    """
+    index = _load_mmap_index(path)
+
+    samples = [{} for _ in range(index["samples_count"])]
+    for tensor_index in index["tensors"]:
+        dtype = np.dtype(tensor_index["dtype"])
+        offsets = tensor_index["offsets"]
+        if offsets[-1] > 0:
+            data = np.memmap(path / tensor_index["filename"], dtype=dtype, mode="c", shape=(offsets[-1],))
+        else:
+            data = np.empty((0,), dtype=dtype)
+
+        for sample, start, end, shape in zip(samples, offsets[:-1], offsets[1:], tensor_index["shapes"]):
+            sample[tensor_index["name"]] = data[start:end].reshape(shape)
 
     return samples
 
 
+def _load_npz_samples(path: pathlib.Path) -> List[Sample]:
+    return list(_iter_npz_samples(path))
+
+
+def _iter_npz_samples(path: pathlib.Path) -> Iterator[Sample]:
+    for sample_filepath in sorted(path.iterdir()):
+        if sample_filepath.suffix != ".npz":
+            continue
+        with np.load(sample_filepath.as_posix()) as data:
+            sample = dict(data.items())
+        yield sample
+
+
 def get_default_output_names(num_output: int) -> List:
     """Generate list of default output names.
 
@@ -251,3 +482,222 @@ def expand_sample(sample: Sample, batch_dim: Optional[int], batch_size: Optional
     for name, tensor in sample.items():
         expanded_sample[name] = tensor.repeat(batch_size, axis=batch_dim)
     return expanded_sample
+
+
+@dataclass
+class PrefetchStats(DataObject):
+    """Time spent on waiting for the dataloader and on processing of the samples.
+
+    Args:
+        samples_count: Number of samples consumed
+        stall_time: Time in seconds spent on waiting for the next sample
+        processing_time: Time in seconds spent on processing the samples by the consumer
+    """
+
+    samples_count: int = 0
+    stall_time: float = 0.0
+    processing_time: float = 0.0
+
+    @property
+    def is_dataloader_bound(self) -> bool:
+        """True when waiting for the dataloader takes longer than processing the samples."""
+        return self.stall_time > self.processing_time
+
+
+_PREFETCH_ITEM, _PREFETCH_END, _PREFETCH_ERROR = range(3)
+_PREFETCH_PUT_TIMEOUT = 0.1
+_PREFETCH_JOIN_TIMEOUT = 1.0
+_PREFETCH_WARNING_STALL_TIME = 1.0
+
+
+_prefetch_processes = set()
+
+
+@atexit.register
+def _terminate_prefetch_processes() -> None:
+    # Prefetching processes are not daemons, so they can start dataloader workers, and would block the exit
+    for process in list(_prefetch_processes):
+        if process.is_alive():
+            process.terminate()
+            process.join()
+
+
+def _prefetch_worker(dataloader, transform, samples_queue, stop_event, serialize_errors: bool) -> None:
+    def _put(item) -> bool:
+        while not stop_event.is_set():
+            try:
+                samples_queue.put(item, timeout=_PREFETCH_PUT_TIMEOUT)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    try:
+        for sample in dataloader:
+            if not _put((_PREFETCH_ITEM, transform(sample) if transform else sample)):
+                return
+        _put((_PREFETCH_END, None))
+    except Exception as e:
+        if serialize_errors:
+            try:
+                pickle.dumps(e)
+            except Exception:
+                e = ModelNavigatorRuntimeError(f"Dataloader prefetching failed:\n{traceback.format_exc()}")
+        _put((_PREFETCH_ERROR, e))
+
+
+class DataloaderPrefetcher:
+    """Iterate over the dataloader with samples fetched and converted in the background.
+
+    Up to `depth` samples are fetched ahead of the consumer into a bounded queue, so the dataloader works
+    while the samples are processed. Time spent waiting for the samples and processing them is collected
+    in `stats`.
+
+    Example:
+        prefetcher = DataloaderPrefetcher(dataloader, transform=lambda s: extract_sample(s, names, framework))
+        for sample in prefetcher:
+            runner.infer(sample)
+        prefetcher.log_stats("Verification")
+    """
+
+    def __init__(
+        self,
+        dataloader: Iterable,
+        transform: Optional[Callable[[Any], Any]] = None,
+        depth: int = DEFAULT_PREFETCH_DEPTH,
+        mode: PrefetchMode = PrefetchMode.THREAD,
+    ) -> None:
+        """Initialize object.
+
+        Args:
+            dataloader: Dataloader to iterate over
+            transform: Function applied to each sample in the background, e.g. conversion to numpy
+            depth: Maximal number of samples fetched ahead. 0 fetches the samples in the consumer.
+                Defaults to `DEFAULT_PREFETCH_DEPTH` which disables prefetching.
+            mode: Fetch samples in a background thread or process
+        """
+        self._dataloader = dataloader
+        self._transform = transform
+        self._depth = depth
+        self._mode = PrefetchMode(mode)
+        self.stats = PrefetchStats()
+
+    def __len__(self) -> int:
+        """Number of samples in the dataloader."""
+        return len(self._dataloader)
+
+    def __iter__(self) -> Iterator:
+        """Iterate over the transformed samples."""
+        self.stats = PrefetchStats()
+        if self._depth <= 0:
+            samples = self._iter_sync()
+        elif self._mode == PrefetchMode.PROCESS and is_cuda_initialized():
+            LOGGER.warning(
+                "CUDA is initialized and cannot be used in a forked process. Prefetching samples in a thread."
+            )
+            samples = self._iter_thread()
+        elif self._mode == PrefetchMode.PROCESS:
+            samples = self._iter_process()
+        else:
+            samples = self._iter_thread()
+
+        while True:
+            start = time.perf_counter()
+            try:
+                sample = next(samples)
+            except StopIteration:
+                return
+            finally:
+                self.stats.stall_time += time.perf_counter() - start
+
+            self.stats.samples_count += 1
+            start = time.perf_counter()
+            try:
+                yield sample
+            except GeneratorExit:
+                samples.close()
+                raise
+            finally:
+                self.stats.processing_time += time.perf_counter() - start
+
+    def log_stats(self, name: str) -> None:
+        """Log time spent on waiting for the dataloader.
+
+        Args:
+            name: Name of the stage which consumed the samples
+        """
+        LOGGER.info(
+            f"{name} | Dataloader stall time: {self.stats.stall_time:.3f} s, "
+            f"processing time: {self.stats.processing_time:.3f} s for {self.stats.samples_count} samples."
+        )
+        if self.stats.is_dataloader_bound and self.stats.stall_time > _PREFETCH_WARNING_STALL_TIME:
+            LOGGER.warning(
+                f"{name} | Most of the time is spent on waiting for the dataloader. "
+                "Consider speeding up the dataloader or prefetching samples in a process "
+                "with `OptimizationProfile.prefetch_mode`."
+            )
+
+    def _iter_sync(self) -> Iterator:
+        for sample in self._dataloader:
+            yield self._transform(sample) if self._transform else sample
+
+    def _iter_thread(self) -> Iterator:
+        samples_queue = queue.Queue(maxsize=self._depth)
+        stop_event = threading.Event()
+        thread = threading.Thread(
+            target=_prefetch_worker,
+            args=(self._dataloader, self._transform, samples_queue, stop_event, False),
+            daemon=True,
+        )
+        thread.start()
+        try:
+            while True:
+                kind, item = samples_queue.get()
+                if kind == _PREFETCH_END:
+                    return
+                if kind == _PREFETCH_ERROR:
+                    raise item
+                yield item
+        finally:
+            stop_event.set()
+            # worker blocked in the dataloader notices the stop only after the next sample, it is left as a daemon
+            thread.join(timeout=_PREFETCH_JOIN_TIMEOUT)
+            if thread.is_alive():
+                LOGGER.debug("Dataloader prefetching thread is still fetching a sample. Leaving it in the background.")
+
+    def _iter_process(self) -> Iterator:
+        start_methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if "fork" in start_methods else "spawn")
+        samples_queue = context.Queue(maxsize=self._depth)
+        stop_event = context.Event()
+        # Not a daemon, so the dataloader can start own worker processes
+        process = context.Process(
+            target=_prefetch_worker,
+            args=(self._dataloader, self._transform, samples_queue, stop_event, True),
+            daemon=False,
+        )
+        process.start()
+        _prefetch_processes.add(process)
+        try:
+            while True:
+                try:
+                    kind, item = samples_queue.get(timeout=_PREFETCH_PUT_TIMEOUT)
+                except queue.Empty:
+                    if not process.is_alive() and samples_queue.empty():
+                        raise ModelNavigatorRuntimeError(
+                            f"Dataloader prefetching process exited with code {process.exitcode}."
+                        ) from None
+                    continue
+                if kind == _PREFETCH_END:
+                    return
+                if kind == _PREFETCH_ERROR:
+                    raise item
+                yield item
+        finally:
+            stop_event.set()
+            process.join(timeout=_PREFETCH_JOIN_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+            _prefetch_processes.discard(process)
+            samples_queue.close()
@@ -15,6 +15,7 @@
 
 import ctypes
 import logging
+import sys
 import uuid
 from ctypes import c_uint8
 from typing import List, Optional, Sequence, Union
@@ -32,6 +33,10 @@ except OSError as e:
     LOGGER.warning(f"CUDA not available: {e}")
     cuda = None
 
+CUDA_RUNTIME_LIBRARIES = ("libcudart.so", "libcublas.so", "libcudnn.so", "libonnxruntime_providers_cuda.so")
+
+_cuda_initialized = False
+
 
 def _check_ret(err):
     if err != CUDA_SUCCESS:
@@ -48,10 +53,13 @@ def _get_device_count():
 
 def get_available_gpus():
     """Get all available GPUs in the system."""
+    global _cuda_initialized
+
     if cuda is None:
         return []
 
     _check_ret(cuda.cuInit(0))
+    _cuda_initialized = True
     device_count = _get_device_count()
     dev_uuid = bytearray(UUID_SIZE)
     name_buf = bytearray(MAX_NAME_SIZE)
@@ -125,3 +133,26 @@ def get_environment_info(gpus: Optional[Sequence[str]] = None):
 def is_cuda_available():
     """Return True if CUDA available, False otherwise."""
     return bool(get_gpus(["all"]))
+
+
+def is_cuda_initialized() -> bool:
+    """Check if CUDA may have been initialized in the current process.
+
+    CUDA cannot be used in processes forked after the initialization. The check is conservative and
+    returns True also when the CUDA runtime libraries are loaded by a framework.
+
+    Returns:
+        True if CUDA driver was initialized by Model Navigator or PyTorch or CUDA runtime is loaded, False otherwise
+    """
+    if _cuda_initialized:
+        return True
+
+    torch = sys.modules.get("torch")
+    if torch is not None and torch.cuda.is_initialized():
+        return True
+
+    try:
+        with open("/proc/self/maps") as f:
+            return any(library in line for line in f for library in CUDA_RUNTIME_LIBRARIES)
+    except OSError:
+        return False
@@ -12,17 +12,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Collect information about current system and environment."""
+import hashlib
+import json
 import locale
 import logging
 import os
+import pathlib
 import platform
 import re
+import sys
+import threading
+import time
+import uuid
 from subprocess import CalledProcessError
 from typing import Dict, List, Optional, Union
 
 import cpuinfo
 import psutil
 
+from model_navigator.core.constants import (
+    DEFAULT_ENVIRONMENT_CACHE_PATH,
+    ENVIRONMENT_CACHE_TTL,
+    NVIDIA_DRIVER_VERSION_FILE,
+)
+
 LOGGER = logging.getLogger(__name__)
 
 PACKAGES = [
@@ -164,11 +177,92 @@ def get_env() -> Dict:
         "os": os_details,
         "python_version": platform.python_version(),
         "python_packages": {k: v for k, v in packages.items() if k in PACKAGES},
-        "libraries": {k: v for k, v in os.environ.items() if k in LIBRARIES},
+        "libraries": _get_libraries(),
     }
     return env
 
 
+def get_env_snapshot(cache_path: Optional[pathlib.Path] = None, ttl: float = ENVIRONMENT_CACHE_TTL) -> Dict:
+    """Collect information from current environment or read the snapshot cached by the previous call.
+
+    Snapshots are cached on disk for each Python interpreter, content of the `sys.path` directories and NVIDIA
+    driver version, so installing packages or updating the driver gathers a new snapshot. Libraries versions
+    are always read from the current environment variables.
+
+    Args:
+        cache_path: Path to the file with cached snapshots. Defaults to `DEFAULT_ENVIRONMENT_CACHE_PATH`.
+        ttl: Time in seconds after which the cached snapshot is gathered again
+
+    Returns:
+        Dictionary with details about current working environment
+    """
+    cache_path = pathlib.Path(cache_path or DEFAULT_ENVIRONMENT_CACHE_PATH).expanduser()
+    key = _get_snapshot_key()
+    now = time.time()
+    snapshots = {
+        snapshot_key: snapshot
+        for snapshot_key, snapshot in _read_snapshots(cache_path).items()
+        if 0 <= now - snapshot["timestamp"] < ttl
+    }
+
+    if key in snapshots:
+        LOGGER.debug(f"Environment snapshot read from {cache_path}.")
+        env = snapshots[key]["environment"]
+    else:
+        env = get_env()
+        snapshots[key] = {"timestamp": now, "environment": env}
+        _write_snapshots(cache_path, snapshots)
+
+    return {**env, "libraries": _get_libraries()}
+
+
+class EnvironmentSnapshot:
+    """Environment snapshot gathered in the background thread.
+
+    Example:
+        environment_snapshot = EnvironmentSnapshot()
+        ...  # work executed while the environment is gathered
+        env = environment_snapshot.get()
+    """
+
+    def __init__(self, cache_path: Optional[pathlib.Path] = None, ttl: float = ENVIRONMENT_CACHE_TTL) -> None:
+        """Start gathering the environment snapshot.
+
+        Args:
+            cache_path: Path to the file with cached snapshots. Defaults to `DEFAULT_ENVIRONMENT_CACHE_PATH`.
+            ttl: Time in seconds after which the cached snapshot is gathered again
+        """
+        self._env: Optional[Dict] = None
+        self._error: Optional[Exception] = None
+        self._thread = threading.Thread(target=self._gather, args=(cache_path, ttl), daemon=True)
+        self._thread.start()
+
+    @property
+    def ready(self) -> bool:
+        """Flag if the snapshot was gathered."""
+        return not self._thread.is_alive()
+
+    def get(self) -> Dict:
+        """Wait until the snapshot is gathered and return it.
+
+        Returns:
+            Dictionary with details about current working environment
+
+        Raises:
+            Exception raised while gathering the snapshot
+        """
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self._env
+
+    def _gather(self, cache_path: Optional[pathlib.Path], ttl: float) -> None:
+        try:
+            self._env = get_env_snapshot(cache_path=cache_path, ttl=ttl)
+        except Exception as e:
+            self._error = e
+
+
 def _command_runner(command: Union[str, List]) -> str:
     """Executed command as subprocess and collect information."""
     import subprocess
@@ -180,6 +274,53 @@ def _command_runner(command: Union[str, List]) -> str:
     )
 
 
+def _get_libraries() -> Dict[str, str]:
+    """Collect versions of libraries from the environment variables."""
+    return {k: v for k, v in os.environ.items() if k in LIBRARIES}
+
+
+def _get_snapshot_key() -> str:
+    """Hash of the interpreter, modification times of the `sys.path` directories and NVIDIA driver version."""
+    # the first entry is the directory of the executed script, changed by the script outputs on every run
+    sys_path = []
+    for path in sys.path[1:]:
+        try:
+            sys_path.append((path, os.stat(path).st_mtime_ns))
+        except OSError:
+            continue
+
+    try:
+        driver_version = pathlib.Path(NVIDIA_DRIVER_VERSION_FILE).read_text().splitlines()[0]
+    except (OSError, IndexError):
+        driver_version = None
+
+    key_data = {"interpreter": sys.executable, "sys_path": sys_path, "driver_version": driver_version}
+    return hashlib.sha256(json.dumps(key_data).encode("utf-8")).hexdigest()
+
+
+def _read_snapshots(cache_path: pathlib.Path) -> Dict:
+    """Read cached snapshots, missing or corrupted file is treated as empty cache."""
+    try:
+        snapshots = json.loads(cache_path.read_text())
+    except (OSError, ValueError) as e:
+        LOGGER.debug(f"Environment snapshots not read from {cache_path}: {e}")
+        return {}
+
+    return snapshots if isinstance(snapshots, dict) else {}
+
+
+def _write_snapshots(cache_path: pathlib.Path, snapshots: Dict) -> None:
+    """Write snapshots atomically, so processes reading the cache never see partially written file."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{uuid.uuid4().hex}")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(snapshots))
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        LOGGER.debug(f"Environment snapshots not written to {cache_path}: {e}")
+        tmp_path.unlink(missing_ok=True)
+
+
 def _search(input: str, regex: str) -> Optional[str]:
     """Search for matching regular expression inside given string.
 
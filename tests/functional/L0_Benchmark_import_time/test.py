@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# Copyright (c) 2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark of the time of importing the top-level package measured with `python -X importtime`"""
+import argparse
+import logging
+import pathlib
+import re
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+import yaml
+
+LOGGER = logging.getLogger((__package__ or "main").split(".")[-1])
+METADATA = {
+    "image_name": "nvcr.io/nvidia/pytorch:{version}-py3",
+}
+
+IMPORTED_MODULE = "model_navigator"
+REPEATS = 5
+TOP_MODULES_COUNT = 10
+MAX_IMPORT_TIME = 0.5
+FRAMEWORK_MODULES = ["jax", "tensorflow", "tensorrt", "torch"]
+
+# import time:     self [us] | cumulative | imported package
+IMPORT_TIME_PATTERN = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(\S+)$")
+
+
+def _measure_import_time(module_name: str) -> Dict[str, Tuple[float, float]]:
+    """Import module in a new interpreter and return the self and cumulative import time of each imported module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        encoding="utf-8",
+        check=True,
+    )
+    import_times = {}
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match:
+            self_time, cumulative_time, name = match.groups()
+            import_times[name] = (int(self_time) / 1e6, int(cumulative_time) / 1e6)
+
+    if module_name not in import_times:
+        raise AssertionError(f"Import time of `{module_name}` not found in the output:\n{result.stderr}")
+
+    return import_times
+
+
+def main():
+    from tests import utils
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--status",
+        type=pathlib.Path,
+        required=True,
+        help="Status file where per path result is stored.",
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Timeout for test.",
+    )
+    args = parser.parse_args()
+
+    log_level = logging.DEBUG if args.verbose else logging.INFO
+    logging.basicConfig(level=log_level, format=utils.DEFAULT_LOG_FORMAT)
+    LOGGER.debug(f"CLI args: {args}")
+
+    # the first import compiles the bytecode, so the fastest of the repeated imports is reported
+    measurements = [_measure_import_time(IMPORTED_MODULE) for _ in range(REPEATS + 1)][1:]
+    import_times = min(measurements, key=lambda times: times[IMPORTED_MODULE][1])
+    import_time = import_times[IMPORTED_MODULE][1]
+
+    top_modules = sorted(import_times.items(), key=lambda item: item[1][0], reverse=True)[:TOP_MODULES_COUNT]
+    for name, (self_time, cumulative_time) in top_modules:
+        LOGGER.info(f"{name}: self {self_time * 1e3:.2f} ms, cumulative {cumulative_time * 1e3:.2f} ms")
+    LOGGER.info(f"Importing `{IMPORTED_MODULE}`: {import_time * 1e3:.2f} ms, {len(import_times)} modules")
+
+    status = {
+        "import_time": import_time,
+        "modules_count": len(import_times),
+        "top_modules": {name: self_time for name, (self_time, _) in top_modules},
+    }
+
+    imported_frameworks = [name for name in FRAMEWORK_MODULES if name in import_times]
+    if imported_frameworks:
+        raise AssertionError(f"Frameworks imported with `{IMPORTED_MODULE}`: {', '.join(imported_frameworks)}")
+    if import_time > MAX_IMPORT_TIME:
+        raise AssertionError(
+            f"Expected import of `{IMPORTED_MODULE}` below {MAX_IMPORT_TIME * 1e3:.0f} ms, "
+            f"got {import_time * 1e3:.2f} ms"
+        )
+
+    status_file = args.status
+    with status_file.open("w") as fp:
+        yaml.safe_dump(status, fp)
+
+    LOGGER.info(f"Status saved to {status_file}")
+
+
+if __name__ == "__main__":
+    main()
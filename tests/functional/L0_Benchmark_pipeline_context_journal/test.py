@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# Copyright (c) 2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Benchmark of saving pipeline context after each unit to the journal and to the whole context file"""
+import argparse
+import logging
+import pathlib
+import tempfile
+import time
+
+import yaml
+
+LOGGER = logging.getLogger((__package__ or "main").split(".")[-1])
+METADATA = {
+    "image_name": "nvcr.io/nvidia/pytorch:{version}-py3",
+}
+
+MODELS_COUNT = 4
+RUNNERS_COUNT = 125
+BATCH_SIZES = [1, 2, 4, 8, 16, 32, 64, 128, 256, 512]
+MEASUREMENTS_COUNT = 100
+SAMPLING_INTERVAL = 50
+MIN_SPEEDUP = 5.0
+
+
+def main():
+    import numpy as np
+
+    from model_navigator.api.config import JitType
+    from model_navigator.commands.base import Command, CommandOutput, CommandStatus, ExecutionUnit
+    from model_navigator.commands.performance.results import ProfilingResults
+    from model_navigator.configuration.model.model_config import ONNXConfig, TorchScriptConfig
+    from model_navigator.core.workspace import Workspace
+    from model_navigator.pipelines.pipeline_context import PipelineContext
+    from tests import utils
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--status",
+        type=pathlib.Path,
+        required=True,
+        help="Status file where per path result is stored.",
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Timeout for test.",
+    )
+    args = parser.parse_args()
+
+    log_level = logging.DEBUG if args.verbose else logging.INFO
+    logging.basicConfig(level=log_level, format=utils.DEFAULT_LOG_FORMAT)
+    LOGGER.debug(f"CLI args: {args}")
+
+    class Performance(Command):
+        def _run(self):
+            pass
+
+    def runner_cls(idx):
+        return type(f"Runner{idx}", (), {"name": classmethod(lambda cls: cls.__name__)})
+
+    ts_trace = TorchScriptConfig(jit_type=JitType.TRACE, strict=True)
+    model_configs = [
+        ts_trace,
+        TorchScriptConfig(jit_type=JitType.SCRIPT, strict=True),
+        ONNXConfig(opset=17, dynamic_axes=None),
+        ONNXConfig(opset=17, dynamic_axes=None, parent=ts_trace),
+    ][:MODELS_COUNT]
+    runners = [runner_cls(idx) for idx in range(RUNNERS_COUNT)]
+    execution_units = [
+        ExecutionUnit(command=Performance, model_config=model_config, runner_cls=runner)
+        for model_config in model_configs
+        for runner in runners
+    ]
+
+    rng = np.random.default_rng(0)
+    command_outputs = [
+        CommandOutput(
+            status=CommandStatus.OK,
+            output={
+                "profiling_results": [
+                    ProfilingResults.from_measurements(
+                        measurements=rng.gamma(2.0, batch_size / 10, MEASUREMENTS_COUNT).tolist(),
+                        batch_size=batch_size,
+                        sample_id=0,
+                    )
+                    for batch_size in BATCH_SIZES
+                ]
+            },
+        )
+        for _ in execution_units
+    ]
+
+    def save_whole_context(context: PipelineContext) -> None:
+        # saving used before the journal was introduced
+        data = {
+            "metadata": context.metadata.to_dict(parse=True),
+            "commands": context.commands.to_dict(parse=True),
+        }
+        with (context.workspace.path / "context.yaml").open("w") as fp:
+            yaml.safe_dump(data=data, stream=fp, sort_keys=False)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        context = PipelineContext(workspace=Workspace(pathlib.Path(tmpdir)))
+        context.initialize()
+        start = time.perf_counter()
+        for execution_unit, command_output in zip(execution_units, command_outputs):
+            context.update(execution_unit=execution_unit, command_output=command_output)
+            context.save()
+        context.compact()
+        journal_time = time.perf_counter() - start
+
+        loaded_context = PipelineContext(workspace=context.workspace)
+        loaded_context.load()
+        if loaded_context.commands.to_dict(parse=True) != context.commands.to_dict(parse=True):
+            raise AssertionError("Context loaded from the file differs from the saved context.")
+
+    # cost of saving the whole context grows with the number of units, every n-th save is measured
+    with tempfile.TemporaryDirectory() as tmpdir:
+        context = PipelineContext(workspace=Workspace(pathlib.Path(tmpdir)))
+        context.initialize()
+        whole_context_time = 0.0
+        for idx, (execution_unit, command_output) in enumerate(zip(execution_units, command_outputs), start=1):
+            start = time.perf_counter()
+            context.update(execution_unit=execution_unit, command_output=command_output)
+            update_time = time.perf_counter() - start
+            if idx % SAMPLING_INTERVAL == 0:
+                start = time.perf_counter()
+                save_whole_context(context)
+                whole_context_time += (update_time + time.perf_counter() - start) * SAMPLING_INTERVAL
+
+    speedup = whole_context_time / journal_time
+    LOGGER.info(
+        f"Saving context after each of {len(execution_units)} units: "
+        f"whole context {whole_context_time:.2f} s (estimated from every {SAMPLING_INTERVAL}th save), "
+        f"journal {journal_time:.2f} s, speedup {speedup:.2f}x"
+    )
+
+    status = {
+        "units_count": len(execution_units),
+        "whole_context_time": whole_context_time,
+        "journal_time": journal_time,
+        "speedup": speedup,
+    }
+    if speedup < MIN_SPEEDUP:
+        raise AssertionError(f"Expected at least {MIN_SPEEDUP}x speedup with the journal, got {speedup:.2f}x")
+
+    status_file = args.status
+    with status_file.open("w") as fp:
+        yaml.safe_dump(status, fp)
+
+    LOGGER.info(f"Status saved to {status_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# Copyright (c) 2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""e2e benchmark of optimize with slow unpack_fn applied serially and by a pool of workers"""
+import argparse
+import logging
+import pathlib
+import tempfile
+import time
+
+import yaml
+
+LOGGER = logging.getLogger((__package__ or "main").split(".")[-1])
+METADATA = {
+    "image_name": "nvcr.io/nvidia/pytorch:{version}-py3",
+}
+
+SAMPLES_COUNT = 100
+UNPACK_DELAY = 0.02
+WORKERS = 4
+MIN_SPEEDUP = 2.0
+
+
+def main():
+    import numpy as np
+
+    import model_navigator as nav
+    from tests import utils
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--status",
+        type=pathlib.Path,
+        required=True,
+        help="Status file where per path result is stored.",
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Timeout for test.",
+    )
+    args = parser.parse_args()
+
+    log_level = logging.DEBUG if args.verbose else logging.INFO
+    logging.basicConfig(level=log_level, format=utils.DEFAULT_LOG_FORMAT)
+    LOGGER.debug(f"CLI args: {args}")
+
+    def infer_func(input__0):
+        return {"output__0": input__0}
+
+    def fast_unpack_fn(seed):
+        return np.random.default_rng(seed).random((3, 5)).astype("float32")
+
+    def slow_unpack_fn(seed):
+        time.sleep(UNPACK_DELAY)  # simulates tokenization or decoding
+        return fast_unpack_fn(seed)
+
+    def optimize(unpack_fn, workers: int) -> float:
+        dataloader = nav.utilities.UnpackedDataloader(list(range(SAMPLES_COUNT)), unpack_fn, workers=workers)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            start = time.perf_counter()
+            nav.python.optimize(
+                model=infer_func,
+                dataloader=dataloader,
+                runners=("PythonRunner",),
+                workspace=pathlib.Path(tmpdir) / "navigator_workspace",
+                optimization_profile=nav.OptimizationProfile(batch_sizes=[1], stability_percentage=100),
+            )
+            return time.perf_counter() - start
+
+    # time of optimize without unpacking cost is subtracted to compare the preprocessing only
+    baseline_time = optimize(fast_unpack_fn, workers=1)
+    serial_time = optimize(slow_unpack_fn, workers=1)
+    parallel_time = optimize(slow_unpack_fn, workers=WORKERS)
+    speedup = (serial_time - baseline_time) / max(parallel_time - baseline_time, 1e-3)
+    LOGGER.info(
+        f"Optimize with {SAMPLES_COUNT} samples unpacked in {UNPACK_DELAY * 1000:.0f} ms: "
+        f"baseline {baseline_time:.2f} s, serial {serial_time:.2f} s, {WORKERS} workers {parallel_time:.2f} s, "
+        f"preprocessing speedup {speedup:.2f}x"
+    )
+
+    status = {
+        "baseline_time": baseline_time,
+        "serial_time": serial_time,
+        "parallel_time": parallel_time,
+        "workers": WORKERS,
+        "speedup": speedup,
+    }
+    if speedup < MIN_SPEEDUP:
+        raise AssertionError(f"Expected at least {MIN_SPEEDUP}x speedup with {WORKERS} workers, got {speedup:.2f}x")
+
+    status_file = args.status
+    with status_file.open("w") as fp:
+        yaml.safe_dump(status, fp)
+
+    LOGGER.info(f"Status saved to {status_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -28,8 +28,6 @@ FORMAT_FILES = [
 ]
 
 EVALUATION_FILES = [
-    "reproduce_correctness.py",
-    "reproduce_correctness.sh",
     "reproduce_profiling.py",
     "reproduce_profiling.sh",
 ]
@@ -122,6 +120,8 @@ def collect_expected_files(package_path: pathlib.Path, status: Status) -> List[s
 
         if conversion_status != "FAIL":
             format_files += EVALUATION_FILES
+            for runner_name in model_status.runners_status:
+                format_files += [f"reproduce_correctness-{runner_name}.py", f"reproduce_correctness-{runner_name}.sh"]
 
         for file in format_files:
             file_path = os.path.join(model_status_key, file)
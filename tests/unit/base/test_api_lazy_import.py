@@ -0,0 +1,51 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import subprocess
+import sys
+
+IMPORTED_MODULES_SCRIPT = """
+import json, sys
+import model_navigator
+print(json.dumps(sorted(sys.modules)))
+"""
+
+API_SCRIPT = """
+import model_navigator as nav
+from model_navigator import *
+assert nav.package.__name__ == "model_navigator.api.package"
+assert nav.triton.__name__ == "model_navigator.api.triton"
+assert nav.DeviceKind is DeviceKind
+assert nav.strategy.MinLatencyStrategy is MinLatencyStrategy
+assert callable(nav.register_runner)
+assert callable(onnx.optimize)
+assert "OnnxConfig" in dir(nav)
+"""
+
+
+def _run_script(script):
+    return subprocess.run([sys.executable, "-c", script], stdout=subprocess.PIPE, check=True, encoding="utf-8").stdout
+
+
+def test_import_of_top_level_package_does_not_import_api_runners_and_frameworks():
+    modules = json.loads(_run_script(IMPORTED_MODULES_SCRIPT).splitlines()[-1])
+
+    assert "model_navigator.api.config" not in modules
+    assert "model_navigator.runners" not in modules
+    for framework in ["jax", "tensorflow", "tensorrt", "torch"]:
+        assert framework not in modules
+
+
+def test_api_attributes_are_imported_on_first_access():
+    _run_script(API_SCRIPT)
@@ -12,6 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Test for API utils"""
+import threading
+import time
+
+import pytest
 
 from model_navigator import utilities as nav_utils
 
@@ -37,3 +41,54 @@ def test_unpacked_dataloader_applies_fn():
     unpacked_dataloader = nav_utils.UnpackedDataloader(dataloader, lambda x: x + 1)
     for org_sample, sample in zip(dataloader, unpacked_dataloader):
         assert sample == org_sample + 1
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_unpacked_dataloader_with_workers_keeps_order(mode):
+    """Test that the UnpackedDataloader with workers returns samples in the dataloader order."""
+
+    def unpack_fn(x):
+        time.sleep(0.01 * (x % 3))
+        return x * 2
+
+    dataloader = list(range(20))
+    unpacked_dataloader = nav_utils.UnpackedDataloader(dataloader, unpack_fn, workers=4, mode=mode)
+
+    assert len(unpacked_dataloader) == len(dataloader)
+    assert list(unpacked_dataloader) == [x * 2 for x in dataloader]
+
+
+def test_unpacked_dataloader_with_workers_bounds_look_ahead():
+    """Test that the UnpackedDataloader does not unpack more than look_ahead samples ahead of the consumer."""
+    unpacked = []
+
+    def unpack_fn(x):
+        unpacked.append(x)
+        return x
+
+    unpacked_dataloader = nav_utils.UnpackedDataloader(list(range(100)), unpack_fn, workers=2, look_ahead=3)
+    for sample in unpacked_dataloader:
+        if sample == 5:
+            break
+
+    assert len(unpacked) <= 5 + 3
+
+
+def test_unpacked_dataloader_with_workers_unpacks_in_parallel():
+    """Test that the UnpackedDataloader with workers applies the function concurrently."""
+
+    barrier = threading.Barrier(4, timeout=10)
+
+    def unpack_fn(x):
+        barrier.wait()
+        return x
+
+    unpacked_dataloader = nav_utils.UnpackedDataloader(list(range(8)), unpack_fn, workers=4)
+
+    assert list(unpacked_dataloader) == list(range(8))
+
+
+def test_unpacked_dataloader_raise_error_when_workers_are_not_positive():
+    """Test that the UnpackedDataloader validates the number of workers."""
+    with pytest.raises(ValueError):
+        nav_utils.UnpackedDataloader([1, 2, 3], lambda x: x, workers=0)
@@ -0,0 +1,124 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import pathlib
+import tempfile
+
+import numpy
+import pytest
+
+from model_navigator.api.config import CorrectnessTolerance
+from model_navigator.commands.correctness import correctness_script
+from model_navigator.commands.correctness.correctness import ErrorAccumulator, ErrorHistogram, count_rejected_elements
+from model_navigator.commands.data_dump.samples import samples_to_mmap
+from model_navigator.core.tensor import TensorMetadata
+
+
+def test_error_accumulator_return_max_errors_over_samples():
+    errors = ErrorAccumulator(["output__0"])
+
+    sample_tolerance = errors.update("output__0", numpy.array([1.0, 2.0]), numpy.array([1.5, 2.0]))
+    errors.update("output__0", numpy.array([1.0, 4.0]), numpy.array([1.0, 2.0]))
+
+    assert sample_tolerance.atol == 0.5
+    assert errors.per_output_tolerance["output__0"].atol == 2.0
+    assert errors.per_output_tolerance["output__0"].rtol == 1.0
+
+
+def test_error_accumulator_count_errors_in_histogram_bins():
+    errors = ErrorAccumulator(["output__0"])
+
+    errors.update("output__0", numpy.array([1.0, 1.0, 1.0]), numpy.array([1.0, 1.0 + 5e-5, 3.0]))
+
+    histogram = errors.per_output_error_histogram["output__0"]
+    assert sum(histogram.abs_counts) == 3
+    assert histogram.abs_counts[0] == 1
+    assert histogram.abs_counts[5] == 1
+    assert histogram.abs_counts[10] == 1
+    assert ErrorHistogram.from_dict(histogram.to_dict()) == histogram
+
+
+def test_correctness_script_stream_samples_and_save_errors(monkeypatch):
+    batch_dim = 0
+    input_metadata = TensorMetadata().add("input__0", (-1, 3), numpy.float32)
+    output_metadata = TensorMetadata().add("output__0", (-1, 3), numpy.float32)
+    inputs = [{"input__0": numpy.full((1, 3), idx, dtype=numpy.float32)} for idx in range(1, 6)]
+    outputs = [{"output__0": sample["input__0"] * 2} for sample in inputs]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = pathlib.Path(tmpdir)
+        samples_to_mmap(inputs, workspace / "model_input" / "correctness", batch_dim)
+        samples_to_mmap(outputs, workspace / "model_output" / "correctness", batch_dim)
+        results_path = workspace / "results.json"
+
+        monkeypatch.setattr(
+            correctness_script, "get_model", lambda: lambda input__0: {"output__0": input__0 * 2 + 0.25}
+        )
+        correctness_script.correctness(
+            batch_dim=batch_dim,
+            results_path=results_path.as_posix(),
+            runner_name="PythonRunner",
+            input_metadata=input_metadata.to_json(),
+            output_metadata=output_metadata.to_json(),
+            navigator_workspace=workspace.as_posix(),
+        )
+
+        with results_path.open() as f:
+            results = json.load(f)
+
+    assert results["per_output_tolerance"][0]["atol"] == 0.25
+    assert results["per_output_tolerance"][0]["rtol"] == pytest.approx(0.25 / 2.25)
+    assert sum(results["per_output_error_histogram"][0]["abs_counts"]) == 15
+
+
+def test_count_rejected_elements_use_atol_and_rtol_relative_to_original_output():
+    original = numpy.array([1.0, 10.0, 100.0, numpy.nan])
+    computed = numpy.array([1.2, 11.5, 120.0, 1.0])
+
+    rejected_count = count_rejected_elements(original, computed, CorrectnessTolerance(atol=0.5, rtol=0.1))
+
+    assert rejected_count == 2
+
+
+def test_correctness_script_stop_on_first_sample_exceeding_tolerance(monkeypatch):
+    batch_dim = 0
+    input_metadata = TensorMetadata().add("input__0", (-1, 3), numpy.float32)
+    output_metadata = TensorMetadata().add("output__0", (-1, 3), numpy.float32)
+    inputs = [{"input__0": numpy.full((1, 3), idx, dtype=numpy.float32)} for idx in range(1, 6)]
+    outputs = [{"output__0": sample["input__0"] * 2} for sample in inputs]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = pathlib.Path(tmpdir)
+        samples_to_mmap(inputs, workspace / "model_input" / "correctness", batch_dim)
+        samples_to_mmap(outputs, workspace / "model_output" / "correctness", batch_dim)
+        results_path = workspace / "results.json"
+
+        monkeypatch.setattr(correctness_script, "get_model", lambda: lambda input__0: {"output__0": input__0 * 2.1})
+        correctness_script.correctness(
+            batch_dim=batch_dim,
+            results_path=results_path.as_posix(),
+            runner_name="PythonRunner",
+            input_metadata=input_metadata.to_json(),
+            output_metadata=output_metadata.to_json(),
+            navigator_workspace=workspace.as_posix(),
+            correctness_tolerances=[{"output_name": "output__0", "atol": 0.25, "rtol": 0.0}],
+        )
+
+        with results_path.open() as f:
+            results = json.load(f)
+
+    assert results["exceeded_tolerance"]["output_name"] == "output__0"
+    assert results["exceeded_tolerance"]["sample_id"] == 2
+    assert results["exceeded_tolerance"]["rejected_count"] == 3
+    assert sum(results["per_output_error_histogram"][0]["abs_counts"]) == 9
@@ -11,15 +11,18 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
 import pathlib
 import tempfile
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from jsonlines import jsonlines
 
 import model_navigator as nav
 from model_navigator.api.config import OptimizationProfile
+from model_navigator.commands.data_dump.samples import samples_to_mmap
 from model_navigator.commands.performance.performance import Performance
 from model_navigator.commands.performance.profiler import ProfilingResults
 from model_navigator.core.workspace import Workspace
@@ -125,3 +128,56 @@ def test_performance_command_raises_error_when_no_profiling_results_and_profiler
                 verbose=True,
                 runner_cls=MagicMock(),
             )
+
+
+def test_performance_command_aggregates_results_weighted_by_traffic_when_profiling_samples_count_is_set(mocker):
+    mocker.patch("subprocess.Popen.poll", return_value=0)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = pathlib.Path(tmpdir)
+        workspace = tmpdir / "navigator_workspace"
+        workspace.mkdir()
+
+        model_file = workspace / "model.pt"
+        model_file.touch()
+
+        stratified_samples = workspace / "model_input" / "stratified"
+        samples = [{"input__0": np.ones((1, size), dtype=np.float32)} for size in [4, 16]]
+        samples_to_mmap(samples, stratified_samples, batch_dim=0)
+        with open(stratified_samples / "traffic_weights.json", "w") as f:
+            json.dump([0.75, 0.25], f)
+
+        with tempfile.NamedTemporaryFile() as tmpfile:
+            mock = MagicMock()
+            mock.__enter__.return_value.name = tmpfile.name
+            mocker.patch("tempfile.NamedTemporaryFile", return_value=mock)
+            with jsonlines.open(tmpfile.name, "w") as f:
+                f.write(ProfilingResults.from_measurements([2.0], batch_size=1, sample_id=0).to_dict())
+                f.write(ProfilingResults.from_measurements([3.0], batch_size=2, sample_id=0).to_dict())
+                f.write(ProfilingResults.from_measurements([8.0], batch_size=1, sample_id=1).to_dict())
+
+            command_output = Performance().run(
+                workspace=Workspace(workspace),
+                path=model_file,
+                format=nav.Format.TORCHSCRIPT,
+                optimization_profile=OptimizationProfile(profiling_samples_count=2),
+                input_metadata=MagicMock(),
+                output_metadata=MagicMock(),
+                batch_dim=0,
+                verbose=True,
+                runner_cls=MagicMock(),
+            )
+
+    assert command_output.status == nav.CommandStatus.OK
+    assert len(command_output.output["samples_profiling_results"]) == 3
+    assert command_output.output["profiling_samples"] == [
+        {"shapes": {"input__0": [1, 4]}, "traffic_weight": 0.75},
+        {"shapes": {"input__0": [1, 16]}, "traffic_weight": 0.25},
+    ]
+
+    profiling_results = command_output.output["profiling_results"]
+    assert len(profiling_results) == 1
+    assert profiling_results[0].batch_size == 1
+    assert profiling_results[0].sample_id == -1
+    assert profiling_results[0].avg_latency == pytest.approx(3.5)
+    assert profiling_results[0].throughput == pytest.approx(1000 / 3.5)
@@ -13,6 +13,7 @@
 # limitations under the License.
 import pathlib
 import tempfile
+import time
 from unittest.mock import MagicMock
 
 import numpy as np
@@ -173,3 +174,100 @@ def test_profiler_run_return_batch_sizes_upto_4_when_batch_size_4_saturates_thro
     results = profiler.run(runner=MagicMock(), profiling_sample=MagicMock(), sample_id=0)
 
     assert results[-1].batch_size == 4
+
+
+def test_profiler_run_measurement_reports_retrace_count_when_runner_retraces(mocker):
+    mocker.patch(
+        "model_navigator.commands.performance.Profiler._run_stable_measurement",
+        return_value=ProfilingResults.from_measurements([10, 10, 10], 1, 0),
+    )
+    runner = MagicMock()
+    runner.retrace_count.side_effect = [2, 3]
+
+    profiler = Profiler(profile=OptimizationProfile(), results_path=MagicMock())
+    result = profiler._run_measurement(runner=runner, sample=MagicMock(), batch_size=1, sample_id=0)
+
+    assert result.retrace_count == 1
+
+
+def test_profiler_run_measurement_skips_retrace_count_when_runner_does_not_trace(mocker):
+    mocker.patch(
+        "model_navigator.commands.performance.Profiler._run_stable_measurement",
+        return_value=ProfilingResults.from_measurements([10, 10, 10], 1, 0),
+    )
+    runner = MagicMock()
+    runner.retrace_count.return_value = None
+
+    profiler = Profiler(profile=OptimizationProfile(), results_path=MagicMock())
+    result = profiler._run_measurement(runner=runner, sample=MagicMock(), batch_size=1, sample_id=0)
+
+    assert result.retrace_count is None
+
+
+def test_profiler_run_measurement_reports_padding_waste_when_runner_pads_inputs(mocker):
+    mocker.patch(
+        "model_navigator.commands.performance.Profiler._run_stable_measurement",
+        return_value=ProfilingResults.from_measurements([10, 10, 10], 1, 0),
+    )
+    runner = MagicMock()
+    runner.retrace_count.return_value = None
+    runner.padding_waste.return_value = 0.25
+
+    profiler = Profiler(profile=OptimizationProfile(), results_path=MagicMock())
+    result = profiler._run_measurement(runner=runner, sample=MagicMock(), batch_size=1, sample_id=0)
+
+    assert result.padding_waste == 0.25
+
+
+def test_profiler_run_measurement_reports_saved_recompilations_when_runner_buckets_shapes(mocker):
+    mocker.patch(
+        "model_navigator.commands.performance.Profiler._run_stable_measurement",
+        return_value=ProfilingResults.from_measurements([10, 10, 10], 1, 0),
+    )
+    runner = MagicMock()
+    runner.retrace_count.return_value = None
+    runner.padding_waste.return_value = 0.25
+    runner.saved_recompilations.return_value = 3
+
+    profiler = Profiler(profile=OptimizationProfile(), results_path=MagicMock())
+    result = profiler._run_measurement(runner=runner, sample=MagicMock(), batch_size=1, sample_id=0)
+
+    assert result.saved_recompilations == 3
+    assert "Saved recompilations: 3" in str(result)
+
+
+def test_profiler_run_measures_concurrent_requests_when_runner_is_thread_safe():
+    runner = MagicMock()
+    runner.is_thread_safe.return_value = True
+    runner.is_stabilized.return_value = False
+    runner.retrace_count.return_value = None
+    runner.padding_waste.return_value = None
+    runner.saved_recompilations.return_value = None
+    runner.infer.side_effect = lambda *args, **kwargs: time.sleep(0.01)
+
+    optimization_profile = OptimizationProfile(
+        batch_sizes=[1], window_size=8, max_trials=10, stability_percentage=50, concurrency=4
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        profiler = Profiler(profile=optimization_profile, results_path=pathlib.Path(tmp_dir) / "results.jsonl")
+        results = profiler.run(runner=runner, profiling_sample={"input__0": np.ones((1, 3))}, sample_id=0)
+
+    assert results[0].concurrency == 4
+    assert runner.infer.call_count >= 3 * 8
+
+
+def test_profiler_run_measures_sequential_requests_when_runner_is_not_thread_safe():
+    runner = MagicMock()
+    runner.is_thread_safe.return_value = False
+    runner.is_stabilized.return_value = False
+    runner.retrace_count.return_value = None
+    runner.padding_waste.return_value = None
+    runner.saved_recompilations.return_value = None
+    runner.last_inference_time.return_value = 0.001
+
+    optimization_profile = OptimizationProfile(batch_sizes=[1], window_size=8, max_trials=3, concurrency=4)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        profiler = Profiler(profile=optimization_profile, results_path=pathlib.Path(tmp_dir) / "results.jsonl")
+        results = profiler.run(runner=runner, profiling_sample={"input__0": np.ones((1, 3))}, sample_id=0)
+
+    assert results[0].concurrency == 1
@@ -0,0 +1,135 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import logging
+import os
+import pathlib
+import sys
+import tempfile
+import time
+
+import psutil
+import pytest
+
+from model_navigator.api.config import ExecutionLimitsConfig
+from model_navigator.commands.execution_context import ExecutionContext
+from model_navigator.commands.process_executor import ExecutionLimits, ProcessesUsage, execute_process
+from model_navigator.core.logger import LOGGER
+from model_navigator.core.workspace import Workspace
+from model_navigator.exceptions import ModelNavigatorUserInputError
+
+CHILD_MEMORY = 128 * 2**20
+
+SLEEPING_CHILD_SCRIPT = """
+import subprocess, sys, time
+child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+print(child.pid, flush=True)
+time.sleep(60)
+"""
+
+
+def test_execute_process_keeps_last_lines_of_output_and_reports_resources():
+    lines = []
+    script = f"data = bytearray({CHILD_MEMORY})\nfor i in range(1000): print(i)"
+    with tempfile.TemporaryDirectory() as tmpdir, ProcessesUsage() as processes_usage:
+        result = execute_process(
+            [sys.executable, "-c", script], cwd=pathlib.Path(tmpdir), on_output=lines.append, output_tail_lines=10
+        )
+
+    assert result.returncode == 0
+    assert not result.timed_out
+    assert lines == [str(i) for i in range(1000)]
+    assert result.output_tail == [str(i) for i in range(990, 1000)]
+    assert result.peak_rss >= CHILD_MEMORY
+    assert result.cpu_time > 0
+    assert processes_usage.results == [result]
+
+
+def test_execute_process_kills_process_and_its_children_after_timeout():
+    lines = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        start = time.perf_counter()
+        result = execute_process(
+            [sys.executable, "-c", SLEEPING_CHILD_SCRIPT],
+            cwd=pathlib.Path(tmpdir),
+            limits=ExecutionLimitsConfig(timeout=1.0),
+            on_output=lines.append,
+        )
+
+    assert time.perf_counter() - start < 30
+    assert result.timed_out
+    assert result.returncode != 0
+    _, alive = psutil.wait_procs([psutil.Process(int(lines[0]))], timeout=10)
+    assert not alive
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Limits are applied with Linux specific calls")
+def test_execute_process_applies_memory_limit_and_cpu_affinity():
+    cpu = sorted(os.sched_getaffinity(0))[-1]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        limits = ExecutionLimitsConfig(max_memory=4 * CHILD_MEMORY, cpu_affinity=[cpu])
+        result = execute_process(
+            [sys.executable, "-c", "import os; print(sorted(os.sched_getaffinity(0)))"],
+            cwd=pathlib.Path(tmpdir),
+            limits=limits,
+        )
+        assert result.returncode == 0
+        assert result.output_tail == [str([cpu])]
+
+        with ExecutionLimits(limits):
+            result = execute_process(
+                [sys.executable, "-c", f"data = bytearray({8 * CHILD_MEMORY})"], cwd=pathlib.Path(tmpdir)
+            )
+        assert result.returncode != 0
+        assert "MemoryError" in result.output_tail[-1]
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="Limits are applied with Linux specific calls")
+def test_execute_process_applies_limits_to_children_started_immediately_by_the_command():
+    cpu = sorted(os.sched_getaffinity(0))[-1]
+    child_script = (
+        "import os, resource; print(sorted(os.sched_getaffinity(0)), resource.getrlimit(resource.RLIMIT_DATA)[0])"
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        result = execute_process(
+            ["bash", "-c", f"{sys.executable} -c '{child_script}' & wait"],
+            cwd=pathlib.Path(tmpdir),
+            limits=ExecutionLimitsConfig(max_memory=4 * CHILD_MEMORY, cpu_affinity=[cpu]),
+        )
+
+    assert result.returncode == 0
+    assert result.output_tail == [f"{[cpu]} {4 * CHILD_MEMORY}"]
+
+
+def test_execution_context_streams_output_to_log_file_and_raises_error_after_timeout():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Workspace(pathlib.Path(tmpdir))
+        log_file = workspace.path / "format.log"
+        log_file_handler = logging.FileHandler(log_file)
+        LOGGER.addHandler(log_file_handler)
+        try:
+            with ExecutionContext(workspace=workspace, cmd_path=workspace.path / "reproduce.sh") as context:
+                context.execute_cmd([sys.executable, "-c", "'print(\"first line\")'"])
+
+            with pytest.raises(ModelNavigatorUserInputError, match="timeout"):
+                with ExecutionLimits(ExecutionLimitsConfig(timeout=0.5)):
+                    with ExecutionContext(workspace=workspace, cmd_path=workspace.path / "reproduce.sh") as context:
+                        context.execute_cmd([sys.executable, "-c", "'import time; time.sleep(60)'"])
+        finally:
+            LOGGER.removeHandler(log_file_handler)
+            log_file_handler.close()
+
+        log = log_file.read_text()
+
+    assert "    first line" in log
+    assert "Process finished with code 0" in log
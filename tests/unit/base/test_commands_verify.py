@@ -11,9 +11,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import pathlib
+import tempfile
 from unittest.mock import MagicMock
 
+import numpy
+
+from model_navigator.api.config import Format
+from model_navigator.commands.base import CommandStatus
 from model_navigator.commands.verification.verify import VerifyModel
+from model_navigator.core.tensor import TensorMetadata
+from model_navigator.core.workspace import Workspace
+from model_navigator.frameworks import Framework
+from model_navigator.runners.python import PythonRunner
+from model_navigator.runners.registry import runner_registry
+from model_navigator.runners.replicated import replicated_runner
 
 
 def test_verify_model_pre_run_returns_true_when_verify_function_is_passed():
@@ -30,3 +42,72 @@ def test_verify_model_pre_run_returns_false_when_verify_function_is_none():
     runner_mock = MagicMock()
     runner_mock.name = MagicMock(return_value="TorchCPU")
     assert verify_model._pre_run(verify_func=None) is False  # pytype: disable=wrong-arg-types
+
+
+def test_verify_model_run_source_model_once_when_verifying_multiple_runners(monkeypatch):
+    runner_cls = replicated_runner(PythonRunner, replicas=2)
+    monkeypatch.setitem(runner_registry, runner_cls.name(), runner_cls)
+
+    calls = []
+
+    def model(input__0):
+        calls.append(input__0)
+        return {"output__0": input__0 * 2}
+
+    def verify_func(y_pred, y_fw):
+        return all((pred["output__0"] == fw["output__0"]).all() for pred, fw in zip(y_pred, y_fw))
+
+    dataloader = [numpy.full((1, 3), idx, dtype=numpy.float32) for idx in range(4)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for _ in range(3):
+            output = VerifyModel().run(
+                framework=Framework.NONE,
+                format=Format.PYTHON,
+                workspace=Workspace(pathlib.Path(tmpdir)),
+                path=pathlib.Path("python/model.py"),
+                dataloader=dataloader,
+                verify_func=verify_func,
+                runner_cls=runner_cls,
+                input_metadata=TensorMetadata().add("input__0", (-1, 3), numpy.float32),
+                output_metadata=TensorMetadata().add("output__0", (-1, 3), numpy.float32),
+                model=model,
+            )
+            assert output.status == CommandStatus.OK
+
+    assert len(calls) == 4 + 3 * 4
+
+
+def test_verify_model_read_dataloader_only_for_inference_when_samples_fingerprint_is_provided(monkeypatch):
+    runner_cls = replicated_runner(PythonRunner, replicas=2)
+    monkeypatch.setitem(runner_registry, runner_cls.name(), runner_cls)
+
+    class CountingDataloader(list):
+        iterations = 0
+
+        def __iter__(self):
+            self.iterations += 1
+            return super().__iter__()
+
+    def verify_func(y_pred, y_fw):
+        return all((pred["output__0"] == fw["output__0"]).all() for pred, fw in zip(y_pred, y_fw))
+
+    dataloader = CountingDataloader(numpy.full((1, 3), idx, dtype=numpy.float32) for idx in range(4))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output = VerifyModel().run(
+            framework=Framework.NONE,
+            format=Format.PYTHON,
+            workspace=Workspace(pathlib.Path(tmpdir)),
+            path=pathlib.Path("python/model.py"),
+            dataloader=dataloader,
+            verify_func=verify_func,
+            runner_cls=runner_cls,
+            input_metadata=TensorMetadata().add("input__0", (-1, 3), numpy.float32),
+            output_metadata=TensorMetadata().add("output__0", (-1, 3), numpy.float32),
+            model=lambda input__0: {"output__0": input__0 * 2},
+            samples_fingerprint="fingerprint",
+        )
+        reference_outputs_saved = (pathlib.Path(tmpdir) / "verification" / "fingerprint").exists()
+
+    assert output.status == CommandStatus.OK
+    assert reference_outputs_saved
+    assert dataloader.iterations == 2
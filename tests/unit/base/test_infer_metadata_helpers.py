@@ -12,11 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import Counter
+
 import numpy
 
 from model_navigator.api.config import TensorRTProfile
 from model_navigator.commands.infer_metadata import (
     _extract_max_batch_size,
+    _get_median_size,
     _get_metadata_from_axes_shapes,
     _get_trt_profile_from_axes_shapes,
 )
@@ -29,10 +32,10 @@ def test_extract_max_batch_size_return_correct_value_when_multiple_values_passed
     batch_dim = 0
     axes_shapes = {
         input_name: {
-            0: [5, max_batch_size, 1, 3, 7],  # batch dimension
-            1: [224, 224, 224, 224, 224],
-            2: [224, 224, 224, 224, 224],
-            3: [3, 3, 3, 3, 3],
+            0: Counter([5, max_batch_size, 1, 3, 7]),  # batch dimension
+            1: Counter([224, 224, 224, 224, 224]),
+            2: Counter([224, 224, 224, 224, 224]),
+            3: Counter([3, 3, 3, 3, 3]),
         }
     }
 
@@ -44,7 +47,12 @@ def test_extract_max_batch_size_return_correct_value_when_multiple_values_passed
 def test_get_trt_profile_return_correct_shapes_when_axes_shapes_passed():
     input_name = "input_0"
     axes_shapes = {
-        input_name: {0: [1, 1, 1, 1, 1], 1: [224, 224, 224, 224, 224], 2: [224, 224, 224, 224, 224], 3: [3, 3, 3, 3, 3]}
+        input_name: {
+            0: Counter([1, 1, 1, 1, 1]),
+            1: Counter([224, 224, 224, 224, 224]),
+            2: Counter([224, 224, 224, 224, 224]),
+            3: Counter([3, 3, 3, 3, 3]),
+        }
     }
     batch_dim = 0
 
@@ -66,7 +74,12 @@ def test_get_metadata_return_correct_data_from_axes_shapes_when_with_valid_shape
     dtype_name = "float64"
     dtypes = {input_name: dtype_name}
     axes_shapes = {
-        input_name: {0: [1, 1, 1, 1, 1], 1: [224, 224, 224, 224, 224], 2: [224, 224, 224, 224, 224], 3: [3, 3, 3, 3, 3]}
+        input_name: {
+            0: Counter([1, 1, 1, 1, 1]),
+            1: Counter([224, 224, 224, 224, 224]),
+            2: Counter([224, 224, 224, 224, 224]),
+            3: Counter([3, 3, 3, 3, 3]),
+        }
     }
 
     expected_metadata = {
@@ -75,3 +88,8 @@ def test_get_metadata_return_correct_data_from_axes_shapes_when_with_valid_shape
     metadata = _get_metadata_from_axes_shapes(axes_shapes=axes_shapes, batch_dim=batch_dim, dtypes=dtypes)
 
     assert metadata == expected_metadata
+
+
+def test_get_median_size_return_median_of_counted_sizes():
+    for sizes in ([3], [1, 2], [5, 1, 1, 8], [1, 2, 2, 3, 10, 10, 10], [7, 7, 4, 4, 4, 9]):
+        assert _get_median_size(Counter(sizes)) == int(numpy.median(sizes))
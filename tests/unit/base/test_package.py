@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import importlib
 import pathlib
 import tempfile
 from unittest.mock import MagicMock
@@ -55,3 +56,20 @@ def test_get_runner_returns_source_runner_when_source_runner_is_best_and_source_
         runner = package.get_runner()
 
         assert isinstance(runner, OnnxrtCUDARunner)
+
+
+def test_get_runner_passes_runner_options_recorded_in_status(mocker):
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        workspace = pathlib.Path(tmp_dir) / "navigator_workspace"
+        package = onnx_package_with_cuda_runner(workspace)
+        runner_options = {"shape_buckets": {"input__1": {"0": [4, 8]}}}
+        for model_status in package.status.models_status.values():
+            for runner_status in model_status.runners_status.values():
+                runner_status.runner_options = runner_options
+        package_module = importlib.import_module("model_navigator.package.package")
+        get_runner_mock = mocker.patch.object(package_module, "get_runner")
+
+        package.load_source_model(MagicMock())
+        package.get_runner()
+
+        assert get_runner_mock.return_value.call_args.kwargs["shape_buckets"] == runner_options["shape_buckets"]
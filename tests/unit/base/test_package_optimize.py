@@ -105,7 +105,7 @@ def test_update_config_returns_original_config_when_no_parameters_passed_and_sou
             "timestamp",
         ]
 
-        runners = tuple(runner_registry.keys())
+        runners = tuple(name for name, runner_cls in runner_registry.items() if runner_cls.is_default())
         runner_names = enums.parse(runners, lambda runner: runner if isinstance(runner, str) else runner.name())
 
         assert config.target_formats == (Format.TORCH, Format.TORCHSCRIPT)
@@ -136,7 +136,7 @@ def test_update_config_returns_config_wo_source_when_serialized_target_format_pa
             "timestamp",
         ]
 
-        runners = tuple(runner_registry.keys())
+        runners = tuple(name for name, runner_cls in runner_registry.items() if runner_cls.is_default())
         runner_names = enums.parse(runners, lambda runner: runner if isinstance(runner, str) else runner.name())
 
         assert config.target_formats == (Format.TORCHSCRIPT,)
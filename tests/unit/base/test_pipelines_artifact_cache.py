@@ -0,0 +1,153 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+import tempfile
+
+import numpy as np
+
+from model_navigator.api.config import ArtifactCacheConfig
+from model_navigator.commands.base import Command, CommandOutput, CommandStatus, ExecutionUnit
+from model_navigator.core.workspace import Workspace
+from model_navigator.pipelines.artifact_cache import ArtifactCache, get_model_fingerprint
+from model_navigator.pipelines.pipeline import Pipeline
+from model_navigator.pipelines.pipeline_context import PipelineContext
+from tests.utils import get_common_config, get_model_configs
+
+
+class Export(Command, is_cacheable=True):
+    def _run(self, workspace, path, model, sample_count):
+        model_path = workspace.path / path
+        if model_path.exists():
+            return CommandOutput(status=CommandStatus.SKIPPED)
+
+        model_path.parent.mkdir(parents=True, exist_ok=True)
+        model_path.write_text(f"{pathlib.Path(model).read_text()}-{sample_count}")
+        (model_path.parent / "weights.bin").write_bytes(b"0" * 100)
+        (model_path.parent / "format.log").write_text("log")
+        return CommandOutput(status=CommandStatus.OK, output={"exported": model_path.read_text()})
+
+
+class Convert(Command, is_cacheable=True):
+    def _run(self, workspace, path, parent_path):
+        model_path = workspace.path / path
+        model_path.parent.mkdir(parents=True, exist_ok=True)
+        model_path.write_text(f"converted-{(workspace.path / parent_path).read_text()}")
+        return CommandOutput(status=CommandStatus.OK)
+
+
+def _run(workspace_path, config, artifact_cache):
+    ts_trace, *_, onnx = get_model_configs()
+    workspace_path.mkdir()
+    workspace = Workspace(workspace_path)
+    context = PipelineContext(workspace=workspace)
+    context.initialize()
+    pipeline = Pipeline(
+        name="Export",
+        execution_units=[
+            ExecutionUnit(command=Export, model_config=ts_trace),
+            ExecutionUnit(command=Convert, model_config=onnx),
+        ],
+    )
+    pipeline.run(workspace=workspace, config=config, context=context, artifact_cache=artifact_cache)
+
+    return workspace, context
+
+
+def test_artifact_cache_restores_models_produced_in_other_workspace():
+    ts_trace, *_, onnx = get_model_configs()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = pathlib.Path(tmpdir)
+        model_path = tmpdir / "model.txt"
+        model_path.write_text("model")
+        artifact_cache = ArtifactCache(ArtifactCacheConfig(path=tmpdir / "cache"))
+
+        _run(tmpdir / "workspace1", get_common_config(model=model_path), artifact_cache)
+        assert artifact_cache.stats.stores == 2
+
+        (tmpdir / "model_copy.txt").write_text("model")
+        workspace, context = _run(
+            tmpdir / "workspace2", get_common_config(model=tmpdir / "model_copy.txt"), artifact_cache
+        )
+
+        assert artifact_cache.stats.hits == 2
+        assert artifact_cache.stats.stores == 2
+        assert (workspace.path / ts_trace.path).read_text() == "model-1"
+        assert (workspace.path / ts_trace.path.parent / "weights.bin").exists()
+        assert not (workspace.path / ts_trace.path.parent / "format.log").exists()
+        assert (workspace.path / onnx.path).read_text() == "converted-model-1"
+        export_command = context.commands.models_commands[ts_trace.key].commands[Export.name]
+        assert export_command.status == CommandStatus.OK
+        assert export_command.output == {"exported": "model-1"}
+
+
+def test_artifact_cache_executes_commands_when_model_or_parameters_change():
+    ts_trace, *_, onnx = get_model_configs()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = pathlib.Path(tmpdir)
+        model_path = tmpdir / "model.txt"
+        model_path.write_text("model")
+        _run(
+            tmpdir / "workspace1",
+            get_common_config(model=model_path),
+            ArtifactCache(ArtifactCacheConfig(path=tmpdir / "cache")),
+        )
+
+        artifact_cache = ArtifactCache(ArtifactCacheConfig(path=tmpdir / "cache"))
+        workspace, _ = _run(tmpdir / "workspace2", get_common_config(model=model_path, sample_count=2), artifact_cache)
+
+        assert artifact_cache.stats.hits == 0
+        assert (workspace.path / onnx.path).read_text() == "converted-model-2"
+
+        model_path.write_text("changed")
+        artifact_cache = ArtifactCache(ArtifactCacheConfig(path=tmpdir / "cache"))
+        workspace, _ = _run(tmpdir / "workspace3", get_common_config(model=model_path), artifact_cache)
+
+        assert artifact_cache.stats.hits == 0
+        assert artifact_cache.stats.stores == 2
+        assert (workspace.path / ts_trace.path).read_text() == "changed-1"
+
+
+def test_artifact_cache_removes_least_recently_used_models_above_size_limit():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = pathlib.Path(tmpdir)
+        model_path = tmpdir / "model.txt"
+        model_path.write_text("model")
+        artifact_cache = ArtifactCache(ArtifactCacheConfig(path=tmpdir / "cache", max_size=130))
+
+        _run(tmpdir / "workspace1", get_common_config(model=model_path), artifact_cache)
+        _run(tmpdir / "workspace2", get_common_config(model=model_path, sample_count=2), artifact_cache)
+
+        assert artifact_cache.stats.evictions == 2
+        assert len(list((tmpdir / "cache" / "entries").iterdir())) == 2
+
+        _run(tmpdir / "workspace3", get_common_config(model=model_path, sample_count=2), artifact_cache)
+        artifact_cache.log_stats()
+
+        assert artifact_cache.stats.hits == 2
+        assert artifact_cache.stats.size <= 130
+
+
+def test_get_model_fingerprint_changes_with_weights():
+    class Module:
+        def __init__(self, weight):
+            self.weight = weight
+
+        def state_dict(self):
+            return {"weight": self.weight}
+
+    fingerprint = get_model_fingerprint(Module(np.ones((2, 2))))
+
+    assert fingerprint == get_model_fingerprint(Module(np.ones((2, 2))))
+    assert fingerprint != get_model_fingerprint(Module(np.zeros((2, 2))))
+    assert get_model_fingerprint(object()) is None
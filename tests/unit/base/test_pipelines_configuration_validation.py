@@ -23,8 +23,12 @@ import tempfile
 import pytest
 
 from model_navigator.api.config import (
+    ArtifactCacheConfig,
+    ExecutionLimitsConfig,
     Format,
     OnnxConfig,
+    ParallelConfig,
+    PlannerConfig,
     TensorRTConfig,
     TensorRTProfile,
     TorchConfig,
@@ -57,6 +61,33 @@ def test_validator_raises_error_when_wrong_type_in_configuration():
             PipelineManagerConfigurationValidator.run(config, None)
 
 
+def test_validator_raises_no_error_when_dataloader_has_no_length():
+    class StreamDataloader:
+        def __iter__(self):
+            yield from range(3)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = pathlib.Path(tmpdir)
+        workspace = tmpdir / "navigator_workspace"
+        package = onnx_package_with_cpu_runner_only(workspace)
+        config = package.config
+        config.dataloader = StreamDataloader()
+        config.from_source = True
+        PipelineManagerConfigurationValidator.run(config, None)
+
+
+def test_validator_raises_error_when_dataloader_is_not_reiterable():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = pathlib.Path(tmpdir)
+        workspace = tmpdir / "navigator_workspace"
+        package = onnx_package_with_cpu_runner_only(workspace)
+        config = package.config
+        config.dataloader = (sample for sample in range(3))
+        config.from_source = True
+        with pytest.raises(ModelNavigatorConfigurationError):
+            PipelineManagerConfigurationValidator.run(config, None)
+
+
 def test_validator_warns_when_custom_config_format_is_not_in_target_formats():
     with tempfile.TemporaryDirectory() as tmpdir:
         tmpdir = pathlib.Path(tmpdir)
@@ -91,6 +122,49 @@ def test_validator_raises_error_when_batching_is_disabled_and_profiler_specify_b
             PipelineManagerConfigurationValidator.run(config, None)
 
 
+def test_validator_raises_error_when_parallel_config_has_no_workers():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = pathlib.Path(tmpdir)
+        workspace = tmpdir / "navigator_workspace"
+        package = onnx_package_with_cpu_runner_only(workspace)
+        config = package.config
+        config.parallel_config = ParallelConfig(max_workers=0)
+        with pytest.raises(ModelNavigatorConfigurationError):
+            PipelineManagerConfigurationValidator.run(config, None)
+
+
+def test_validator_raises_error_when_artifact_cache_size_limit_is_not_positive():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = pathlib.Path(tmpdir)
+        workspace = tmpdir / "navigator_workspace"
+        package = onnx_package_with_cpu_runner_only(workspace)
+        config = package.config
+        config.artifact_cache = ArtifactCacheConfig(path=tmpdir / "cache", max_size=0)
+        with pytest.raises(ModelNavigatorConfigurationError):
+            PipelineManagerConfigurationValidator.run(config, None)
+
+
+def test_validator_raises_error_when_planner_time_budget_is_not_positive():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = pathlib.Path(tmpdir) / "navigator_workspace"
+        package = onnx_package_with_cpu_runner_only(workspace)
+        config = package.config
+        config.planner = PlannerConfig(time_budget=0)
+        with pytest.raises(ModelNavigatorConfigurationError):
+            PipelineManagerConfigurationValidator.run(config, None)
+
+
+def test_validator_raises_error_when_execution_limits_are_not_positive():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = pathlib.Path(tmpdir) / "navigator_workspace"
+        package = onnx_package_with_cpu_runner_only(workspace)
+        config = package.config
+        for execution_limits in [ExecutionLimitsConfig(timeout=0), ExecutionLimitsConfig(cpu_affinity=[])]:
+            config.execution_limits = execution_limits
+            with pytest.raises(ModelNavigatorConfigurationError):
+                PipelineManagerConfigurationValidator.run(config, None)
+
+
 def test_validator_raises_no_error_when_trt_profile_names_match_input_names():
     with tempfile.TemporaryDirectory() as tmpdir:
         tmpdir = pathlib.Path(tmpdir)
@@ -0,0 +1,97 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import pathlib
+import subprocess
+import sys
+import tempfile
+
+from model_navigator.commands.base import Command, CommandMetrics, CommandOutput, CommandStatus, ExecutionUnit
+from model_navigator.core.workspace import Workspace
+from model_navigator.pipelines.metrics import CommandMetricsCollector, save_commands_trace
+from model_navigator.pipelines.pipeline import Pipeline
+from model_navigator.pipelines.pipeline_context import PipelineContext
+from tests.utils import RunnerA, get_common_config, get_model_configs
+
+CHILD_MEMORY = 256 * 2**20
+CHILD_WRITTEN_BYTES = 4 * 2**20
+
+CHILD_SCRIPT = f"""
+import os, sys
+data = bytearray(os.urandom({CHILD_MEMORY}))
+with open(sys.argv[1], "wb") as f:
+    f.write(data[:{CHILD_WRITTEN_BYTES}])
+    f.flush()
+    os.fsync(f.fileno())
+"""
+
+
+class Export(Command):
+    def _run(self, workspace):
+        subprocess.run([sys.executable, "-c", CHILD_SCRIPT, str(workspace.path / "output.bin")], check=True)
+        return CommandOutput(status=CommandStatus.OK)
+
+
+def test_collector_includes_resources_used_by_child_processes():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        with CommandMetricsCollector() as collector:
+            subprocess.run([sys.executable, "-c", CHILD_SCRIPT, str(pathlib.Path(tmpdir) / "output.bin")], check=True)
+
+    metrics = collector.metrics
+    assert metrics.wall_time > 0
+    assert metrics.cpu_time > 0
+    assert metrics.peak_rss >= CHILD_MEMORY
+    assert metrics.disk_bytes_written is None or metrics.disk_bytes_written >= CHILD_WRITTEN_BYTES
+
+
+def test_execute_unit_stores_metrics_in_command_output():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Workspace(pathlib.Path(tmpdir))
+        context = PipelineContext(workspace=workspace)
+        context.initialize()
+        execution_unit = ExecutionUnit(command=Export)
+
+        command_output = Pipeline(name="Export", execution_units=[execution_unit]).execute_unit(
+            workspace=workspace, execution_unit=execution_unit, config=get_common_config(), context=context
+        )
+
+    assert command_output.status == CommandStatus.OK
+    assert command_output.metrics.peak_rss >= CHILD_MEMORY
+    assert CommandOutput.from_dict(command_output.to_dict(parse=True)) == command_output
+
+
+def test_save_commands_trace_writes_complete_events_of_commands_with_metrics():
+    ts_trace, *_ = get_model_configs()
+    metrics = CommandMetrics(start_time=10.0, wall_time=0.5, cpu_time=0.25, peak_rss=2**20, pid=123)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Workspace(pathlib.Path(tmpdir))
+        context = PipelineContext(workspace=workspace)
+        context.update(ExecutionUnit(command=Export), CommandOutput(status=CommandStatus.OK, metrics=metrics))
+        context.update(
+            ExecutionUnit(command=Export, model_config=ts_trace, runner_cls=RunnerA),
+            CommandOutput(status=CommandStatus.FAIL, metrics=metrics),
+        )
+        context.update(ExecutionUnit(command=Export, model_config=ts_trace), CommandOutput(status=CommandStatus.OK))
+
+        trace_path = workspace.path / "trace.json"
+        save_commands_trace(context.commands, trace_path)
+        events = json.loads(trace_path.read_text())["traceEvents"]
+
+    assert [event["name"] for event in events] == ["Export", f"{ts_trace.key} RunnerA Export"]
+    assert events[1]["ph"] == "X"
+    assert events[1]["ts"] == 10.0 * 1e6
+    assert events[1]["dur"] == 0.5 * 1e6
+    assert events[1]["tid"] == 123
+    assert events[1]["args"]["status"] == "FAIL"
+    assert events[1]["args"]["peak_rss"] == 2**20
@@ -0,0 +1,344 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import pathlib
+import tempfile
+import threading
+
+import numpy as np
+import yaml
+
+from model_navigator.commands.base import Command, CommandOutput, CommandStatus, ExecutionUnit
+from model_navigator.configuration.model.model_config import ONNXConfig
+from model_navigator.core.constants import CONTEXT_FILENAME, CONTEXT_JOURNAL_FILENAME, CONTEXT_OUTPUTS_DIRNAME
+from model_navigator.core.workspace import Workspace
+from model_navigator.pipelines.pipeline import Pipeline
+from model_navigator.pipelines.pipeline_context import PipelineContext
+from model_navigator.utils import environment
+from model_navigator.utils.dataloader import get_samples_fingerprint
+from tests.utils import RunnerA, get_common_config, get_model_configs, load_executions, record_execution
+
+
+class Module:
+    def __init__(self, weight):
+        self.weight = weight
+
+    def state_dict(self):
+        return {"weight": self.weight}
+
+
+class InferSamples(Command):
+    def _run(self, workspace, dataloader):
+        record_execution(workspace, "infer-samples")
+        samples_fingerprint = get_samples_fingerprint({"input__0": sample} for sample in dataloader)
+        return CommandOutput(status=CommandStatus.OK, output={"samples_fingerprint": samples_fingerprint})
+
+
+class Prepare(Command):
+    def _run(self, workspace):
+        record_execution(workspace, "prepare")
+        samples_path = workspace.path / "samples"
+        samples_path.mkdir(exist_ok=True)
+        return CommandOutput(status=CommandStatus.OK, output={"samples_path": samples_path})
+
+
+class Export(Command):
+    def _run(self, workspace, path, samples_path):
+        record_execution(workspace, f"export-{path.parent}")
+        model_path = workspace.path / path
+        if model_path.exists():
+            return CommandOutput(status=CommandStatus.SKIPPED)
+
+        model_path.parent.mkdir(parents=True, exist_ok=True)
+        model_path.write_text(samples_path.name)
+        return CommandOutput(status=CommandStatus.OK)
+
+
+class Measure(Command):
+    def _run(self, workspace, path):
+        record_execution(workspace, f"measure-{path.parent}")
+        model_path = workspace.path / path
+        if (workspace.path / "fail").exists():
+            return CommandOutput(status=CommandStatus.FAIL)
+
+        return CommandOutput(status=CommandStatus.OK, output={"model_content": model_path.read_text()})
+
+
+def _pipelines(model_configs, infer_samples=False):
+    prepare_units = [ExecutionUnit(command=Prepare)]
+    if infer_samples:
+        prepare_units.insert(0, ExecutionUnit(command=InferSamples))
+
+    return [
+        Pipeline(name="Prepare", execution_units=prepare_units),
+        Pipeline(
+            name="Export",
+            execution_units=[
+                ExecutionUnit(command=Export, model_config=model_config) for model_config in model_configs
+            ],
+        ),
+        Pipeline(
+            name="Measure",
+            execution_units=[
+                ExecutionUnit(command=Measure, model_config=model_config, runner_cls=RunnerA)
+                for model_config in model_configs
+            ],
+        ),
+    ]
+
+
+def _executed_names(workspace):
+    return [execution["name"] for execution in load_executions(workspace)]
+
+
+def _run_pipelines(workspace, config, model_configs, resume, infer_samples=False, pipelines_count=None):
+    context = PipelineContext(workspace=workspace)
+    if resume:
+        context.resume()
+    else:
+        context.initialize()
+
+    for pipeline in _pipelines(model_configs, infer_samples=infer_samples)[:pipelines_count]:
+        pipeline.run(workspace=workspace, config=config, context=context)
+
+    return context
+
+
+def _journal_units(workspace):
+    journal = (workspace.path / CONTEXT_JOURNAL_FILENAME).read_text().splitlines()
+    return [json.loads(line)["unit"] for line in journal if "unit" in json.loads(line)]
+
+
+def test_resume_reuses_outputs_of_completed_units():
+    ts_trace, _, onnx, _ = get_model_configs()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Workspace(pathlib.Path(tmpdir))
+        config = get_common_config(resume=True)
+        context = _run_pipelines(workspace, config, [ts_trace, onnx], resume=False)
+        assert len(load_executions(workspace)) == 5
+
+        resumed_context = _run_pipelines(workspace, config, [ts_trace, onnx], resume=True)
+
+        assert _executed_names(workspace) == []
+        assert resumed_context.commands.to_dict(parse=True) == context.commands.to_dict(parse=True)
+        prepare_output = resumed_context.commands.commands[Prepare.name].output
+        assert prepare_output == {"samples_path": workspace.path / "samples"}
+
+
+def test_resume_executes_units_with_missing_outputs_and_units_depending_on_them():
+    ts_trace, _, onnx, _ = get_model_configs()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Workspace(pathlib.Path(tmpdir))
+        config = get_common_config(resume=True)
+        _run_pipelines(workspace, config, [ts_trace, onnx], resume=False)
+        load_executions(workspace)
+
+        (workspace.path / onnx.path).unlink()
+        context = _run_pipelines(workspace, config, [ts_trace, onnx], resume=True)
+
+        assert _executed_names(workspace) == [f"export-{onnx.key}", f"measure-{onnx.key}"]
+        assert context.commands.models_commands[onnx.key].commands[Export.name].status == CommandStatus.OK
+
+        (workspace.path / "samples").rmdir()
+        _run_pipelines(workspace, config, [ts_trace, onnx], resume=True)
+
+        assert len(load_executions(workspace)) == 5
+
+
+def test_resume_executes_units_with_changed_inputs_and_removes_stale_models():
+    ts_trace, _, onnx, _ = get_model_configs()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Workspace(pathlib.Path(tmpdir))
+        _run_pipelines(workspace, get_common_config(resume=True), [ts_trace, onnx], resume=False)
+        load_executions(workspace)
+
+        changed_onnx = ONNXConfig(opset=17, dynamic_axes={"input__0": [0]})
+        context = _run_pipelines(workspace, get_common_config(resume=True), [ts_trace, changed_onnx], resume=True)
+
+        assert _executed_names(workspace) == [f"export-{onnx.key}", f"measure-{onnx.key}"]
+        assert context.commands.models_commands[onnx.key].commands[Export.name].status == CommandStatus.OK
+
+        _run_pipelines(workspace, get_common_config(sample_count=2, resume=True), [ts_trace, changed_onnx], resume=True)
+
+        assert len(load_executions(workspace)) == 5
+
+
+def test_resume_executes_all_units_when_model_or_samples_change():
+    ts_trace, _, onnx, _ = get_model_configs()
+    dataloader = [np.ones((2, 2))]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Workspace(pathlib.Path(tmpdir))
+        config = get_common_config(model=Module(np.ones((2, 2))), dataloader=dataloader, resume=True)
+        _run_pipelines(workspace, config, [ts_trace, onnx], resume=False, infer_samples=True)
+        load_executions(workspace)
+
+        config = get_common_config(model=Module(np.ones((2, 2))), dataloader=[np.ones((2, 2))], resume=True)
+        _run_pipelines(workspace, config, [ts_trace, onnx], resume=True, infer_samples=True)
+
+        assert _executed_names(workspace) == ["infer-samples"]
+
+        config = get_common_config(model=Module(np.zeros((2, 2))), dataloader=dataloader, resume=True)
+        _run_pipelines(workspace, config, [ts_trace, onnx], resume=True, infer_samples=True)
+
+        assert len(load_executions(workspace)) == 6
+
+        config = get_common_config(model=Module(np.zeros((2, 2))), dataloader=[np.zeros((2, 2))], resume=True)
+        _run_pipelines(workspace, config, [ts_trace, onnx], resume=True, infer_samples=True)
+
+        assert len(load_executions(workspace)) == 6
+
+
+def test_unit_fingerprint_is_computed_only_when_resume_is_enabled_without_iterating_dataloader():
+    class Dataloader:
+        def __init__(self):
+            self.iterations = 0
+
+        def __iter__(self):
+            self.iterations += 1
+            yield np.ones((2, 2))
+
+    class NotFingerprintedModule:
+        def state_dict(self):
+            raise AssertionError("Model fingerprint is computed.")
+
+    ts_trace, _, onnx, _ = get_model_configs()
+    dataloader = Dataloader()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Workspace(pathlib.Path(tmpdir))
+        config = get_common_config(model=NotFingerprintedModule(), dataloader=dataloader)
+        _run_pipelines(workspace, config, [ts_trace, onnx], resume=False, infer_samples=True)
+
+        assert dataloader.iterations == 1
+        assert all(unit_record is None for unit_record in _journal_units(workspace))
+
+        config = get_common_config(model=Module(np.ones((2, 2))), dataloader=dataloader, resume=True)
+        _run_pipelines(workspace, config, [ts_trace, onnx], resume=True, infer_samples=True)
+
+        assert dataloader.iterations == 2
+        assert _journal_units(workspace)[0] is None
+        assert all(unit_record is not None for unit_record in _journal_units(workspace)[1:])
+
+
+def test_resume_executes_failed_units():
+    ts_trace, _, onnx, _ = get_model_configs()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Workspace(pathlib.Path(tmpdir))
+        config = get_common_config(resume=True)
+        (workspace.path / "fail").touch()
+        context = _run_pipelines(workspace, config, [ts_trace, onnx], resume=False)
+        load_executions(workspace)
+        assert (
+            context.commands.models_commands[onnx.key].runners_commands["RunnerA"].commands[Measure.name].status
+            == CommandStatus.FAIL
+        )
+
+        (workspace.path / "fail").unlink()
+        context = _run_pipelines(workspace, config, [ts_trace, onnx], resume=True)
+
+        assert _executed_names(workspace) == [f"measure-{ts_trace.key}", f"measure-{onnx.key}"]
+        assert context.commands.models_commands[onnx.key].runners_commands["RunnerA"].commands[Measure.name].output == {
+            "model_content": "samples"
+        }
+
+
+def test_resume_keeps_units_of_previous_execution_when_resumed_execution_is_interrupted_again():
+    ts_trace, _, onnx, _ = get_model_configs()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Workspace(pathlib.Path(tmpdir))
+        config = get_common_config(resume=True)
+        _run_pipelines(workspace, config, [ts_trace, onnx], resume=False).compact()
+        load_executions(workspace)
+
+        # resumed executions are interrupted after the first pipeline
+        _run_pipelines(workspace, config, [ts_trace, onnx], resume=True, pipelines_count=1)
+        _run_pipelines(workspace, config, [ts_trace, onnx], resume=True, pipelines_count=1)
+
+        assert _executed_names(workspace) == []
+        assert (workspace.path / onnx.path).exists()
+
+        context = _run_pipelines(workspace, config, [ts_trace, onnx], resume=True)
+        context.compact()
+
+        assert _executed_names(workspace) == []
+        units = yaml.safe_load((workspace.path / CONTEXT_FILENAME).read_text())["units"]
+        stored_outputs = {path.stem for path in (workspace.path / CONTEXT_OUTPUTS_DIRNAME).iterdir()}
+        assert len(units) == 5
+        assert stored_outputs == {unit["result"] for unit in units}
+
+
+def test_context_is_saved_in_journal_and_compacted_into_context_file():
+    ts_trace, *_ = get_model_configs()
+    onnx = ONNXConfig(opset=17, dynamic_axes=None, parent=ts_trace)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Workspace(pathlib.Path(tmpdir))
+        context = _run_pipelines(workspace, get_common_config(), [ts_trace, onnx], resume=False)
+
+        journal = (workspace.path / CONTEXT_JOURNAL_FILENAME).read_text().splitlines()
+        assert len(journal) == 6
+        assert "metadata" in json.loads(journal[0])
+        assert not (workspace.path / CONTEXT_FILENAME).exists()
+
+        loaded_context = PipelineContext(workspace=workspace)
+        loaded_context.load()
+        assert loaded_context.commands.to_dict(parse=True) == context.commands.to_dict(parse=True)
+        assert loaded_context.commands.models_commands[onnx.key].model_config.parent.key == ts_trace.key
+
+        context.compact()
+        assert not (workspace.path / CONTEXT_JOURNAL_FILENAME).exists()
+
+        loaded_context = PipelineContext(workspace=workspace)
+        loaded_context.load()
+        assert loaded_context.commands.to_dict(parse=True) == context.commands.to_dict(parse=True)
+
+
+def test_resume_executes_unit_with_incomplete_journal_record():
+    ts_trace, _, onnx, _ = get_model_configs()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Workspace(pathlib.Path(tmpdir))
+        _run_pipelines(workspace, get_common_config(resume=True), [ts_trace, onnx], resume=False)
+        load_executions(workspace)
+
+        journal_path = workspace.path / CONTEXT_JOURNAL_FILENAME
+        journal = journal_path.read_text()
+        journal_path.write_text(journal[: journal.rindex("\n", 0, -1) + 10])
+        _run_pipelines(workspace, get_common_config(resume=True), [ts_trace, onnx], resume=True)
+
+        assert _executed_names(workspace) == [f"measure-{onnx.key}"]
+
+
+def test_environment_gathered_in_background_is_saved_in_context_file(mocker):
+    environment_gathered = threading.Event()
+
+    def _get_env_snapshot(**kwargs):
+        environment_gathered.wait(timeout=60)
+        return {"python_version": "3.10.0"}
+
+    mocker.patch.object(environment, "get_env_snapshot", side_effect=_get_env_snapshot)
+    ts_trace, _, onnx, _ = get_model_configs()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Workspace(pathlib.Path(tmpdir))
+        # pipelines are executed while the environment is gathered
+        context = _run_pipelines(workspace, get_common_config(), [ts_trace, onnx], resume=False)
+        journal = (workspace.path / CONTEXT_JOURNAL_FILENAME).read_text().splitlines()
+        assert json.loads(journal[0])["metadata"]["environment"] == {}
+
+        environment_gathered.set()
+        context.compact()
+        assert context.metadata.environment == {"python_version": "3.10.0"}
+        assert environment.get_env_snapshot.call_count == 1
+
+        loaded_context = PipelineContext(workspace=workspace)
+        loaded_context.load()
+        assert loaded_context.metadata.environment == {"python_version": "3.10.0"}
+        assert environment.get_env_snapshot.call_count == 1
@@ -0,0 +1,247 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+import tempfile
+import zipfile
+
+import yaml
+
+from model_navigator.api.config import DeviceKind, OptimizationProfile, PlannerConfig
+from model_navigator.commands.base import Command, CommandMetrics, CommandOutput, CommandStatus, ExecutionUnit
+from model_navigator.commands.correctness.correctness import Correctness
+from model_navigator.commands.infer_metadata import InferInputMetadata
+from model_navigator.commands.performance.performance import Performance
+from model_navigator.commands.performance.results import ProfilingResults
+from model_navigator.core.workspace import Workspace
+from model_navigator.pipelines.pipeline import Pipeline
+from model_navigator.pipelines.pipeline_context import PipelineContext
+from model_navigator.pipelines.planner import OptimizePlan, OptimizePlanner, TimingDatabase
+from tests.utils import RunnerA, get_common_config, get_model_configs
+
+
+class Export(Command):
+    def _run(self):
+        pass
+
+
+class Convert(Command):
+    def _run(self):
+        pass
+
+
+def _metrics(wall_time, start_time=100.0):
+    return CommandMetrics(start_time=start_time, wall_time=wall_time, cpu_time=wall_time, peak_rss=2**20)
+
+
+def _profiling_results(batch_sizes):
+    return [
+        ProfilingResults.from_measurements(measurements=[1.0, 2.0], batch_size=batch_size, sample_id=0)
+        for batch_size in batch_sizes
+    ]
+
+
+def _pipelines():
+    ts_trace, *_, onnx = get_model_configs()
+    return [
+        Pipeline(name="Preprocessing", execution_units=[ExecutionUnit(command=InferInputMetadata)]),
+        Pipeline(
+            name="Export",
+            execution_units=[
+                ExecutionUnit(command=Export, model_config=ts_trace),
+                ExecutionUnit(command=Convert, model_config=onnx),
+            ],
+        ),
+        Pipeline(
+            name="Evaluation",
+            execution_units=[
+                ExecutionUnit(command=Correctness, model_config=ts_trace, runner_cls=RunnerA),
+                ExecutionUnit(command=Performance, model_config=ts_trace, runner_cls=RunnerA),
+                ExecutionUnit(command=Correctness, model_config=onnx, runner_cls=RunnerA),
+                ExecutionUnit(command=Performance, model_config=onnx, runner_cls=RunnerA),
+            ],
+        ),
+    ]
+
+
+def _record_timings(timings_path, commands_timings):
+    ts_trace, *_, onnx = get_model_configs()
+    model_configs = {ts_trace.key: ts_trace, onnx.key: onnx}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        context = PipelineContext(workspace=Workspace(pathlib.Path(tmpdir)))
+        for command, model_key, wall_time, output in commands_timings:
+            model_config = model_configs.get(model_key)
+            runner_cls = RunnerA if command in [Correctness, Performance] else None
+            context.update(
+                ExecutionUnit(command=command, model_config=model_config, runner_cls=runner_cls),
+                CommandOutput(status=CommandStatus.OK, output=output, metrics=_metrics(wall_time)),
+            )
+
+    timing_database = TimingDatabase(timings_path)
+    timing_database.add_commands(context.commands, target_device=DeviceKind.CPU.value)
+    timing_database.save()
+
+
+def test_planner_estimates_units_from_recorded_timings():
+    ts_trace, onnx = (unit.model_config for unit in _pipelines()[1].execution_units)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        timings_path = pathlib.Path(tmpdir) / "timings.json"
+        _record_timings(
+            timings_path,
+            [
+                (InferInputMetadata, None, 1.0, None),
+                (Export, ts_trace.key, 10.0, None),
+                (Correctness, ts_trace.key, 2.0, None),
+                (Performance, ts_trace.key, 8.0, {"profiling_results": _profiling_results([1, 2, 4, 8])}),
+            ],
+        )
+        _record_timings(timings_path, [(Export, ts_trace.key, 20.0, None)])
+
+        planner = OptimizePlanner(PlannerConfig(timings_path=timings_path))
+        plan = planner.plan(
+            pipelines=_pipelines(),
+            config=get_common_config(optimization_profile=OptimizationProfile(batch_sizes=[1, 2])),
+        )
+
+    estimated_times = {(unit.command, unit.model_key): unit.estimated_time for unit in plan.units}
+    assert estimated_times[(InferInputMetadata.name, None)] == 1.0
+    assert estimated_times[(Export.name, ts_trace.key)] == 15.0
+    assert estimated_times[(Convert.name, onnx.key)] is None
+    # profiling time is scaled by the number of profiled batch sizes
+    assert estimated_times[(Performance.name, ts_trace.key)] == 4.0
+    # timings of other model are used by the command
+    assert estimated_times[(Correctness.name, onnx.key)] == 2.0
+    assert plan.estimated_time == 1.0 + 15.0 + 2.0 + 4.0 + 2.0 + 4.0
+    assert len(plan.unknown_units) == 1
+    assert plan.units[4].batch_sizes == [1, 2]
+    assert OptimizePlan.from_dict(plan.to_dict(parse=True)) == plan
+
+
+def test_planner_skips_units_not_fitting_in_time_budget_with_dependent_units():
+    ts_trace, onnx = (unit.model_config for unit in _pipelines()[1].execution_units)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        timings_path = pathlib.Path(tmpdir) / "timings.json"
+        _record_timings(
+            timings_path,
+            [
+                (InferInputMetadata, None, 1.0, None),
+                (Export, ts_trace.key, 5.0, None),
+                (Convert, onnx.key, 50.0, None),
+                (Correctness, ts_trace.key, 10.0, None),
+                (Performance, ts_trace.key, 10.0, None),
+            ],
+        )
+
+        pipelines = _pipelines()
+        planner = OptimizePlanner(PlannerConfig(timings_path=timings_path, time_budget=20.0))
+        plan = planner.plan(pipelines=pipelines, config=get_common_config())
+        planned_pipelines = planner.get_planned_pipelines(pipelines=pipelines, plan=plan)
+
+    skipped = [(unit.command, unit.model_key) for unit in plan.skipped_units]
+    # conversion does not fit, so all units of the converted model are skipped
+    assert (Convert.name, onnx.key) in skipped
+    assert (Correctness.name, onnx.key) in skipped
+    # correctness fits, performance does not fit in remaining time
+    assert (Correctness.name, ts_trace.key) not in skipped
+    assert (Performance.name, ts_trace.key) in skipped
+    assert plan.estimated_time == 16.0
+    assert [[unit.command.name for unit in pipeline.execution_units] for pipeline in planned_pipelines] == [
+        [InferInputMetadata.name],
+        [Export.name],
+        [Correctness.name],
+    ]
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        timings_path = pathlib.Path(tmpdir) / "timings.json"
+        _record_timings(timings_path, [(Correctness, ts_trace.key, 30.0, None)])
+
+        pipelines = _pipelines()
+        planner = OptimizePlanner(PlannerConfig(timings_path=timings_path, time_budget=20.0))
+        plan = planner.plan(pipelines=pipelines, config=get_common_config())
+
+    # performance requires correctness of the same model and runner
+    assert [(unit.command, unit.model_key) for unit in plan.skipped_units] == [
+        (Correctness.name, ts_trace.key),
+        (Performance.name, ts_trace.key),
+        (Correctness.name, onnx.key),
+        (Performance.name, onnx.key),
+    ]
+
+
+def test_planner_dry_run_keeps_only_required_units_without_model():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        pipelines = _pipelines()
+        planner = OptimizePlanner(PlannerConfig(dry_run=True, timings_path=pathlib.Path(tmpdir) / "timings.json"))
+        plan = planner.plan(pipelines=pipelines, config=get_common_config())
+        planned_pipelines = planner.get_planned_pipelines(pipelines=pipelines, plan=plan, dry_run=True)
+
+    assert len(plan.units) == 7
+    assert [[unit.command.name for unit in pipeline.execution_units] for pipeline in planned_pipelines] == [
+        [InferInputMetadata.name],
+        [],
+        [],
+    ]
+
+
+def test_timing_database_reads_timings_from_package_status_and_skips_resumed_commands():
+    ts_trace, *_ = get_model_configs()
+    status = {
+        "config": {"target_device": "cpu"},
+        "metrics": {InferInputMetadata.name: _metrics(3.0).to_dict(parse=True)},
+        "models_status": {
+            ts_trace.key: {
+                "model_config": ts_trace.to_dict(parse=True),
+                "metrics": {Export.name: _metrics(7.0).to_dict(parse=True)},
+                "runners_status": {
+                    RunnerA.name(): {
+                        "metrics": {Performance.name: _metrics(6.0).to_dict(parse=True)},
+                        "result": {
+                            Performance.name: {
+                                "profiling_results": [
+                                    result.to_dict(parse=True) for result in _profiling_results([1, 2, 4])
+                                ]
+                            }
+                        },
+                    }
+                },
+            }
+        },
+    }
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = pathlib.Path(tmpdir)
+        package_path = tmpdir / "model.nav"
+        with zipfile.ZipFile(package_path, "w") as zf:
+            zf.writestr("status.yaml", yaml.safe_dump(status))
+
+        timings_path = tmpdir / "timings.json"
+        planner = OptimizePlanner(PlannerConfig(timings_path=timings_path, history=[package_path]))
+        plan = planner.plan(
+            pipelines=_pipelines(),
+            config=get_common_config(optimization_profile=OptimizationProfile(batch_sizes=[1, 2, 4, 8])),
+        )
+
+        context = PipelineContext(workspace=Workspace(tmpdir))
+        context.update(
+            ExecutionUnit(command=Export, model_config=ts_trace),
+            CommandOutput(status=CommandStatus.OK, metrics=_metrics(1.0, start_time=10.0)),
+        )
+        planner.timing_database.add_commands(context.commands, target_device="cpu", since=50.0)
+        planner.timing_database.save()
+
+        # timings from the package history are not recorded in the database
+        assert not timings_path.exists()
+
+    estimated_times = {(unit.command, unit.model_key): unit.estimated_time for unit in plan.units}
+    assert estimated_times[(InferInputMetadata.name, None)] == 3.0
+    assert estimated_times[(Export.name, ts_trace.key)] == 7.0
+    assert estimated_times[(Performance.name, ts_trace.key)] == 8.0
@@ -0,0 +1,329 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+import pathlib
+import sys
+import tempfile
+import time
+
+import pytest
+
+from model_navigator.api.config import ParallelConfig
+from model_navigator.commands.base import Command, CommandOutput, CommandStatus, ExecutionUnit
+from model_navigator.commands.process_executor import execute_process
+from model_navigator.core.logger import LOGGER
+from model_navigator.core.workspace import Workspace
+from model_navigator.pipelines.pipeline import Pipeline
+from model_navigator.pipelines.pipeline_context import PipelineContext
+from model_navigator.pipelines.scheduler import (
+    PipelineScheduler,
+    get_units_dependencies,
+    is_parallel_execution_supported,
+)
+from model_navigator.utils import environment
+from tests.utils import RunnerA, RunnerB, get_common_config, get_model_configs, load_executions, record_execution
+
+SLEEP_TIME = 0.5
+
+
+class Prepare(Command):
+    def _run(self, workspace):
+        record_execution(workspace, "prepare")
+        return CommandOutput(status=CommandStatus.OK, output={"prepared": True})
+
+
+class Export(Command):
+    def _run(self, workspace, path, prepared):
+        start = time.perf_counter()
+        assert prepared
+        time.sleep(SLEEP_TIME)
+        record_execution(workspace, f"export-{path.parent}", start)
+        return CommandOutput(status=CommandStatus.OK, output={"exported": path.parent.as_posix()})
+
+
+class Measure(Command, is_exclusive=True):
+    def _run(self, workspace, path, exported):
+        start = time.perf_counter()
+        time.sleep(SLEEP_TIME / 5)
+        record_execution(workspace, f"measure-{exported}", start)
+        return CommandOutput(status=CommandStatus.OK)
+
+
+class Verify(Command, requires=[Measure.name]):
+    def _run(self, workspace):
+        return CommandOutput(status=CommandStatus.OK)
+
+
+class Convert(Command, is_isolated=True):
+    def _run(self, workspace, path):
+        start = time.perf_counter()
+        script = f"import time; time.sleep({SLEEP_TIME}); print('converted {path.parent}')"
+        result = execute_process([sys.executable, "-c", script], cwd=workspace.path, on_output=LOGGER.info)
+        record_execution(workspace, f"convert-{path.parent}", start)
+        return CommandOutput(status=CommandStatus.OK if result.returncode == 0 else CommandStatus.FAIL)
+
+
+def test_get_units_dependencies_return_dependencies_on_shared_models_required_commands_and_parents():
+    ts_trace, ts_script, onnx, onnx_from_ts = get_model_configs()
+    execution_units = [
+        ExecutionUnit(command=Prepare),
+        ExecutionUnit(command=Export, model_config=ts_trace),
+        ExecutionUnit(command=Export, model_config=ts_script),
+        ExecutionUnit(command=Export, model_config=onnx),
+        ExecutionUnit(command=Export, model_config=onnx_from_ts),
+        ExecutionUnit(command=Measure, model_config=ts_trace, runner_cls=RunnerA),
+        ExecutionUnit(command=Measure, model_config=onnx, runner_cls=RunnerA),
+        ExecutionUnit(command=Measure, model_config=onnx, runner_cls=RunnerB),
+        ExecutionUnit(command=Measure, model_config=onnx, runner_cls=RunnerA),
+        ExecutionUnit(command=Verify, model_config=onnx, runner_cls=RunnerA),
+        ExecutionUnit(command=Verify, model_config=onnx, runner_cls=RunnerB),
+        ExecutionUnit(command=Prepare),
+    ]
+
+    dependencies = get_units_dependencies(execution_units)
+
+    assert dependencies == [
+        set(),
+        {0},
+        {0},
+        {0},
+        {0, 1},
+        {0, 1},
+        {0, 3},
+        {0, 3},
+        {0, 3},
+        {0, 3, 6, 8},
+        {0, 3, 7},
+        set(range(11)),
+    ]
+
+
+@pytest.mark.skipif(not is_parallel_execution_supported(), reason="Forking processes is not supported.")
+def test_scheduler_run_executes_independent_units_concurrently_and_keeps_context_order():
+    ts_trace, ts_script, onnx, _ = get_model_configs()
+    pipelines = [
+        Pipeline(name="Prepare", execution_units=[ExecutionUnit(command=Prepare)]),
+        Pipeline(
+            name="Export",
+            execution_units=[
+                ExecutionUnit(command=Export, model_config=model_config) for model_config in [ts_trace, ts_script, onnx]
+            ],
+        ),
+        Pipeline(
+            name="Measure",
+            execution_units=[
+                ExecutionUnit(command=Measure, model_config=model_config, runner_cls=RunnerA)
+                for model_config in [ts_trace, ts_script, onnx]
+            ],
+        ),
+    ]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Workspace(pathlib.Path(tmpdir))
+        context = PipelineContext(workspace=workspace)
+        context.initialize()
+
+        PipelineScheduler(pipelines=pipelines, parallel_config=ParallelConfig(max_workers=3)).run(
+            workspace=workspace, config=get_common_config(), context=context
+        )
+        executions = {execution["name"]: execution for execution in load_executions(workspace)}
+
+    exports = [executions[f"export-{model_config.key}"] for model_config in [ts_trace, ts_script, onnx]]
+    assert max(export["start"] for export in exports) < min(export["end"] for export in exports)
+    assert len({export["pid"] for export in exports} | {os.getpid()}) == 4
+    assert executions["prepare"]["pid"] == os.getpid()
+
+    measures = sorted(
+        (executions[f"measure-{model_config.key}"] for model_config in [ts_trace, ts_script, onnx]),
+        key=lambda measure: measure["start"],
+    )
+    for measure, next_measure in zip(measures, measures[1:]):
+        assert measure["end"] <= next_measure["start"]
+
+    assert list(context.commands.commands) == [Prepare.name]
+    assert list(context.commands.models_commands) == [ts_trace.key, ts_script.key, onnx.key]
+    for model_config in [ts_trace, ts_script, onnx]:
+        model_command = context.commands.models_commands[model_config.key]
+        assert model_command.commands[Export.name].output == {"exported": model_config.key}
+        assert model_command.runners_commands[RunnerA.name()].commands[Measure.name].status == CommandStatus.OK
+
+
+@pytest.mark.skipif(not is_parallel_execution_supported(), reason="Forking processes is not supported.")
+def test_scheduler_run_executes_units_one_at_a_time_when_memory_limit_is_exceeded():
+    ts_trace, ts_script, onnx, _ = get_model_configs()
+    pipelines = [
+        Pipeline(name="Prepare", execution_units=[ExecutionUnit(command=Prepare)]),
+        Pipeline(
+            name="Export",
+            execution_units=[
+                ExecutionUnit(command=Export, model_config=model_config) for model_config in [ts_trace, ts_script, onnx]
+            ],
+        ),
+    ]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Workspace(pathlib.Path(tmpdir))
+        context = PipelineContext(workspace=workspace)
+        context.initialize()
+
+        PipelineScheduler(pipelines=pipelines, parallel_config=ParallelConfig(max_workers=3, max_memory=1)).run(
+            workspace=workspace, config=get_common_config(), context=context
+        )
+        executions = {execution["name"]: execution for execution in load_executions(workspace)}
+
+    exports = sorted(
+        (executions[f"export-{model_config.key}"] for model_config in [ts_trace, ts_script, onnx]),
+        key=lambda export: export["start"],
+    )
+    for export, next_export in zip(exports, exports[1:]):
+        assert export["end"] <= next_export["start"]
+
+
+@pytest.mark.skipif(not is_parallel_execution_supported(), reason="Forking processes is not supported.")
+def test_scheduler_run_starts_workers_after_environment_is_gathered(mocker):
+    gathering_end = []
+
+    def _get_env_snapshot(**kwargs):
+        time.sleep(SLEEP_TIME)
+        gathering_end.append(time.perf_counter())
+        return {}
+
+    mocker.patch.object(environment, "get_env_snapshot", side_effect=_get_env_snapshot)
+    ts_trace, *_ = get_model_configs()
+    pipelines = [
+        Pipeline(name="Prepare", execution_units=[ExecutionUnit(command=Prepare)]),
+        Pipeline(name="Export", execution_units=[ExecutionUnit(command=Export, model_config=ts_trace)]),
+    ]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Workspace(pathlib.Path(tmpdir))
+        context = PipelineContext(workspace=workspace)
+        context.initialize()
+
+        PipelineScheduler(pipelines=pipelines, parallel_config=ParallelConfig(max_workers=2)).run(
+            workspace=workspace, config=get_common_config(), context=context
+        )
+        _, export = load_executions(workspace)
+
+    assert export["pid"] != os.getpid()
+    assert export["start"] > gathering_end[0]
+
+
+def test_scheduler_run_executes_units_in_main_process_when_cuda_is_initialized(mocker):
+    mocker.patch("model_navigator.pipelines.scheduler.is_cuda_initialized", return_value=True)
+    ts_trace, ts_script, onnx, _ = get_model_configs()
+    pipelines = [
+        Pipeline(name="Prepare", execution_units=[ExecutionUnit(command=Prepare)]),
+        Pipeline(
+            name="Export",
+            execution_units=[
+                ExecutionUnit(command=Export, model_config=model_config) for model_config in [ts_trace, ts_script, onnx]
+            ],
+        ),
+    ]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Workspace(pathlib.Path(tmpdir))
+        context = PipelineContext(workspace=workspace)
+        context.initialize()
+
+        PipelineScheduler(pipelines=pipelines, parallel_config=ParallelConfig(max_workers=3)).run(
+            workspace=workspace, config=get_common_config(), context=context
+        )
+        executions = load_executions(workspace)
+
+    assert [execution["name"] for execution in executions] == [
+        "prepare",
+        *[f"export-{model_config.key}" for model_config in [ts_trace, ts_script, onnx]],
+    ]
+    assert all(execution["pid"] == os.getpid() for execution in executions)
+    for execution, next_execution in zip(executions, executions[1:]):
+        assert execution["end"] <= next_execution["start"]
+
+
+def test_scheduler_run_executes_isolated_units_concurrently_in_threads_when_cuda_is_initialized(mocker):
+    mocker.patch("model_navigator.pipelines.scheduler.is_cuda_initialized", return_value=True)
+    model_configs = get_model_configs()[:3]
+    pipelines = [
+        Pipeline(name="Prepare", execution_units=[ExecutionUnit(command=Prepare)]),
+        Pipeline(
+            name="Export",
+            execution_units=[
+                ExecutionUnit(command=Export, model_config=model_config) for model_config in model_configs
+            ],
+        ),
+        Pipeline(
+            name="Convert",
+            execution_units=[
+                ExecutionUnit(command=Convert, model_config=model_config) for model_config in model_configs
+            ],
+        ),
+    ]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Workspace(pathlib.Path(tmpdir))
+        context = PipelineContext(workspace=workspace)
+        context.initialize()
+
+        PipelineScheduler(pipelines=pipelines, parallel_config=ParallelConfig(max_workers=3)).run(
+            workspace=workspace, config=get_common_config(), context=context
+        )
+        executions = {execution["name"]: execution for execution in load_executions(workspace)}
+        logs = {
+            model_config.key: (workspace.path / model_config.path.parent / "format.log").read_text()
+            for model_config in model_configs
+        }
+
+    exports = [executions[f"export-{model_config.key}"] for model_config in model_configs]
+    for export, next_export in zip(exports, exports[1:]):
+        assert export["end"] <= next_export["start"]
+
+    converts = [executions[f"convert-{model_config.key}"] for model_config in model_configs]
+    assert max(convert["start"] for convert in converts) < min(convert["end"] for convert in converts)
+    assert all(execution["pid"] == os.getpid() for execution in executions.values())
+
+    for model_config in model_configs:
+        assert f"converted {model_config.key}" in logs[model_config.key]
+        for other_model_config in model_configs:
+            if other_model_config != model_config:
+                assert f"converted {other_model_config.key}" not in logs[model_config.key]
+    for model_config in model_configs:
+        model_command = context.commands.models_commands[model_config.key]
+        assert model_command.commands[Convert.name].status == CommandStatus.OK
+
+
+@pytest.mark.skipif(not is_parallel_execution_supported(), reason="Forking processes is not supported.")
+def test_scheduler_run_resumes_units_completed_in_previous_execution():
+    ts_trace, ts_script, onnx, _ = get_model_configs()
+    pipelines = [
+        Pipeline(name="Prepare", execution_units=[ExecutionUnit(command=Prepare)]),
+        Pipeline(
+            name="Export",
+            execution_units=[
+                ExecutionUnit(command=Export, model_config=model_config) for model_config in [ts_trace, onnx]
+            ],
+        ),
+    ]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = Workspace(pathlib.Path(tmpdir))
+        context = PipelineContext(workspace=workspace)
+        context.initialize()
+        PipelineScheduler(pipelines=pipelines, parallel_config=ParallelConfig(max_workers=2)).run(
+            workspace=workspace, config=get_common_config(resume=True), context=context
+        )
+        load_executions(workspace)
+
+        resumed_context = PipelineContext(workspace=workspace)
+        resumed_context.resume()
+        PipelineScheduler(pipelines=pipelines, parallel_config=ParallelConfig(max_workers=2)).run(
+            workspace=workspace, config=get_common_config(resume=True), context=resumed_context
+        )
+
+        assert load_executions(workspace) == []
+        assert resumed_context.commands.to_dict(parse=True) == context.commands.to_dict(parse=True)
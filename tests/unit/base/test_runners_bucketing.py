@@ -0,0 +1,206 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+import pytest
+
+from model_navigator.api.config import TensorRTProfile
+from model_navigator.commands.infer_metadata import _extract_axes_shapes
+from model_navigator.core.tensor import TensorMetadata
+from model_navigator.exceptions import ModelNavigatorRuntimeError
+from model_navigator.frameworks import Framework
+from model_navigator.runners.bucketing import (
+    bucketing_runner,
+    get_bucket_size,
+    get_shape_buckets_from_axes_shapes,
+    get_shape_buckets_from_trt_profile,
+)
+from model_navigator.runners.python import PythonRunner
+
+
+def _model(input__0):
+    return {"output__0": input__0 * 2, "output__1": input__0.sum(axis=1, keepdims=True)}
+
+
+def _get_runner(runner_cls=None, **kwargs):
+    input_metadata = TensorMetadata().add("input__0", shape=(-1, -1), dtype=np.float32)
+    output_metadata = (
+        TensorMetadata()
+        .add("output__0", shape=(-1, -1), dtype=np.float32)
+        .add("output__1", shape=(-1, 1), dtype=np.float32)
+    )
+    runner_cls = runner_cls or bucketing_runner(PythonRunner)
+    return runner_cls(model=_model, input_metadata=input_metadata, output_metadata=output_metadata, **kwargs)
+
+
+def test_get_shape_buckets_from_trt_profile_return_powers_of_2_with_opt_and_max_for_dynamic_axes():
+    trt_profile = TensorRTProfile().add("input__0", min=(1, 3), opt=(6, 3), max=(20, 3))
+
+    shape_buckets = get_shape_buckets_from_trt_profile(trt_profile)
+
+    assert shape_buckets == {"input__0": {0: [1, 2, 4, 6, 8, 16, 20]}}
+
+
+def test_get_shape_buckets_from_axes_shapes_return_quantiles_for_dynamic_axes():
+    axes_shapes = {"input__0": {0: [1, 2, 3, 4, 5, 6, 7, 8], 1: [3] * 8}}
+
+    shape_buckets = get_shape_buckets_from_axes_shapes(axes_shapes, buckets_count=2)
+
+    assert shape_buckets == {"input__0": {0: [4, 8]}}
+
+
+def test_get_shape_buckets_from_axes_shapes_return_observed_sizes_when_quantiles_fall_between_sizes():
+    axes_shapes = {"input__0": {0: [1, 1, 1, 2, 7, 9]}}
+
+    shape_buckets = get_shape_buckets_from_axes_shapes(axes_shapes, buckets_count=4)
+
+    assert shape_buckets == {"input__0": {0: [1, 7, 9]}}
+
+
+def test_get_shape_buckets_from_axes_shapes_weight_sizes_by_counts_when_axes_shapes_are_extracted_from_dataloader():
+    sequence_lengths = [8] * 6 + [16, 32, 64, 128]
+    dataloader = [np.ones((1, length), dtype=np.float32) for length in sequence_lengths]
+    axes_shapes = _extract_axes_shapes(
+        dataloader=dataloader,
+        input_names=["input__0"],
+        input_ndims=[2],
+        num_samples=len(dataloader),
+        framework=Framework.NONE,
+    )
+
+    shape_buckets = get_shape_buckets_from_axes_shapes(axes_shapes, buckets_count=2)
+
+    assert shape_buckets == get_shape_buckets_from_axes_shapes({"input__0": {1: sequence_lengths}}, buckets_count=2)
+    assert shape_buckets == {"input__0": {1: [8, 128]}}
+
+
+def test_get_bucket_size_return_smallest_fitting_bucket():
+    assert get_bucket_size(3, [2, 4, 8]) == 4
+    assert get_bucket_size(4, [2, 4, 8]) == 4
+    assert get_bucket_size(9, [2, 4, 8]) == 9
+    assert get_bucket_size(5, None) == 8
+
+
+def test_bucketing_runner_return_outputs_sliced_to_original_shapes():
+    runner = _get_runner(shape_buckets={"input__0": {0: [4, 8], 1: [8]}})
+    sample = {"input__0": np.ones((3, 5), dtype=np.float32)}
+
+    with runner:
+        outputs = runner.infer(sample)
+        padding_waste = runner.padding_waste()
+
+    assert runner.name() == "PythonRunnerBucketing"
+    assert outputs["output__0"].shape == (3, 5)
+    assert np.allclose(outputs["output__0"], 2.0)
+    assert outputs["output__1"].shape == (3, 1)
+    assert np.allclose(outputs["output__1"], 5.0)
+    assert padding_waste == 1 - 15 / 32
+
+
+def test_bucketing_runner_collect_stats_when_shapes_share_bucket():
+    runner = _get_runner()
+
+    with runner:
+        for batch_size in [3, 4, 5, 7]:
+            runner.infer({"input__0": np.ones((batch_size, 2), dtype=np.float32)})
+        stats = runner.bucketing_stats()
+
+    assert stats.request_count == 4
+    assert stats.shapes_count == 4
+    assert stats.buckets_count == 2
+    assert stats.saved_recompilations == 2
+    assert stats.padding_waste == (1 + 0 + 3 + 1) * 2 / ((4 + 4 + 8 + 8) * 2)
+
+
+def test_bucketing_runner_slice_only_dynamic_output_axes_when_static_axis_matches_bucket_size():
+    def _model(input__0):
+        return {"output__0": input__0 * 2, "output__1": np.ones((input__0.shape[0], 4), dtype=np.float32)}
+
+    input_metadata = TensorMetadata().add("input__0", shape=(-1, 3), dtype=np.float32)
+    output_metadata = (
+        TensorMetadata()
+        .add("output__0", shape=(-1, 3), dtype=np.float32)
+        .add("output__1", shape=(-1, 4), dtype=np.float32)
+    )
+    runner = bucketing_runner(PythonRunner)(
+        model=_model, input_metadata=input_metadata, output_metadata=output_metadata
+    )
+
+    with runner:
+        outputs = runner.infer({"input__0": np.ones((4, 3), dtype=np.float32)})
+        outputs_padded = runner.infer({"input__0": np.ones((3, 3), dtype=np.float32)})
+
+    assert outputs["output__1"].shape == (4, 4)
+    assert outputs_padded["output__0"].shape == (3, 3)
+    assert outputs_padded["output__1"].shape == (3, 4)
+
+
+def test_bucketing_runner_use_class_buckets_and_name_when_passed_to_factory():
+    runner_cls = bucketing_runner(PythonRunner, shape_buckets={"input__0": {0: [16]}}, name="PythonShortBatches")
+    runner = _get_runner(runner_cls)
+
+    with runner:
+        runner.infer({"input__0": np.ones((3, 2), dtype=np.float32)})
+        saved_recompilations = runner.saved_recompilations()
+
+    assert runner_cls.name() == "PythonShortBatches"
+    assert not runner_cls.is_default()
+    assert runner.padding_waste() == 1 - 3 / 16
+    assert saved_recompilations == 0
+
+
+def test_bucketing_runner_get_runner_options_return_buckets_from_trt_profile_when_class_has_no_buckets():
+    trt_profile = TensorRTProfile().add("input__0", min=(1, 3), opt=(6, 3), max=(20, 3))
+
+    runner_options = bucketing_runner(PythonRunner).get_runner_options(dataloader_trt_profile=trt_profile)
+    class_runner_options = bucketing_runner(PythonRunner, shape_buckets={"input__0": {0: [16]}}).get_runner_options(
+        dataloader_trt_profile=trt_profile
+    )
+
+    assert runner_options == {"shape_buckets": get_shape_buckets_from_trt_profile(trt_profile)}
+    assert class_runner_options == {}
+
+
+def test_bucketing_runner_pad_to_buckets_when_axes_are_passed_as_strings():
+    runner = _get_runner(shape_buckets={"input__0": {"0": [4, 8]}})
+
+    with runner:
+        outputs = runner.infer({"input__0": np.ones((3, 5), dtype=np.float32)})
+        padding_waste = runner.padding_waste()
+
+    assert outputs["output__0"].shape == (3, 5)
+    assert padding_waste == 1 - 3 / 4
+
+
+def test_bucketing_runner_raise_error_when_inputs_of_different_sizes_are_padded_to_output_size():
+    def _model(input__0, input__1):
+        return {"output__0": input__0 + input__1.sum()}
+
+    input_metadata = (
+        TensorMetadata()
+        .add("input__0", shape=(-1, 2), dtype=np.float32)
+        .add("input__1", shape=(-1, 2), dtype=np.float32)
+    )
+    output_metadata = TensorMetadata().add("output__0", shape=(-1, 2), dtype=np.float32)
+    runner = bucketing_runner(PythonRunner)(
+        model=_model, input_metadata=input_metadata, output_metadata=output_metadata
+    )
+
+    with runner:
+        outputs = runner.infer(
+            {"input__0": np.ones((3, 2), dtype=np.float32), "input__1": np.ones((3, 2), dtype=np.float32)}
+        )
+        with pytest.raises(ModelNavigatorRuntimeError):
+            runner.infer({"input__0": np.ones((3, 2), dtype=np.float32), "input__1": np.ones((4, 2), dtype=np.float32)})
+
+    assert outputs["output__0"].shape == (3, 2)
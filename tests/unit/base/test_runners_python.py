@@ -0,0 +1,121 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+
+import numpy as np
+import pytest
+
+from model_navigator.api.config import DeviceKind
+from model_navigator.core.tensor import TensorMetadata
+from model_navigator.exceptions import ModelNavigatorRuntimeError
+from model_navigator.runners.python import PythonProcessPoolRunner
+from model_navigator.runners.registry import get_runner
+from model_navigator.runners.utils import default_runners
+
+
+def _model(input__0):
+    if (input__0 < 0).any():
+        raise ValueError("Negative input")
+    return {"output__0": input__0 * 2}
+
+
+def _get_runner(runner_cls=PythonProcessPoolRunner, **kwargs):
+    input_metadata = TensorMetadata().add("input__0", shape=(-1, 3), dtype=np.float32)
+    output_metadata = TensorMetadata().add("output__0", shape=(-1, 3), dtype=np.float32)
+    return runner_cls(model=_model, input_metadata=input_metadata, output_metadata=output_metadata, **kwargs)
+
+
+def test_process_pool_runner_return_outputs_when_input_size_changes():
+    runner = _get_runner(workers=2)
+    with runner:
+        for batch_size in [1, 1024, 8]:
+            outputs = runner.infer({"input__0": np.full((batch_size, 3), batch_size, dtype=np.float32)})
+            assert outputs["output__0"].shape == (batch_size, 3)
+            assert np.allclose(outputs["output__0"], 2 * batch_size)
+
+
+def test_process_pool_runner_return_outputs_when_called_from_multiple_threads():
+    runner = _get_runner(workers=2)
+    errors = []
+
+    def _infer(value):
+        for _ in range(20):
+            outputs = runner.infer({"input__0": np.full((4, 3), value, dtype=np.float32)})
+            if not np.allclose(outputs["output__0"], 2 * value):
+                errors.append(value)
+
+    with runner:
+        threads = [threading.Thread(target=_infer, args=(value,)) for value in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert runner.is_thread_safe()
+    assert errors == []
+
+
+def test_process_pool_runner_raise_error_when_model_fails_in_worker():
+    runner = _get_runner(workers=1)
+    with runner:
+        with pytest.raises(ModelNavigatorRuntimeError, match="Negative input"):
+            runner.infer({"input__0": -np.ones((1, 3), dtype=np.float32)})
+
+        outputs = runner.infer({"input__0": np.ones((1, 3), dtype=np.float32)})
+
+    assert np.allclose(outputs["output__0"], 2.0)
+
+
+def test_process_pool_runner_replace_worker_when_worker_process_exits():
+    runner = _get_runner(workers=1)
+    with runner:
+        process = runner._workers[0][0]
+        process.kill()
+        process.join()
+
+        with pytest.raises(ModelNavigatorRuntimeError, match="exited during inference"):
+            runner.infer({"input__0": np.ones((1, 3), dtype=np.float32)})
+
+        outputs = runner.infer({"input__0": np.ones((1, 3), dtype=np.float32)})
+        new_process = runner._workers[0][0]
+
+    assert np.allclose(outputs["output__0"], 2.0)
+    assert new_process.pid != process.pid
+    assert not new_process.is_alive()
+
+
+def test_process_pool_runner_raise_error_when_workers_count_is_not_positive():
+    with pytest.raises(ValueError):
+        _get_runner(workers=0)
+
+
+def test_process_pool_runner_use_registered_workers_count_when_selected_by_name():
+    runner_cls = get_runner("PythonProcessPool2")
+    runner = _get_runner(runner_cls)
+
+    assert runner.workers == 2
+    assert not runner_cls.is_default()
+    assert "PythonProcessPool" not in default_runners(DeviceKind.CPU)
+
+
+def test_process_pool_runner_terminate_worker_when_it_does_not_stop_in_time(mocker):
+    mocker.patch("model_navigator.runners.python.DEFAULT_PROCESS_POOL_JOIN_TIMEOUT", 0.1)
+    runner = _get_runner(workers=1)
+    runner.activate()
+    process, connection, _, _ = runner._workers[0]
+    mocker.patch.object(connection, "send")
+
+    runner.deactivate()
+
+    assert not process.is_alive()
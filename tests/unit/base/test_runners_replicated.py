@@ -0,0 +1,165 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+import tempfile
+import threading
+import time
+
+import numpy as np
+import onnx
+import pytest
+from onnx import numpy_helper
+
+from model_navigator.api.config import DeviceKind, Format, ReplicatedRunnerConfig, map_custom_configs
+from model_navigator.core.tensor import TensorMetadata
+from model_navigator.exceptions import ModelNavigatorConfigurationError
+from model_navigator.runners.python import PythonRunner
+from model_navigator.runners.registry import get_runner
+from model_navigator.runners.replicated import ReplicasDispatch, replicated_runner
+from model_navigator.runners.utils import default_runners
+
+
+class _Model:
+    def __init__(self, delay=0.0):
+        self.calls = 0
+        self.delay = delay
+
+    def __call__(self, input__0):
+        self.calls += 1
+        time.sleep(self.delay)
+        return {"output__0": input__0 * 2}
+
+
+def _get_runner(runner_cls, model, **kwargs):
+    input_metadata = TensorMetadata().add("input__0", shape=(-1, 3), dtype=np.float32)
+    output_metadata = TensorMetadata().add("output__0", shape=(-1, 3), dtype=np.float32)
+    return runner_cls(model=model, input_metadata=input_metadata, output_metadata=output_metadata, **kwargs)
+
+
+def test_replicated_runner_name_contains_replicas_count_and_dispatch():
+    assert replicated_runner(PythonRunner, replicas=2).name() == "PythonRunnerReplicated2"
+    assert (
+        replicated_runner(PythonRunner, replicas=4, dispatch="least_loaded").name()
+        == "PythonRunnerReplicated4LeastLoaded"
+    )
+    assert replicated_runner(PythonRunner, replicas=2).format() == Format.PYTHON
+    assert replicated_runner(PythonRunner).name() == "PythonRunnerReplicated"
+
+
+def test_replicated_runner_raise_error_when_replicas_count_is_not_positive():
+    with pytest.raises(ValueError):
+        replicated_runner(PythonRunner, replicas=0)
+
+
+def test_replicated_runner_dispatch_requests_in_turns_when_round_robin_is_used():
+    model = _Model()
+    runner = _get_runner(replicated_runner(PythonRunner, replicas=3), model)
+
+    with runner:
+        outputs = [runner.infer({"input__0": np.ones((1, 3), dtype=np.float32)}) for _ in range(6)]
+        replicas = runner.replicated_runners
+
+    assert all(np.allclose(output["output__0"], 2.0) for output in outputs)
+    assert len(replicas) == 3
+    assert model.calls == 6
+    assert runner._next_replica == 0
+
+
+def test_replicated_runner_dispatch_requests_to_idle_replicas_when_least_loaded_is_used():
+    model = _Model(delay=0.1)
+    runner = _get_runner(replicated_runner(PythonRunner, replicas=2, dispatch=ReplicasDispatch.LEAST_LOADED), model)
+    used_replicas = []
+    original_acquire = runner._acquire_replica
+
+    def _acquire_replica():
+        idx = original_acquire()
+        used_replicas.append(idx)
+        return idx
+
+    runner._acquire_replica = _acquire_replica
+
+    def _infer():
+        runner.infer({"input__0": np.ones((1, 3), dtype=np.float32)})
+
+    with runner:
+        threads = [threading.Thread(target=_infer) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert runner.is_thread_safe()
+    assert sorted(used_replicas) == [0, 1]
+    assert runner._in_progress == [0, 0]
+
+
+def test_replicated_onnx_runner_share_initializers_between_replicas_when_activated():
+    weights = np.arange(9, dtype=np.float32).reshape(3, 3)
+    graph = onnx.helper.make_graph(
+        [onnx.helper.make_node("MatMul", ["input__0", "weights"], ["output__0"])],
+        "matmul",
+        [onnx.helper.make_tensor_value_info("input__0", onnx.TensorProto.FLOAT, [None, 3])],
+        [onnx.helper.make_tensor_value_info("output__0", onnx.TensorProto.FLOAT, [None, 3])],
+        [numpy_helper.from_array(weights, name="weights")],
+    )
+    runner_cls = get_runner("OnnxCPUReplicated")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        model_path = pathlib.Path(tmp_dir) / "model.onnx"
+        onnx.save(onnx.helper.make_model(graph, opset_imports=[onnx.helper.make_opsetid("", 13)]), model_path)
+        runner = _get_runner(runner_cls, model_path, replicas=2, threads_per_replica=1)
+        with runner:
+            outputs = runner.infer({"input__0": np.ones((2, 3), dtype=np.float32)})
+            initializers = [replica._sess.initializers for replica in runner.replicated_runners]
+            threads = [replica.sess.get_session_options().intra_op_num_threads for replica in runner.replicated_runners]
+
+    assert not runner_cls.is_default()
+    assert "OnnxCPUReplicated" not in default_runners(DeviceKind.CPU)
+    assert threads == [1, 1]
+    assert np.allclose(outputs["output__0"], np.ones((2, 3)) @ weights)
+    assert list(initializers[0]) == ["weights"]
+    assert initializers[0] is initializers[1]
+
+
+def test_replicated_runner_divide_cpu_cores_among_replicas_when_threads_per_replica_is_not_set(mocker):
+    mocker.patch("model_navigator.runners.replicated.os.cpu_count", return_value=8)
+    replica_init = mocker.spy(PythonRunner, "__init__")
+
+    runner = _get_runner(replicated_runner(PythonRunner), _Model(), replicas=4)
+
+    assert len(runner.replicated_runners) == 4
+    assert runner.threads_per_replica == 2
+    assert replica_init.call_args_list[0].kwargs["intra_op_num_threads"] == 2
+
+
+def test_replicated_runner_get_runner_options_return_replicas_config_when_not_fixed_by_runner_class():
+    custom_configs = map_custom_configs([ReplicatedRunnerConfig(replicas=4, threads_per_replica=2)])
+
+    runner_options = replicated_runner(PythonRunner).get_runner_options(custom_configs=custom_configs)
+    default_runner_options = replicated_runner(PythonRunner).get_runner_options()
+    fixed_runner_options = replicated_runner(PythonRunner, replicas=2, dispatch="least_loaded").get_runner_options(
+        custom_configs=custom_configs
+    )
+
+    assert runner_options == {"replicas": 4, "dispatch": "round_robin", "threads_per_replica": 2}
+    assert default_runner_options == {"replicas": 2, "dispatch": "round_robin"}
+    assert fixed_runner_options == {"threads_per_replica": 2}
+
+
+def test_replicated_runner_config_raise_error_when_replicas_count_is_not_positive():
+    config = ReplicatedRunnerConfig(replicas=3, dispatch="least_loaded")
+
+    assert ReplicatedRunnerConfig.from_dict(config.to_dict(parse=True)) == config
+    with pytest.raises(ModelNavigatorConfigurationError):
+        ReplicatedRunnerConfig(replicas=0)
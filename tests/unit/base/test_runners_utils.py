@@ -0,0 +1,34 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from model_navigator.api.config import DeviceKind
+from model_navigator.runners.python import PythonRunner
+from model_navigator.runners.registry import runner_registry
+from model_navigator.runners.utils import default_runners
+
+
+class OptInPythonRunner(PythonRunner):
+    @classmethod
+    def is_default(cls):
+        return False
+
+    @classmethod
+    def name(cls):
+        return "OptInPython"
+
+
+def test_default_runners_skip_runners_which_have_to_be_selected_explicitly(monkeypatch):
+    monkeypatch.setitem(runner_registry, OptInPythonRunner.name(), OptInPythonRunner)
+
+    assert PythonRunner.name() in default_runners(DeviceKind.CPU)
+    assert OptInPythonRunner.name() not in default_runners(DeviceKind.CPU)
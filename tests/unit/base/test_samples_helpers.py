@@ -12,15 +12,29 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import pathlib
 import tempfile
 
 import numpy
 import pytest
 
-from model_navigator.commands.data_dump.samples import _validate_tensor, samples_to_npz
+from model_navigator.api.config import OptimizationProfile
+from model_navigator.commands.base import CommandStatus
+from model_navigator.commands.data_dump.samples import (
+    FetchOutputModelData,
+    ProfilingSamplesSelector,
+    SamplesCollector,
+    _validate_tensor,
+    samples_to_mmap,
+    samples_to_npz,
+)
+from model_navigator.commands.infer_metadata import InferInputMetadata
+from model_navigator.core.tensor import TensorMetadata
+from model_navigator.core.workspace import Workspace
 from model_navigator.exceptions import ModelNavigatorUserInputError
-from model_navigator.utils.dataloader import load_samples
+from model_navigator.frameworks import Framework
+from model_navigator.utils.dataloader import get_samples_fingerprint, iter_samples, load_mmap_samples, load_samples
 
 
 def test_validate_tensor_raise_exception_when_values_are_nan():
@@ -98,3 +112,248 @@ def test_samples_are_saved_and_loaded_in_the_same_order():
             for (k1, v1), (k2, v2) in zip(s.items(), l_s.items()):
                 assert k1 == k2
                 assert (v1 == v2).all()
+
+
+def test_samples_to_mmap_are_loaded_in_the_same_order_when_shapes_differ():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        sample_filepath = pathlib.Path(tmpdir) / "model_input" / "correctness"
+
+        batch_dim = 0
+        samples = []
+        for idx in range(0, 10):
+            sample = {
+                "input_0": numpy.full(shape=(1, idx + 1), fill_value=idx, dtype=numpy.float32),
+                "input_1": numpy.arange(idx * 2).reshape(1, idx, 2),
+            }
+            samples.append(sample)
+        samples_to_mmap(samples=samples, path=sample_filepath, batch_dim=batch_dim)
+        loaded_samples = load_samples(samples_name="correctness_samples", workspace=tmpdir, batch_dim=batch_dim)
+
+        assert len(samples) == len(loaded_samples)
+        for s, l_s in zip(samples, loaded_samples):
+            assert list(s.keys()) == list(l_s.keys())
+            for name in s:
+                assert s[name].dtype == l_s[name].dtype
+                assert s[name].shape == l_s[name].shape
+                assert (s[name] == l_s[name]).all()
+
+
+def test_load_mmap_samples_return_views_of_memory_mapped_file():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        sample_filepath = pathlib.Path(tmpdir)
+        samples = [{"input_0": numpy.full(shape=(2, 3), fill_value=idx)} for idx in range(0, 4)]
+        samples_to_mmap(samples=samples, path=sample_filepath, batch_dim=None)
+
+        loaded_samples = load_mmap_samples(sample_filepath)
+
+        assert len(loaded_samples) == 4
+        for loaded_sample in loaded_samples:
+            assert isinstance(loaded_sample["input_0"].base, numpy.memmap)
+
+
+def test_samples_to_mmap_raise_error_when_dtype_differs_between_samples():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        samples = [
+            {"input_0": numpy.zeros(shape=(3,), dtype=numpy.float32)},
+            {"input_0": numpy.zeros(shape=(3,), dtype=numpy.int64)},
+        ]
+        with pytest.raises(ModelNavigatorUserInputError):
+            samples_to_mmap(samples=samples, path=pathlib.Path(tmpdir), batch_dim=None)
+
+
+def test_samples_collector_select_first_samples_with_min_and_max_shapes():
+    batch_dim = 0
+    sizes = [(2, 4), (1, 8), (4, 2), (4, 8), (1, 2)]
+    samples = [{"input_0": numpy.full(shape=size, fill_value=idx)} for idx, size in enumerate(sizes)]
+
+    collector = SamplesCollector(batch_dim=batch_dim, correctness_samples_ind={0, 3})
+    for idx, sample in enumerate(samples):
+        collector.add(idx, sample)
+    profiling_sample, correctness_samples, conversion_samples = collector.samples()
+
+    assert [sample["input_0"][0, 0] for sample in correctness_samples] == [0, 3]
+    assert [sample["input_0"][0, 0] for sample in conversion_samples] == [1, 2]
+    assert all(sample["input_0"].shape[batch_dim] == 1 for sample in conversion_samples)
+    assert profiling_sample["input_0"][0, 0] == 2
+
+
+def test_infer_input_metadata_collect_samples_in_single_pass_over_dataloader():
+    class CountingDataloader:
+        def __init__(self, samples):
+            self.samples = samples
+            self.iterations = 0
+
+        def __len__(self):
+            return len(self.samples)
+
+        def __iter__(self):
+            self.iterations += 1
+            return iter(self.samples)
+
+    dataloader = CountingDataloader([numpy.full(shape=(idx, 3), fill_value=idx) for idx in range(1, 6)])
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output = InferInputMetadata().run(
+            model=lambda x: x,
+            framework=Framework.NONE,
+            dataloader=dataloader,
+            optimization_profile=OptimizationProfile(),
+            batch_dim=0,
+            workspace=Workspace(pathlib.Path(tmpdir)),
+            sample_count=3,
+        )
+        correctness_samples = load_samples("correctness_samples", tmpdir, batch_dim=0)
+        profiling_sample = load_samples("profiling_sample", tmpdir, batch_dim=0)[0]
+
+    assert dataloader.iterations == 1
+    assert output.output["dataloader_max_batch_size"] == 5
+    assert output.output["samples_fingerprint"] == get_samples_fingerprint(
+        [{"input__0": sample} for sample in dataloader.samples]
+    )
+    assert output.output["input_metadata"]["input__0"].shape == (-1, 3)
+    assert len(correctness_samples) == 3
+    assert profiling_sample["input__0"][0, 0] == 5
+
+
+def test_iter_samples_map_each_sample_separately():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        sample_filepath = pathlib.Path(tmpdir) / "model_output" / "correctness"
+        samples = [{"output_0": numpy.full(shape=(1, idx + 1), fill_value=idx)} for idx in range(0, 4)]
+        samples_to_mmap(samples=samples, path=sample_filepath, batch_dim=0)
+
+        loaded_samples = list(iter_samples("correctness_samples_output", tmpdir, batch_dim=0))
+
+        assert len(loaded_samples) == 4
+        for sample, loaded_sample in zip(samples, loaded_samples):
+            assert loaded_sample["output_0"].shape == sample["output_0"].shape
+            assert (loaded_sample["output_0"] == sample["output_0"]).all()
+            assert isinstance(loaded_sample["output_0"].base, numpy.memmap)
+            assert loaded_sample["output_0"].base.size == sample["output_0"].size
+
+
+def test_fetch_output_model_data_infer_samples_with_same_shapes_in_batches():
+    batch_dim = 0
+    batch_sizes = []
+
+    def model(input__0):
+        batch_sizes.append(input__0.shape[batch_dim])
+        return {"output__0": input__0 * 2}
+
+    correctness_samples = [{"input__0": numpy.full((1, idx % 2 + 2), idx, dtype=numpy.float32)} for idx in range(10)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        workspace = pathlib.Path(tmpdir)
+        samples_to_mmap(correctness_samples[:1], workspace / "model_input" / "profiling", batch_dim)
+        samples_to_mmap(correctness_samples, workspace / "model_input" / "correctness", batch_dim)
+        samples_to_mmap(correctness_samples[:2], workspace / "model_input" / "conversion", batch_dim)
+
+        output = FetchOutputModelData().run(
+            framework=Framework.NONE,
+            workspace=Workspace(workspace),
+            model=model,
+            input_metadata=TensorMetadata().add("input__0", (-1, -1), numpy.float32),
+            output_metadata=TensorMetadata().add("output__0", (-1, -1), numpy.float32),
+            batch_dim=batch_dim,
+            dataloader_max_batch_size=4,
+        )
+        correctness_outputs = load_samples("correctness_samples_output", tmpdir, batch_dim=batch_dim)
+
+    assert output.status == CommandStatus.OK
+    assert batch_sizes == [1, 4, 1, 4, 1, 1, 1]
+    for sample, sample_output in zip(correctness_samples, correctness_outputs):
+        assert (sample_output["output__0"] == sample["input__0"] * 2).all()
+
+
+class StreamDataloader:
+    """Unbounded dataloader without length."""
+
+    def __init__(self):
+        self.read_samples = 0
+
+    def __iter__(self):
+        idx = 0
+        while True:
+            self.read_samples += 1
+            yield numpy.full(shape=(idx % 3 + 1, 2), fill_value=idx, dtype=numpy.float32)
+            idx += 1
+
+
+def test_samples_collector_select_correctness_samples_with_reservoir_sampling_when_indices_not_provided():
+    samples = [{"input_0": numpy.full(shape=(1, 2), fill_value=idx)} for idx in range(100)]
+
+    selected = []
+    for _ in range(2):
+        collector = SamplesCollector(batch_dim=0, sample_count=10, seed=7)
+        for idx, sample in enumerate(samples):
+            collector.add(idx, sample)
+        _, correctness_samples, _ = collector.samples()
+        selected.append([int(sample["input_0"][0, 0]) for sample in correctness_samples])
+
+    assert selected[0] == selected[1]
+    assert len(selected[0]) == 10
+    assert selected[0] == sorted(set(selected[0]))
+    assert selected[0][-1] > 10
+
+
+def test_infer_input_metadata_read_samples_up_to_max_samples_when_dataloader_has_no_length():
+    dataloader = StreamDataloader()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output = InferInputMetadata().run(
+            model=lambda x: x,
+            framework=Framework.NONE,
+            dataloader=dataloader,
+            optimization_profile=OptimizationProfile(prefetch_depth=0),
+            batch_dim=0,
+            workspace=Workspace(pathlib.Path(tmpdir)),
+            sample_count=5,
+            max_samples=30,
+        )
+        correctness_samples = load_samples("correctness_samples", tmpdir, batch_dim=0)
+
+    assert dataloader.read_samples == 30
+    assert len(correctness_samples) == 5
+    assert output.output["dataloader_max_batch_size"] == 3
+    assert output.output["dataloader_trt_profile"]["input__0"].opt == (2, 2)
+
+
+def test_profiling_samples_selector_select_samples_at_quantiles_with_traffic_weights():
+    sizes = [4] * 4 + [8] * 3 + [16] * 2 + [32] * 1
+    selector = ProfilingSamplesSelector(batch_dim=0, samples_count=3)
+    for size in sizes:
+        selector.add({"input_0": numpy.ones((2, size), dtype=numpy.float32)})
+
+    samples, traffic_weights = selector.samples()
+
+    assert [sample["input_0"].shape for sample in samples] == [(1, 4), (1, 8), (1, 16)]
+    assert traffic_weights == pytest.approx([0.4, 0.3, 0.3])
+
+
+def test_profiling_samples_selector_keep_at_most_max_candidates_spread_over_sizes():
+    selector = ProfilingSamplesSelector(batch_dim=0, samples_count=2, max_candidates=4)
+    for size in range(1, 101):
+        selector.add({"input_0": numpy.ones((1, size), dtype=numpy.float32)})
+
+    samples, traffic_weights = selector.samples()
+
+    assert len(selector._candidates) == 4
+    assert {1, 100} <= {shape[0][1][0] for shape in selector._candidates}
+    assert len(samples) == 2
+    assert sum(traffic_weights) == pytest.approx(1.0)
+
+
+def test_infer_input_metadata_save_profiling_samples_when_profiling_samples_count_is_set():
+    dataloader = [numpy.ones((1, idx % 4 + 1), dtype=numpy.float32) for idx in range(20)]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output = InferInputMetadata().run(
+            model=lambda x: x,
+            framework=Framework.NONE,
+            dataloader=dataloader,
+            optimization_profile=OptimizationProfile(prefetch_depth=0, profiling_samples_count=2),
+            batch_dim=0,
+            workspace=Workspace(pathlib.Path(tmpdir)),
+            sample_count=5,
+        )
+        profiling_samples = load_samples("stratified_samples", tmpdir, batch_dim=0)
+        with open(output.output["stratified_samples"] / "traffic_weights.json") as f:
+            traffic_weights = json.load(f)
+
+    assert [sample["input__0"].shape for sample in profiling_samples] == [(1, 1), (1, 3)]
+    assert traffic_weights == pytest.approx([0.5, 0.5])
@@ -0,0 +1,176 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import multiprocessing
+import threading
+import time
+
+import numpy
+import pytest
+
+from model_navigator.api.config import PrefetchMode
+from model_navigator.exceptions import ModelNavigatorUserInputError
+from model_navigator.frameworks import Framework
+from model_navigator.utils.dataloader import DataloaderPrefetcher, get_samples_fingerprint, sample_to_numpy
+
+
+class BlockingDataloader:
+    def __init__(self, release_event):
+        self.release_event = release_event
+
+    def __iter__(self):
+        yield numpy.zeros((2,))
+        self.release_event.wait()
+        yield numpy.ones((2,))
+
+
+class SlowDataloader:
+    def __init__(self, size, delay=0.0, fail_at=None):
+        self.size = size
+        self.delay = delay
+        self.fail_at = fail_at
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for idx in range(self.size):
+            if idx == self.fail_at:
+                raise ModelNavigatorUserInputError(f"Invalid sample {idx}")
+            time.sleep(self.delay)
+            yield numpy.full((2,), idx)
+
+
+def _full(idx):
+    return numpy.full((2,), idx)
+
+
+class WorkersDataloader:
+    def __iter__(self):
+        with multiprocessing.get_context("fork").Pool(2) as pool:
+            yield from pool.imap(_full, range(4))
+
+
+@pytest.mark.parametrize("mode", [PrefetchMode.THREAD, PrefetchMode.PROCESS])
+@pytest.mark.parametrize("depth", [0, 1, 4])
+def test_prefetcher_return_transformed_samples_in_order(mode, depth):
+    prefetcher = DataloaderPrefetcher(SlowDataloader(10), transform=lambda sample: sample * 2, depth=depth, mode=mode)
+
+    samples = list(prefetcher)
+
+    assert len(prefetcher) == 10
+    assert [int(sample[0]) for sample in samples] == [idx * 2 for idx in range(10)]
+    assert prefetcher.stats.samples_count == 10
+
+
+@pytest.mark.parametrize("mode", [PrefetchMode.THREAD, PrefetchMode.PROCESS])
+def test_prefetcher_raise_dataloader_error_in_consumer(mode):
+    prefetcher = DataloaderPrefetcher(SlowDataloader(10, fail_at=3), depth=2, mode=mode)
+
+    consumed = []
+    with pytest.raises(ModelNavigatorUserInputError, match="Invalid sample 3"):
+        for sample in prefetcher:
+            consumed.append(sample)
+
+    assert len(consumed) == 3
+
+
+@pytest.mark.parametrize("mode", [PrefetchMode.THREAD, PrefetchMode.PROCESS])
+def test_prefetcher_stop_fetching_when_consumer_breaks(mode):
+    prefetcher = DataloaderPrefetcher(SlowDataloader(1000), depth=2, mode=mode)
+
+    for idx, _ in enumerate(prefetcher):
+        if idx == 2:
+            break
+
+    assert prefetcher.stats.samples_count == 3
+
+
+def test_prefetcher_stats_show_dataloader_bound_iteration_when_dataloader_is_slow():
+    prefetcher = DataloaderPrefetcher(SlowDataloader(5, delay=0.05), depth=2)
+
+    for _ in prefetcher:
+        pass
+
+    assert prefetcher.stats.is_dataloader_bound is True
+    assert prefetcher.stats.stall_time >= 0.2
+
+
+def test_prefetcher_overlap_dataloader_with_processing():
+    prefetcher = DataloaderPrefetcher(SlowDataloader(5, delay=0.05), depth=4)
+
+    start = time.perf_counter()
+    for _ in prefetcher:
+        time.sleep(0.05)
+    duration = time.perf_counter() - start
+
+    assert duration < 0.45
+    assert prefetcher.stats.processing_time >= 0.25
+
+
+def test_sample_to_numpy_keep_sample_structure():
+    tensor = numpy.zeros((2,))
+
+    assert isinstance(sample_to_numpy(tensor, Framework.NONE), numpy.ndarray)
+    assert isinstance(sample_to_numpy((tensor, tensor), Framework.NONE), tuple)
+    assert list(sample_to_numpy({"b": tensor, "a": tensor}, Framework.NONE).keys()) == ["b", "a"]
+
+
+def test_get_samples_fingerprint_change_when_data_shape_or_order_change():
+    samples = [{"input__0": numpy.arange(6, dtype=numpy.float32).reshape(2, 3)}, {"input__0": numpy.zeros((1, 3))}]
+
+    fingerprint = get_samples_fingerprint(samples)
+
+    assert fingerprint == get_samples_fingerprint([{name: t.copy() for name, t in s.items()} for s in samples])
+    assert fingerprint != get_samples_fingerprint(samples[::-1])
+    assert fingerprint != get_samples_fingerprint([{"input__0": samples[0]["input__0"].reshape(3, 2)}, samples[1]])
+    assert fingerprint != get_samples_fingerprint([{"input__0": samples[0]["input__0"] + 1}, samples[1]])
+
+
+def test_prefetcher_return_when_consumer_breaks_and_dataloader_blocks(mocker):
+    mocker.patch("model_navigator.utils.dataloader._PREFETCH_JOIN_TIMEOUT", 0.1)
+    release_event = threading.Event()
+    prefetcher = DataloaderPrefetcher(BlockingDataloader(release_event), depth=1, mode=PrefetchMode.THREAD)
+
+    for _ in prefetcher:
+        break
+    release_event.set()
+
+    assert prefetcher.stats.samples_count == 1
+
+
+def test_prefetcher_fetch_samples_in_consumer_when_depth_is_default(mocker):
+    thread_mock = mocker.patch("model_navigator.utils.dataloader.threading.Thread")
+
+    samples = list(DataloaderPrefetcher(SlowDataloader(3)))
+
+    assert len(samples) == 3
+    thread_mock.assert_not_called()
+
+
+def test_prefetcher_return_samples_when_dataloader_starts_worker_processes_in_prefetching_process():
+    prefetcher = DataloaderPrefetcher(WorkersDataloader(), depth=2, mode=PrefetchMode.PROCESS)
+
+    samples = list(prefetcher)
+
+    assert [int(sample[0]) for sample in samples] == [0, 1, 2, 3]
+
+
+def test_prefetcher_fetch_samples_in_thread_when_process_mode_is_used_and_cuda_is_initialized(mocker):
+    mocker.patch("model_navigator.utils.dataloader.is_cuda_initialized", return_value=True)
+    get_context_mock = mocker.patch("model_navigator.utils.dataloader.multiprocessing.get_context")
+
+    samples = list(DataloaderPrefetcher(SlowDataloader(3), depth=2, mode=PrefetchMode.PROCESS))
+
+    assert len(samples) == 3
+    get_context_mock.assert_not_called()
@@ -0,0 +1,81 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pathlib
+import sys
+import tempfile
+import threading
+
+from model_navigator.utils import environment
+from model_navigator.utils.environment import EnvironmentSnapshot, get_env_snapshot
+
+
+def _mock_get_env(mocker):
+    calls = []
+
+    def _get_env():
+        calls.append(1)
+        return {"python_packages": {"numpy": str(len(calls))}, "libraries": {}}
+
+    mocker.patch.object(environment, "get_env", side_effect=_get_env)
+    return calls
+
+
+def test_get_env_snapshot_reads_cached_snapshot_until_environment_changes(mocker, monkeypatch):
+    calls = _mock_get_env(mocker)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache_path = pathlib.Path(tmpdir) / "environment.json"
+        env = get_env_snapshot(cache_path=cache_path)
+        monkeypatch.setenv("CUDA_VERSION", "12.1")
+        cached_env = get_env_snapshot(cache_path=cache_path)
+
+        assert len(calls) == 1
+        assert cached_env["python_packages"] == env["python_packages"]
+        assert cached_env["libraries"]["CUDA_VERSION"] == "12.1"
+
+        # installing packages changes modification time of the directory in sys.path
+        packages_path = pathlib.Path(tmpdir) / "site-packages"
+        packages_path.mkdir()
+        monkeypatch.setattr(sys, "path", [*sys.path, packages_path.as_posix()])
+        get_env_snapshot(cache_path=cache_path)
+        assert len(calls) == 2
+        (packages_path / "package").mkdir()
+        get_env_snapshot(cache_path=cache_path)
+        assert len(calls) == 3
+
+        # expired snapshots are gathered again
+        get_env_snapshot(cache_path=cache_path, ttl=0)
+        assert len(calls) == 4
+
+        cache_path.write_text("{")
+        assert get_env_snapshot(cache_path=cache_path)["python_packages"] == {"numpy": "5"}
+
+
+def test_environment_snapshot_is_gathered_in_background_thread(mocker):
+    gathering = threading.Event()
+    finish = threading.Event()
+
+    def _get_env():
+        gathering.set()
+        finish.wait(timeout=60)
+        return {"python_packages": {}, "libraries": {}}
+
+    mocker.patch.object(environment, "get_env", side_effect=_get_env)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        environment_snapshot = EnvironmentSnapshot(cache_path=pathlib.Path(tmpdir) / "environment.json")
+        assert gathering.wait(timeout=60)
+        assert not environment_snapshot.ready
+
+        finish.set()
+        assert environment_snapshot.get() == {"python_packages": {}, "libraries": {}}
+        assert environment_snapshot.ready
@@ -16,7 +16,7 @@ import numpy as np
 import pytest
 
 from model_navigator.api.config import TensorType
-from model_navigator.core.tensor import TensorSpec, TensorUtils, get_tensor_type
+from model_navigator.core.tensor import TensorSpec, TensorUtils, find_non_finite_values, get_tensor_type
 
 
 def test_numpy_eq():
@@ -85,3 +85,38 @@ def test_tensorspec_optional():
 def test_get_tensor_type_numpy():
     a = np.ones((8, 64), dtype=np.float32)
     assert get_tensor_type(a) == TensorType.NUMPY
+
+
+def test_find_non_finite_values_return_none_when_tensor_is_finite():
+    assert find_non_finite_values(np.ones((8, 64), dtype=np.float32), chunk_size=100) is None
+    assert find_non_finite_values(np.ones((8, 64), dtype=np.int64)) is None
+    assert find_non_finite_values(np.ones((0, 64), dtype=np.float32)) is None
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 10000])
+def test_find_non_finite_values_return_count_and_first_index(chunk_size):
+    a = np.zeros((4, 8, 16), dtype=np.float32)
+    a[1, 2, 3] = np.nan
+    a[3, 0, 0] = np.nan
+    a[2, 7, 15] = np.inf
+    a[2, 7, 14] = -np.inf
+
+    non_finite_values = find_non_finite_values(a, chunk_size=chunk_size)
+
+    assert non_finite_values.nan_count == 2
+    assert non_finite_values.inf_count == 2
+    assert non_finite_values.first_nan_index == (1, 2, 3)
+    assert non_finite_values.first_inf_index == (2, 7, 14)
+
+
+def test_find_non_finite_values_return_index_in_original_tensor_when_tensor_is_not_contiguous():
+    a = np.zeros((16, 8), dtype=np.float64)
+    a[5, 6] = np.nan
+    transposed = a.T
+
+    non_finite_values = find_non_finite_values(transposed, chunk_size=16)
+
+    assert non_finite_values.nan_count == 1
+    assert non_finite_values.inf_count == 0
+    assert non_finite_values.first_nan_index == (6, 5)
+    assert non_finite_values.first_inf_index is None
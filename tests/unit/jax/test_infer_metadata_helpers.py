@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import Counter
+
 import numpy
 
 from model_navigator.commands.infer_metadata import _extract_axes_shapes
@@ -23,7 +25,12 @@ def test_extract_axes_shapes_return_correct_shapes_when_valid_dataloader_used():
     shape = (1, 224, 224, 3)
     input_name = "input_0"
     expected_axes_shapes = {
-        input_name: {0: [1, 1, 1, 1, 1], 1: [224, 224, 224, 224, 224], 2: [224, 224, 224, 224, 224], 3: [3, 3, 3, 3, 3]}
+        input_name: {
+            0: Counter([1, 1, 1, 1, 1]),
+            1: Counter([224, 224, 224, 224, 224]),
+            2: Counter([224, 224, 224, 224, 224]),
+            3: Counter([3, 3, 3, 3, 3]),
+        }
     }
 
     axes_shapes = _extract_axes_shapes(
@@ -0,0 +1,100 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test for JAX runners"""
+import functools
+import pathlib
+import tempfile
+
+import jax.numpy as jnp  # pytype: disable=import-error
+import numpy as np
+
+from model_navigator.core.tensor import TensorMetadata
+from model_navigator.frameworks.jax import JaxModel
+from model_navigator.runners import jax as jax_runners
+from model_navigator.runners.jax import JAXCPURunner
+
+
+def _predict(x, params):
+    return jnp.multiply(x, params["weight"])
+
+
+def _get_runner(model, **kwargs):
+    input_metadata = TensorMetadata().add("input__0", shape=(-1, 3), dtype=np.float32)
+    output_metadata = TensorMetadata().add("output__0", shape=(-1, 3), dtype=np.float32)
+    return JAXCPURunner(model=model, input_metadata=input_metadata, output_metadata=output_metadata, **kwargs)
+
+
+def test_jax_cpu_runner_compiles_once_per_shape():
+    model = JaxModel(model=_predict, params={"weight": np.full((3,), 2.0, dtype=np.float32)})
+    runner = _get_runner(model, max_compiled_shapes=2)
+    with runner:
+        for batch_size in [1, 1, 2, 2, 1]:
+            output = runner.infer({"input__0": np.ones((batch_size, 3), dtype=np.float32)})
+            assert np.allclose(output["output__0"], 2.0)
+        assert runner.retrace_count() == 2
+
+        runner.infer({"input__0": np.ones((4, 3), dtype=np.float32)})
+        runner.infer({"input__0": np.ones((2, 3), dtype=np.float32)})
+        assert runner.retrace_count() == 4
+
+
+def test_jax_cpu_runner_returns_same_outputs_when_inputs_are_donated():
+    model = JaxModel(model=_predict, params={"weight": np.full((3,), 2.0, dtype=np.float32)})
+    runner = _get_runner(model, donate_inputs=True)
+    with runner:
+        output = runner.infer({"input__0": np.ones((2, 3), dtype=np.float32)})
+
+    assert np.allclose(output["output__0"], 2.0)
+
+
+def test_jax_cpu_runner_creates_compilation_cache_dir_when_provided_in_model():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_dir = pathlib.Path(tmp_dir) / "jax_compilation_cache"
+        model = JaxModel(
+            model=_predict,
+            params={"weight": np.full((3,), 2.0, dtype=np.float32)},
+            compilation_cache_dir=cache_dir,
+        )
+        runner = _get_runner(model)
+        with runner:
+            runner.infer({"input__0": np.ones((2, 3), dtype=np.float32)})
+
+        assert cache_dir.exists()
+
+
+def test_jax_cpu_runner_restores_compilation_cache_dir_after_deactivation():
+    previous_cache_dir = jax_runners._get_compilation_cache_dir()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name in ["first", "second"]:
+            cache_dir = pathlib.Path(tmp_dir) / name
+            model = JaxModel(
+                model=_predict,
+                params={"weight": np.full((3,), 2.0, dtype=np.float32)},
+                compilation_cache_dir=cache_dir,
+            )
+            with _get_runner(model):
+                assert jax_runners._get_compilation_cache_dir() == cache_dir.as_posix()
+
+            assert jax_runners._get_compilation_cache_dir() == previous_cache_dir
+
+
+def test_jax_cpu_runner_does_not_use_persistent_compilation_cache_by_default():
+    previous_cache_dir = jax_runners._get_compilation_cache_dir()
+    jax_model = JaxModel(model=_predict, params={"weight": np.full((3,), 2.0, dtype=np.float32)})
+    assert jax_model.compilation_cache_dir is None
+
+    for model in [jax_model, functools.partial(_predict, params={"weight": np.full((3,), 2.0, dtype=np.float32)})]:
+        with _get_runner(model) as runner:
+            runner.infer({"input__0": np.ones((2, 3), dtype=np.float32)})
+            assert jax_runners._get_compilation_cache_dir() == previous_cache_dir
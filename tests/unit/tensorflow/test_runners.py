@@ -0,0 +1,62 @@
+# Copyright (c) 2021-2023, NVIDIA CORPORATION. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test for TensorFlow runners"""
+import tempfile
+
+import numpy as np
+import tensorflow  # pytype: disable=import-error
+
+from model_navigator.core.tensor import TensorMetadata
+from model_navigator.runners.tensorflow import TensorFlowSavedModelCPURunner
+
+
+def _save_model(path):
+    inp = tensorflow.keras.layers.Input((3,), name="input__1")
+    model_output = tensorflow.keras.layers.Lambda(lambda x: x * 2)(inp)
+    model = tensorflow.keras.Model(inp, model_output)
+    model.save(path)
+
+
+def _get_runner(path, **kwargs):
+    input_metadata = TensorMetadata().add("input__1", shape=(-1, 3), dtype=np.float32)
+    output_metadata = TensorMetadata().add("output__1", shape=(-1, 3), dtype=np.float32)
+    return TensorFlowSavedModelCPURunner(
+        model=path, input_metadata=input_metadata, output_metadata=output_metadata, **kwargs
+    )
+
+
+def test_savedmodel_runner_returns_none_retrace_count_when_shapes_are_not_specialized():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        _save_model(tmp_dir)
+        runner = _get_runner(tmp_dir)
+        with runner:
+            output = runner.infer({"input__1": np.ones((2, 3), dtype=np.float32)})
+            assert runner.retrace_count() is None
+
+    assert np.allclose(output["output__1"], 2.0)
+
+
+def test_savedmodel_runner_traces_once_per_shape_when_shapes_are_specialized():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        _save_model(tmp_dir)
+        runner = _get_runner(tmp_dir, specialize_shapes=True, max_traced_signatures=2)
+        with runner:
+            for batch_size in [1, 1, 2, 2, 1]:
+                output = runner.infer({"input__1": np.ones((batch_size, 3), dtype=np.float32)})
+                assert np.allclose(output["output__1"], 2.0)
+            assert runner.retrace_count() == 2
+
+            runner.infer({"input__1": np.ones((4, 3), dtype=np.float32)})
+            runner.infer({"input__1": np.ones((2, 3), dtype=np.float32)})
+            assert runner.retrace_count() == 4
@@ -11,15 +11,24 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
 import logging
 import os
 import pathlib
 import select
 import subprocess
-from typing import Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from model_navigator.api.config import DeviceKind, JitType, OptimizationProfile
+from model_navigator.configuration.common_config import CommonConfig
+from model_navigator.configuration.model.model_config import ModelConfig, ONNXConfig, TorchScriptConfig
+from model_navigator.core.workspace import Workspace
+from model_navigator.frameworks import Framework
 
 LOGGER = logging.getLogger(__name__)
 DEFAULT_LOG_FORMAT = "%(asctime)s - %(levelname)8s - %(name)s: %(message)s"
+EXECUTIONS_FILENAME = "executions.jsonl"
 
 
 def exec_command(cmd, workspace=None, name=None, shell=False) -> Optional[int]:
@@ -67,3 +76,67 @@ def _read_outputs(_process, _outputs):
 
 def get_assets_path():
     return pathlib.Path(__file__).parent / "assets"
+
+
+class RunnerA:
+    @classmethod
+    def name(cls):
+        return "RunnerA"
+
+
+class RunnerB:
+    @classmethod
+    def name(cls):
+        return "RunnerB"
+
+
+def get_common_config(
+    model: Any = None,
+    dataloader: Optional[List] = None,
+    sample_count: int = 1,
+    optimization_profile: Optional[OptimizationProfile] = None,
+    resume: bool = False,
+) -> CommonConfig:
+    return CommonConfig(
+        framework=Framework.NONE,
+        model=model,
+        dataloader=dataloader or [],
+        target_formats=(),
+        target_device=DeviceKind.CPU,
+        sample_count=sample_count,
+        optimization_profile=optimization_profile or OptimizationProfile(),
+        runner_names=(),
+        resume=resume,
+    )
+
+
+def get_model_configs() -> Tuple[ModelConfig, ModelConfig, ModelConfig, ModelConfig]:
+    """Return TorchScript trace, TorchScript script, ONNX and ONNX exported from the TorchScript trace configs."""
+    ts_trace = TorchScriptConfig(jit_type=JitType.TRACE, strict=True)
+    ts_script = TorchScriptConfig(jit_type=JitType.SCRIPT, strict=True)
+    onnx = ONNXConfig(opset=17, dynamic_axes=None)
+    onnx_from_ts = ONNXConfig(opset=17, dynamic_axes=None, parent=ts_trace)
+    return ts_trace, ts_script, onnx, onnx_from_ts
+
+
+def record_execution(workspace: Workspace, name: str, start: Optional[float] = None) -> None:
+    """Append execution of a command to the workspace log. Safe for commands executed in worker processes."""
+    end = time.perf_counter()
+    execution = {"name": name, "start": end if start is None else start, "end": end, "pid": os.getpid()}
+    fd = os.open(workspace.path / EXECUTIONS_FILENAME, os.O_WRONLY | os.O_CREAT | os.O_APPEND)
+    try:
+        os.write(fd, f"{json.dumps(execution)}\n".encode())
+    finally:
+        os.close(fd)
+
+
+def load_executions(workspace: Workspace) -> List[Dict]:
+    """Load executions recorded in the workspace in the order of recording and clear the log."""
+    executions_path = workspace.path / EXECUTIONS_FILENAME
+    if not executions_path.exists():
+        return []
+
+    executions = [json.loads(line) for line in executions_path.read_text().splitlines()]
+    executions_path.unlink()
+
+    return executions